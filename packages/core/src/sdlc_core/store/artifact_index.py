@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from pydantic import BaseModel
 
 
+# Consumed bytes kept to recognise a file rewritten in place.
+_TAIL_BYTES = 4096
+
+
 class ArtifactIndexRow(BaseModel):
     artifact_id: str
     artifact_type: str
@@ -16,32 +21,130 @@ class ArtifactIndexRow(BaseModel):
     cache_key: str | None = None
 
 
+@dataclass
+class _IndexState:
+    """Rows read so far from an index file plus hash lookups over them.
+
+    `offset` is the byte length of the file consumed; only complete lines are
+    consumed, so a line being written by another process is picked up on the
+    next sync. `identity`, `mtime_ns` and `tail` (the last consumed bytes)
+    detect a file that was replaced or rewritten rather than appended to.
+    """
+
+    offset: int = 0
+    identity: tuple[int, int] | None = None
+    mtime_ns: int | None = None
+    tail: bytes = b""
+    rows: list[ArtifactIndexRow] = field(default_factory=list)
+    by_cache_key: dict[str, ArtifactIndexRow] = field(default_factory=dict)
+    by_artifact_id: dict[str, ArtifactIndexRow] = field(default_factory=dict)
+    by_type: dict[str, list[ArtifactIndexRow]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __getstate__(self) -> dict[str, object]:
+        # Copies (e.g. sent to worker processes) re-import the file lazily.
+        return {}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__init__()  # type: ignore[misc]
+
+    def reset(self) -> None:
+        self.offset = 0
+        self.identity = None
+        self.mtime_ns = None
+        self.tail = b""
+        self.rows = []
+        self.by_cache_key = {}
+        self.by_artifact_id = {}
+        self.by_type = {}
+
+    def add(self, row: ArtifactIndexRow) -> None:
+        # Later rows win, matching a backwards scan of the file.
+        self.rows.append(row)
+        if row.cache_key is not None:
+            self.by_cache_key[row.cache_key] = row
+        self.by_artifact_id[row.artifact_id] = row
+        self.by_type.setdefault(row.artifact_type, []).append(row)
+
+
 @dataclass(frozen=True)
 class ArtifactIndexStore:
+    """Append-only JSONL artifact index with in-memory lookups.
+
+    The file stays the source of truth. Existing indexes are imported on the
+    first read, and later reads only parse lines appended since then (by this
+    store or any other writer), so lookups by cache key, artifact id or type
+    are dict hits instead of a full re-read of the file.
+    """
+
     path: Path
+    _state: _IndexState = field(
+        default_factory=_IndexState, init=False, repr=False, compare=False
+    )
 
     def append(self, row: ArtifactIndexRow) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(
-                json.dumps(
-                    row.model_dump(mode="json"),
-                    sort_keys=True,
-                    ensure_ascii=True,
+        with self._state.lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(
+                    json.dumps(
+                        row.model_dump(mode="json"),
+                        sort_keys=True,
+                        ensure_ascii=True,
+                    )
                 )
-            )
-            f.write("\n")
+                f.write("\n")
+            self._sync()
 
     def list_rows(self, *, artifact_type: str | None = None) -> list[ArtifactIndexRow]:
-        if not self.path.exists():
-            return []
+        with self._state.lock:
+            self._sync()
+            if artifact_type is None:
+                return list(self._state.rows)
+            return list(self._state.by_type.get(artifact_type, []))
+
+    def find_by_cache_key(self, cache_key: str) -> ArtifactIndexRow | None:
+        """Return the latest row written with `cache_key`, if any."""
+        with self._state.lock:
+            self._sync()
+            return self._state.by_cache_key.get(cache_key)
 
-        rows: list[ArtifactIndexRow] = []
-        for line in self.path.read_text(encoding="utf-8").splitlines():
+    def find_by_artifact_id(self, artifact_id: str) -> ArtifactIndexRow | None:
+        """Return the latest row for `artifact_id`, if any."""
+        with self._state.lock:
+            self._sync()
+            return self._state.by_artifact_id.get(artifact_id)
+
+    def _sync(self) -> None:
+        state = self._state
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            state.reset()
+            return
+        identity = (st.st_dev, st.st_ino)
+        if identity != state.identity or st.st_size < state.offset:
+            # Replaced (e.g. atomic rename) or truncated; re-import it.
+            state.reset()
+        elif st.st_size == state.offset and st.st_mtime_ns == state.mtime_ns:
+            return
+
+        with self.path.open("rb") as f:
+            if state.tail:
+                f.seek(state.offset - len(state.tail))
+                if f.read(len(state.tail)) != state.tail:
+                    # Rewritten in place; the consumed prefix is stale.
+                    state.reset()
+            f.seek(state.offset)
+            data = f.read(st.st_size - state.offset)
+        state.identity = identity
+        state.mtime_ns = st.st_mtime_ns
+
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].decode("utf-8").splitlines():
             if not line.strip():
                 continue
-            row = ArtifactIndexRow.model_validate(json.loads(line))
-            if artifact_type is not None and row.artifact_type != artifact_type:
-                continue
-            rows.append(row)
-        return rows
+            state.add(ArtifactIndexRow.model_validate(json.loads(line)))
+        state.offset += end
+        if end:
+            state.tail = (state.tail + data[:end])[-_TAIL_BYTES:]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -13,9 +13,16 @@ from sdlc_core.types.artifact import ArtifactRecord, ArtifactRef
 @dataclass(frozen=True)
 class FileArtifactStore:
     root: Path
+    _index_store: ArtifactIndexStore = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # One index store per artifact store, so its lookup maps are reused.
+        object.__setattr__(
+            self, "_index_store", ArtifactIndexStore(path=self.root / "artifact_index.jsonl")
+        )
 
     def _index(self) -> ArtifactIndexStore:
-        return ArtifactIndexStore(path=self.root / "artifact_index.jsonl")
+        return self._index_store
 
     def write_json(self, *, rel_path: str, payload: Any) -> Path:
         p = self.root / rel_path
@@ -62,15 +69,14 @@ class FileArtifactStore:
         return ref
 
     def find_cached(self, *, cache_key: str) -> ArtifactRef | None:
-        rows = self._index().list_rows()
-        for row in reversed(rows):
-            if row.cache_key == cache_key:
-                return ArtifactRef(
-                    artifact_id=row.artifact_id,
-                    artifact_type=row.artifact_type,
-                    artifact_version=row.artifact_version,
-                    relative_path=row.relative_path,
-                    content_sha256=row.content_sha256,
-                    cache_key=row.cache_key,
-                )
-        return None
+        row = self._index().find_by_cache_key(cache_key)
+        if row is None:
+            return None
+        return ArtifactRef(
+            artifact_id=row.artifact_id,
+            artifact_type=row.artifact_type,
+            artifact_version=row.artifact_version,
+            relative_path=row.relative_path,
+            content_sha256=row.content_sha256,
+            cache_key=row.cache_key,
+        )
@@ -1,3 +1,5 @@
+import os
+
 from sdlc_core.store.artifact_index import ArtifactIndexRow, ArtifactIndexStore
 
 
@@ -25,3 +27,59 @@ def test_artifact_index_append_and_filter(tmp_path) -> None:
     )
     rows = idx.list_rows(artifact_type="route_result")
     assert [r.artifact_id for r in rows] == ["a1"]
+
+
+def _row(artifact_id: str, *, cache_key: str | None = None, artifact_type: str = "route_result") -> ArtifactIndexRow:
+    return ArtifactIndexRow(
+        artifact_id=artifact_id,
+        artifact_type=artifact_type,
+        artifact_version="v2",
+        relative_path=f"artifacts/{artifact_type}/{artifact_id}.json",
+        content_sha256=artifact_id,
+        cache_key=cache_key,
+    )
+
+
+def test_artifact_index_lookups_follow_appends_and_existing_files(tmp_path) -> None:
+    path = tmp_path / "artifact_index.jsonl"
+    ArtifactIndexStore(path=path).append(_row("a1", cache_key="k1"))
+
+    idx = ArtifactIndexStore(path=path)
+    assert idx.find_by_cache_key("k1").artifact_id == "a1"
+    assert idx.find_by_cache_key("missing") is None
+
+    idx.append(_row("a2", cache_key="k1"))
+    ArtifactIndexStore(path=path).append(_row("t1", artifact_type="truth_label"))
+
+    assert idx.find_by_cache_key("k1").artifact_id == "a2"
+    assert idx.find_by_artifact_id("t1").artifact_type == "truth_label"
+    assert [r.artifact_id for r in idx.list_rows(artifact_type="route_result")] == ["a1", "a2"]
+    assert [r.artifact_id for r in idx.list_rows()] == ["a1", "a2", "t1"]
+
+    path.write_text("", encoding="utf-8")
+    assert idx.list_rows() == []
+    assert idx.find_by_cache_key("k1") is None
+
+
+def test_artifact_index_reimports_replaced_or_rewritten_files(tmp_path) -> None:
+    path = tmp_path / "artifact_index.jsonl"
+    idx = ArtifactIndexStore(path=path)
+    idx.append(_row("a1", cache_key="k1"))
+    assert idx.find_by_cache_key("k1").artifact_id == "a1"
+
+    # Atomic replacement by a longer file: same prefix length, new inode.
+    other = tmp_path / "other.jsonl"
+    writer = ArtifactIndexStore(path=other)
+    writer.append(_row("b1", cache_key="k1"))
+    writer.append(_row("b2", cache_key="k2"))
+    os.replace(other, path)
+    assert idx.find_by_cache_key("k1").artifact_id == "b1"
+    assert [r.artifact_id for r in idx.list_rows()] == ["b1", "b2"]
+
+    # In-place rewrite of the same size: same inode, consumed bytes differ.
+    st = path.stat()
+    path.write_text(path.read_text(encoding="utf-8").replace("b1", "c1"), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert path.stat().st_size == st.st_size
+    assert idx.find_by_cache_key("k1").artifact_id == "c1"
+    assert [r.artifact_id for r in idx.list_rows()] == ["c1", "b2"]
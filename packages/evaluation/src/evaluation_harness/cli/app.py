@@ -198,11 +198,20 @@ def run(
     ),
     execution_mode: str = typer.Option(
         "sequential",
-        help="Execution mode: sequential | parallel",
+        help="Execution mode: sequential | parallel | sharded",
     ),
     max_workers: int | None = typer.Option(
         None,
-        help="Max workers for --execution-mode=parallel",
+        help="Max workers for --execution-mode=parallel|sharded",
+    ),
+    boundary_cutoff_policy: str = typer.Option(
+        "exact",
+        help="Boundary artifact cutoff bucketing: exact | hourly | daily",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip PRs already completed by an interrupted run with this run id",
     ),
 ):
     configs = list(router_config)
@@ -231,10 +240,14 @@ def run(
     if not prs:
         raise typer.BadParameter("no PRs selected")
 
-    defaults = EvalDefaults(
-        execution_mode=execution_mode,
-        max_workers=max_workers,
-    )
+    try:
+        defaults = EvalDefaults(
+            execution_mode=execution_mode,
+            max_workers=max_workers,
+            boundary_cutoff_policy=boundary_cutoff_policy,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
     cfg = EvalRunConfig(
         repo=repo,
         data_dir=data_dir,
@@ -248,6 +261,7 @@ def run(
         cfg=cfg,
         pr_numbers=list(prs),
         router_specs=specs,
+        resume=resume,
     )
     typer.echo(f"run_dir {res.run_dir}")
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import timedelta
 
 from pydantic import BaseModel, Field, field_validator
+from repo_routing.boundary.cutoffs import BoundaryCutoffPolicy
 
 
 class EvalDefaults(BaseModel):
@@ -10,6 +11,9 @@ class EvalDefaults(BaseModel):
 
     strict_streaming_eval: bool = True
     cutoff_policy: str = "created_at"
+    # Bucketing used to resolve boundary artifacts for PR cutoffs; must match
+    # the policy the cohort's artifacts were built with (`boundary build-cohort`).
+    boundary_cutoff_policy: str = BoundaryCutoffPolicy.EXACT.value
 
     truth_window: timedelta = timedelta(minutes=60)
     truth_include_review_comments: bool = True
@@ -40,10 +44,21 @@ class EvalDefaults(BaseModel):
     @classmethod
     def _normalize_execution_mode(cls, value: str) -> str:
         mode = str(value).strip().lower()
-        if mode not in {"sequential", "parallel"}:
-            raise ValueError("execution_mode must be one of: sequential, parallel")
+        if mode not in {"sequential", "parallel", "sharded"}:
+            raise ValueError("execution_mode must be one of: sequential, parallel, sharded")
         return mode
 
+    @field_validator("boundary_cutoff_policy")
+    @classmethod
+    def _normalize_boundary_cutoff_policy(cls, value: str) -> str:
+        policy = str(value).strip().lower()
+        try:
+            return BoundaryCutoffPolicy(policy).value
+        except ValueError as exc:
+            raise ValueError(
+                "boundary_cutoff_policy must be one of: exact, hourly, daily"
+            ) from exc
+
     @field_validator("max_workers")
     @classmethod
     def _validate_max_workers(cls, value: int | None) -> int | None:
@@ -4,6 +4,7 @@ import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from repo_routing.history.db import connect_history_db
 from repo_routing.paths import repo_db_path
 
 
@@ -49,8 +50,7 @@ def cutoff_for_pr(
         return timedelta(seconds=n)
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
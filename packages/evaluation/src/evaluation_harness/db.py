@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from repo_routing.history.db import connect_history_db
+
 from .paths import repo_db_path
 
 
@@ -31,8 +33,7 @@ class RepoDb:
 
     def connect(self) -> sqlite3.Connection:
         p = repo_db_path(repo_full_name=self.repo, data_dir=self.data_dir)
-        conn = sqlite3.connect(str(p))
-        conn.row_factory = sqlite3.Row
+        conn = connect_history_db(p)
         return conn
 
     def repo_id(self, conn: sqlite3.Connection) -> int:
@@ -21,8 +21,13 @@ def run_streaming_eval(
     router_config_path: str | Path | None = None,
     repo_profile_settings: RepoProfileRunSettings | None = None,
     pr_cutoffs: dict[int | str, datetime] | None = None,
+    resume: bool = False,
 ) -> RunResult:
-    """Run a leakage-safe streaming evaluation."""
+    """Run a leakage-safe streaming evaluation.
+
+    With `resume=True`, PRs completed by an earlier, interrupted run of the
+    same run id (and same config, routers and cutoffs) are not re-evaluated.
+    """
 
     prepared = prepare_eval_stage(
         cfg=cfg,
@@ -34,6 +39,7 @@ def run_streaming_eval(
     per_pr = per_pr_evaluate_stage(
         prepared=prepared,
         repo_profile_settings=repo_profile_settings,
+        resume=resume,
     )
     aggregated = aggregate_eval_stage(prepared=prepared, per_pr=per_pr)
     return emit_eval_stage(prepared=prepared, per_pr=per_pr, aggregated=aggregated)
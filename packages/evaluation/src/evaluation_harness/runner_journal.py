@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sdlc_core.hashing import stable_hash_json
+
+from .runner_models import PreparedEvalStage, RepoProfileRunSettings
+
+JOURNAL_FILENAME = "per_pr_journal.jsonl"
+JOURNAL_VERSION = "v1"
+
+# Files appended once per completed PR; the journal records their sizes so a
+# resumed run can drop rows from a PR that did not finish.
+_APPENDED_FILES = ("per_pr.jsonl", "artifact_index.jsonl")
+
+
+def run_fingerprint(
+    *,
+    prepared: PreparedEvalStage,
+    repo_profile_settings: RepoProfileRunSettings | None,
+) -> str:
+    """Hash of everything that determines per-PR outputs of a run.
+
+    Scheduling knobs (execution mode, worker count) are excluded so a run can
+    be resumed with a different mode than it was started with.
+    """
+    cfg = prepared.cfg.model_dump(mode="json")
+    cfg.pop("run_id", None)
+    defaults = dict(cfg.get("defaults") or {})
+    defaults.pop("execution_mode", None)
+    defaults.pop("max_workers", None)
+    cfg["defaults"] = defaults
+    return stable_hash_json(
+        {
+            "version": JOURNAL_VERSION,
+            "config": cfg,
+            "routers": {
+                rid: spec.model_dump(mode="json")
+                for rid, spec in zip(prepared.router_ids, prepared.specs)
+            },
+            "cutoffs": {
+                str(n): prepared.cutoffs[n].isoformat()
+                for n in prepared.ordered_pr_numbers
+            },
+            "truth_policies": {
+                pid: resolved.policy_hash
+                for pid, resolved in prepared.truth_policies.items()
+            },
+            "truth_primary_policy": prepared.truth_primary_policy,
+            "repo_profile": (
+                None
+                if repo_profile_settings is None
+                else asdict(repo_profile_settings)
+            ),
+        }
+    )
+
+
+@dataclass(frozen=True)
+class PerPrJournal:
+    """Append-only record of PRs whose outputs are fully written.
+
+    The first line is a header with the run fingerprint; each later line is
+    one completed PR with its aggregate inputs and the sizes of the shared
+    JSONL outputs right after it was merged. A trailing partial line (from a
+    crash mid-write) is ignored on resume.
+    """
+
+    run_dir: Path
+    fingerprint: str
+
+    @property
+    def path(self) -> Path:
+        return self.run_dir / JOURNAL_FILENAME
+
+    def start(self) -> None:
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        header = {"journal_version": JOURNAL_VERSION, "fingerprint": self.fingerprint}
+        self.path.write_text(_dumps(header) + "\n", encoding="utf-8")
+
+    def resume(self, *, ordered_pr_numbers: list[int]) -> list[dict[str, object]]:
+        """Return completed entries and roll shared outputs back to the last one.
+
+        Raises RuntimeError when the journal belongs to a different run
+        configuration or does not match the PR order of this run.
+        """
+        if not self.path.exists():
+            if any((self.run_dir / name).exists() for name in _APPENDED_FILES):
+                raise RuntimeError(
+                    f"cannot resume: {self.run_dir} has outputs but no {JOURNAL_FILENAME}"
+                )
+            self.start()
+            return []
+
+        data = self.path.read_bytes()
+        end = data.rfind(b"\n") + 1
+        lines = [ln for ln in data[:end].decode("utf-8").splitlines() if ln.strip()]
+        if not lines:
+            raise RuntimeError(f"cannot resume: empty journal {self.path}")
+        header = json.loads(lines[0])
+        if header.get("fingerprint") != self.fingerprint:
+            raise RuntimeError(
+                "cannot resume: run config, routers or cutoffs changed since "
+                f"{self.path} was written"
+            )
+
+        entries = [json.loads(ln) for ln in lines[1:]]
+        done = [int(e["pr_number"]) for e in entries]  # type: ignore[arg-type]
+        if done != ordered_pr_numbers[: len(done)]:
+            raise RuntimeError(
+                f"cannot resume: journaled PRs {done} are not a prefix of this run's PR order"
+            )
+
+        # Drop the partial line, then anything appended after the last entry.
+        if end != len(data):
+            with self.path.open("r+b") as f:
+                f.truncate(end)
+        offsets = entries[-1]["offsets"] if entries else {}
+        for name in _APPENDED_FILES:
+            p = self.run_dir / name
+            size = int(offsets.get(name, 0))  # type: ignore[union-attr]
+            if p.exists() and p.stat().st_size > size:
+                with p.open("r+b") as f:
+                    f.truncate(size)
+        return entries
+
+    def record(self, *, pr_number: int, outcome: dict[str, object]) -> None:
+        offsets = {}
+        for name in _APPENDED_FILES:
+            p = self.run_dir / name
+            offsets[name] = p.stat().st_size if p.exists() else 0
+        entry = {"pr_number": pr_number, "offsets": offsets, "outcome": outcome}
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(_dumps(entry) + "\n")
+
+
+def _dumps(obj: object) -> str:
+    return json.dumps(obj, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
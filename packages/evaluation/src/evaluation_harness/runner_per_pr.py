@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import inspect
-from concurrent.futures import ThreadPoolExecutor
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import Iterable, Iterator
 
 from repo_routing.artifacts.models import RouteArtifact
-from repo_routing.artifacts.writer import (
-    ArtifactWriter,
-    build_pr_inputs_artifact,
-    build_pr_snapshot_artifact,
-)
-from repo_routing.inputs.models import PRInputBundle
+from repo_routing.artifacts.writer import ArtifactWriter, build_pr_snapshot_and_inputs
+from repo_routing.history.reader import HistoryReader
+from repo_routing.inputs.models import PRInputBuilderOptions, PRInputBundle
 from repo_routing.predictor.pipeline import PipelinePredictor
 from repo_routing.repo_profile.builder import build_repo_profile
+from repo_routing.router.context import RoutingContext
 from sdlc_core.types.artifact import (
     ArtifactEntityRef,
     ArtifactHeader,
@@ -23,9 +23,18 @@ from sdlc_core.types.artifact import (
 from .metrics.gates import per_pr_gate_metrics
 from .metrics.queue import per_pr_queue_metrics
 from .metrics.routing_agreement import per_pr_metrics
-from .models import PRMetrics, TruthDiagnostics, TruthLabel, TruthStatus
+from .models import (
+    GateMetrics,
+    PRMetrics,
+    QueueMetrics,
+    TruthDiagnostics,
+    TruthLabel,
+    TruthStatus,
+)
+from .runner_journal import PerPrJournal, run_fingerprint
 from .runner_models import PerPrEvalStage, PreparedEvalStage, RepoProfileRunSettings
-from .truth import truth_with_policy
+from .runner_prepare import load_routers
+from .truth import truth_with_policies_for_cohort
 
 
 def _build_repo_profile_for_pr(
@@ -104,22 +113,6 @@ def _build_repo_profile_for_pr(
     }
 
 
-def _router_accepts_input_bundle(router: object) -> bool:
-    route_fn = getattr(router, "route", None)
-    if route_fn is None:
-        return False
-    try:
-        sig = inspect.signature(route_fn)
-    except (TypeError, ValueError):
-        return False
-
-    if "input_bundle" in sig.parameters:
-        return True
-    return any(
-        p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-    )
-
-
 def _route_router(
     *,
     router: object,
@@ -129,17 +122,19 @@ def _route_router(
     data_dir: str,
     top_k: int,
     input_bundle: PRInputBundle,
+    routing_context: RoutingContext,
 ):
-    kwargs: dict[str, object] = {
-        "repo": repo,
-        "pr_number": pr_number,
-        "as_of": cutoff,
-        "data_dir": data_dir,
-        "top_k": top_k,
-    }
-    if _router_accepts_input_bundle(router):
-        kwargs["input_bundle"] = input_bundle
-    return router.route(**kwargs)  # type: ignore[call-arg, attr-defined]
+    # Through the context, so baselines that composite routers also consume
+    # (union, hybrid ranker, LLM rerank) are routed once per PR.
+    return routing_context.route(
+        router,
+        repo=repo,
+        pr_number=pr_number,
+        as_of=cutoff,
+        data_dir=data_dir,
+        top_k=top_k,
+        input_bundle=input_bundle,
+    )
 
 
 def _collect_router_run(
@@ -149,6 +144,7 @@ def _collect_router_run(
     pr_number: int,
     cutoff: datetime,
     inputs: PRInputBundle,
+    routing_context: RoutingContext,
 ):
     router = prepared.routers_by_id[router_id]
     result = _route_router(
@@ -159,6 +155,7 @@ def _collect_router_run(
         data_dir=prepared.cfg.data_dir,
         top_k=prepared.cfg.defaults.top_k,
         input_bundle=inputs,
+        routing_context=routing_context,
     )
     return router_id, result, router
 
@@ -167,110 +164,137 @@ def _sorted_router_ids(prepared: PreparedEvalStage) -> list[str]:
     return sorted(prepared.router_ids, key=str.lower)
 
 
-def per_pr_evaluate_stage(
+@dataclass
+class _RouterOutcome:
+    router_id: str
+    has_candidates: bool
+    feature_meta: dict[str, object]
+    metrics_primary: PRMetrics
+    metrics_by_policy: dict[str, PRMetrics]
+    queue_metrics: QueueMetrics
+
+
+@dataclass
+class _PrOutcome:
+    """Everything one PR contributes to shared run outputs.
+
+    Per-PR files (snapshots, inputs, route results, features) are written while
+    evaluating; the index, `per_pr.jsonl` and aggregate rows are merged from
+    this in cohort order, so a PR can be evaluated in another process.
+    """
+
+    pr_number: int
+    truth_diags: dict[str, TruthDiagnostics]
+    artifacts: list[tuple[ArtifactRecord, str]]
+    routers: list[_RouterOutcome]
+    gate_metrics: GateMetrics
+    row: dict[str, object]
+
+    def journal_payload(self) -> dict[str, object]:
+        """Aggregate inputs of this PR, as recorded in the resume journal."""
+        return {
+            "truth_diags": {
+                pid: d.model_dump(mode="json") for pid, d in self.truth_diags.items()
+            },
+            "routers": [
+                {
+                    "router_id": r.router_id,
+                    "has_candidates": r.has_candidates,
+                    "feature_meta": r.feature_meta,
+                    "metrics_primary": r.metrics_primary.model_dump(mode="json"),
+                    "metrics_by_policy": {
+                        pid: m.model_dump(mode="json")
+                        for pid, m in r.metrics_by_policy.items()
+                    },
+                    "queue_metrics": r.queue_metrics.model_dump(mode="json"),
+                }
+                for r in self.routers
+            ],
+            "gate_metrics": self.gate_metrics.model_dump(mode="json"),
+        }
+
+    @classmethod
+    def from_journal(cls, *, pr_number: int, payload: dict) -> "_PrOutcome":
+        # Outputs were already written by the interrupted run; only the
+        # aggregate inputs are restored.
+        return cls(
+            pr_number=pr_number,
+            truth_diags={
+                pid: TruthDiagnostics.model_validate(d)
+                for pid, d in payload["truth_diags"].items()
+            },
+            artifacts=[],
+            routers=[
+                _RouterOutcome(
+                    router_id=r["router_id"],
+                    has_candidates=bool(r["has_candidates"]),
+                    feature_meta=dict(r["feature_meta"]),
+                    metrics_primary=PRMetrics.model_validate(r["metrics_primary"]),
+                    metrics_by_policy={
+                        pid: PRMetrics.model_validate(m)
+                        for pid, m in r["metrics_by_policy"].items()
+                    },
+                    queue_metrics=QueueMetrics.model_validate(r["queue_metrics"]),
+                )
+                for r in payload["routers"]
+            ],
+            gate_metrics=GateMetrics.model_validate(payload["gate_metrics"]),
+            row={},
+        )
+
+
+def _evaluate_pr(
     *,
     prepared: PreparedEvalStage,
+    pr_number: int,
+    ordered_router_ids: list[str],
+    routing_writer: ArtifactWriter,
     repo_profile_settings: RepoProfileRunSettings | None,
-) -> PerPrEvalStage:
-    routing_writer = ArtifactWriter(
+    reader: HistoryReader,
+    truth_diags: dict[str, TruthDiagnostics],
+) -> _PrOutcome:
+    cutoff = prepared.cutoffs[pr_number]
+
+    snap, inputs = build_pr_snapshot_and_inputs(
         repo=prepared.cfg.repo,
+        pr_number=pr_number,
+        as_of=cutoff,
         data_dir=prepared.cfg.data_dir,
-        run_id=prepared.cfg.run_id,
+        options=PRInputBuilderOptions(
+            boundary_cutoff_policy=prepared.cfg.defaults.boundary_cutoff_policy,
+        ),
+        reader=reader,
     )
-    ordered_router_ids = _sorted_router_ids(prepared)
-
-    routing_rows_by_router: dict[str, list[object]] = {rid: [] for rid in ordered_router_ids}
-    routing_rows_known_by_router: dict[str, list[object]] = {
-        rid: [] for rid in ordered_router_ids
-    }
-    routing_rows_by_policy_router: dict[
-        str, dict[str, list[tuple[PRMetrics, TruthDiagnostics, bool]]]
-    ] = {
-        pid: {rid: [] for rid in ordered_router_ids}
-        for pid in prepared.truth_policies
-    }
-    queue_rows_by_router: dict[str, list[object]] = {rid: [] for rid in ordered_router_ids}
-    gate_rows: list[object] = []
-    router_feature_meta: dict[str, dict[str, object]] = {}
-    truth_status_counts: dict[str, int] = {
-        TruthStatus.observed.value: 0,
-        TruthStatus.no_post_cutoff_response.value: 0,
-        TruthStatus.unknown_due_to_ingestion_gap.value: 0,
-        TruthStatus.policy_unavailable.value: 0,
-    }
-    truth_status_counts_by_policy: dict[str, dict[str, int]] = {
-        pid: {
-            TruthStatus.observed.value: 0,
-            TruthStatus.no_post_cutoff_response.value: 0,
-            TruthStatus.unknown_due_to_ingestion_gap.value: 0,
-            TruthStatus.policy_unavailable.value: 0,
-        }
-        for pid in prepared.truth_policies
-    }
-
-    for pr_number in prepared.ordered_pr_numbers:
-        cutoff = prepared.cutoffs[pr_number]
+    routing_writer.write_pr_snapshot(snap)
 
-        snap = build_pr_snapshot_artifact(
-            repo=prepared.cfg.repo,
+    repo_profile_row: dict[str, object] | None = None
+    if repo_profile_settings is not None:
+        repo_profile_row = _build_repo_profile_for_pr(
+            prepared=prepared,
             pr_number=pr_number,
-            as_of=cutoff,
-            data_dir=prepared.cfg.data_dir,
+            cutoff=cutoff,
+            base_sha=snap.base_sha,
+            routing_writer=routing_writer,
+            settings=repo_profile_settings,
         )
-        routing_writer.write_pr_snapshot(snap)
 
-        repo_profile_row: dict[str, object] | None = None
-        if repo_profile_settings is not None:
-            repo_profile_row = _build_repo_profile_for_pr(
-                prepared=prepared,
-                pr_number=pr_number,
-                cutoff=cutoff,
-                base_sha=snap.base_sha,
-                routing_writer=routing_writer,
-                settings=repo_profile_settings,
-            )
-
-        inputs = build_pr_inputs_artifact(
-            repo=prepared.cfg.repo,
-            pr_number=pr_number,
-            as_of=cutoff,
-            data_dir=prepared.cfg.data_dir,
+    if repo_profile_row is not None:
+        inputs = inputs.model_copy(
+            update={
+                "repo_profile_path": repo_profile_row.get("profile_path"),
+                "repo_profile_qa": repo_profile_row.get("qa") or {},
+            }
         )
-        if repo_profile_row is not None:
-            inputs = inputs.model_copy(
-                update={
-                    "repo_profile_path": repo_profile_row.get("profile_path"),
-                    "repo_profile_qa": repo_profile_row.get("qa") or {},
-                }
-            )
-        routing_writer.write_pr_inputs(inputs)
-
-        truth_diags: dict[str, TruthDiagnostics] = {}
-        for policy_id, resolved in prepared.truth_policies.items():
-            diag = truth_with_policy(
-                policy=resolved.spec,
-                repo=prepared.cfg.repo,
-                pr_number=pr_number,
-                cutoff=cutoff,
-                data_dir=prepared.cfg.data_dir,
-                exclude_author=prepared.cfg.defaults.exclude_author,
-                exclude_bots=prepared.cfg.defaults.exclude_bots,
-            )
-            truth_diags[policy_id] = diag
-            truth_status_counts_by_policy[policy_id][diag.status.value] = (
-                truth_status_counts_by_policy[policy_id].get(diag.status.value, 0) + 1
-            )
+    routing_writer.write_pr_inputs(inputs)
 
-        truth_diag = truth_diags[prepared.truth_primary_policy]
-        truth_targets = (
-            [] if truth_diag.selected_login is None else [truth_diag.selected_login]
-        )
-        truth_status_counts[truth_diag.status.value] = (
-            truth_status_counts.get(truth_diag.status.value, 0) + 1
-        )
+    truth_diag = truth_diags[prepared.truth_primary_policy]
+    truth_targets = (
+        [] if truth_diag.selected_login is None else [truth_diag.selected_login]
+    )
 
-        prepared.artifact_store.write_artifact(
-            record=ArtifactRecord(
+    artifacts: list[tuple[ArtifactRecord, str]] = [
+        (
+            ArtifactRecord(
                 header=ArtifactHeader(
                     artifact_type="truth_label",
                     artifact_version="v2",
@@ -299,95 +323,100 @@ def per_pr_evaluate_stage(
                     },
                 },
             ),
-            cache_key=f"truth:{prepared.cfg.repo}:{pr_number}:{cutoff.isoformat()}:{prepared.truth_primary_policy}",
+            f"truth:{prepared.cfg.repo}:{pr_number}:{cutoff.isoformat()}:{prepared.truth_primary_policy}",
         )
+    ]
 
-        gate_metrics = per_pr_gate_metrics(
-            repo=prepared.cfg.repo,
-            pr_number=pr_number,
-            cutoff=cutoff,
-            data_dir=prepared.cfg.data_dir,
-        )
+    gate_metrics = per_pr_gate_metrics(
+        repo=prepared.cfg.repo,
+        pr_number=pr_number,
+        cutoff=cutoff,
+        data_dir=prepared.cfg.data_dir,
+    )
 
-        results_by_router: dict[str, tuple[object, object]] = {}
-        if prepared.cfg.defaults.execution_mode == "parallel" and len(ordered_router_ids) > 1:
-            workers = prepared.cfg.defaults.max_workers or len(ordered_router_ids)
-            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
-                futures = [
-                    pool.submit(
-                        _collect_router_run,
-                        prepared=prepared,
-                        router_id=router_id,
-                        pr_number=pr_number,
-                        cutoff=cutoff,
-                        inputs=inputs,
-                    )
-                    for router_id in ordered_router_ids
-                ]
-                for fut in futures:
-                    router_id, result, router = fut.result()
-                    results_by_router[router_id] = (result, router)
-        else:
-            for router_id in ordered_router_ids:
-                _, result, router = _collect_router_run(
+    # Composite routers share baseline results for this PR through the context.
+    routing_context = RoutingContext(
+        repo=prepared.cfg.repo, pr_number=pr_number, as_of=cutoff
+    )
+    results_by_router: dict[str, tuple[object, object]] = {}
+    if prepared.cfg.defaults.execution_mode == "parallel" and len(ordered_router_ids) > 1:
+        workers = prepared.cfg.defaults.max_workers or len(ordered_router_ids)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [
+                pool.submit(
+                    _collect_router_run,
                     prepared=prepared,
                     router_id=router_id,
                     pr_number=pr_number,
                     cutoff=cutoff,
                     inputs=inputs,
+                    routing_context=routing_context,
                 )
+                for router_id in ordered_router_ids
+            ]
+            for fut in futures:
+                router_id, result, router = fut.result()
                 results_by_router[router_id] = (result, router)
-
-        per_router: dict[str, object] = {}
+    else:
         for router_id in ordered_router_ids:
-            result, router = results_by_router[router_id]
-            feature_meta: dict[str, object] = {}
+            _, result, router = _collect_router_run(
+                prepared=prepared,
+                router_id=router_id,
+                pr_number=pr_number,
+                cutoff=cutoff,
+                inputs=inputs,
+                routing_context=routing_context,
+            )
+            results_by_router[router_id] = (result, router)
 
-            predictor = getattr(router, "predictor", None)
-            if isinstance(predictor, PipelinePredictor) and predictor.last_features is not None:
-                routing_writer.write_features(
-                    pr_number=pr_number,
-                    router_id=router_id,
-                    features=predictor.last_features,
-                )
-                raw_meta = predictor.last_features.get("meta")
-                if isinstance(raw_meta, dict):
-                    for k in ("candidate_gen_version", "task_policy", "feature_registry"):
-                        if k in raw_meta:
-                            feature_meta[k] = raw_meta[k]
-                if "feature_version" in predictor.last_features:
-                    feature_meta["feature_version"] = predictor.last_features[
-                        "feature_version"
-                    ]
-
-            router_provenance = getattr(router, "provenance", None)
-            if isinstance(router_provenance, dict):
-                feature_meta["router_provenance"] = router_provenance
-                if router_id not in router_feature_meta:
-                    router_feature_meta[router_id] = dict(feature_meta)
-
-            llm_steps = getattr(router, "last_llm_steps", None)
-            if isinstance(llm_steps, dict):
-                for step in sorted(llm_steps.keys(), key=str.lower):
-                    payload = llm_steps.get(step)
-                    if isinstance(payload, dict):
-                        routing_writer.write_llm_step(
-                            pr_number=pr_number,
-                            router_id=router_id,
-                            step=str(step),
-                            payload=payload,
-                        )
-            llm_provenance = getattr(router, "last_provenance", None)
-            if isinstance(llm_provenance, dict):
-                feature_meta["llm_provenance"] = llm_provenance
-            if feature_meta:
-                router_feature_meta[router_id] = dict(feature_meta)
-
-            routing_writer.write_route_result(
-                RouteArtifact(router_id=router_id, result=result, meta=feature_meta)
+    routers: list[_RouterOutcome] = []
+    per_router: dict[str, object] = {}
+    for router_id in ordered_router_ids:
+        result, router = results_by_router[router_id]
+        feature_meta: dict[str, object] = {}
+
+        predictor = getattr(router, "predictor", None)
+        if isinstance(predictor, PipelinePredictor) and predictor.last_features is not None:
+            routing_writer.write_features(
+                pr_number=pr_number,
+                router_id=router_id,
+                features=predictor.last_features,
             )
-            prepared.artifact_store.write_artifact(
-                record=ArtifactRecord(
+            raw_meta = predictor.last_features.get("meta")
+            if isinstance(raw_meta, dict):
+                for k in ("candidate_gen_version", "task_policy", "feature_registry"):
+                    if k in raw_meta:
+                        feature_meta[k] = raw_meta[k]
+            if "feature_version" in predictor.last_features:
+                feature_meta["feature_version"] = predictor.last_features[
+                    "feature_version"
+                ]
+
+        router_provenance = getattr(router, "provenance", None)
+        if isinstance(router_provenance, dict):
+            feature_meta["router_provenance"] = router_provenance
+
+        llm_steps = getattr(router, "last_llm_steps", None)
+        if isinstance(llm_steps, dict):
+            for step in sorted(llm_steps.keys(), key=str.lower):
+                payload = llm_steps.get(step)
+                if isinstance(payload, dict):
+                    routing_writer.write_llm_step(
+                        pr_number=pr_number,
+                        router_id=router_id,
+                        step=str(step),
+                        payload=payload,
+                    )
+        llm_provenance = getattr(router, "last_provenance", None)
+        if isinstance(llm_provenance, dict):
+            feature_meta["llm_provenance"] = llm_provenance
+
+        routing_writer.write_route_result(
+            RouteArtifact(router_id=router_id, result=result, meta=feature_meta)
+        )
+        artifacts.append(
+            (
+                ArtifactRecord(
                     header=ArtifactHeader(
                         artifact_type="route_result",
                         artifact_version="v2",
@@ -414,103 +443,361 @@ def per_pr_evaluate_stage(
                         "meta": feature_meta,
                     },
                 ),
-                cache_key=f"route:{router_id}:{prepared.cfg.repo}:{pr_number}:{cutoff.isoformat()}",
+                f"route:{router_id}:{prepared.cfg.repo}:{pr_number}:{cutoff.isoformat()}",
             )
+        )
 
-            pr_metrics_primary = per_pr_metrics(
+        pr_metrics_primary = per_pr_metrics(
+            result=result,
+            truth=TruthLabel(
+                repo=prepared.cfg.repo,
+                pr_number=pr_number,
+                cutoff=cutoff,
+                targets=truth_targets,
+            ),
+        )
+        pr_metrics_by_policy: dict[str, PRMetrics] = {}
+        for policy_id, diag in truth_diags.items():
+            targets = [] if diag.selected_login is None else [diag.selected_login]
+            pr_metrics_by_policy[policy_id] = per_pr_metrics(
                 result=result,
                 truth=TruthLabel(
                     repo=prepared.cfg.repo,
                     pr_number=pr_number,
                     cutoff=cutoff,
-                    targets=truth_targets,
+                    targets=targets,
                 ),
             )
-            pr_metrics_by_policy: dict[str, PRMetrics] = {}
-            for policy_id, diag in truth_diags.items():
-                targets = [] if diag.selected_login is None else [diag.selected_login]
-                pr_metrics_by_policy[policy_id] = per_pr_metrics(
-                    result=result,
-                    truth=TruthLabel(
-                        repo=prepared.cfg.repo,
-                        pr_number=pr_number,
-                        cutoff=cutoff,
-                        targets=targets,
-                    ),
-                )
-            queue_metrics = per_pr_queue_metrics(
-                result=result,
+        queue_metrics = per_pr_queue_metrics(
+            result=result,
+            router_id=router_id,
+            cutoff=cutoff,
+            data_dir=prepared.cfg.data_dir,
+            include_ttfc=False,
+        )
+
+        routers.append(
+            _RouterOutcome(
                 router_id=router_id,
-                cutoff=cutoff,
-                data_dir=prepared.cfg.data_dir,
-                include_ttfc=False,
+                has_candidates=bool(result.candidates),
+                feature_meta=feature_meta,
+                metrics_primary=pr_metrics_primary,
+                metrics_by_policy=pr_metrics_by_policy,
+                queue_metrics=queue_metrics,
             )
+        )
+        per_router[router_id] = {
+            "route_result": result.model_dump(mode="json"),
+            "feature_meta": feature_meta,
+            "routing_agreement": pr_metrics_primary.model_dump(mode="json"),
+            "routing_agreement_by_policy": {
+                pid: pr_metrics_by_policy[pid].model_dump(mode="json")
+                for pid in prepared.truth_policies
+            },
+            "queue": queue_metrics.model_dump(mode="json"),
+        }
 
-            routing_rows_by_router[router_id].append(pr_metrics_primary)
-            if truth_diag.status != TruthStatus.unknown_due_to_ingestion_gap:
-                routing_rows_known_by_router[router_id].append(pr_metrics_primary)
-            for policy_id, diag in truth_diags.items():
-                routing_rows_by_policy_router[policy_id][router_id].append(
-                    (
-                        pr_metrics_by_policy[policy_id],
-                        diag,
-                        bool(result.candidates),
-                    )
-                )
-            queue_rows_by_router[router_id].append(queue_metrics)
-            per_router[router_id] = {
-                "route_result": result.model_dump(mode="json"),
-                "feature_meta": feature_meta,
-                "routing_agreement": pr_metrics_primary.model_dump(mode="json"),
-                "routing_agreement_by_policy": {
-                    pid: pr_metrics_by_policy[pid].model_dump(mode="json")
-                    for pid in prepared.truth_policies
-                },
-                "queue": queue_metrics.model_dump(mode="json"),
-            }
-
-        row: dict[str, object] = {
-            "repo": prepared.cfg.repo,
-            "run_id": prepared.cfg.run_id,
-            "pr_number": pr_number,
-            "cutoff": cutoff.isoformat(),
-            "truth_behavior": truth_targets,
-            "truth_status": truth_diag.status.value,
-            "truth_diagnostics": truth_diag.model_dump(mode="json"),
-            "truth": {
-                "version": "v1",
-                "primary_policy": prepared.truth_primary_policy,
-                "policies": {
-                    pid: {
-                        "targets": (
-                            []
-                            if truth_diags[pid].selected_login is None
-                            else [truth_diags[pid].selected_login]
-                        ),
-                        "status": truth_diags[pid].status.value,
-                        "diagnostics": truth_diags[pid].model_dump(mode="json"),
-                        "policy_hash": prepared.truth_policies[pid].policy_hash,
-                        "policy_source": prepared.truth_policies[pid].source,
-                        "policy_source_ref": prepared.truth_policies[pid].source_ref,
-                    }
-                    for pid in prepared.truth_policies
-                },
+    row: dict[str, object] = {
+        "repo": prepared.cfg.repo,
+        "run_id": prepared.cfg.run_id,
+        "pr_number": pr_number,
+        "cutoff": cutoff.isoformat(),
+        "truth_behavior": truth_targets,
+        "truth_status": truth_diag.status.value,
+        "truth_diagnostics": truth_diag.model_dump(mode="json"),
+        "truth": {
+            "version": "v1",
+            "primary_policy": prepared.truth_primary_policy,
+            "policies": {
+                pid: {
+                    "targets": (
+                        []
+                        if truth_diags[pid].selected_login is None
+                        else [truth_diags[pid].selected_login]
+                    ),
+                    "status": truth_diags[pid].status.value,
+                    "diagnostics": truth_diags[pid].model_dump(mode="json"),
+                    "policy_hash": prepared.truth_policies[pid].policy_hash,
+                    "policy_source": prepared.truth_policies[pid].source,
+                    "policy_source_ref": prepared.truth_policies[pid].source_ref,
+                }
+                for pid in prepared.truth_policies
             },
-            "gates": gate_metrics.model_dump(mode="json"),
-            "routers": per_router,
+        },
+        "gates": gate_metrics.model_dump(mode="json"),
+        "routers": per_router,
+    }
+    if repo_profile_row is not None:
+        row["repo_profile"] = repo_profile_row
+
+    return _PrOutcome(
+        pr_number=pr_number,
+        truth_diags=truth_diags,
+        artifacts=artifacts,
+        routers=routers,
+        gate_metrics=gate_metrics,
+        row=row,
+    )
+
+
+def _merge_pr_outcome(
+    *,
+    prepared: PreparedEvalStage,
+    stage: PerPrEvalStage,
+    outcome: _PrOutcome,
+    journal: PerPrJournal,
+) -> None:
+    for record, cache_key in outcome.artifacts:
+        prepared.artifact_store.write_artifact(record=record, cache_key=cache_key)
+    prepared.store.append_jsonl("per_pr.jsonl", outcome.row)
+    journal.record(pr_number=outcome.pr_number, outcome=outcome.journal_payload())
+    _accumulate_pr_outcome(prepared=prepared, stage=stage, outcome=outcome)
+
+
+def _accumulate_pr_outcome(
+    *,
+    prepared: PreparedEvalStage,
+    stage: PerPrEvalStage,
+    outcome: _PrOutcome,
+) -> None:
+    for policy_id, diag in outcome.truth_diags.items():
+        counts = stage.truth_status_counts_by_policy[policy_id]
+        counts[diag.status.value] = counts.get(diag.status.value, 0) + 1
+    truth_diag = outcome.truth_diags[prepared.truth_primary_policy]
+    stage.truth_status_counts[truth_diag.status.value] = (
+        stage.truth_status_counts.get(truth_diag.status.value, 0) + 1
+    )
+
+    for r in outcome.routers:
+        if r.feature_meta:
+            stage.router_feature_meta[r.router_id] = dict(r.feature_meta)
+        stage.routing_rows_by_router[r.router_id].append(r.metrics_primary)
+        if truth_diag.status != TruthStatus.unknown_due_to_ingestion_gap:
+            stage.routing_rows_known_by_router[r.router_id].append(r.metrics_primary)
+        for policy_id, diag in outcome.truth_diags.items():
+            stage.routing_rows_by_policy_router[policy_id][r.router_id].append(
+                (r.metrics_by_policy[policy_id], diag, r.has_candidates)
+            )
+        stage.queue_rows_by_router[r.router_id].append(r.queue_metrics)
+
+    stage.gate_rows.append(outcome.gate_metrics)
+
+
+def _empty_per_pr_stage(
+    *, prepared: PreparedEvalStage, ordered_router_ids: list[str]
+) -> PerPrEvalStage:
+    def status_counts() -> dict[str, int]:
+        return {
+            TruthStatus.observed.value: 0,
+            TruthStatus.no_post_cutoff_response.value: 0,
+            TruthStatus.unknown_due_to_ingestion_gap.value: 0,
+            TruthStatus.policy_unavailable.value: 0,
         }
-        if repo_profile_row is not None:
-            row["repo_profile"] = repo_profile_row
-        prepared.store.append_jsonl("per_pr.jsonl", row)
-        gate_rows.append(gate_metrics)
 
     return PerPrEvalStage(
-        routing_rows_by_router=routing_rows_by_router,
-        routing_rows_known_by_router=routing_rows_known_by_router,
-        routing_rows_by_policy_router=routing_rows_by_policy_router,
-        queue_rows_by_router=queue_rows_by_router,
-        gate_rows=gate_rows,
-        router_feature_meta=router_feature_meta,
-        truth_status_counts=truth_status_counts,
-        truth_status_counts_by_policy=truth_status_counts_by_policy,
+        routing_rows_by_router={rid: [] for rid in ordered_router_ids},
+        routing_rows_known_by_router={rid: [] for rid in ordered_router_ids},
+        routing_rows_by_policy_router={
+            pid: {rid: [] for rid in ordered_router_ids}
+            for pid in prepared.truth_policies
+        },
+        queue_rows_by_router={rid: [] for rid in ordered_router_ids},
+        gate_rows=[],
+        router_feature_meta={},
+        truth_status_counts=status_counts(),
+        truth_status_counts_by_policy={
+            pid: status_counts() for pid in prepared.truth_policies
+        },
+    )
+
+
+def _open_reader(prepared: PreparedEvalStage) -> HistoryReader:
+    # One strict reader serves snapshot/input reads for every PR evaluated here.
+    return HistoryReader(
+        repo_full_name=prepared.cfg.repo,
+        data_dir=prepared.cfg.data_dir,
+        strict_as_of=True,
+    )
+
+
+# Per-process state of a shard worker, set by `_init_shard_worker`.
+_SHARD_WORKER: (
+    tuple[PreparedEvalStage, ArtifactWriter, RepoProfileRunSettings | None, HistoryReader]
+    | None
+) = None
+
+
+def _init_shard_worker(
+    prepared: PreparedEvalStage,
+    repo_profile_settings: RepoProfileRunSettings | None,
+) -> None:
+    global _SHARD_WORKER
+    # Each worker loads its own routers (and so its own DB connections).
+    prepared = replace(
+        prepared,
+        routers_by_id=load_routers(
+            specs=prepared.specs, llm_mode=prepared.cfg.defaults.llm_mode
+        ),
+    )
+    routing_writer = ArtifactWriter(
+        repo=prepared.cfg.repo,
+        data_dir=prepared.cfg.data_dir,
+        run_id=prepared.cfg.run_id,
+    )
+    # The reader lives as long as the worker process.
+    _SHARD_WORKER = (
+        prepared,
+        routing_writer,
+        repo_profile_settings,
+        _open_reader(prepared),
+    )
+
+
+def _cohort_truth(
+    *, prepared: PreparedEvalStage, pr_numbers: list[int]
+) -> dict[int, dict[str, TruthDiagnostics]]:
+    return truth_with_policies_for_cohort(
+        policies={pid: r.spec for pid, r in prepared.truth_policies.items()},
+        repo=prepared.cfg.repo,
+        cutoffs={n: prepared.cutoffs[n] for n in pr_numbers},
+        data_dir=prepared.cfg.data_dir,
+        exclude_author=prepared.cfg.defaults.exclude_author,
+        exclude_bots=prepared.cfg.defaults.exclude_bots,
+    )
+
+
+def _evaluate_pr_in_shard(
+    pr_number: int, truth_diags: dict[str, TruthDiagnostics]
+) -> _PrOutcome:
+    assert _SHARD_WORKER is not None, "shard worker not initialized"
+    prepared, routing_writer, repo_profile_settings, reader = _SHARD_WORKER
+    return _evaluate_pr(
+        prepared=prepared,
+        pr_number=pr_number,
+        ordered_router_ids=_sorted_router_ids(prepared),
+        routing_writer=routing_writer,
+        repo_profile_settings=repo_profile_settings,
+        reader=reader,
+        truth_diags=truth_diags,
+    )
+
+
+def _close_routers(prepared: PreparedEvalStage) -> None:
+    # Routers may pool per-repo DB connections across PRs (feature extractors).
+    for router in prepared.routers_by_id.values():
+        close = getattr(router, "close", None)
+        if callable(close):
+            close()
+
+
+def _iter_local_outcomes(
+    *,
+    prepared: PreparedEvalStage,
+    pr_numbers: list[int],
+    ordered_router_ids: list[str],
+    repo_profile_settings: RepoProfileRunSettings | None,
+    truth: dict[int, dict[str, TruthDiagnostics]],
+) -> Iterator[_PrOutcome]:
+    routing_writer = ArtifactWriter(
+        repo=prepared.cfg.repo,
+        data_dir=prepared.cfg.data_dir,
+        run_id=prepared.cfg.run_id,
     )
+    try:
+        with _open_reader(prepared) as reader:
+            for pr_number in pr_numbers:
+                yield _evaluate_pr(
+                    prepared=prepared,
+                    pr_number=pr_number,
+                    ordered_router_ids=ordered_router_ids,
+                    routing_writer=routing_writer,
+                    repo_profile_settings=repo_profile_settings,
+                    reader=reader,
+                    truth_diags=truth[pr_number],
+                )
+    finally:
+        _close_routers(prepared)
+
+
+def _iter_sharded_outcomes(
+    *,
+    prepared: PreparedEvalStage,
+    pr_numbers: list[int],
+    repo_profile_settings: RepoProfileRunSettings | None,
+    truth: dict[int, dict[str, TruthDiagnostics]],
+) -> Iterator[_PrOutcome]:
+    workers = prepared.cfg.defaults.max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(pr_numbers)))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_shard_worker,
+        # Routers are rebuilt per worker rather than pickled.
+        initargs=(replace(prepared, routers_by_id={}), repo_profile_settings),
+    ) as pool:
+        # `map` yields in submission order, so outcomes merge in
+        # (cutoff, pr_number) order while later PRs are still running.
+        yield from pool.map(
+            _evaluate_pr_in_shard, pr_numbers, [truth[n] for n in pr_numbers]
+        )
+
+
+def per_pr_evaluate_stage(
+    *,
+    prepared: PreparedEvalStage,
+    repo_profile_settings: RepoProfileRunSettings | None,
+    resume: bool = False,
+) -> PerPrEvalStage:
+    """Evaluate every PR in cohort order and collect aggregate inputs.
+
+    Completed PRs are journaled in the run directory. With `resume=True`, PRs
+    already journaled by an interrupted run with the same fingerprint are
+    restored from the journal instead of being evaluated again.
+    """
+    ordered_router_ids = _sorted_router_ids(prepared)
+    stage = _empty_per_pr_stage(prepared=prepared, ordered_router_ids=ordered_router_ids)
+
+    journal = PerPrJournal(
+        run_dir=prepared.run_dir,
+        fingerprint=run_fingerprint(
+            prepared=prepared, repo_profile_settings=repo_profile_settings
+        ),
+    )
+    pending = list(prepared.ordered_pr_numbers)
+    if resume:
+        entries = journal.resume(ordered_pr_numbers=prepared.ordered_pr_numbers)
+        for entry in entries:
+            _accumulate_pr_outcome(
+                prepared=prepared,
+                stage=stage,
+                outcome=_PrOutcome.from_journal(
+                    pr_number=int(entry["pr_number"]),  # type: ignore[arg-type]
+                    payload=entry["outcome"],  # type: ignore[arg-type]
+                ),
+            )
+        pending = pending[len(entries) :]
+    else:
+        journal.start()
+
+    # Truth labels for the remaining cohort come from a few batched queries.
+    truth = _cohort_truth(prepared=prepared, pr_numbers=pending)
+
+    outcomes: Iterable[_PrOutcome]
+    if prepared.cfg.defaults.execution_mode == "sharded" and pending:
+        outcomes = _iter_sharded_outcomes(
+            prepared=prepared,
+            pr_numbers=pending,
+            repo_profile_settings=repo_profile_settings,
+            truth=truth,
+        )
+    else:
+        outcomes = _iter_local_outcomes(
+            prepared=prepared,
+            pr_numbers=pending,
+            ordered_router_ids=ordered_router_ids,
+            repo_profile_settings=repo_profile_settings,
+            truth=truth,
+        )
+
+    for outcome in outcomes:
+        _merge_pr_outcome(prepared=prepared, stage=stage, outcome=outcome, journal=journal)
+    return stage
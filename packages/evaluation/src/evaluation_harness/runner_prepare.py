@@ -86,6 +86,14 @@ def normalize_pr_cutoffs(
     return normalized, "provided"
 
 
+def load_routers(*, specs: list[RouterSpec], llm_mode: str) -> dict[str, object]:
+    routers_by_id = {router_id_for_spec(spec): load_router(spec) for spec in specs}
+    for router in routers_by_id.values():
+        if hasattr(router, "mode") and isinstance(getattr(router, "mode"), str):
+            setattr(router, "mode", str(llm_mode or "replay").strip().lower())
+    return routers_by_id
+
+
 def prepare_eval_stage(
     *,
     cfg: EvalRunConfig,
@@ -99,10 +107,7 @@ def prepare_eval_stage(
         router_config_path=router_config_path,
     )
     router_ids = [router_id_for_spec(s) for s in specs]
-    routers_by_id = {router_id_for_spec(spec): load_router(spec) for spec in specs}
-    for router in routers_by_id.values():
-        if hasattr(router, "mode") and isinstance(getattr(router, "mode"), str):
-            setattr(router, "mode", str(cfg.defaults.llm_mode or "replay").strip().lower())
+    routers_by_id = load_routers(specs=specs, llm_mode=cfg.defaults.llm_mode)
 
     def pkg_version(name: str) -> str | None:
         try:
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+from repo_routing.history.db import connect_history_db
 from repo_routing.paths import repo_db_path
 
 
@@ -22,8 +22,7 @@ def sample_pr_numbers_created_in_window(
     """Stable sampling for v0: deterministic created_at window slice."""
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
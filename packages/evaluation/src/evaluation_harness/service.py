@@ -26,6 +26,7 @@ def run(
     router_config_path: str | Path | None = None,
     repo_profile_settings: RepoProfileRunSettings | None = None,
     pr_cutoffs: dict[int | str, datetime] | None = None,
+    resume: bool = False,
 ) -> RunResult:
     return run_streaming_eval(
         cfg=cfg,
@@ -34,6 +35,7 @@ def run(
         router_config_path=router_config_path,
         repo_profile_settings=repo_profile_settings,
         pr_cutoffs=pr_cutoffs,
+        resume=resume,
     )
 
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Mapping
 
+from repo_routing.history.db import connect_history_db
 from repo_routing.paths import repo_db_path
 
 from .models import TruthDiagnostics, TruthStatus
@@ -92,6 +94,181 @@ def _truth_gap_resources(conn: sqlite3.Connection, *, repo_id: int) -> list[str]
     return [r for r in resources if r in relevant]
 
 
+_REVIEW_ROWS_SQL = """
+    select r.pull_request_id as pr_id,
+           r.user_id as user_id,
+           u.login as login,
+           u.type as type,
+           r.state as review_state,
+           r.submitted_at as ts,
+           r.id as event_id,
+           'review_submitted' as kind
+    from reviews r
+    join users u on u.id = r.user_id
+    where r.repo_id = ?
+      and r.pull_request_id in ({pr_ids})
+      and r.submitted_at is not null
+      and r.submitted_at > ?
+      and r.submitted_at <= ?
+      and u.login is not null
+"""
+
+_REVIEW_COMMENT_ROWS_SQL = """
+    select c.pull_request_id as pr_id,
+           c.user_id as user_id,
+           u.login as login,
+           u.type as type,
+           c.created_at as ts,
+           c.id as event_id,
+           'review_comment' as kind
+    from comments c
+    join users u on u.id = c.user_id
+    where c.repo_id = ?
+      and c.pull_request_id in ({pr_ids})
+      and c.review_id is not null
+      and c.created_at is not null
+      and c.created_at > ?
+      and c.created_at <= ?
+      and u.login is not null
+"""
+
+# Bound on PR ids per `in (...)` clause, below SQLite's host-parameter limit.
+_PR_ID_CHUNK = 500
+
+
+def _window_rows(
+    conn: sqlite3.Connection,
+    sql: str,
+    *,
+    repo_id: int,
+    pr_ids: list[int],
+    start_s: str,
+    end_s: str,
+) -> list[sqlite3.Row]:
+    out: list[sqlite3.Row] = []
+    for i in range(0, len(pr_ids), _PR_ID_CHUNK):
+        chunk = pr_ids[i : i + _PR_ID_CHUNK]
+        out.extend(
+            conn.execute(
+                sql.format(pr_ids=",".join("?" for _ in chunk)),
+                (repo_id, *chunk, start_s, end_s),
+            ).fetchall()
+        )
+    return out
+
+
+def _review_comment_window_rows(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    pr_ids: list[int],
+    start_s: str,
+    end_s: str,
+) -> list[sqlite3.Row]:
+    try:
+        return _window_rows(
+            conn,
+            _REVIEW_COMMENT_ROWS_SQL,
+            repo_id=repo_id,
+            pr_ids=pr_ids,
+            start_s=start_s,
+            end_s=end_s,
+        )
+    except sqlite3.OperationalError:
+        return []
+
+
+def _behavior_truth_from_rows(
+    *,
+    repo: str,
+    pr_number: int,
+    cutoff: datetime,
+    window_end: datetime,
+    author_id: object,
+    review_rows: list[sqlite3.Row],
+    review_comment_rows: list[sqlite3.Row],
+    horizon_max: datetime | None,
+    gap_resources: list[str],
+    exclude_author: bool,
+    exclude_bots: bool,
+    include_review_comments: bool,
+    review_states: set[str] | None,
+    policy_id: str,
+    policy_version: str,
+) -> TruthDiagnostics:
+    rows = sorted(
+        [*review_rows, *review_comment_rows],
+        key=lambda r: (str(r["ts"]), int(r["event_id"]), str(r["kind"])),
+    )
+
+    selected: str | None = None
+    selected_source: str | None = None
+    selected_event_id: int | None = None
+    eligible = 0
+    for r in rows:
+        if exclude_bots and (r["type"] == "Bot" or _is_bot_login(str(r["login"]))):
+            continue
+        if exclude_author and author_id is not None and r["user_id"] == author_id:
+            continue
+        if review_states is not None and str(r["kind"]) == "review_submitted":
+            state = str(r["review_state"] or "").upper()
+            if state not in review_states:
+                continue
+        eligible += 1
+        if selected is None:
+            selected = str(r["login"])
+            selected_source = str(r["kind"])
+            selected_event_id = int(r["event_id"])
+
+    horizon_complete = horizon_max is not None and horizon_max >= window_end
+    coverage_complete = bool(horizon_complete and not gap_resources)
+
+    notes: list[str] = []
+    if horizon_max is None:
+        notes.append("truth coverage horizon unavailable")
+    elif not horizon_complete:
+        notes.append("truth window extends beyond ingested horizon")
+    if gap_resources:
+        notes.append("ingestion gaps present for truth-related resources")
+    if review_states:
+        notes.append(
+            "review-state filter="
+            + ",".join(sorted({s.upper() for s in review_states}, key=str.lower))
+        )
+    if include_review_comments:
+        notes.append("truth scans review_submitted + review_comment")
+    else:
+        notes.append("truth scans review_submitted only")
+
+    if selected is not None:
+        status = TruthStatus.observed
+    elif coverage_complete:
+        status = TruthStatus.no_post_cutoff_response
+    else:
+        status = TruthStatus.unknown_due_to_ingestion_gap
+
+    return TruthDiagnostics(
+        repo=repo,
+        pr_number=pr_number,
+        cutoff=cutoff,
+        window_end=window_end,
+        status=status,
+        policy_id=policy_id,
+        policy_version=policy_version,
+        selected_login=selected,
+        selected_source=selected_source,
+        selected_event_id=selected_event_id,
+        include_review_comments=include_review_comments,
+        scanned_review_rows=len(review_rows),
+        scanned_review_comment_rows=len(review_comment_rows),
+        eligible_candidates=eligible,
+        coverage_complete=coverage_complete,
+        coverage_horizon_max=horizon_max,
+        gap_resources=list(gap_resources),
+        notes=notes,
+    )
+
+
 def behavior_truth_with_diagnostics(
     *,
     repo: str,
@@ -109,8 +286,7 @@ def behavior_truth_with_diagnostics(
     """Behavior truth with explicit coverage diagnostics."""
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -127,131 +303,44 @@ def behavior_truth_with_diagnostics(
             raise KeyError(f"pr not found: {repo}#{pr_number}")
 
         pr_id = int(pr["id"])
-        author_id = pr["user_id"]
-
-        cutoff_s = _dt_sql(cutoff)
         window_end = cutoff + window
+        cutoff_s = _dt_sql(cutoff)
         end_s = _dt_sql(window_end)
 
-        review_rows = conn.execute(
-            """
-            select r.user_id as user_id,
-                   u.login as login,
-                   u.type as type,
-                   r.state as review_state,
-                   r.submitted_at as ts,
-                   r.id as event_id,
-                   'review_submitted' as kind
-            from reviews r
-            join users u on u.id = r.user_id
-            where r.repo_id = ?
-              and r.pull_request_id = ?
-              and r.submitted_at is not null
-              and r.submitted_at > ?
-              and r.submitted_at <= ?
-              and u.login is not null
-            """,
-            (repo_id, pr_id, cutoff_s, end_s),
-        ).fetchall()
-
+        review_rows = _window_rows(
+            conn,
+            _REVIEW_ROWS_SQL,
+            repo_id=repo_id,
+            pr_ids=[pr_id],
+            start_s=cutoff_s,
+            end_s=end_s,
+        )
         review_comment_rows: list[sqlite3.Row] = []
         if include_review_comments:
-            try:
-                review_comment_rows = conn.execute(
-                    """
-                    select c.user_id as user_id,
-                           u.login as login,
-                           u.type as type,
-                           c.created_at as ts,
-                           c.id as event_id,
-                           'review_comment' as kind
-                    from comments c
-                    join users u on u.id = c.user_id
-                    where c.repo_id = ?
-                      and c.pull_request_id = ?
-                      and c.review_id is not null
-                      and c.created_at is not null
-                      and c.created_at > ?
-                      and c.created_at <= ?
-                      and u.login is not null
-                    """,
-                    (repo_id, pr_id, cutoff_s, end_s),
-                ).fetchall()
-            except sqlite3.OperationalError:
-                review_comment_rows = []
-
-        rows = sorted(
-            [*review_rows, *review_comment_rows],
-            key=lambda r: (str(r["ts"]), int(r["event_id"]), str(r["kind"])),
-        )
-
-        selected: str | None = None
-        selected_source: str | None = None
-        selected_event_id: int | None = None
-        eligible = 0
-        for r in rows:
-            if exclude_bots and (r["type"] == "Bot" or _is_bot_login(str(r["login"]))):
-                continue
-            if exclude_author and author_id is not None and r["user_id"] == author_id:
-                continue
-            if review_states is not None and str(r["kind"]) == "review_submitted":
-                state = str(r["review_state"] or "").upper()
-                if state not in review_states:
-                    continue
-            eligible += 1
-            if selected is None:
-                selected = str(r["login"])
-                selected_source = str(r["kind"])
-                selected_event_id = int(r["event_id"])
-
-        horizon_max = _truth_coverage_horizon_max(conn, repo_id=repo_id)
-        horizon_complete = horizon_max is not None and horizon_max >= window_end
-        gap_resources = _truth_gap_resources(conn, repo_id=repo_id)
-        coverage_complete = bool(horizon_complete and not gap_resources)
-
-        notes: list[str] = []
-        if horizon_max is None:
-            notes.append("truth coverage horizon unavailable")
-        elif not horizon_complete:
-            notes.append("truth window extends beyond ingested horizon")
-        if gap_resources:
-            notes.append("ingestion gaps present for truth-related resources")
-        if review_states:
-            notes.append(
-                "review-state filter="
-                + ",".join(sorted({s.upper() for s in review_states}, key=str.lower))
+            review_comment_rows = _review_comment_window_rows(
+                conn,
+                repo_id=repo_id,
+                pr_ids=[pr_id],
+                start_s=cutoff_s,
+                end_s=end_s,
             )
-        if include_review_comments:
-            notes.append("truth scans review_submitted + review_comment")
-        else:
-            notes.append("truth scans review_submitted only")
-
-        if selected is not None:
-            status = TruthStatus.observed
-        elif coverage_complete:
-            status = TruthStatus.no_post_cutoff_response
-        else:
-            status = TruthStatus.unknown_due_to_ingestion_gap
-
-        return TruthDiagnostics(
+
+        return _behavior_truth_from_rows(
             repo=repo,
             pr_number=pr_number,
             cutoff=cutoff,
             window_end=window_end,
-            status=status,
+            author_id=pr["user_id"],
+            review_rows=review_rows,
+            review_comment_rows=review_comment_rows,
+            horizon_max=_truth_coverage_horizon_max(conn, repo_id=repo_id),
+            gap_resources=_truth_gap_resources(conn, repo_id=repo_id),
+            exclude_author=exclude_author,
+            exclude_bots=exclude_bots,
+            include_review_comments=include_review_comments,
+            review_states=review_states,
             policy_id=policy_id,
             policy_version=policy_version,
-            selected_login=selected,
-            selected_source=selected_source,
-            selected_event_id=selected_event_id,
-            include_review_comments=include_review_comments,
-            scanned_review_rows=len(review_rows),
-            scanned_review_comment_rows=len(review_comment_rows),
-            eligible_candidates=eligible,
-            coverage_complete=coverage_complete,
-            coverage_horizon_max=horizon_max,
-            gap_resources=gap_resources,
-            notes=notes,
         )
     finally:
         conn.close()
@@ -281,55 +370,23 @@ def behavior_truth_first_eligible_review(
     return diagnostics.selected_login
 
 
-def truth_with_policy(
-    *,
-    policy: TruthPolicySpec,
-    repo: str,
-    pr_number: int,
-    cutoff: datetime,
-    data_dir: str | Path = "data",
-    exclude_author: bool = True,
-    exclude_bots: bool = True,
-) -> TruthDiagnostics:
-    window = timedelta(seconds=policy.window_seconds)
-    policy_id = policy.id
-
-    if policy_id == "first_response_v1":
-        return behavior_truth_with_diagnostics(
-            repo=repo,
-            pr_number=pr_number,
-            cutoff=cutoff,
-            data_dir=data_dir,
-            exclude_author=exclude_author,
-            exclude_bots=exclude_bots,
-            window=window,
-            include_review_comments=True,
-            policy_id=policy.id,
-            policy_version=policy.version,
-        )
+# Behavior-backed policies: (include_review_comments, review_states).
+_BEHAVIOR_POLICIES: dict[str, tuple[bool, set[str] | None]] = {
+    "first_response_v1": (True, None),
+    "first_approval_v1": (False, {"APPROVED"}),
+}
 
-    if policy_id == "first_approval_v1":
-        return behavior_truth_with_diagnostics(
-            repo=repo,
-            pr_number=pr_number,
-            cutoff=cutoff,
-            data_dir=data_dir,
-            exclude_author=exclude_author,
-            exclude_bots=exclude_bots,
-            window=window,
-            include_review_comments=False,
-            review_states={"APPROVED"},
-            policy_id=policy.id,
-            policy_version=policy.version,
-        )
 
+def _unavailable_truth(
+    *, policy: TruthPolicySpec, repo: str, pr_number: int, cutoff: datetime
+) -> TruthDiagnostics:
     # Stubbed readiness-gated policies remain unavailable until ingestion readiness
     # is explicitly implemented.
     return TruthDiagnostics(
         repo=repo,
         pr_number=pr_number,
         cutoff=cutoff,
-        window_end=cutoff + window,
+        window_end=cutoff + timedelta(seconds=policy.window_seconds),
         status=TruthStatus.policy_unavailable,
         policy_id=policy.id,
         policy_version=policy.version,
@@ -347,6 +404,165 @@ def truth_with_policy(
     )
 
 
+def truth_with_policy(
+    *,
+    policy: TruthPolicySpec,
+    repo: str,
+    pr_number: int,
+    cutoff: datetime,
+    data_dir: str | Path = "data",
+    exclude_author: bool = True,
+    exclude_bots: bool = True,
+) -> TruthDiagnostics:
+    behavior = _BEHAVIOR_POLICIES.get(policy.id)
+    if behavior is None:
+        return _unavailable_truth(
+            policy=policy, repo=repo, pr_number=pr_number, cutoff=cutoff
+        )
+
+    include_review_comments, review_states = behavior
+    return behavior_truth_with_diagnostics(
+        repo=repo,
+        pr_number=pr_number,
+        cutoff=cutoff,
+        data_dir=data_dir,
+        exclude_author=exclude_author,
+        exclude_bots=exclude_bots,
+        window=timedelta(seconds=policy.window_seconds),
+        include_review_comments=include_review_comments,
+        review_states=review_states,
+        policy_id=policy.id,
+        policy_version=policy.version,
+    )
+
+
+def truth_with_policies_for_cohort(
+    *,
+    policies: Mapping[str, TruthPolicySpec],
+    repo: str,
+    cutoffs: Mapping[int, datetime],
+    data_dir: str | Path = "data",
+    exclude_author: bool = True,
+    exclude_bots: bool = True,
+) -> dict[int, dict[str, TruthDiagnostics]]:
+    """`truth_with_policy` for every (PR, cutoff) and policy in one pass.
+
+    Post-cutoff reviews and review comments of the whole cohort are read with
+    one windowed query each, and the repo-wide coverage horizon and ingestion
+    gaps are read once. Returns diagnostics per PR number, per policy id (in
+    `policies` order), equal to calling `truth_with_policy` for each pair.
+    """
+    out: dict[int, dict[str, TruthDiagnostics]] = {n: {} for n in cutoffs}
+    behavior_ids = [pid for pid in policies if policies[pid].id in _BEHAVIOR_POLICIES]
+    if not cutoffs or not behavior_ids:
+        for pr_number, cutoff in cutoffs.items():
+            for pid, policy in policies.items():
+                out[pr_number][pid] = _unavailable_truth(
+                    policy=policy, repo=repo, pr_number=pr_number, cutoff=cutoff
+                )
+        return out
+
+    db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
+    conn = connect_history_db(db)
+    try:
+        row = conn.execute(
+            "select id from repos where full_name = ?", (repo,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"repo not found in db: {repo}")
+        repo_id = int(row["id"])
+
+        prs: dict[int, tuple[int, object]] = {}
+        numbers = list(cutoffs)
+        for i in range(0, len(numbers), _PR_ID_CHUNK):
+            chunk = numbers[i : i + _PR_ID_CHUNK]
+            for r in conn.execute(
+                f"""
+                select number, id, user_id from pull_requests
+                where repo_id = ? and number in ({",".join("?" for _ in chunk)})
+                """,
+                (repo_id, *chunk),
+            ):
+                prs[int(r["number"])] = (int(r["id"]), r["user_id"])
+        for pr_number in numbers:
+            if pr_number not in prs:
+                raise KeyError(f"pr not found: {repo}#{pr_number}")
+
+        max_window = max(
+            timedelta(seconds=policies[pid].window_seconds) for pid in behavior_ids
+        )
+        start_s = min(_dt_sql(c) for c in cutoffs.values())
+        end_s = max(_dt_sql(c + max_window) for c in cutoffs.values())
+        pr_ids = sorted({pr_id for pr_id, _ in prs.values()})
+
+        review_rows: dict[int, list[sqlite3.Row]] = {}
+        for r in _window_rows(
+            conn,
+            _REVIEW_ROWS_SQL,
+            repo_id=repo_id,
+            pr_ids=pr_ids,
+            start_s=start_s,
+            end_s=end_s,
+        ):
+            review_rows.setdefault(int(r["pr_id"]), []).append(r)
+        review_comment_rows: dict[int, list[sqlite3.Row]] = {}
+        if any(_BEHAVIOR_POLICIES[policies[pid].id][0] for pid in behavior_ids):
+            for r in _review_comment_window_rows(
+                conn,
+                repo_id=repo_id,
+                pr_ids=pr_ids,
+                start_s=start_s,
+                end_s=end_s,
+            ):
+                review_comment_rows.setdefault(int(r["pr_id"]), []).append(r)
+
+        horizon_max = _truth_coverage_horizon_max(conn, repo_id=repo_id)
+        gap_resources = _truth_gap_resources(conn, repo_id=repo_id)
+    finally:
+        conn.close()
+
+    for pr_number, cutoff in cutoffs.items():
+        pr_id, author_id = prs[pr_number]
+        cutoff_s = _dt_sql(cutoff)
+        for pid, policy in policies.items():
+            behavior = _BEHAVIOR_POLICIES.get(policy.id)
+            if behavior is None:
+                out[pr_number][pid] = _unavailable_truth(
+                    policy=policy, repo=repo, pr_number=pr_number, cutoff=cutoff
+                )
+                continue
+            include_review_comments, review_states = behavior
+            window_end = cutoff + timedelta(seconds=policy.window_seconds)
+            end_s = _dt_sql(window_end)
+
+            def in_window(rows: list[sqlite3.Row]) -> list[sqlite3.Row]:
+                # Same TEXT comparison the per-PR query applies in SQL.
+                return [r for r in rows if cutoff_s < str(r["ts"]) <= end_s]
+
+            out[pr_number][pid] = _behavior_truth_from_rows(
+                repo=repo,
+                pr_number=pr_number,
+                cutoff=cutoff,
+                window_end=window_end,
+                author_id=author_id,
+                review_rows=in_window(review_rows.get(pr_id, [])),
+                review_comment_rows=(
+                    in_window(review_comment_rows.get(pr_id, []))
+                    if include_review_comments
+                    else []
+                ),
+                horizon_max=horizon_max,
+                gap_resources=gap_resources,
+                exclude_author=exclude_author,
+                exclude_bots=exclude_bots,
+                include_review_comments=include_review_comments,
+                review_states=review_states,
+                policy_id=policy.id,
+                policy_version=policy.version,
+            )
+    return out
+
+
 def intent_truth_from_review_requests(
     *,
     repo: str,
@@ -365,8 +581,7 @@ def intent_truth_from_review_requests(
     start = cutoff - window
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         pr_row = conn.execute(
             """
@@ -235,3 +235,80 @@ def build_min_db(
         reviewer_login="bob",
         created_at=created_at,
     )
+
+
+def add_min_pr(
+    db: MinDb,
+    *,
+    pr_number: int,
+    created_at: datetime,
+    body: str = "Please review @bob",
+    reviewer_id: int = 11,
+    review_after: timedelta = timedelta(hours=1),
+    comment_after: timedelta | None = timedelta(minutes=30),
+) -> None:
+    """Add another open, non-draft PR to a `build_min_db` database.
+
+    Row ids are derived from `pr_number`, so numbers must differ from the
+    base PR's. The PR gets a review request for `reviewer_id`, an approval
+    `review_after` its creation and optionally a review comment.
+    """
+    base = pr_number * 1000
+    pr_id = base + 100
+    created = created_at.replace(tzinfo=None).isoformat(sep=" ")
+
+    conn = sqlite3.connect(str(db.db_path))
+    try:
+        c = conn.cursor()
+        c.execute(
+            "insert into pull_requests (id, repo_id, issue_id, number, user_id, created_at, title, body, base_sha, base_ref) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (pr_id, 1, None, pr_number, 10, created, f"Test PR {pr_number}", body, "deadbeef" * 5, "main"),
+        )
+        events = [
+            (base + 200, "pull_request.synchronize", None, None, None, f"e:head:{pr_number}"),
+            (base + 201, "pull_request.review_requested", "user", reviewer_id, None, f"e:rr:{pr_number}"),
+            (base + 202, "pull_request.draft.set", None, None, '{"is_draft": false}', f"e:draft0:{pr_number}"),
+        ]
+        for event_id, event_type, object_type, object_id, payload, key in events:
+            c.execute(
+                "insert into events (id, repo_id, occurred_at, actor_id, subject_type, subject_id, event_type, object_type, object_id, commit_sha, payload_json, event_key) values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (event_id, 1, created, 10, "pull_request", pr_id, event_type, object_type, object_id, None, payload, key),
+            )
+        c.execute(
+            "insert into pull_request_head_intervals (id, pull_request_id, head_sha, head_ref, start_event_id, end_event_id) values (?, ?, ?, ?, ?, ?)",
+            (base + 300, pr_id, "cafebabe" * 5, "main", base + 200, None),
+        )
+        c.execute(
+            "insert into pull_request_draft_intervals (id, pull_request_id, is_draft, start_event_id, end_event_id) values (?, ?, ?, ?, ?)",
+            (base + 310, pr_id, 0, base + 202, None),
+        )
+        c.execute(
+            "insert into pull_request_review_request_intervals (id, pull_request_id, reviewer_type, reviewer_id, start_event_id, end_event_id) values (?, ?, ?, ?, ?, ?)",
+            (base + 400, pr_id, "User", reviewer_id, base + 201, None),
+        )
+        c.execute(
+            "insert into reviews (id, repo_id, pull_request_id, user_id, state, submitted_at) values (?, ?, ?, ?, ?, ?)",
+            (
+                base + 500,
+                1,
+                pr_id,
+                reviewer_id,
+                "APPROVED",
+                (created_at + review_after).replace(tzinfo=None).isoformat(sep=" "),
+            ),
+        )
+        if comment_after is not None:
+            c.execute(
+                "insert into comments (id, repo_id, pull_request_id, review_id, user_id, created_at) values (?, ?, ?, ?, ?, ?)",
+                (
+                    base + 600,
+                    1,
+                    pr_id,
+                    base + 500,
+                    reviewer_id,
+                    (created_at + comment_after).replace(tzinfo=None).isoformat(sep=" "),
+                ),
+            )
+        conn.commit()
+    finally:
+        conn.close()
@@ -35,3 +35,22 @@ def test_runner_import_path_router_writes_route_and_features(tmp_path) -> None:
 
     manifest = json.loads((res.run_dir / "manifest.json").read_text(encoding="utf-8"))
     assert manifest["router_feature_meta"][rid]["candidate_gen_version"] == "cg.v1"
+
+
+def test_runner_closes_routers_when_the_run_ends(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from repo_routing.registry import PredictorRouterAdapter
+
+    closed: list[object] = []
+    monkeypatch.setattr(PredictorRouterAdapter, "close", lambda self: closed.append(self))
+
+    db = build_min_db(tmp_path=tmp_path)
+    cfg = EvalRunConfig(repo=db.repo, data_dir=str(db.data_dir), run_id="run-close")
+    spec = RouterSpec(
+        type="import_path",
+        name="example-llm",
+        import_path="repo_routing.examples.llm_router_example:create_router",
+    )
+
+    run_streaming_eval(cfg=cfg, pr_numbers=[db.pr_number], router_specs=[spec])
+
+    assert len(closed) == 1
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 
 from evaluation_harness.config import EvalDefaults, EvalRunConfig
 from evaluation_harness.runner import run_streaming_eval
 from repo_routing.registry import RouterSpec
 
-from .fixtures.build_min_db import build_min_db
+from .fixtures.build_min_db import add_min_pr, build_min_db
 
 
 def _strip_volatile(payload: object) -> object:
@@ -59,3 +60,49 @@ def test_parallel_mode_matches_sequential_outputs(tmp_path) -> None:  # type: ig
         if line.strip()
     ]
     assert _strip_volatile(seq_per_pr) == _strip_volatile(par_per_pr)
+
+
+def test_sharded_mode_matches_sequential_outputs(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    db = build_min_db(tmp_path=tmp_path)
+    # Staggered cutoffs so each PR sees a different slice of history, and
+    # more PRs than workers so shards hold several PRs out of order.
+    extra = {
+        2: ("2024-01-03T09:00:00+00:00", "cc @alice and @bob"),
+        3: ("2024-01-05T16:30:00+00:00", "no mentions"),
+        4: ("2024-01-08T12:15:00+00:00", "Please review @bob"),
+    }
+    for number, (created_at, body) in extra.items():
+        add_min_pr(
+            db,
+            pr_number=number,
+            created_at=datetime.fromisoformat(created_at),
+            body=body,
+        )
+    pr_numbers = [4, db.pr_number, 3, 2]
+    specs = [
+        RouterSpec(type="builtin", name="mentions"),
+        RouterSpec(type="builtin", name="popularity"),
+    ]
+    runs = {}
+    for mode in ("sequential", "sharded"):
+        cfg = EvalRunConfig(
+            repo=db.repo,
+            data_dir=str(db.data_dir),
+            run_id=f"run-{mode}",
+            defaults=EvalDefaults(execution_mode=mode, max_workers=2),
+        )
+        runs[mode] = run_streaming_eval(cfg=cfg, pr_numbers=pr_numbers, router_specs=specs)
+
+    def read(mode: str, name: str) -> object:
+        text = (runs[mode].run_dir / name).read_text(encoding="utf-8")
+        if name.endswith(".jsonl"):
+            return [json.loads(line) for line in text.splitlines() if line.strip()]
+        return json.loads(text)
+
+    per_pr = read("sequential", "per_pr.jsonl")
+    assert isinstance(per_pr, list)
+    assert len(per_pr) == len(pr_numbers)
+    assert len({row["cutoff"] for row in per_pr}) == len(pr_numbers)
+
+    for name in ("report.json", "per_pr.jsonl", "artifact_index.jsonl"):
+        assert _strip_volatile(read("sequential", name)) == _strip_volatile(read("sharded", name))
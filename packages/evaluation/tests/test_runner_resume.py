@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from evaluation_harness import runner_per_pr
+from evaluation_harness.config import EvalDefaults, EvalRunConfig
+from evaluation_harness.runner import run_streaming_eval
+from evaluation_harness.runner_journal import JOURNAL_FILENAME
+from repo_routing.registry import RouterSpec
+
+from .fixtures.build_min_db import build_min_db
+
+
+def _strip_volatile(payload: object) -> object:
+    if isinstance(payload, dict):
+        return {
+            k: _strip_volatile(v)
+            for k, v in payload.items()
+            if k not in {"run_id", "generated_at"}
+        }
+    if isinstance(payload, list):
+        return [_strip_volatile(x) for x in payload]
+    return payload
+
+
+def _read(run_dir, name: str) -> object:  # type: ignore[no-untyped-def]
+    text = (run_dir / name).read_text(encoding="utf-8")
+    if name.endswith(".jsonl"):
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return json.loads(text)
+
+
+def test_resume_restores_journaled_prs_and_rolls_back_partial_output(
+    tmp_path, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    db = build_min_db(tmp_path=tmp_path)
+    specs = [
+        RouterSpec(type="builtin", name="mentions"),
+        RouterSpec(type="builtin", name="popularity"),
+    ]
+
+    def cfg(run_id: str, **defaults: object) -> EvalRunConfig:
+        return EvalRunConfig(
+            repo=db.repo,
+            data_dir=str(db.data_dir),
+            run_id=run_id,
+            defaults=EvalDefaults(**defaults),
+        )
+
+    full = run_streaming_eval(cfg=cfg("run-full"), pr_numbers=[db.pr_number], router_specs=specs)
+    resumed = run_streaming_eval(cfg=cfg("run-resumed"), pr_numbers=[db.pr_number], router_specs=specs)
+
+    # Simulate a crash after the PR was journaled: the report is missing and a
+    # later PR left half-written rows behind.
+    (resumed.run_dir / "report.json").unlink()
+    with (resumed.run_dir / "per_pr.jsonl").open("a", encoding="utf-8") as f:
+        f.write('{"pr_number": 99')
+    with (resumed.run_dir / JOURNAL_FILENAME).open("a", encoding="utf-8") as f:
+        f.write('{"pr_number": 99')
+
+    def fail(**kwargs: object) -> object:
+        raise AssertionError("journaled PR was re-evaluated")
+
+    monkeypatch.setattr(runner_per_pr, "_evaluate_pr", fail)
+    run_streaming_eval(
+        cfg=cfg("run-resumed", execution_mode="parallel"),
+        pr_numbers=[db.pr_number],
+        router_specs=specs,
+        resume=True,
+    )
+    for name in ("report.json", "per_pr.jsonl", "artifact_index.jsonl"):
+        assert _strip_volatile(_read(full.run_dir, name)) == _strip_volatile(
+            _read(resumed.run_dir, name)
+        )
+
+    with pytest.raises(RuntimeError, match="cannot resume"):
+        run_streaming_eval(
+            cfg=cfg("run-resumed", top_k=3),
+            pr_numbers=[db.pr_number],
+            router_specs=specs,
+            resume=True,
+        )
+
+
+def test_resume_without_journal_entries_reevaluates_from_scratch(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    db = build_min_db(tmp_path=tmp_path)
+    specs = [RouterSpec(type="builtin", name="mentions")]
+    cfg = EvalRunConfig(repo=db.repo, data_dir=str(db.data_dir), run_id="run-1")
+
+    first = run_streaming_eval(cfg=cfg, pr_numbers=[db.pr_number], router_specs=specs)
+    expected = _read(first.run_dir, "per_pr.jsonl")
+
+    # Keep only the header: the PR's rows must be dropped and rewritten once.
+    journal = first.run_dir / JOURNAL_FILENAME
+    journal.write_text(journal.read_text(encoding="utf-8").splitlines()[0] + "\n", encoding="utf-8")
+    run_streaming_eval(cfg=cfg, pr_numbers=[db.pr_number], router_specs=specs, resume=True)
+
+    assert _read(first.run_dir, "per_pr.jsonl") == expected
+    assert len(_read(first.run_dir, JOURNAL_FILENAME)) == 2  # type: ignore[arg-type]
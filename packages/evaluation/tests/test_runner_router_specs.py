@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 
-from evaluation_harness.config import EvalRunConfig
+from evaluation_harness.config import EvalDefaults, EvalRunConfig
 from evaluation_harness.runner import run_streaming_eval
+from repo_routing.artifacts.writer import pr_created_at
+from repo_routing.boundary.cutoffs import boundary_cutoff_key
+from repo_routing.boundary.pipeline import write_boundary_model_artifacts_for_cutoffs
 from repo_routing.registry import RouterSpec
 
 from .fixtures.build_min_db import build_min_db
@@ -28,3 +32,75 @@ def test_runner_writes_router_artifacts_and_routers_key(tmp_path) -> None:  # ty
     row = json.loads(per_pr[0])
     assert "routers" in row
     assert "mentions" in row["routers"]
+
+
+
+def test_runner_threads_boundary_cutoff_policy_into_inputs(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    # Mid-day creation so the daily bucket differs from the exact cutoff.
+    db = build_min_db(
+        tmp_path=tmp_path,
+        created_at=datetime.fromisoformat("2024-01-01T13:45:00+00:00"),
+    )
+    cutoff = pr_created_at(repo=db.repo, data_dir=db.data_dir, pr_number=db.pr_number)
+    assert cutoff is not None
+    artifacts = write_boundary_model_artifacts_for_cutoffs(
+        repo_full_name=db.repo,
+        cutoffs_utc=[cutoff],
+        data_dir=db.data_dir,
+        cutoff_policy="daily",
+    )
+    cfg = EvalRunConfig(
+        repo=db.repo,
+        data_dir=str(db.data_dir),
+        run_id="run-boundary-policy",
+        defaults=EvalDefaults(boundary_cutoff_policy="daily"),
+    )
+
+    res = run_streaming_eval(
+        cfg=cfg,
+        pr_numbers=[db.pr_number],
+        router_specs=[RouterSpec(type="builtin", name="mentions")],
+    )
+
+    pr_dir = res.run_dir / "prs" / str(db.pr_number)
+    inputs = json.loads((pr_dir / "inputs.json").read_text(encoding="utf-8"))
+    assert inputs["boundary_cutoff_key"] == boundary_cutoff_key(cutoff, "daily")
+    assert inputs["boundary_cutoff_key"] in artifacts
+
+
+def test_runner_routes_shared_baselines_once_per_pr(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from repo_routing.router.baselines.mentions import MentionsRouter
+    from repo_routing.router.baselines.popularity import PopularityRouter
+
+    calls: list[str] = []
+
+    def _counting(cls, name):  # type: ignore[no-untyped-def]
+        original = cls.route
+
+        def route(self, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(name)
+            return original(self, **kwargs)
+
+        monkeypatch.setattr(cls, "route", route)
+
+    _counting(MentionsRouter, "mentions")
+    _counting(PopularityRouter, "popularity")
+
+    db = build_min_db(tmp_path=tmp_path)
+    cfg = EvalRunConfig(repo=db.repo, data_dir=str(db.data_dir), run_id="run-shared")
+    res = run_streaming_eval(
+        cfg=cfg,
+        pr_numbers=[db.pr_number],
+        router_specs=[
+            RouterSpec(type="builtin", name=name)
+            for name in ("mentions", "popularity", "union", "hybrid_ranker")
+        ],
+    )
+
+    assert sorted(calls) == ["mentions", "popularity"]
+    route = json.loads(
+        (res.run_dir / "prs" / str(db.pr_number) / "routes" / "mentions.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert route["result"]["top_k"] == cfg.defaults.top_k
@@ -4,9 +4,14 @@ import sqlite3
 from datetime import timedelta
 
 from evaluation_harness.models import TruthStatus
-from evaluation_harness.truth import behavior_truth_with_diagnostics
+from evaluation_harness.truth import (
+    behavior_truth_with_diagnostics,
+    truth_with_policies_for_cohort,
+    truth_with_policy,
+)
+from evaluation_harness.truth_policy import builtin_truth_policy_specs
 
-from .fixtures.build_min_db import build_min_db
+from .fixtures.build_min_db import add_min_pr, build_min_db
 
 
 def test_truth_diagnostics_observed_when_response_found(tmp_path) -> None:  # type: ignore[no-untyped-def]
@@ -99,3 +104,66 @@ def test_truth_diagnostics_unknown_when_truth_related_gap_exists(tmp_path) -> No
 
     assert diag.status == TruthStatus.unknown_due_to_ingestion_gap
     assert "reviews" in diag.gap_resources
+
+
+def test_cohort_truth_matches_per_pr_truth_for_every_policy(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    db = build_min_db(tmp_path=tmp_path)
+    # One cohort, staggered cutoffs: the cohort reads rows between the
+    # earliest cutoff and the latest cutoff + longest window, so each PR's
+    # rows must still be clipped to its own (cutoff, cutoff + window].
+    base = db.created_at
+    add_min_pr(  # responses before its cutoff and past the 1h windows
+        db,
+        pr_number=2,
+        created_at=base + timedelta(hours=30),
+        review_after=timedelta(hours=3),
+        comment_after=timedelta(minutes=10),
+    )
+    add_min_pr(  # review exactly at the 1h window end, no comment
+        db,
+        pr_number=3,
+        created_at=base + timedelta(days=2, minutes=5),
+        review_after=timedelta(hours=1),
+        comment_after=None,
+    )
+    add_min_pr(  # only response lands just past the 48h window
+        db,
+        pr_number=4,
+        created_at=base + timedelta(days=3),
+        review_after=timedelta(hours=48, seconds=1),
+        comment_after=None,
+    )
+    cutoffs = {
+        db.pr_number: base,
+        2: base + timedelta(hours=30, minutes=20),
+        3: base + timedelta(days=2, minutes=5),
+        4: base + timedelta(days=3),
+    }
+    policies = builtin_truth_policy_specs()
+
+    batch = truth_with_policies_for_cohort(
+        policies=policies,
+        repo=db.repo,
+        cutoffs=cutoffs,
+        data_dir=db.data_dir,
+    )
+
+    assert list(batch) == list(cutoffs)
+    statuses: set[TruthStatus] = set()
+    for pr_number, cutoff in cutoffs.items():
+        assert list(batch[pr_number]) == list(policies)
+        for pid, policy in policies.items():
+            expected = truth_with_policy(
+                policy=policy,
+                repo=db.repo,
+                pr_number=pr_number,
+                cutoff=cutoff,
+                data_dir=db.data_dir,
+            )
+            assert batch[pr_number][pid] == expected, (pr_number, pid)
+            statuses.add(expected.status)
+    # The cohort exercises both found and not-found truth.
+    assert statuses >= {
+        TruthStatus.observed,
+        TruthStatus.no_post_cutoff_response,
+    }
@@ -10,6 +10,7 @@ from typing import Any
 import typer
 from evaluation_harness.db import RepoDb
 from repo_routing.api import DEFAULT_PINNED_ARTIFACT_PATHS, HistoryReader
+from repo_routing.history.db import connect_history_db
 
 from .pinned_artifacts_plan import build_pinned_artifacts_plan
 from .workflow_helpers import (
@@ -104,8 +105,7 @@ def doctor(
     if not db_path.exists():
         raise typer.BadParameter(f"missing DB: {db_path}")
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db_path)
     try:
         db = RepoDb(repo=repo, data_dir=data_dir)
         repo_id = db.repo_id(conn)
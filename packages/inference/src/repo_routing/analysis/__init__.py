@@ -1,6 +1,6 @@
 """Analysis pipeline for routing decisions."""
 
-from .engine import analyze_pr
+from .engine import analyze_pr, load_activity_timeline
 from .models import AnalysisResult, CandidateAnalysis, CandidateFeatures
 
 __all__ = [
@@ -8,4 +8,5 @@ __all__ = [
     "CandidateAnalysis",
     "CandidateFeatures",
     "analyze_pr",
+    "load_activity_timeline",
 ]
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Iterable
 
 from ..boundary.consumption import project_files_to_boundary_footprint
-from ..boundary.io import read_boundary_artifact
+from ..boundary.handle import open_boundary_artifact
+from ..history.db import connect_history_db
 from ..history.reader import HistoryReader
+from ..history.timeline import ActivityEvent, ActivityTimeline
 from ..parsing.gates import GateFields, parse_gate_fields
 from ..paths import repo_db_path
 from ..router.base import Evidence
-from ..time import cutoff_key_utc, dt_sql_utc, parse_dt_utc, require_dt_utc
+from ..time import cutoff_key_utc, require_dt_utc
 from ..scoring import (
     confidence_from_scores,
     decay_weight,
@@ -28,18 +29,9 @@ def _is_bot_login(login: str) -> bool:
     return login.lower().endswith("[bot]")
 
 
-@dataclass(frozen=True)
-class ActivityEvent:
-    login: str
-    occurred_at: datetime
-    kind: str
-    pr_id: int
-
-
 def _candidate_pool(
     *,
-    conn: sqlite3.Connection,
-    repo_id: int,
+    timeline: ActivityTimeline,
     cutoff: datetime,
     lookback_days: int,
     exclude_bots: bool,
@@ -47,38 +39,11 @@ def _candidate_pool(
     author_login: str | None,
 ) -> list[str]:
     start = cutoff - timedelta(days=lookback_days)
-    start_s = dt_sql_utc(start, timespec="microseconds")
-    cutoff_s = dt_sql_utc(cutoff, timespec="microseconds")
-
-    rows = conn.execute(
-        """
-        select distinct u.login as login, u.type as type
-        from comments c
-        join users u on u.id = c.user_id
-        where c.repo_id = ?
-          and c.pull_request_id is not null
-          and c.created_at is not null
-          and c.created_at >= ?
-          and c.created_at <= ?
-          and u.login is not null
-        union
-        select distinct u.login as login, u.type as type
-        from reviews r
-        join users u on u.id = r.user_id
-        where r.repo_id = ?
-          and r.submitted_at is not null
-          and r.submitted_at >= ?
-          and r.submitted_at <= ?
-          and u.login is not null
-        """,
-        (repo_id, start_s, cutoff_s, repo_id, start_s, cutoff_s),
-    ).fetchall()
 
     author_login_l = author_login.lower() if author_login else None
     out: list[str] = []
-    for r in rows:
-        login = str(r["login"])
-        if exclude_bots and (r["type"] == "Bot" or _is_bot_login(login)):
+    for login, user_type in timeline.participants(start=start, end=cutoff):
+        if exclude_bots and (user_type == "Bot" or _is_bot_login(login)):
             continue
         if exclude_author and author_login_l and login.lower() == author_login_l:
             continue
@@ -87,137 +52,24 @@ def _candidate_pool(
     return sorted(set(out), key=lambda s: s.lower())
 
 
-def _activity_events(
-    *,
-    conn: sqlite3.Connection,
-    repo_id: int,
-    cutoff: datetime,
-    lookback_days: int,
-) -> list[ActivityEvent]:
-    start = cutoff - timedelta(days=lookback_days)
-    start_s = dt_sql_utc(start, timespec="microseconds")
-    cutoff_s = dt_sql_utc(cutoff, timespec="microseconds")
-
-    events: list[ActivityEvent] = []
-
-    review_rows = conn.execute(
-        """
-        select r.pull_request_id as pr_id,
-               r.submitted_at as occurred_at,
-               u.login as login
-        from reviews r
-        join users u on u.id = r.user_id
-        where r.repo_id = ?
-          and r.submitted_at is not null
-          and r.submitted_at >= ?
-          and r.submitted_at <= ?
-          and u.login is not null
-        """,
-        (repo_id, start_s, cutoff_s),
-    ).fetchall()
-    for r in review_rows:
-        occurred_at = parse_dt_utc(r["occurred_at"])
-        if occurred_at is None:
-            continue
-        events.append(
-            ActivityEvent(
-                login=str(r["login"]),
-                occurred_at=occurred_at,
-                kind="review_submitted",
-                pr_id=int(r["pr_id"]),
-            )
-        )
-
-    comment_rows = conn.execute(
-        """
-        select c.pull_request_id as pr_id,
-               c.created_at as occurred_at,
-               c.comment_type as comment_type,
-               c.review_id as review_id,
-               u.login as login
-        from comments c
-        join users u on u.id = c.user_id
-        where c.repo_id = ?
-          and c.pull_request_id is not null
-          and c.created_at is not null
-          and c.created_at >= ?
-          and c.created_at <= ?
-          and u.login is not null
-        """,
-        (repo_id, start_s, cutoff_s),
-    ).fetchall()
-    for r in comment_rows:
-        occurred_at = parse_dt_utc(r["occurred_at"])
-        if occurred_at is None:
-            continue
-        comment_type = r["comment_type"]
-        kind = "comment_created"
-        if comment_type == "review" or r["review_id"] is not None:
-            kind = "review_comment_created"
-        events.append(
-            ActivityEvent(
-                login=str(r["login"]),
-                occurred_at=occurred_at,
-                kind=kind,
-                pr_id=int(r["pr_id"]),
-            )
-        )
-
-    events.sort(
-        key=lambda e: (e.occurred_at, e.pr_id, e.login.lower(), e.kind)
-    )
-    return events
-
-
-def _pr_head_sha_as_of(
-    *, conn: sqlite3.Connection, pr_id: int, as_of: datetime
-) -> str | None:
-    as_of_s = dt_sql_utc(as_of, timespec="microseconds")
-    row = conn.execute(
-        """
-        select phi.head_sha as head_sha
-        from pull_request_head_intervals phi
-        join events se on se.id = phi.start_event_id
-        left join events ee on ee.id = phi.end_event_id
-        where phi.pull_request_id = ?
-          and se.occurred_at <= ?
-          and (ee.id is null or ? < ee.occurred_at)
-        order by se.occurred_at desc, se.id desc
-        limit 1
-        """,
-        (pr_id, as_of_s, as_of_s),
-    ).fetchone()
-    return None if row is None else row["head_sha"]
-
-
 def _pr_boundaries_for_event(
     *,
     conn: sqlite3.Connection,
-    repo_id: int,
-    pr_id: int,
-    occurred_at: datetime,
+    timeline: ActivityTimeline,
+    event: ActivityEvent,
     cache: dict[tuple[int, str | None], list[str]],
     boundary_index: dict[str, list[str]],
 ) -> list[str]:
-    head_sha = _pr_head_sha_as_of(conn=conn, pr_id=pr_id, as_of=occurred_at)
-    cache_key = (pr_id, head_sha)
+    head_sha = timeline.pr_head_sha_as_of(conn, pr_id=event.pr_id, as_of=event.occurred_at)
+    cache_key = (event.pr_id, head_sha)
     if cache_key in cache:
         return cache[cache_key]
     if head_sha is None:
         cache[cache_key] = []
         return []
 
-    rows = conn.execute(
-        """
-        select path from pull_request_files
-        where repo_id = ? and pull_request_id = ? and head_sha = ?
-        order by path asc
-        """,
-        (repo_id, pr_id, head_sha),
-    ).fetchall()
     boundaries: set[str] = set()
-    for r in rows:
-        path = str(r["path"])
+    for path in timeline.pr_paths(conn, pr_id=event.pr_id, head_sha=head_sha):
         for boundary_id in boundary_index.get(path, []):
             boundaries.add(boundary_id)
     unique = sorted(boundaries, key=lambda s: s.lower())
@@ -270,6 +122,12 @@ def _build_evidence(
     ]
 
 
+def load_activity_timeline(*, repo: str, data_dir: str | Path = "data") -> ActivityTimeline:
+    """Load a repo's activity timeline for reuse across `analyze_pr` calls."""
+    with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
+        return reader.activity_timeline()
+
+
 def analyze_pr(
     *,
     repo: str,
@@ -277,18 +135,27 @@ def analyze_pr(
     cutoff: datetime,
     data_dir: str | Path = "data",
     config_path: str | Path,
+    timeline: ActivityTimeline | None = None,
+    boundary_cutoff_key: str | None = None,
 ) -> AnalysisResult:
+    """Score candidate stewards for a PR as of `cutoff`.
+
+    Pass a preloaded `timeline` (see `load_activity_timeline`) when analyzing
+    many PRs of one repo; otherwise the repo's activity is loaded per call.
+    `boundary_cutoff_key` selects a shared (bucketed) boundary artifact
+    instead of the one at `cutoff`.
+    """
     cutoff_utc = require_dt_utc(cutoff, name="cutoff")
     config = load_scoring_config(config_path)
 
     with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
         snapshot = reader.pull_request_snapshot(number=pr_number, as_of=cutoff_utc)
 
-    boundary_artifact = read_boundary_artifact(
+    boundary_artifact = open_boundary_artifact(
         repo_full_name=repo,
         data_dir=data_dir,
         strategy_id="hybrid_path_cochange.v1",
-        cutoff_key=cutoff_key_utc(cutoff_utc),
+        cutoff_key=boundary_cutoff_key or cutoff_key_utc(cutoff_utc),
     )
     footprint = project_files_to_boundary_footprint(
         paths=[f.path for f in snapshot.changed_files],
@@ -301,8 +168,7 @@ def analyze_pr(
     boundaries = _current_pr_boundaries(current_paths, boundary_index)
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -311,9 +177,11 @@ def analyze_pr(
             raise KeyError(f"repo not found in db: {repo}")
         repo_id = int(row["id"])
 
+        if timeline is None:
+            timeline = ActivityTimeline.load(conn, repo_id=repo_id)
+
         candidates = _candidate_pool(
-            conn=conn,
-            repo_id=repo_id,
+            timeline=timeline,
             cutoff=cutoff_utc,
             lookback_days=config.candidate_pool.lookback_days,
             exclude_bots=config.candidate_pool.exclude_bots,
@@ -321,43 +189,35 @@ def analyze_pr(
             author_login=snapshot.author_login,
         )
 
-        events = _activity_events(
-            conn=conn,
-            repo_id=repo_id,
-            cutoff=cutoff_utc,
-            lookback_days=config.decay.lookback_days,
-        )
-
         event_weights = config.event_weights.model_dump()
         by_login: dict[str, CandidateFeatures] = {}
         overlap_cache: dict[tuple[int, str | None], list[str]] = {}
-
-        for event in events:
-            if event.login not in candidates:
-                continue
-            weight = float(event_weights.get(event.kind, 0.0))
-            if weight == 0.0:
-                continue
-            age_days = (cutoff_utc - event.occurred_at).total_seconds() / 86400.0
-            if age_days < 0:
-                continue
-            if age_days > config.decay.lookback_days:
-                continue
-            decayed = weight * decay_weight(age_days, config.decay.half_life_days)
-            feats = by_login.setdefault(event.login, CandidateFeatures())
-            feats.activity_total += decayed
-
-            if boundaries:
-                event_boundaries = _pr_boundaries_for_event(
-                    conn=conn,
-                    repo_id=repo_id,
-                    pr_id=event.pr_id,
-                    occurred_at=event.occurred_at,
-                    cache=overlap_cache,
-                    boundary_index=boundary_index,
-                )
-                if set(event_boundaries).intersection(boundaries):
-                    feats.boundary_overlap_activity += decayed
+        events_start = cutoff_utc - timedelta(days=config.decay.lookback_days)
+
+        for login in candidates:
+            for event in timeline.events(login, start=events_start, end=cutoff_utc):
+                weight = float(event_weights.get(event.kind, 0.0))
+                if weight == 0.0:
+                    continue
+                age_days = (cutoff_utc - event.occurred_at).total_seconds() / 86400.0
+                if age_days < 0:
+                    continue
+                if age_days > config.decay.lookback_days:
+                    continue
+                decayed = weight * decay_weight(age_days, config.decay.half_life_days)
+                feats = by_login.setdefault(event.login, CandidateFeatures())
+                feats.activity_total += decayed
+
+                if boundaries:
+                    event_boundaries = _pr_boundaries_for_event(
+                        conn=conn,
+                        timeline=timeline,
+                        event=event,
+                        cache=overlap_cache,
+                        boundary_index=boundary_index,
+                    )
+                    if set(event_boundaries).intersection(boundaries):
+                        feats.boundary_overlap_activity += decayed
     finally:
         conn.close()
 
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
 from ..boundary.pipeline import write_boundary_model_artifacts
+from ..history.db import connect_history_db
+from ..history.models import PullRequestSnapshot
 from ..history.reader import HistoryReader
 from ..inputs.builder import build_pr_input_bundle
 from ..inputs.models import PRInputBuilderOptions, PRInputBundle
@@ -204,13 +205,9 @@ class ArtifactWriter:
         return p
 
 
-def build_pr_snapshot_artifact(
-    *, repo: str, pr_number: int, as_of: datetime, data_dir: str | Path = "data"
+def _snapshot_artifact(
+    *, repo: str, pr_number: int, as_of: datetime, pr: PullRequestSnapshot
 ) -> PRSnapshotArtifact:
-    as_of_utc = require_dt_utc(as_of, name="as_of")
-    with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
-        pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of_utc)
-
     changed_files = sorted(pr.changed_files, key=lambda f: f.path)
     review_requests = sorted(
         pr.review_requests,
@@ -219,7 +216,7 @@ def build_pr_snapshot_artifact(
     return PRSnapshotArtifact(
         repo=repo,
         pr_number=pr_number,
-        as_of=as_of_utc,
+        as_of=as_of,
         author=pr.author_login,
         title=pr.title,
         body=pr.body,
@@ -230,6 +227,15 @@ def build_pr_snapshot_artifact(
     )
 
 
+def build_pr_snapshot_artifact(
+    *, repo: str, pr_number: int, as_of: datetime, data_dir: str | Path = "data"
+) -> PRSnapshotArtifact:
+    as_of_utc = require_dt_utc(as_of, name="as_of")
+    with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
+        pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of_utc)
+    return _snapshot_artifact(repo=repo, pr_number=pr_number, as_of=as_of_utc, pr=pr)
+
+
 def build_pr_inputs_artifact(
     *,
     repo: str,
@@ -237,6 +243,7 @@ def build_pr_inputs_artifact(
     as_of: datetime,
     data_dir: str | Path = "data",
     options: PRInputBuilderOptions | None = None,
+    reader: HistoryReader | None = None,
 ) -> PRInputBundle:
     return build_pr_input_bundle(
         repo=repo,
@@ -244,7 +251,36 @@ def build_pr_inputs_artifact(
         cutoff=as_of,
         data_dir=data_dir,
         options=options,
+        reader=reader,
+    )
+
+
+def build_pr_snapshot_and_inputs(
+    *,
+    repo: str,
+    pr_number: int,
+    as_of: datetime,
+    data_dir: str | Path = "data",
+    options: PRInputBuilderOptions | None = None,
+    reader: HistoryReader | None = None,
+) -> tuple[PRSnapshotArtifact, PRInputBundle]:
+    """Build the snapshot artifact and input bundle from one as-of read.
+
+    Equivalent to `build_pr_snapshot_artifact` plus `build_pr_inputs_artifact`,
+    but the PR snapshot is queried once; `reader` may be shared across PRs.
+    """
+    inputs = build_pr_inputs_artifact(
+        repo=repo,
+        pr_number=pr_number,
+        as_of=as_of,
+        data_dir=data_dir,
+        options=options,
+        reader=reader,
+    )
+    snap = _snapshot_artifact(
+        repo=repo, pr_number=pr_number, as_of=inputs.cutoff, pr=inputs.snapshot
     )
+    return snap, inputs
 
 
 def build_route_result(
@@ -308,8 +344,7 @@ def iter_pr_numbers_created_in_window(
     end_at: datetime | None,
 ) -> Iterable[int]:
     db_path = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db_path)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -342,8 +377,7 @@ def pr_created_at(
     *, repo: str, data_dir: str | Path, pr_number: int
 ) -> datetime | None:
     db_path = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db_path)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -10,6 +10,8 @@ from .consumption import (
     PRBoundaryFootprint,
     project_files_to_boundary_footprint,
 )
+from .cutoffs import BoundaryCutoffPolicy, boundary_cutoff, boundary_cutoff_key
+from .handle import BoundaryArtifactHandle, open_boundary_artifact
 from .hash import boundary_model_hash, canonical_boundary_payload
 from .inference import BoundaryInferenceContext, BoundaryInferenceStrategy, get_boundary_strategy
 from .io import read_boundary_artifact, write_boundary_artifact
@@ -40,12 +42,19 @@ from .paths import (
     boundary_signals_path,
     repo_boundary_artifacts_dir,
 )
-from .pipeline import build_boundary_model, write_boundary_model_artifacts
+from .pipeline import (
+    build_boundary_model,
+    build_boundary_models,
+    write_boundary_model_artifacts,
+    write_boundary_model_artifacts_for_cutoffs,
+)
 from .source_snapshot import resolve_snapshot_root
 
 __all__ = [
+    "BoundaryArtifactHandle",
     "BoundaryConfig",
     "BoundaryCoverageSummary",
+    "BoundaryCutoffPolicy",
     "BoundaryDef",
     "BoundaryDeterminismConfig",
     "BoundaryHashConfig",
@@ -66,6 +75,8 @@ __all__ = [
     "ParsedImport",
     "ParserRunResult",
     "PythonAstParserBackend",
+    "boundary_cutoff",
+    "boundary_cutoff_key",
     "boundary_manifest_path",
     "boundary_memberships_path",
     "boundary_model_dir",
@@ -73,9 +84,11 @@ __all__ = [
     "boundary_model_path",
     "boundary_signals_path",
     "build_boundary_model",
+    "build_boundary_models",
     "canonical_boundary_payload",
     "get_boundary_strategy",
     "get_parser_backend",
+    "open_boundary_artifact",
     "project_files_to_boundary_footprint",
     "TypeScriptJavaScriptRegexParserBackend",
     "ZigRegexParserBackend",
@@ -84,4 +97,5 @@ __all__ = [
     "resolve_snapshot_root",
     "write_boundary_artifact",
     "write_boundary_model_artifacts",
+    "write_boundary_model_artifacts_for_cutoffs",
 ]
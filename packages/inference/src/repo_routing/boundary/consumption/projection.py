@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
 from ..artifacts import BoundaryModelArtifact
 from ..signals.path import normalize_path
 from .models import BoundaryCoverageSummary, PRBoundaryFootprint
 
+if TYPE_CHECKING:
+    from ..handle import BoundaryArtifactHandle
+
 
 def project_files_to_boundary_footprint(
     *,
     paths: list[str],
-    artifact: BoundaryModelArtifact,
+    artifact: BoundaryModelArtifact | BoundaryArtifactHandle,
 ) -> PRBoundaryFootprint:
-    unit_to_boundary_weights: dict[str, dict[str, float]] = defaultdict(dict)
-    for m in artifact.model.memberships:
-        unit_to_boundary_weights[m.unit_id][m.boundary_id] = float(m.weight)
+    if isinstance(artifact, BoundaryModelArtifact):
+        unit_to_boundary_weights: dict[str, dict[str, float]] = defaultdict(dict)
+        for m in artifact.model.memberships:
+            unit_to_boundary_weights[m.unit_id][m.boundary_id] = float(m.weight)
+        lookup = unit_to_boundary_weights.get
+        strategy_id = artifact.model.strategy_id
+        strategy_version = artifact.model.strategy_version
+    else:
+        # Indexed handle: only the PR's own units are read.
+        lookup = artifact.unit_weights
+        strategy_id = artifact.manifest.strategy_id
+        strategy_version = artifact.manifest.strategy_version
 
     file_boundaries: dict[str, list[str]] = {}
     file_boundary_weights: dict[str, dict[str, float]] = {}
@@ -22,7 +35,7 @@ def project_files_to_boundary_footprint(
 
     for path in sorted({normalize_path(p) for p in paths}):
         unit_id = f"file:{path}"
-        weights = unit_to_boundary_weights.get(unit_id)
+        weights = lookup(unit_id)
         if not weights:
             uncovered.append(path)
             continue
@@ -44,6 +57,6 @@ def project_files_to_boundary_footprint(
             covered_file_count=len(file_boundaries),
             uncovered_files=sorted(uncovered, key=str.lower),
         ),
-        strategy_id=artifact.model.strategy_id,
-        strategy_version=artifact.model.strategy_version,
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
     )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+from ..time import cutoff_key_utc, require_dt_utc
+
+
+class BoundaryCutoffPolicy(str, Enum):
+    """Which boundary model a PR evaluated at some cutoff reads.
+
+    `exact` uses a model built at the PR's own cutoff. The bucketed policies
+    use the model at the start of the enclosing UTC hour/day, so PRs in the
+    same bucket share one artifact. Bucket cutoffs never follow the PR
+    cutoff, so a shared model cannot see PRs created after it.
+    """
+
+    EXACT = "exact"
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+
+def boundary_cutoff(
+    cutoff: datetime, policy: BoundaryCutoffPolicy | str = BoundaryCutoffPolicy.EXACT
+) -> datetime:
+    cutoff_utc = require_dt_utc(cutoff, name="cutoff")
+    policy = BoundaryCutoffPolicy(policy)
+    if policy == BoundaryCutoffPolicy.HOURLY:
+        return cutoff_utc.replace(minute=0, second=0, microsecond=0)
+    if policy == BoundaryCutoffPolicy.DAILY:
+        return cutoff_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    return cutoff_utc
+
+
+def boundary_cutoff_key(
+    cutoff: datetime, policy: BoundaryCutoffPolicy | str = BoundaryCutoffPolicy.EXACT
+) -> str:
+    return cutoff_key_utc(boundary_cutoff(cutoff, policy))
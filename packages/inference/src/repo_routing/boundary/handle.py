@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .artifacts import BoundaryManifest, BoundaryModelArtifact
+from .io import _read_json, read_boundary_artifact
+from .paths import boundary_manifest_path, boundary_memberships_path
+
+
+class BoundaryArtifactHandle:
+    """Read-side view of one boundary artifact for per-PR projection.
+
+    Memberships are kept as Arrow columns read (memory-mapped) from
+    `memberships.parquet`, which the writer sorts by unit id, plus an index
+    from unit id to its row range. Looking up the boundaries of a PR's files
+    costs O(changed files) instead of a pass over every membership. The
+    artifact is validated once when the handle is opened; the full pydantic
+    artifact is only loaded if `artifact` is accessed.
+    """
+
+    def __init__(
+        self,
+        *,
+        repo_full_name: str,
+        data_dir: str | Path,
+        strategy_id: str,
+        cutoff_key: str,
+        manifest: BoundaryManifest,
+        memberships: pa.Table,
+    ) -> None:
+        self.repo_full_name = repo_full_name
+        self.data_dir = data_dir
+        self.strategy_id = strategy_id
+        self.cutoff_key = cutoff_key
+        self.manifest = manifest
+
+        memberships = memberships.combine_chunks()
+        self._boundary_ids = memberships.column("boundary_id").chunk(0) if memberships.num_rows else None
+        self._weights = memberships.column("weight").chunk(0) if memberships.num_rows else None
+        self._rows: dict[str, tuple[int, int]] = {}
+        unit_ids = memberships.column("unit_id").to_pylist() if memberships.num_rows else []
+        start = 0
+        for i in range(1, len(unit_ids) + 1):
+            if i == len(unit_ids) or unit_ids[i] != unit_ids[start]:
+                self._rows[unit_ids[start]] = (start, i)
+                start = i
+
+    @property
+    def strategy_version(self) -> str:
+        return self.manifest.strategy_version
+
+    def unit_weights(self, unit_id: str) -> dict[str, float]:
+        span = self._rows.get(unit_id)
+        if span is None or self._boundary_ids is None or self._weights is None:
+            return {}
+        start, stop = span
+        boundary_ids = self._boundary_ids.slice(start, stop - start).to_pylist()
+        weights = self._weights.slice(start, stop - start).to_pylist()
+        return {b: float(w) for b, w in zip(boundary_ids, weights)}
+
+    @cached_property
+    def artifact(self) -> BoundaryModelArtifact:
+        return read_boundary_artifact(
+            repo_full_name=self.repo_full_name,
+            data_dir=self.data_dir,
+            strategy_id=self.strategy_id,
+            cutoff_key=self.cutoff_key,
+        )
+
+
+_HANDLE_CACHE_SIZE = 16
+_handles: OrderedDict[tuple[str, str, str, str, str], BoundaryArtifactHandle] = OrderedDict()
+_handles_lock = threading.Lock()
+
+
+def open_boundary_artifact(
+    *,
+    repo_full_name: str,
+    data_dir: str | Path,
+    strategy_id: str,
+    cutoff_key: str,
+) -> BoundaryArtifactHandle:
+    """Return a shared handle for the artifact at `cutoff_key`.
+
+    Handles live in a process-wide LRU keyed by (repo, data dir, strategy,
+    cutoff key, model hash); only the manifest is re-read per call, so a
+    rewritten artifact gets a fresh handle. Raises FileNotFoundError when
+    the artifact does not exist, like `read_boundary_artifact`.
+    """
+    manifest_path = boundary_manifest_path(
+        repo_full_name=repo_full_name,
+        data_dir=data_dir,
+        strategy_id=strategy_id,
+        cutoff_key=cutoff_key,
+    )
+    model_hash = str(_read_json(manifest_path).get("model_hash") or "")
+    key = (repo_full_name, str(data_dir), strategy_id, cutoff_key, model_hash)
+    with _handles_lock:
+        handle = _handles.get(key)
+        if handle is not None:
+            _handles.move_to_end(key)
+            return handle
+
+    # Full validation (hash, counts, repo, strategy) once per artifact.
+    artifact = read_boundary_artifact(
+        repo_full_name=repo_full_name,
+        data_dir=data_dir,
+        strategy_id=strategy_id,
+        cutoff_key=cutoff_key,
+    )
+    memberships_path = boundary_memberships_path(
+        repo_full_name=repo_full_name,
+        data_dir=data_dir,
+        strategy_id=strategy_id,
+        cutoff_key=cutoff_key,
+    )
+    if memberships_path.exists() and len(artifact.memberships_rows) == len(artifact.model.memberships):
+        memberships = pq.read_table(memberships_path, memory_map=True)
+    else:
+        # Older artifacts may lack the parquet; fall back to the model.
+        memberships = pa.Table.from_pylist(
+            sorted(
+                (
+                    {"unit_id": m.unit_id, "boundary_id": m.boundary_id, "weight": float(m.weight)}
+                    for m in artifact.model.memberships
+                ),
+                key=lambda r: (r["unit_id"], r["boundary_id"], r["weight"]),
+            )
+        )
+    handle = BoundaryArtifactHandle(
+        repo_full_name=repo_full_name,
+        data_dir=data_dir,
+        strategy_id=strategy_id,
+        cutoff_key=cutoff_key,
+        manifest=artifact.manifest,
+        memberships=memberships,
+    )
+
+    with _handles_lock:
+        handle = _handles.setdefault(key, handle)
+        _handles.move_to_end(key)
+        while len(_handles) > _HANDLE_CACHE_SIZE:
+            _handles.popitem(last=False)
+    return handle
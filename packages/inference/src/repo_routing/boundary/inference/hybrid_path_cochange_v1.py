@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import sqlite3
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from ...history.db import connect_history_db
 from ...paths import repo_db_path
 from ...time import dt_sql_utc, require_dt_utc
 from ..models import (
@@ -16,7 +18,7 @@ from ..models import (
     MembershipMode,
 )
 from ..parsers.registry import get_parser_backend
-from ..signals.cochange import cochange_scores
+from ..signals.cochange import cochange_matrix
 from ..signals.parser import parser_boundary_votes
 from ..signals.path import normalize_path, path_boundary
 from ..source_snapshot import resolve_snapshot_root
@@ -34,12 +36,159 @@ class HybridPathCochangeV1:
         db_path = repo_db_path(repo_full_name=context.repo_full_name, data_dir=context.data_dir)
 
         file_sets = _read_file_sets_as_of(db_path=db_path, repo=context.repo_full_name, cutoff_sql=dt_sql_utc(cutoff))
-        files = sorted({f for fs in file_sets for f in fs})
+        state = _HybridBuildState(self, context)
+        state.add_file_sets(file_sets)
+        return state.model(cutoff)
+
+    def infer_many(
+        self, contexts: list[BoundaryInferenceContext]
+    ) -> Iterator[tuple[BoundaryModel, list[dict[str, Any]]]]:
+        """Yield `infer(context)` for each context, building incrementally.
+
+        Contexts must share repo, data dir, membership mode and config, with
+        non-decreasing cutoffs. PR file sets are read once in creation order;
+        each model applies only the PRs created since the previous cutoff and
+        recomputes memberships of the files those PRs touched.
+        """
+        if not contexts:
+            return
+        first = contexts[0]
+        for context in contexts[1:]:
+            if (
+                context.repo_full_name != first.repo_full_name
+                or str(context.data_dir) != str(first.data_dir)
+                or context.membership_mode != first.membership_mode
+                or context.config != first.config
+            ):
+                raise ValueError("infer_many contexts must differ only in cutoff_utc")
+
+        cutoffs = [require_dt_utc(c.cutoff_utc, name="cutoff_utc") for c in contexts]
+        if any(b < a for a, b in zip(cutoffs, cutoffs[1:])):
+            raise ValueError("infer_many cutoffs must be non-decreasing")
+
+        db_path = repo_db_path(repo_full_name=first.repo_full_name, data_dir=first.data_dir)
+        timed = _read_timed_file_sets(
+            db_path=db_path,
+            repo=first.repo_full_name,
+            cutoff_sql=dt_sql_utc(cutoffs[-1]),
+        )
+        state = _HybridBuildState(self, first)
+        pos = 0
+        for cutoff in cutoffs:
+            cutoff_sql = dt_sql_utc(cutoff)
+            end = pos
+            while end < len(timed) and timed[end][0] <= cutoff_sql:
+                end += 1
+            state.add_file_sets(paths for _, paths in timed[pos:end])
+            pos = end
+            yield state.model(cutoff)
+
+
+class _HybridBuildState:
+    """Co-change counts and per-file scores for one repo as PRs are added.
+
+    A file's scores depend only on its own co-change row (and parser votes),
+    so after adding PRs only the files those PRs touched are rescored.
+    Parser votes are recomputed per model, which disables reuse.
+    """
+
+    def __init__(self, strategy: HybridPathCochangeV1, context: BoundaryInferenceContext) -> None:
+        self.strategy = strategy
+        self.context = context
+        config = context.config
+        self.path_weight = float(config.get("path_weight", 1.0))
+        self.cochange_weight = float(config.get("cochange_weight", 0.35))
+        self.min_mixed_weight = float(config.get("min_mixed_weight", 1e-8))
+        self.parser_enabled = bool(config.get("parser_enabled", False))
+        self.parser_weight = float(config.get("parser_weight", 0.2))
+        self.parser_backend_id = str(config.get("parser_backend_id", "python.ast.v1"))
+        max_pr_files_raw = config.get("cochange_max_pr_files")
+        self.max_pr_files = None if max_pr_files_raw is None else int(max_pr_files_raw)
+
+        self.cochange = cochange_matrix([], max_pr_files=self.max_pr_files)
+        self.files: set[str] = set()
+        self.path_map: dict[str, tuple[str, str]] = {}
+        # file -> (normalized boundary scores, co-change neighbour count)
+        self._scored: dict[str, tuple[list[tuple[str, float]], int]] = {}
+
+    def add_file_sets(self, file_sets: Iterable[list[str]]) -> None:
+        file_sets = list(file_sets)
+        for fs in file_sets:
+            for f in fs:
+                if f not in self.files:
+                    self.files.add(f)
+                    self.path_map[f] = path_boundary(f)
+        for f in self.cochange.add_file_sets(file_sets):
+            self._scored.pop(f, None)
+
+    def _parser_votes(
+        self, files: list[str]
+    ) -> tuple[dict[str, dict[str, float]], str | None, list[str]]:
+        parser_backend_version: str | None = None
+        parser_votes: dict[str, dict[str, float]] = {}
+        parser_diagnostics: list[str] = []
+        if not self.parser_enabled:
+            return parser_votes, parser_backend_version, parser_diagnostics
+
+        parser_strict = bool(self.context.config.get("parser_strict", False))
+        snapshot_root = resolve_snapshot_root(
+            configured_root=self.context.config.get("parser_snapshot_root")
+        )
+        if snapshot_root is None:
+            parser_diagnostics.append("parser_snapshot_missing")
+            if parser_strict:
+                raise RuntimeError("parser snapshot root missing in strict parser mode")
+        else:
+            try:
+                backend = get_parser_backend(self.parser_backend_id)
+                parsed = backend.parse_snapshot(root=snapshot_root, paths=files)
+            except Exception as exc:
+                parser_diagnostics.append(f"parser_backend_error:{type(exc).__name__}")
+                if parser_strict:
+                    raise
+            else:
+                parser_backend_version = parsed.backend_version
+                parser_votes = parser_boundary_votes(parsed)
+                parser_diagnostics.extend(parsed.diagnostics)
+        return parser_votes, parser_backend_version, parser_diagnostics
+
+    def _score_file(
+        self, file_path: str, parser_votes: dict[str, dict[str, float]]
+    ) -> tuple[list[tuple[str, float]], int]:
+        by_boundary: dict[str, float] = defaultdict(float)
+
+        own_boundary_id, _ = self.path_map[file_path]
+        by_boundary[own_boundary_id] += self.path_weight
+
+        neighbors = self.cochange.row(file_path)
+        for neighbor_path, score in neighbors.items():
+            neighbor_boundary_id, _ = self.path_map.get(neighbor_path, path_boundary(neighbor_path))
+            by_boundary[neighbor_boundary_id] += self.cochange_weight * float(score)
+
+        for boundary_id, vote in parser_votes.get(file_path, {}).items():
+            by_boundary[boundary_id] += self.parser_weight * float(vote)
+
+        ranked = sorted(
+            by_boundary.items(),
+            key=lambda it: (-round(it[1], 12), it[0]),
+        )
+
+        total = sum(v for _, v in ranked)
+        if total <= 0:
+            ranked = [(own_boundary_id, 1.0)]
+            total = 1.0
+
+        return [(bid, (val / total)) for bid, val in ranked], len(neighbors)
+
+    def model(self, cutoff: datetime) -> tuple[BoundaryModel, list[dict[str, Any]]]:
+        context = self.context
+        strategy = self.strategy
+        files = sorted(self.files)
 
         if not files:
             model = BoundaryModel(
-                strategy_id=self.strategy_id,
-                strategy_version=self.strategy_version,
+                strategy_id=strategy.strategy_id,
+                strategy_version=strategy.strategy_version,
                 repo=context.repo_full_name,
                 cutoff_utc=cutoff,
                 membership_mode=context.membership_mode,
@@ -50,43 +199,13 @@ class HybridPathCochangeV1:
             )
             return model, []
 
-        path_map: dict[str, tuple[str, str]] = {f: path_boundary(f) for f in files}
-        base_boundary_ids = sorted({bid for bid, _ in path_map.values()})
-        boundary_name_by_id = {bid: name for bid, name in path_map.values()}
-
-        cochange = cochange_scores(file_sets)
+        path_map = self.path_map
+        base_boundary_ids = sorted({path_map[f][0] for f in files})
+        boundary_name_by_id = {bid: name for bid, name in (path_map[f] for f in files)}
 
-        path_weight = float(context.config.get("path_weight", 1.0))
-        cochange_weight = float(context.config.get("cochange_weight", 0.35))
-        min_mixed_weight = float(context.config.get("min_mixed_weight", 1e-8))
-
-        parser_enabled = bool(context.config.get("parser_enabled", False))
-        parser_weight = float(context.config.get("parser_weight", 0.2))
-        parser_backend_id = str(context.config.get("parser_backend_id", "python.ast.v1"))
-        parser_backend_version: str | None = None
-        parser_votes: dict[str, dict[str, float]] = {}
-        parser_diagnostics: list[str] = []
-        if parser_enabled:
-            parser_strict = bool(context.config.get("parser_strict", False))
-            snapshot_root = resolve_snapshot_root(
-                configured_root=context.config.get("parser_snapshot_root")
-            )
-            if snapshot_root is None:
-                parser_diagnostics.append("parser_snapshot_missing")
-                if parser_strict:
-                    raise RuntimeError("parser snapshot root missing in strict parser mode")
-            else:
-                try:
-                    backend = get_parser_backend(parser_backend_id)
-                    parsed = backend.parse_snapshot(root=snapshot_root, paths=files)
-                except Exception as exc:
-                    parser_diagnostics.append(f"parser_backend_error:{type(exc).__name__}")
-                    if parser_strict:
-                        raise
-                else:
-                    parser_backend_version = parsed.backend_version
-                    parser_votes = parser_boundary_votes(parsed)
-                    parser_diagnostics.extend(parsed.diagnostics)
+        parser_votes, parser_backend_version, parser_diagnostics = self._parser_votes(files)
+        if self.parser_enabled:
+            self._scored.clear()
 
         parser_boundary_ids = sorted(
             {
@@ -103,39 +222,23 @@ class HybridPathCochangeV1:
         mixed_memberships: list[Membership] = []
         hard_memberships: list[Membership] = []
         confidence: dict[str, float] = {}
+        cochange_edges = 0
 
         for file_path in files:
-            by_boundary: dict[str, float] = defaultdict(float)
-
-            own_boundary_id, _ = path_map[file_path]
-            by_boundary[own_boundary_id] += path_weight
-
-            neighbors = cochange.get(file_path, {})
-            for neighbor_path, score in neighbors.items():
-                neighbor_boundary_id, _ = path_map.get(neighbor_path, path_boundary(neighbor_path))
-                by_boundary[neighbor_boundary_id] += cochange_weight * float(score)
-
-            for boundary_id, vote in parser_votes.get(file_path, {}).items():
-                by_boundary[boundary_id] += parser_weight * float(vote)
-
-            ranked = sorted(
-                by_boundary.items(),
-                key=lambda it: (-round(it[1], 12), it[0]),
-            )
+            scored = self._scored.get(file_path)
+            if scored is None:
+                scored = self._score_file(file_path, parser_votes)
+                self._scored[file_path] = scored
+            normalized, neighbor_count = scored
+            cochange_edges += neighbor_count
 
-            total = sum(v for _, v in ranked)
-            if total <= 0:
-                ranked = [(own_boundary_id, 1.0)]
-                total = 1.0
-
-            normalized = [(bid, (val / total)) for bid, val in ranked]
             confidence[file_path] = normalized[0][1]
             hard_memberships.append(
                 Membership(unit_id=f"file:{file_path}", boundary_id=normalized[0][0], weight=1.0)
             )
 
             for bid, frac in normalized:
-                if frac < min_mixed_weight:
+                if frac < self.min_mixed_weight:
                     continue
                 mixed_memberships.append(
                     Membership(
@@ -172,8 +275,8 @@ class HybridPathCochangeV1:
             else mixed_memberships
         )
         model = BoundaryModel(
-            strategy_id=self.strategy_id,
-            strategy_version=self.strategy_version,
+            strategy_id=strategy.strategy_id,
+            strategy_version=strategy.strategy_version,
             repo=context.repo_full_name,
             cutoff_utc=cutoff,
             membership_mode=context.membership_mode,
@@ -191,13 +294,21 @@ class HybridPathCochangeV1:
                     ),
                 },
                 "weights": {
-                    "path_weight": path_weight,
-                    "cochange_weight": cochange_weight,
-                    "parser_weight": parser_weight,
+                    "path_weight": self.path_weight,
+                    "cochange_weight": self.cochange_weight,
+                    "parser_weight": self.parser_weight,
                 },
-                "cochange_edges": int(sum(len(v) for v in cochange.values())),
-                "parser_enabled": parser_enabled,
-                "parser_backend_id": parser_backend_id if parser_enabled else None,
+                "cochange_edges": cochange_edges,
+                **(
+                    {}
+                    if self.max_pr_files is None
+                    else {
+                        "cochange_max_pr_files": self.max_pr_files,
+                        "cochange_skipped_prs": self.cochange.skipped_prs,
+                    }
+                ),
+                "parser_enabled": self.parser_enabled,
+                "parser_backend_id": self.parser_backend_id if self.parser_enabled else None,
                 "parser_backend_version": parser_backend_version,
                 "parser_signal_files": len(parser_votes),
                 "parser_diagnostics": sorted(set(parser_diagnostics)),
@@ -221,8 +332,14 @@ class HybridPathCochangeV1:
 
 
 def _read_file_sets_as_of(*, db_path: Path, repo: str, cutoff_sql: str) -> list[list[str]]:
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    return [paths for _, paths in _read_timed_file_sets(db_path=db_path, repo=repo, cutoff_sql=cutoff_sql)]
+
+
+def _read_timed_file_sets(
+    *, db_path: Path, repo: str, cutoff_sql: str
+) -> list[tuple[str, list[str]]]:
+    """(created_at, sorted paths) per PR created by `cutoff_sql`, oldest first."""
+    conn = connect_history_db(db_path)
     try:
         repo_row = conn.execute(
             "select id from repos where full_name = ?",
@@ -234,7 +351,7 @@ def _read_file_sets_as_of(*, db_path: Path, repo: str, cutoff_sql: str) -> list[
 
         rows = conn.execute(
             """
-            select pr.id as pull_request_id, prf.path as path
+            select pr.id as pull_request_id, pr.created_at as created_at, prf.path as path
             from pull_request_files prf
             join pull_requests pr on pr.id = prf.pull_request_id
             where prf.repo_id = ?
@@ -248,12 +365,18 @@ def _read_file_sets_as_of(*, db_path: Path, repo: str, cutoff_sql: str) -> list[
         ).fetchall()
 
         by_pr: dict[int, list[str]] = defaultdict(list)
+        created_at: dict[int, str] = {}
         for row in rows:
             path = normalize_path(str(row["path"]))
             if not path:
                 continue
-            by_pr[int(row["pull_request_id"])].append(path)
+            pr_id = int(row["pull_request_id"])
+            by_pr[pr_id].append(path)
+            created_at[pr_id] = str(row["created_at"])
 
-        return [sorted(set(paths)) for _, paths in sorted(by_pr.items())]
+        return sorted(
+            ((created_at[pr_id], sorted(set(paths))) for pr_id, paths in by_pr.items()),
+            key=lambda item: item[0],
+        )
     finally:
         conn.close()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from ..time import require_dt_utc
+from ..time import cutoff_key_utc, require_dt_utc
 from .artifacts import BoundaryModelArtifact
+from .cutoffs import BoundaryCutoffPolicy, boundary_cutoff
 from .inference import BoundaryInferenceContext, get_boundary_strategy
 from .io import write_boundary_artifact
 from .models import BoundaryModel, MembershipMode
@@ -58,3 +60,82 @@ def write_boundary_model_artifacts(
         signal_rows=signal_rows,
         manifest_metadata=manifest_metadata,
     )
+
+
+def build_boundary_models(
+    *,
+    repo_full_name: str,
+    cutoffs_utc: Iterable[datetime],
+    strategy_id: str = "hybrid_path_cochange.v1",
+    data_dir: str | Path = "data",
+    membership_mode: MembershipMode = MembershipMode.MIXED,
+    strategy_config: dict[str, Any] | None = None,
+) -> Iterator[tuple[datetime, BoundaryModel, list[dict[str, Any]]]]:
+    """Build models at each distinct cutoff, oldest first.
+
+    Strategies exposing `infer_many` build incrementally across cutoffs;
+    others run a full `infer` per cutoff.
+    """
+    strategy = get_boundary_strategy(strategy_id)
+    cutoffs = sorted({require_dt_utc(c, name="cutoff_utc") for c in cutoffs_utc})
+    contexts = [
+        BoundaryInferenceContext(
+            repo_full_name=repo_full_name,
+            cutoff_utc=cutoff,
+            data_dir=data_dir,
+            membership_mode=membership_mode,
+            config=dict(strategy_config or {}),
+        )
+        for cutoff in cutoffs
+    ]
+    infer_many = getattr(strategy, "infer_many", None)
+    results = (
+        infer_many(contexts)
+        if infer_many is not None
+        else (strategy.infer(context) for context in contexts)
+    )
+    for cutoff, (model, signal_rows) in zip(cutoffs, results):
+        yield cutoff, model, signal_rows
+
+
+def write_boundary_model_artifacts_for_cutoffs(
+    *,
+    repo_full_name: str,
+    cutoffs_utc: Iterable[datetime],
+    strategy_id: str = "hybrid_path_cochange.v1",
+    data_dir: str | Path = "data",
+    membership_mode: MembershipMode = MembershipMode.MIXED,
+    strategy_config: dict[str, Any] | None = None,
+    cutoff_policy: BoundaryCutoffPolicy | str = BoundaryCutoffPolicy.EXACT,
+    manifest_metadata: dict[str, Any] | None = None,
+) -> dict[str, BoundaryModelArtifact]:
+    """Write one artifact per bucketed cutoff, keyed by cutoff key.
+
+    PR cutoffs are mapped through `cutoff_policy` first, so e.g. a daily
+    policy writes at most one artifact per day for a whole cohort. Readers
+    must look artifacts up with the same policy (`boundary_cutoff_key`).
+    """
+    policy = BoundaryCutoffPolicy(cutoff_policy)
+    buckets = {boundary_cutoff(c, policy) for c in cutoffs_utc}
+    out: dict[str, BoundaryModelArtifact] = {}
+    for cutoff, model, signal_rows in build_boundary_models(
+        repo_full_name=repo_full_name,
+        cutoffs_utc=buckets,
+        strategy_id=strategy_id,
+        data_dir=data_dir,
+        membership_mode=membership_mode,
+        strategy_config=strategy_config,
+    ):
+        cutoff_key = cutoff_key_utc(cutoff)
+        metadata = dict(manifest_metadata or {})
+        if policy != BoundaryCutoffPolicy.EXACT:
+            metadata["cutoff_policy"] = policy.value
+        out[cutoff_key] = write_boundary_artifact(
+            model=model,
+            repo_full_name=repo_full_name,
+            data_dir=data_dir,
+            cutoff_key=cutoff_key,
+            signal_rows=signal_rows,
+            manifest_metadata=metadata,
+        )
+    return out
@@ -1,4 +1,4 @@
-from .cochange import cochange_scores
+from .cochange import CochangeMatrix, cochange_matrix, cochange_scores
 from .parser import parser_boundary_votes
 from .path import (
     boundary_id_for_name,
@@ -8,8 +8,10 @@ from .path import (
 )
 
 __all__ = [
+    "CochangeMatrix",
     "boundary_id_for_name",
     "boundary_name_for_path",
+    "cochange_matrix",
     "cochange_scores",
     "normalize_path",
     "parser_boundary_votes",
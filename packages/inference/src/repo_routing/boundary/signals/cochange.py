@@ -1,27 +1,112 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from itertools import combinations
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
+
+
+class CochangeMatrix(Mapping[str, dict[str, float]]):
+    """Sparse file co-change scores built from per-PR file sets.
+
+    Files are interned to integer ids and the PR x file incidence is kept
+    sparse: a CSR index (PR -> files) plus one posting array per file
+    (file -> PRs). A file's row of the co-occurrence product is computed on
+    demand (row-by-row sparse product), so memory stays proportional to the
+    incidence rather than to the number of co-changed pairs. PRs can be
+    appended with `add_file_sets`, which is how incremental boundary builds
+    advance from one cutoff to the next.
+
+    Reading `matrix[a]` gives the same `{b: count(a, b) / count(a)}` dict,
+    sorted by neighbour path, that `cochange_scores` returns for `a`. Only
+    files that co-changed with at least one other file are keys.
+
+    PRs touching more than `max_pr_files` files (when set) are left out of
+    the counts; large vendoring or rename PRs otherwise dominate memory and
+    tie every file they touch together.
+    """
+
+    def __init__(self, file_sets: Iterable[list[str]] = (), *, max_pr_files: int | None = None) -> None:
+        self.max_pr_files = max_pr_files
+        self.skipped_prs = 0
+        self.files: list[str] = []
+        self._file_id: dict[str, int] = {}
+        self._pr_indptr = array("l", [0])
+        self._pr_indices = array("l")
+        self._file_prs: list[array] = []
+        self._file_freq: list[int] = []
+        # A file has a row iff it shares some PR with another file.
+        self._has_row: list[bool] = []
+        self.add_file_sets(file_sets)
+
+    def add_file_sets(self, file_sets: Iterable[list[str]]) -> set[str]:
+        """Append PRs; return the files whose rows may have changed."""
+        touched: set[str] = set()
+        for file_set in file_sets:
+            uniq = sorted(set(file_set))
+            if self.max_pr_files is not None and len(uniq) > self.max_pr_files:
+                self.skipped_prs += 1
+                continue
+            pr = len(self._pr_indptr) - 1
+            for f in uniq:
+                i = self._file_id.get(f)
+                if i is None:
+                    i = len(self.files)
+                    self._file_id[f] = i
+                    self.files.append(f)
+                    self._file_prs.append(array("l"))
+                    self._file_freq.append(0)
+                    self._has_row.append(False)
+                self._pr_indices.append(i)
+                self._file_prs[i].append(pr)
+                self._file_freq[i] += 1
+                if len(uniq) >= 2:
+                    self._has_row[i] = True
+            self._pr_indptr.append(len(self._pr_indices))
+            touched.update(uniq)
+        return touched
+
+    def _row_counts(self, i: int) -> Counter[int]:
+        counts: Counter[int] = Counter()
+        pr_indptr = self._pr_indptr
+        pr_indices = self._pr_indices
+        for pr in self._file_prs[i]:
+            counts.update(pr_indices[pr_indptr[pr] : pr_indptr[pr + 1]])
+        del counts[i]
+        return counts
+
+    def row(self, path: str) -> dict[str, float]:
+        i = self._file_id.get(path)
+        if i is None or not self._has_row[i]:
+            return {}
+        freq = float(self._file_freq[i])
+        counts = self._row_counts(i)
+        files = self.files
+        return {
+            files[j]: float(counts[j]) / freq
+            for j in sorted(counts, key=files.__getitem__)
+        }
+
+    def __getitem__(self, path: str) -> dict[str, float]:
+        out = self.row(path)
+        if not out:
+            raise KeyError(path)
+        return out
+
+    def __contains__(self, path: object) -> bool:
+        i = self._file_id.get(path) if isinstance(path, str) else None
+        return i is not None and self._has_row[i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(f for i, f in enumerate(self.files) if self._has_row[i]))
+
+    def __len__(self) -> int:
+        return sum(self._has_row)
+
+
+def cochange_matrix(file_sets: list[list[str]], *, max_pr_files: int | None = None) -> CochangeMatrix:
+    return CochangeMatrix(file_sets, max_pr_files=max_pr_files)
 
 
 def cochange_scores(file_sets: list[list[str]]) -> dict[str, dict[str, float]]:
-    file_freq: Counter[str] = Counter()
-    pair_freq: Counter[tuple[str, str]] = Counter()
-
-    for file_set in file_sets:
-        uniq = sorted(set(file_set))
-        for f in uniq:
-            file_freq[f] += 1
-        for a, b in combinations(uniq, 2):
-            pair_freq[(a, b)] += 1
-
-    out: dict[str, dict[str, float]] = defaultdict(dict)
-    for (a, b), c in pair_freq.items():
-        ca = file_freq[a]
-        cb = file_freq[b]
-        if ca > 0:
-            out[a][b] = float(c) / float(ca)
-        if cb > 0:
-            out[b][a] = float(c) / float(cb)
-
-    return {k: dict(sorted(v.items())) for k, v in sorted(out.items())}
+    matrix = cochange_matrix(file_sets)
+    return {f: matrix.row(f) for f in matrix}
@@ -12,8 +12,12 @@ from ..artifacts.writer import (
     iter_pr_numbers_created_in_window,
     pr_created_at,
 )
+from ..boundary.cutoffs import BoundaryCutoffPolicy, boundary_cutoff
 from ..boundary.models import MembershipMode
-from ..boundary.pipeline import write_boundary_model_artifacts
+from ..boundary.pipeline import (
+    write_boundary_model_artifacts,
+    write_boundary_model_artifacts_for_cutoffs,
+)
 from ..config import RepoRoutingConfig
 from ..paths import repo_codeowners_dir, repo_db_path
 from ..registry import RouterSpec
@@ -150,17 +154,18 @@ def boundary_build(
     parser_snapshot_root: str | None = typer.Option(None, help="Pinned source snapshot root"),
     parser_weight: float = typer.Option(0.2, help="Parser signal channel weight"),
     parser_strict: bool = typer.Option(False, help="Fail if parser snapshot is unavailable"),
+    cutoff_policy: str = typer.Option(
+        "exact",
+        help="Cutoff bucketing: exact | hourly | daily (build at the start of the bucket)",
+    ),
 ):
     """Build deterministic boundary model artifacts for a repo/cutoff."""
     cfg = RepoRoutingConfig(repo=repo, data_dir=data_dir)
     cutoff = _parse_iso_utc(as_of, param="--as-of")
 
-    try:
-        mode = MembershipMode(membership_mode.lower())
-    except ValueError as exc:
-        raise typer.BadParameter(
-            "--membership-mode must be one of: hard, overlap, mixed"
-        ) from exc
+    mode = _parse_membership_mode(membership_mode)
+    policy = _parse_cutoff_policy(cutoff_policy)
+    cutoff = boundary_cutoff(cutoff, policy)
 
     artifact = write_boundary_model_artifacts(
         repo_full_name=cfg.repo,
@@ -169,15 +174,15 @@ def boundary_build(
         strategy_id=strategy,
         data_dir=cfg.data_dir,
         membership_mode=mode,
-        strategy_config={
-            "path_weight": path_weight,
-            "cochange_weight": cochange_weight,
-            "parser_enabled": parser_enabled,
-            "parser_backend_id": parser_backend_id,
-            "parser_snapshot_root": parser_snapshot_root,
-            "parser_weight": parser_weight,
-            "parser_strict": parser_strict,
-        },
+        strategy_config=_boundary_strategy_config(
+            path_weight=path_weight,
+            cochange_weight=cochange_weight,
+            parser_enabled=parser_enabled,
+            parser_backend_id=parser_backend_id,
+            parser_snapshot_root=parser_snapshot_root,
+            parser_weight=parser_weight,
+            parser_strict=parser_strict,
+        ),
     )
 
     print(
@@ -189,6 +194,142 @@ def boundary_build(
     )
 
 
+@boundary_app.command("build-cohort")
+def boundary_build_cohort(
+    repo: str = typer.Option(..., help="Repository in owner/name format"),
+    start_at: str | None = typer.Option(
+        None, "--from", "--start-at", help="ISO created_at window start"
+    ),
+    end_at: str | None = typer.Option(None, help="ISO created_at window end"),
+    pr: list[int] = typer.Option(
+        [],
+        "--pr",
+        help="Explicit PR number(s). If provided, window options are ignored.",
+    ),
+    data_dir: str = typer.Option(DEFAULT_DATA_DIR, help="Base directory for per-repo data"),
+    strategy: str = typer.Option(
+        "hybrid_path_cochange.v1", help="Boundary strategy id"
+    ),
+    membership_mode: str = typer.Option(
+        "mixed", help="Membership mode: hard | overlap | mixed"
+    ),
+    path_weight: float = typer.Option(1.0, help="Path prior weight"),
+    cochange_weight: float = typer.Option(0.35, help="Co-change signal weight"),
+    parser_enabled: bool = typer.Option(False, help="Enable parser signal channel"),
+    parser_backend_id: str = typer.Option(
+        "python.ast.v1",
+        help="Parser backend id (python.ast.v1 | zig.regex.v1 | typescript_javascript.regex.v1)",
+    ),
+    parser_snapshot_root: str | None = typer.Option(None, help="Pinned source snapshot root"),
+    parser_weight: float = typer.Option(0.2, help="Parser signal channel weight"),
+    parser_strict: bool = typer.Option(False, help="Fail if parser snapshot is unavailable"),
+    cutoff_policy: str = typer.Option(
+        "daily",
+        help="Cutoff bucketing: exact | hourly | daily (one artifact per bucket)",
+    ),
+):
+    """Build boundary model artifacts for every cutoff in a PR cohort.
+
+    Each PR's cutoff is its created_at; cutoffs are bucketed by
+    `--cutoff-policy` so the cohort shares one artifact per bucket. Evaluate
+    with the same `boundary_cutoff_policy` so PR inputs resolve these keys.
+    """
+    cfg = RepoRoutingConfig(repo=repo, data_dir=data_dir)
+    mode = _parse_membership_mode(membership_mode)
+    policy = _parse_cutoff_policy(cutoff_policy)
+    start_dt = _parse_iso_utc(start_at, param="--start-at") if start_at else None
+    end_dt = _parse_iso_utc(end_at, param="--end-at") if end_at else None
+
+    if pr:
+        pr_numbers = sorted(set(pr))
+    else:
+        pr_numbers = list(
+            iter_pr_numbers_created_in_window(
+                repo=cfg.repo,
+                data_dir=cfg.data_dir,
+                start_at=start_dt,
+                end_at=end_dt,
+            )
+        )
+    if not pr_numbers:
+        raise typer.BadParameter("no PRs selected")
+
+    cutoffs: list[datetime] = []
+    for pr_number in pr_numbers:
+        created = pr_created_at(repo=cfg.repo, data_dir=cfg.data_dir, pr_number=pr_number)
+        if created is None:
+            raise typer.BadParameter(f"missing created_at for {cfg.repo}#{pr_number}")
+        cutoffs.append(created)
+
+    artifacts = write_boundary_model_artifacts_for_cutoffs(
+        repo_full_name=cfg.repo,
+        cutoffs_utc=cutoffs,
+        strategy_id=strategy,
+        data_dir=cfg.data_dir,
+        membership_mode=mode,
+        strategy_config=_boundary_strategy_config(
+            path_weight=path_weight,
+            cochange_weight=cochange_weight,
+            parser_enabled=parser_enabled,
+            parser_backend_id=parser_backend_id,
+            parser_snapshot_root=parser_snapshot_root,
+            parser_weight=parser_weight,
+            parser_strict=parser_strict,
+        ),
+        cutoff_policy=policy,
+    )
+
+    for cutoff_key in sorted(artifacts):
+        artifact = artifacts[cutoff_key]
+        print(
+            "[bold]wrote[/bold] "
+            f"cutoff={cutoff_key} "
+            f"hash={artifact.manifest.model_hash} "
+            f"units={artifact.manifest.unit_count} "
+            f"boundaries={artifact.manifest.boundary_count}"
+        )
+    print(f"prs={len(pr_numbers)} artifacts={len(artifacts)} policy={policy.value}")
+
+
+def _parse_membership_mode(value: str) -> MembershipMode:
+    try:
+        return MembershipMode(value.lower())
+    except ValueError as exc:
+        raise typer.BadParameter(
+            "--membership-mode must be one of: hard, overlap, mixed"
+        ) from exc
+
+
+def _parse_cutoff_policy(value: str) -> BoundaryCutoffPolicy:
+    try:
+        return BoundaryCutoffPolicy(value.lower())
+    except ValueError as exc:
+        raise typer.BadParameter(
+            "--cutoff-policy must be one of: exact, hourly, daily"
+        ) from exc
+
+
+def _boundary_strategy_config(
+    *,
+    path_weight: float,
+    cochange_weight: float,
+    parser_enabled: bool,
+    parser_backend_id: str,
+    parser_snapshot_root: str | None,
+    parser_weight: float,
+    parser_strict: bool,
+) -> dict[str, object]:
+    return {
+        "path_weight": path_weight,
+        "cochange_weight": cochange_weight,
+        "parser_enabled": parser_enabled,
+        "parser_backend_id": parser_backend_id,
+        "parser_snapshot_root": parser_snapshot_root,
+        "parser_weight": parser_weight,
+        "parser_strict": parser_strict,
+    }
+
+
 @app.command("build-artifacts")
 def build_artifacts(
     repo: str = typer.Option(..., help="Repository in owner/name format"),
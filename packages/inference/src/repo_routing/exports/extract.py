@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable
 
+from ..history.db import connect_history_db
 from ..history.models import PullRequestSnapshot
 from ..history.reader import HistoryReader
 from ..parsing.gates import parse_gate_fields
@@ -171,8 +171,7 @@ def export_pr_activity_rows(
     end_at: datetime,
 ) -> list[dict[str, object]]:
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -287,8 +286,7 @@ def export_truth_behavior_rows(
     exclude_bots: bool = True,
 ) -> list[dict[str, object]]:
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -363,8 +361,7 @@ def export_truth_intent_rows(
     intent_window: timedelta = timedelta(minutes=60),
 ) -> list[dict[str, object]]:
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
     try:
         row = conn.execute(
             "select id from repos where full_name = ?", (repo,)
@@ -1,5 +1,6 @@
 """Offline reader for per-repo history.sqlite."""
 
 from .reader import HistoryReader
+from .timeline import ActivityTimeline
 
-__all__ = ["HistoryReader"]
+__all__ = ["ActivityTimeline", "HistoryReader"]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+# Applied to every read-side history.sqlite connection. `query_only` guards
+# against accidental writes; the cache/mmap settings mirror the ingest profile
+# so large as-of scans stay in memory.
+READER_PRAGMAS: tuple[tuple[str, str | int], ...] = (
+    ("query_only", "ON"),
+    ("cache_size", -32768),
+    ("mmap_size", 268435456),
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 5000),
+)
+
+
+def connect_history_db(
+    db_path: str | Path, *, check_same_thread: bool = True
+) -> sqlite3.Connection:
+    """Open a history.sqlite read-only with `sqlite3.Row` rows.
+
+    Uses a `mode=ro` URI, so the file is never created or written and the
+    connection can read a WAL database while an ingest is writing it.
+    `check_same_thread=False` lets several threads share the connection
+    (safe here since it never writes). Callers must close the returned
+    connection.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    for name, value in READER_PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
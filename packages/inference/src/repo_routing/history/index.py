@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 
 from .models import UserActivityCount
 from .reader import HistoryReader
+from .timeline import ActivityTimeline
 
 
 def popularity_index(
@@ -12,10 +13,18 @@ def popularity_index(
     *,
     as_of: datetime,
     lookback_days: int = 180,
+    timeline: ActivityTimeline | None = None,
 ) -> list[UserActivityCount]:
-    """Rank users by review/comment activity in a lookback window."""
+    """Rank users by review/comment activity in a lookback window.
+
+    With a preloaded `timeline` the counts come from its per-login prefix
+    sums instead of a scan of the window's reviews and comments.
+    """
 
     start = as_of - timedelta(days=lookback_days)
-    counts = Counter(reader.iter_participants(start=start, end=as_of))
+    if timeline is not None:
+        counts = Counter(timeline.participant_counts(start=start, end=as_of))
+    else:
+        counts = Counter(reader.iter_participants(start=start, end=as_of))
     ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
     return [UserActivityCount(login=login, count=count) for login, count in ranked]
@@ -8,7 +8,9 @@ from typing import Iterable
 
 from ..paths import repo_db_path
 from ..time import dt_sql_utc, parse_dt_utc, require_dt_utc
+from .db import connect_history_db
 from .models import PullRequestFile, PullRequestSnapshot, ReviewRequest
+from .timeline import ActivityTimeline
 
 
 @dataclass(frozen=True)
@@ -31,11 +33,15 @@ class HistoryReader:
         self.db_path = repo_db_path(
             repo_full_name=repo_full_name, data_dir=self.data_dir
         )
-        self._conn = sqlite3.connect(str(self.db_path))
-        self._conn.row_factory = sqlite3.Row
+        self._conn = connect_history_db(self.db_path)
         self._repo_ids: RepoIds | None = None
         self.strict_as_of = strict_as_of
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The underlying connection, for as-of queries not covered here."""
+        return self._conn
+
     def close(self) -> None:
         self._conn.close()
 
@@ -114,6 +120,10 @@ class HistoryReader:
             review_requests=review_requests,
         )
 
+    def activity_timeline(self) -> ActivityTimeline:
+        """Load the repo's review/comment activity for repeated as-of queries."""
+        return ActivityTimeline.load(self._conn, repo_id=self.repo_ids().repo_id)
+
     def iter_participants(self, *, start: datetime, end: datetime) -> Iterable[str]:
         """Yield user logins who commented or reviewed in [start, end]."""
         repo_id = self.repo_ids().repo_id
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import sqlite3
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator
+
+from ..time import dt_sql_utc, parse_dt_utc
+
+
+@dataclass(frozen=True)
+class ActivityEvent:
+    login: str
+    occurred_at: datetime
+    kind: str
+    pr_id: int
+
+
+@dataclass
+class _LoginActivity:
+    """One login's events in timeline order, with parallel lookup arrays."""
+
+    events: list[ActivityEvent] = field(default_factory=list)
+    times: list[datetime] = field(default_factory=list)
+    raw_times: list[str] = field(default_factory=list)
+    user_types: list[str | None] = field(default_factory=list)
+    # non_bot_prefix[i] = number of events before i whose user type is not "Bot".
+    non_bot_prefix: list[int] = field(default_factory=lambda: [0])
+
+    def window(self, start_s: str, end_s: str, start: datetime, end: datetime) -> tuple[int, int]:
+        lo = bisect_left(self.times, start)
+        hi = bisect_right(self.times, end)
+        # Bounds follow the SQL TEXT comparisons these lookups replace.
+        while lo < hi and self.raw_times[lo] < start_s:
+            lo += 1
+        while hi > lo and self.raw_times[hi - 1] > end_s:
+            hi -= 1
+        return lo, hi
+
+
+class ActivityTimeline:
+    """Review/comment activity of one repo, indexed by login and time.
+
+    Loaded once from history.sqlite, it answers as-of window queries (who was
+    active, how often, which events) by binary search instead of rescanning
+    `reviews`/`comments` per PR. Head SHAs and changed paths of event PRs are
+    resolved on first use and memoized, since they do not depend on the PR
+    being analyzed.
+
+    The timeline is a snapshot of the database when loaded; rows ingested
+    later are not seen.
+    """
+
+    def __init__(self, *, repo_id: int, by_login: dict[str, _LoginActivity]) -> None:
+        self.repo_id = repo_id
+        self._by_login = by_login
+        self._head_intervals: dict[int, list[tuple[str, int, str | None, str | None]]] | None = None
+        self._head_at: dict[tuple[int, str], str | None] = {}
+        self._pr_paths: dict[tuple[int, str], list[str]] = {}
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection, *, repo_id: int) -> "ActivityTimeline":
+        rows: list[tuple[datetime, int, str, str, str, str | None]] = []
+
+        for r in conn.execute(
+            """
+            select r.pull_request_id as pr_id,
+                   r.submitted_at as occurred_at,
+                   u.login as login,
+                   u.type as type
+            from reviews r
+            join users u on u.id = r.user_id
+            where r.repo_id = ?
+              and r.submitted_at is not null
+              and u.login is not null
+            """,
+            (repo_id,),
+        ):
+            occurred_at = parse_dt_utc(r["occurred_at"])
+            if occurred_at is None:
+                continue
+            rows.append(
+                (occurred_at, int(r["pr_id"]), str(r["login"]), "review_submitted", str(r["occurred_at"]), r["type"])
+            )
+
+        for r in _comment_rows(conn, repo_id=repo_id):
+            occurred_at = parse_dt_utc(r["occurred_at"])
+            if occurred_at is None:
+                continue
+            kind = "comment_created"
+            if r["comment_type"] == "review" or r["review_id"] is not None:
+                kind = "review_comment_created"
+            rows.append(
+                (occurred_at, int(r["pr_id"]), str(r["login"]), kind, str(r["occurred_at"]), r["type"])
+            )
+
+        rows.sort(key=lambda x: (x[0], x[1], x[2].lower(), x[3]))
+
+        by_login: dict[str, _LoginActivity] = {}
+        for occurred_at, pr_id, login, kind, raw, user_type in rows:
+            acts = by_login.get(login)
+            if acts is None:
+                acts = _LoginActivity()
+                by_login[login] = acts
+            acts.events.append(
+                ActivityEvent(login=login, occurred_at=occurred_at, kind=kind, pr_id=pr_id)
+            )
+            acts.times.append(occurred_at)
+            acts.raw_times.append(raw)
+            acts.user_types.append(user_type)
+            acts.non_bot_prefix.append(acts.non_bot_prefix[-1] + (0 if user_type == "Bot" else 1))
+        return cls(repo_id=repo_id, by_login=by_login)
+
+    def participants(self, *, start: datetime, end: datetime) -> list[tuple[str, str | None]]:
+        """Distinct (login, user type) pairs with activity in [start, end]."""
+        start_s, end_s = _window_bounds(start, end)
+        out: list[tuple[str, str | None]] = []
+        for login, acts in self._by_login.items():
+            lo, hi = acts.window(start_s, end_s, start, end)
+            for user_type in dict.fromkeys(acts.user_types[lo:hi]):
+                out.append((login, user_type))
+        return out
+
+    def participant_counts(self, *, start: datetime, end: datetime) -> dict[str, int]:
+        """Event counts in [start, end] per login, excluding `Bot` users."""
+        start_s, end_s = _window_bounds(start, end)
+        out: dict[str, int] = {}
+        for login, acts in self._by_login.items():
+            lo, hi = acts.window(start_s, end_s, start, end)
+            count = acts.non_bot_prefix[hi] - acts.non_bot_prefix[lo]
+            if count > 0:
+                out[login] = count
+        return out
+
+    def events(self, login: str, *, start: datetime, end: datetime) -> Iterator[ActivityEvent]:
+        """Yield the login's events in [start, end] in timeline order."""
+        acts = self._by_login.get(login)
+        if acts is None:
+            return
+        start_s, end_s = _window_bounds(start, end)
+        lo, hi = acts.window(start_s, end_s, start, end)
+        yield from acts.events[lo:hi]
+
+    def pr_head_sha_as_of(
+        self, conn: sqlite3.Connection, *, pr_id: int, as_of: datetime
+    ) -> str | None:
+        as_of_s = dt_sql_utc(as_of, timespec="microseconds")
+        key = (pr_id, as_of_s)
+        if key in self._head_at:
+            return self._head_at[key]
+        if self._head_intervals is None:
+            self._head_intervals = _load_head_intervals(conn)
+        best: tuple[str, int] | None = None
+        head_sha: str | None = None
+        for start_at, start_id, end_at, sha in self._head_intervals.get(pr_id, ()):
+            if start_at > as_of_s:
+                continue
+            if end_at is not None and not as_of_s < end_at:
+                continue
+            if best is None or (start_at, start_id) > best:
+                best = (start_at, start_id)
+                head_sha = sha
+        self._head_at[key] = head_sha
+        return head_sha
+
+    def pr_paths(self, conn: sqlite3.Connection, *, pr_id: int, head_sha: str) -> list[str]:
+        key = (pr_id, head_sha)
+        paths = self._pr_paths.get(key)
+        if paths is None:
+            rows = conn.execute(
+                """
+                select path from pull_request_files
+                where repo_id = ? and pull_request_id = ? and head_sha = ?
+                order by path asc
+                """,
+                (self.repo_id, pr_id, head_sha),
+            ).fetchall()
+            paths = [str(r["path"]) for r in rows]
+            self._pr_paths[key] = paths
+        return paths
+
+
+def _window_bounds(start: datetime, end: datetime) -> tuple[str, str]:
+    return (
+        dt_sql_utc(start, timespec="microseconds"),
+        dt_sql_utc(end, timespec="microseconds"),
+    )
+
+
+def _comment_rows(conn: sqlite3.Connection, *, repo_id: int) -> list[sqlite3.Row]:
+    try:
+        return conn.execute(
+            """
+            select c.pull_request_id as pr_id,
+                   c.created_at as occurred_at,
+                   c.comment_type as comment_type,
+                   c.review_id as review_id,
+                   u.login as login,
+                   u.type as type
+            from comments c
+            join users u on u.id = c.user_id
+            where c.repo_id = ?
+              and c.pull_request_id is not null
+              and c.created_at is not null
+              and u.login is not null
+            """,
+            (repo_id,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        # Minimal schemas without review linkage: every comment is a plain comment.
+        return conn.execute(
+            """
+            select c.pull_request_id as pr_id,
+                   c.created_at as occurred_at,
+                   null as comment_type,
+                   null as review_id,
+                   u.login as login,
+                   u.type as type
+            from comments c
+            join users u on u.id = c.user_id
+            where c.repo_id = ?
+              and c.pull_request_id is not null
+              and c.created_at is not null
+              and u.login is not null
+            """,
+            (repo_id,),
+        ).fetchall()
+
+
+def _load_head_intervals(
+    conn: sqlite3.Connection,
+) -> dict[int, list[tuple[str, int, str | None, str | None]]]:
+    """Head intervals per PR as (start_at, start_event_id, end_at, head_sha).
+
+    `end_at` is None for open intervals. Intervals whose end event exists but
+    has no timestamp can never contain an as-of time and are dropped, as are
+    intervals whose start has no timestamp.
+    """
+    rows = conn.execute(
+        """
+        select phi.pull_request_id as pr_id,
+               phi.head_sha as head_sha,
+               se.id as start_id,
+               se.occurred_at as start_at,
+               ee.id as end_id,
+               ee.occurred_at as end_at
+        from pull_request_head_intervals phi
+        join events se on se.id = phi.start_event_id
+        left join events ee on ee.id = phi.end_event_id
+        """
+    ).fetchall()
+    out: dict[int, list[tuple[str, int, str | None, str | None]]] = {}
+    for r in rows:
+        if r["start_at"] is None:
+            continue
+        if r["end_id"] is not None and r["end_at"] is None:
+            continue
+        end_at = None if r["end_id"] is None else str(r["end_at"])
+        out.setdefault(int(r["pr_id"]), []).append(
+            (str(r["start_at"]), int(r["start_id"]), end_at, r["head_sha"])
+        )
+    return out
@@ -5,11 +5,11 @@ from datetime import datetime
 from pathlib import Path
 
 from ..boundary.consumption import project_files_to_boundary_footprint
-from ..boundary.io import read_boundary_artifact
+from ..boundary.cutoffs import boundary_cutoff_key
+from ..boundary.handle import open_boundary_artifact
 from ..history.reader import HistoryReader
-from ..paths import repo_db_path
 from ..parsing.gates import parse_gate_fields
-from ..time import cutoff_key_utc, dt_sql_utc, require_dt_utc
+from ..time import dt_sql_utc, require_dt_utc
 from .models import (
     PRGateFields,
     PRInputBuilderOptions,
@@ -19,86 +19,72 @@ from .models import (
 
 
 def _recent_activity_window(
+    conn: sqlite3.Connection,
     *,
-    repo: str,
-    data_dir: str | Path,
+    repo_id: int,
     cutoff: datetime,
     options: PRInputBuilderOptions,
 ) -> list[RecentActivityEvent]:
     if options.recent_activity_limit <= 0:
         return []
 
-    db_path = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    try:
-        row = conn.execute(
-            "select id from repos where full_name = ?",
-            (repo,),
-        ).fetchone()
-        if row is None:
-            raise KeyError(f"repo not found in db: {repo}")
-        repo_id = int(row["id"])
-
-        start = cutoff - options.recent_activity_window
-        start_s = dt_sql_utc(start, timespec="microseconds")
-        cutoff_s = dt_sql_utc(cutoff, timespec="microseconds")
-
-        limit = int(options.recent_activity_limit)
-        rows = conn.execute(
-            """
-            select kind, actor_login, occurred_at
-            from (
-              select
-                'review' as kind,
-                u.login as actor_login,
-                r.submitted_at as occurred_at
-              from reviews r
-              join users u on u.id = r.user_id
-              where r.repo_id = ?
-                and r.submitted_at is not null
-                and r.submitted_at >= ?
-                and r.submitted_at <= ?
-                and u.login is not null
-                and (u.type is null or u.type != 'Bot')
-
-              union all
-
-              select
-                'comment' as kind,
-                u.login as actor_login,
-                c.created_at as occurred_at
-              from comments c
-              join users u on u.id = c.user_id
-              where c.repo_id = ?
-                and c.pull_request_id is not null
-                and c.created_at is not null
-                and c.created_at >= ?
-                and c.created_at <= ?
-                and u.login is not null
-                and (u.type is null or u.type != 'Bot')
-            )
-            order by occurred_at desc, actor_login asc, kind asc
-            limit ?
-            """,
-            (repo_id, start_s, cutoff_s, repo_id, start_s, cutoff_s, limit),
-        ).fetchall()
-
-        out = [
-            RecentActivityEvent(
-                kind=str(r["kind"]),
-                actor_login=str(r["actor_login"]),
-                occurred_at=datetime.fromisoformat(
-                    str(r["occurred_at"]).replace("Z", "+00:00")
-                ),
-            )
-            for r in rows
-            if r["occurred_at"] is not None
-        ]
-        out.sort(key=lambda e: (e.occurred_at, e.actor_login.lower(), e.kind))
-        return out
-    finally:
-        conn.close()
+    start = cutoff - options.recent_activity_window
+    start_s = dt_sql_utc(start, timespec="microseconds")
+    cutoff_s = dt_sql_utc(cutoff, timespec="microseconds")
+
+    limit = int(options.recent_activity_limit)
+    rows = conn.execute(
+        """
+        select kind, actor_login, occurred_at
+        from (
+          select
+            'review' as kind,
+            u.login as actor_login,
+            r.submitted_at as occurred_at
+          from reviews r
+          join users u on u.id = r.user_id
+          where r.repo_id = ?
+            and r.submitted_at is not null
+            and r.submitted_at >= ?
+            and r.submitted_at <= ?
+            and u.login is not null
+            and (u.type is null or u.type != 'Bot')
+
+          union all
+
+          select
+            'comment' as kind,
+            u.login as actor_login,
+            c.created_at as occurred_at
+          from comments c
+          join users u on u.id = c.user_id
+          where c.repo_id = ?
+            and c.pull_request_id is not null
+            and c.created_at is not null
+            and c.created_at >= ?
+            and c.created_at <= ?
+            and u.login is not null
+            and (u.type is null or u.type != 'Bot')
+        )
+        order by occurred_at desc, actor_login asc, kind asc
+        limit ?
+        """,
+        (repo_id, start_s, cutoff_s, repo_id, start_s, cutoff_s, limit),
+    ).fetchall()
+
+    out = [
+        RecentActivityEvent(
+            kind=str(r["kind"]),
+            actor_login=str(r["actor_login"]),
+            occurred_at=datetime.fromisoformat(
+                str(r["occurred_at"]).replace("Z", "+00:00")
+            ),
+        )
+        for r in rows
+        if r["occurred_at"] is not None
+    ]
+    out.sort(key=lambda e: (e.occurred_at, e.actor_login.lower(), e.kind))
+    return out
 
 
 def build_pr_input_bundle(
@@ -108,12 +94,24 @@ def build_pr_input_bundle(
     data_dir: str | Path,
     *,
     options: PRInputBuilderOptions | None = None,
+    reader: HistoryReader | None = None,
 ) -> PRInputBundle:
+    """Build the as-of input bundle for one PR.
+
+    Pass an open strict `reader` to reuse one connection across many PRs
+    (e.g. an evaluation cohort); otherwise one is opened for this call.
+    """
+    if reader is None:
+        with HistoryReader(
+            repo_full_name=repo, data_dir=data_dir, strict_as_of=True
+        ) as own_reader:
+            return build_pr_input_bundle(
+                repo, pr_number, cutoff, data_dir, options=options, reader=own_reader
+            )
+
     cutoff_utc = require_dt_utc(cutoff, name="cutoff")
     opts = options or PRInputBuilderOptions()
-
-    with HistoryReader(repo_full_name=repo, data_dir=data_dir, strict_as_of=True) as reader:
-        snapshot = reader.pull_request_snapshot(number=pr_number, as_of=cutoff_utc)
+    snapshot = reader.pull_request_snapshot(number=pr_number, as_of=cutoff_utc)
 
     changed_files = sorted(snapshot.changed_files, key=lambda f: f.path)
     review_requests = sorted(
@@ -132,12 +130,13 @@ def build_pr_input_bundle(
     )
 
     boundary_artifact = None
+    boundary_key = boundary_cutoff_key(cutoff_utc, opts.boundary_cutoff_policy)
     try:
-        boundary_artifact = read_boundary_artifact(
+        boundary_artifact = open_boundary_artifact(
             repo_full_name=repo,
             data_dir=data_dir,
             strategy_id=opts.boundary_strategy_id,
-            cutoff_key=cutoff_key_utc(cutoff_utc),
+            cutoff_key=boundary_key,
         )
     except FileNotFoundError:
         if opts.boundary_required:
@@ -155,6 +154,7 @@ def build_pr_input_bundle(
         }
         boundary_strategy = opts.boundary_strategy_id
         boundary_strategy_version = None
+        boundary_key_used = None
     else:
         footprint = project_files_to_boundary_footprint(
             paths=[f.path for f in changed_files],
@@ -171,12 +171,13 @@ def build_pr_input_bundle(
         }
         boundary_strategy = footprint.strategy_id
         boundary_strategy_version = footprint.strategy_version
+        boundary_key_used = boundary_key
 
     recent_activity: list[RecentActivityEvent] = []
     if opts.include_recent_activity:
         recent_activity = _recent_activity_window(
-            repo=repo,
-            data_dir=data_dir,
+            reader.conn,
+            repo_id=reader.repo_ids().repo_id,
             cutoff=cutoff_utc,
             options=opts,
         )
@@ -198,5 +199,6 @@ def build_pr_input_bundle(
         boundary_coverage=boundary_coverage,
         boundary_strategy=boundary_strategy,
         boundary_strategy_version=boundary_strategy_version,
+        boundary_cutoff_key=boundary_key_used,
         recent_activity=recent_activity,
     )
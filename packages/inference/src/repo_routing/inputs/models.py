@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
 from ..boundary.consumption.models import PRBoundaryFootprint
+from ..boundary.cutoffs import BoundaryCutoffPolicy
 from ..history.models import PullRequestFile, PullRequestSnapshot, ReviewRequest
 
 
@@ -46,6 +47,7 @@ class PRInputBundle(BaseModel):
     boundary_coverage: dict[str, object] = Field(default_factory=dict)
     boundary_strategy: str | None = None
     boundary_strategy_version: str | None = None
+    boundary_cutoff_key: str | None = None
 
     recent_activity: list[RecentActivityEvent] = Field(default_factory=list)
     repo_profile_path: str | None = None
@@ -59,3 +61,4 @@ class PRInputBuilderOptions(BaseModel):
 
     boundary_strategy_id: str = "hybrid_path_cochange.v1"
     boundary_required: bool = False
+    boundary_cutoff_policy: BoundaryCutoffPolicy = BoundaryCutoffPolicy.EXACT
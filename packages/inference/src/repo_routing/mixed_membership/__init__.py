@@ -5,7 +5,11 @@ from .artifacts import (
 )
 from .config import BoundaryMembershipConfig
 from .dataset import build_boundary_membership_dataset, build_boundary_membership_matrix
-from .pipeline import derive_role_features_for_pr, fit_boundary_membership_model
+from .pipeline import (
+    derive_role_features_for_pr,
+    fit_boundary_membership_model,
+    fit_boundary_membership_models,
+)
 
 __all__ = [
     "BoundaryMembershipConfig",
@@ -13,6 +17,7 @@ __all__ = [
     "build_boundary_membership_dataset",
     "build_boundary_membership_matrix",
     "fit_boundary_membership_model",
+    "fit_boundary_membership_models",
     "derive_role_features_for_pr",
     "write_model_artifact",
     "read_model_artifact",
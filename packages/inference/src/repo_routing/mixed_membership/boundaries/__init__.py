@@ -1,15 +1,19 @@
 from .basis import (
+    SparseUserBoundaryMatrix,
     UserBoundaryMatrix,
     build_user_boundary_activity_frame,
     build_user_boundary_activity_rows,
     pr_boundary_distribution_from_paths,
+    rows_to_sparse_user_boundary_matrix,
     rows_to_user_boundary_matrix,
 )
 
 __all__ = [
+    "SparseUserBoundaryMatrix",
     "UserBoundaryMatrix",
     "build_user_boundary_activity_frame",
     "build_user_boundary_activity_rows",
     "pr_boundary_distribution_from_paths",
+    "rows_to_sparse_user_boundary_matrix",
     "rows_to_user_boundary_matrix",
 ]
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 from ...boundary.signals.path import path_boundary
+from ...history.db import connect_history_db
 from ...paths import repo_db_path
 from ...time import dt_sql_utc, require_dt_utc
 from ..config import BoundaryMembershipConfig
@@ -20,6 +21,40 @@ class UserBoundaryMatrix:
     values: list[list[float]]
 
 
+@dataclass(frozen=True)
+class SparseUserBoundaryMatrix:
+    """Users x boundaries activity as row-major (row, col, value) triplets.
+
+    Most users touch a handful of boundaries, so this stays proportional to
+    the activity rows instead of users x boundaries.
+    """
+
+    users: list[str]
+    boundaries: list[str]
+    row_ix: list[int]
+    col_ix: list[int]
+    data: list[float]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.users), len(self.boundaries))
+
+    def to_csr(self):
+        try:
+            from scipy.sparse import csr_matrix  # type: ignore[import-not-found]
+        except Exception as exc:  # pragma: no cover
+            raise ImportError(
+                "scipy is required for sparse matrices. Install mixed-membership extras."
+            ) from exc
+        return csr_matrix((self.data, (self.row_ix, self.col_ix)), shape=self.shape, dtype=float)
+
+    def to_dense(self) -> UserBoundaryMatrix:
+        values = [[0.0 for _ in self.boundaries] for _ in self.users]
+        for i, j, w in zip(self.row_ix, self.col_ix, self.data):
+            values[i][j] = w
+        return UserBoundaryMatrix(users=self.users, boundaries=self.boundaries, values=values)
+
+
 def pr_boundary_distribution_from_paths(
     *,
     repo: str,
@@ -47,8 +82,7 @@ def build_user_boundary_activity_rows(
     start_utc = cutoff_utc - timedelta(days=cfg.lookback_days)
 
     db = repo_db_path(repo_full_name=repo, data_dir=data_dir)
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(db)
 
     try:
         repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
@@ -259,11 +293,11 @@ def build_user_boundary_activity_frame(
     return pl.DataFrame(schema={"user_login": pl.String, "boundary": pl.String, "weight": pl.Float64})
 
 
-def rows_to_user_boundary_matrix(
+def rows_to_sparse_user_boundary_matrix(
     rows: list[dict[str, Any]],
     *,
     min_user_total_weight: float = 0.0,
-) -> UserBoundaryMatrix:
+) -> SparseUserBoundaryMatrix:
     by_user_boundary: dict[tuple[str, str], float] = defaultdict(float)
     user_totals: dict[str, float] = defaultdict(float)
 
@@ -284,13 +318,30 @@ def rows_to_user_boundary_matrix(
 
     user_ix = {u: i for i, u in enumerate(users)}
     boundary_ix = {b: j for j, b in enumerate(boundaries)}
-    values = [[0.0 for _ in boundaries] for _ in users]
-
-    for (u, b), w in sorted(by_user_boundary.items(), key=lambda kv: (kv[0][0], kv[0][1])):
+    cells: list[tuple[int, int, float]] = []
+    for (u, b), w in by_user_boundary.items():
         i = user_ix.get(u)
         j = boundary_ix.get(b)
         if i is None or j is None:
             continue
-        values[i][j] = float(w)
+        cells.append((i, j, float(w)))
+    cells.sort()
+
+    return SparseUserBoundaryMatrix(
+        users=users,
+        boundaries=boundaries,
+        row_ix=[i for i, _j, _w in cells],
+        col_ix=[j for _i, j, _w in cells],
+        data=[w for _i, _j, w in cells],
+    )
+
 
-    return UserBoundaryMatrix(users=users, boundaries=boundaries, values=values)
+def rows_to_user_boundary_matrix(
+    rows: list[dict[str, Any]],
+    *,
+    min_user_total_weight: float = 0.0,
+) -> UserBoundaryMatrix:
+    return rows_to_sparse_user_boundary_matrix(
+        rows,
+        min_user_total_weight=min_user_total_weight,
+    ).to_dense()
@@ -5,18 +5,23 @@ from typing import Any
 
 from ...time import require_dt_utc
 from ..artifacts import BoundaryMembershipModelArtifact, compute_model_hash
-from ..boundaries.basis import UserBoundaryMatrix, rows_to_user_boundary_matrix
+from ..boundaries.basis import SparseUserBoundaryMatrix, rows_to_sparse_user_boundary_matrix
 from ..config import BoundaryMembershipConfig
 
 
-def _row_normalize(rows: list[list[float]]) -> list[list[float]]:
-    out: list[list[float]] = []
-    for row in rows:
-        s = float(sum(row))
-        if s <= 0:
-            out.append([0.0 for _ in row])
-        else:
-            out.append([float(v) / s for v in row])
+def _row_normalize(M):  # type: ignore[no-untyped-def]
+    """Row-normalise a non-negative array; all-zero rows stay zero.
+
+    Row sums are accumulated left to right (cumsum) so they equal a plain
+    per-row `sum`, keeping normalised values bit-for-bit stable.
+    """
+    import numpy as np  # type: ignore[import-not-found]
+
+    out = np.zeros(M.shape, dtype=float)
+    if M.shape[1] == 0:
+        return out
+    sums = np.cumsum(M, axis=1)[:, -1:]
+    np.divide(M, sums, out=out, where=sums > 0)
     return out
 
 
@@ -35,17 +40,78 @@ def _round_matrix(rows: list[list[float]], ndigits: int = 10) -> list[list[float
     return [[round(float(v), ndigits) for v in row] for row in rows]
 
 
+def _warm_start_factors(
+    *,
+    previous: BoundaryMembershipModelArtifact,
+    matrix: SparseUserBoundaryMatrix,
+    X,  # type: ignore[no-untyped-def]
+    n_components: int,
+    min_overlap: float,
+):  # type: ignore[no-untyped-def]
+    """Initial (W, H) taken from a previous cutoff's model, or None.
+
+    Requires the same number of roles and at least `min_overlap` of the
+    current users and of the current boundaries to be known to `previous`.
+    Users new at this cutoff start from their activity projected on the
+    previous roles. Stored mixes are row-normalised, so W and H are rescaled
+    to X's magnitude by the least-squares factor.
+    """
+    import numpy as np  # type: ignore[import-not-found]
+
+    if len(previous.roles) != n_components:
+        return None
+    users, boundaries = matrix.users, matrix.boundaries
+    known_users = [u in previous.user_role_mix for u in users]
+    known_boundaries = set(previous.boundaries)
+    user_overlap = sum(known_users) / float(len(users))
+    boundary_overlap = sum(1 for b in boundaries if b in known_boundaries) / float(len(boundaries))
+    if min(user_overlap, boundary_overlap) < min_overlap:
+        return None
+
+    H = np.array(
+        [
+            [float(previous.role_boundary_mix.get(role, {}).get(b, 0.0)) for b in boundaries]
+            for role in previous.roles
+        ],
+        dtype=float,
+    )
+    if not H.any():
+        return None
+
+    XH = np.asarray(X @ H.T)
+    W = _row_normalize(XH)
+    for i, u in enumerate(users):
+        if known_users[i]:
+            W[i, :] = previous.user_role_mix[u]
+    W[~W.any(axis=1)] = 1.0 / float(n_components)
+
+    # argmin_a ||X - a W H||: <X, WH> / ||WH||^2, without forming W H.
+    num = float(np.sum(XH * W))
+    den = float(np.sum((W.T @ W) * (H @ H.T)))
+    scale = (num / den) ** 0.5 if num > 0.0 and den > 0.0 else 1.0
+    return W * scale, H * scale
+
+
 def fit_boundary_membership_nmf(
     *,
     repo: str,
     cutoff: datetime,
     rows: list[dict[str, Any]],
     config: BoundaryMembershipConfig | None = None,
+    warm_start: BoundaryMembershipModelArtifact | None = None,
+    warm_start_min_overlap: float = 0.5,
 ) -> BoundaryMembershipModelArtifact:
+    """Fit user role mixes over boundaries with NMF on a sparse matrix.
+
+    Pass the previous cutoff's artifact as `warm_start` to initialise W/H
+    from it (see `_warm_start_factors`); sequential cutoffs then converge
+    in far fewer iterations. Falls back to `config.init` when the models
+    do not overlap enough.
+    """
     cfg = config or BoundaryMembershipConfig()
     cutoff_utc = require_dt_utc(cutoff, name="cutoff")
 
-    matrix: UserBoundaryMatrix = rows_to_user_boundary_matrix(
+    matrix = rows_to_sparse_user_boundary_matrix(
         rows,
         min_user_total_weight=cfg.min_user_total_weight,
     )
@@ -73,27 +139,41 @@ def fit_boundary_membership_nmf(
         from sklearn.decomposition import NMF  # type: ignore[import-not-found]
     except Exception as exc:  # pragma: no cover
         raise ImportError(
-            "fit_boundary_membership_nmf requires numpy and scikit-learn."
+            "fit_boundary_membership_nmf requires numpy, scipy and scikit-learn."
         ) from exc
 
-    X = np.array(matrix.values, dtype=float)
+    X = matrix.to_csr()
     n_users, n_boundaries = X.shape
     effective_k = max(1, min(int(cfg.n_components), int(n_users), int(n_boundaries)))
 
+    init_factors = None
+    if warm_start is not None:
+        init_factors = _warm_start_factors(
+            previous=warm_start,
+            matrix=matrix,
+            X=X,
+            n_components=effective_k,
+            min_overlap=warm_start_min_overlap,
+        )
+
     model = NMF(
         n_components=effective_k,
-        init=cfg.init,
+        init=cfg.init if init_factors is None else "custom",
         random_state=int(cfg.random_state),
         max_iter=int(cfg.max_iter),
         solver="cd",
         beta_loss="frobenius",
     )
 
-    W = model.fit_transform(X)
+    if init_factors is None:
+        W = model.fit_transform(X)
+    else:
+        W0, H0 = init_factors
+        W = model.fit_transform(X, W=W0, H=H0)
     H = model.components_
 
-    Wn = _round_matrix(_row_normalize(W.tolist()))
-    Hn = _round_matrix(_row_normalize(H.tolist()))
+    Wn = _round_matrix(_row_normalize(np.asarray(W)).tolist())
+    Hn = _round_matrix(_row_normalize(np.asarray(H)).tolist())
 
     roles = [f"k{i}" for i in range(effective_k)]
 
@@ -120,6 +200,8 @@ def fit_boundary_membership_nmf(
         "n_iter": int(getattr(model, "n_iter_", 0)),
         "basis_version": cfg.basis_version,
     }
+    if warm_start is not None:
+        diagnostics["warm_started"] = init_factors is not None
 
     artifact = BoundaryMembershipModelArtifact(
         repo=repo,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -22,6 +23,7 @@ def fit_boundary_membership_model(
     cutoff: datetime,
     data_dir: str | Path = "data",
     config: BoundaryMembershipConfig | None = None,
+    warm_start: BoundaryMembershipModelArtifact | None = None,
 ) -> BoundaryMembershipModelArtifact:
     cfg = config or BoundaryMembershipConfig()
     rows = build_user_boundary_activity_rows(
@@ -35,9 +37,30 @@ def fit_boundary_membership_model(
         cutoff=cutoff,
         rows=rows,
         config=cfg,
+        warm_start=warm_start,
     )
 
 
+def fit_boundary_membership_models(
+    *,
+    repo: str,
+    cutoffs: list[datetime],
+    data_dir: str | Path = "data",
+    config: BoundaryMembershipConfig | None = None,
+) -> Iterator[BoundaryMembershipModelArtifact]:
+    """Fit one model per cutoff in time order, warm-starting each from the last."""
+    previous: BoundaryMembershipModelArtifact | None = None
+    for cutoff in sorted(set(cutoffs)):
+        previous = fit_boundary_membership_model(
+            repo=repo,
+            cutoff=cutoff,
+            data_dir=data_dir,
+            config=config,
+            warm_start=previous,
+        )
+        yield previous
+
+
 def derive_role_features_for_pr(
     *,
     model: BoundaryMembershipModelArtifact,
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import re
+import threading
+from pathlib import Path
 from typing import Any
 
-from ..boundary.io import read_boundary_artifact
+from ..boundary.handle import open_boundary_artifact
 from ..inputs.models import PRInputBundle
+from ..router.baselines.codeowners import compile_codeowners
 from ..time import cutoff_key_utc
 from .base import FeatureExtractor
 from .features.candidate_activity import build_candidate_activity_table
@@ -16,7 +19,6 @@ from .features.team_roster import expand_team_members, load_team_roster
 from .features.ownership import (
     load_codeowners_text_for_pr,
     match_codeowners_for_changed_files,
-    parse_codeowners_rules,
 )
 from .features.automation import build_automation_features
 from .features.ownership import build_ownership_features
@@ -25,6 +27,7 @@ from .features.pr_timeline import build_pr_timeline_features
 from .features.repo_priors import build_repo_priors_features
 from .features.schemas import FeatureExtractionConfig
 from .features.similarity import build_similarity_features
+from .features.sql import HistoryContext
 
 
 class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
@@ -32,8 +35,30 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
 
     def __init__(self, *, config: FeatureExtractionConfig | None = None) -> None:
         self.config = config or FeatureExtractionConfig()
+        # Repo history contexts shared by every thread extracting with this
+        # extractor (e.g. parallel router execution); see `HistoryContext`.
+        self._histories: dict[str, HistoryContext] = {}
+        self._histories_lock = threading.Lock()
+
+    def history(self, repo: str) -> HistoryContext:
+        """Pooled history context for `repo`, reused across `extract` calls."""
+        with self._histories_lock:
+            history = self._histories.get(repo)
+            if history is None:
+                history = HistoryContext(repo=repo, data_dir=self.config.data_dir, shared=True)
+                self._histories[repo] = history
+            return history
+
+    def close(self) -> None:
+        """Close the pooled history connections."""
+        with self._histories_lock:
+            histories = list(self._histories.values())
+            self._histories.clear()
+        for history in histories:
+            history.close()
 
     def extract(self, input: PRInputBundle) -> dict[str, Any]:
+        history = self.history(input.repo)
         pr_features: dict[str, Any] = {}
         pr_features.update(build_pr_surface_features(input))
 
@@ -49,17 +74,17 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
 
             text = load_codeowners_text_for_pr(input=input, data_dir=self.config.data_dir)
             if text:
-                rules = parse_codeowners_rules(text)
+                rules = compile_codeowners(text)
                 summary = match_codeowners_for_changed_files(input, rules=rules)
                 codeowner_logins = set(summary.owner_set)
                 source_hashes["codeowners"] = hashlib.sha256(text.encode("utf-8")).hexdigest()
 
         try:
-            boundary_artifact = read_boundary_artifact(
+            boundary_artifact = open_boundary_artifact(
                 repo_full_name=input.repo,
                 data_dir=self.config.data_dir,
                 strategy_id=input.boundary_strategy or "hybrid_path_cochange.v1",
-                cutoff_key=cutoff_key_utc(input.cutoff),
+                cutoff_key=input.boundary_cutoff_key or cutoff_key_utc(input.cutoff),
             )
             source_hashes["boundary_model"] = boundary_artifact.manifest.model_hash
         except Exception:
@@ -71,6 +96,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
                     input,
                     data_dir=str(self.config.data_dir),
                     codeowner_logins=codeowner_logins,
+                    history=history,
                 )
             )
 
@@ -79,6 +105,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
                 build_repo_priors_features(
                     input=input,
                     data_dir=self.config.data_dir,
+                    history=history,
                 )
             )
         except Exception:
@@ -88,6 +115,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
                 build_similarity_features(
                     input=input,
                     data_dir=self.config.data_dir,
+                    history=history,
                 )
             )
         except Exception:
@@ -97,6 +125,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
                 build_automation_features(
                     input=input,
                     data_dir=self.config.data_dir,
+                    history=history,
                 )
             )
         except Exception:
@@ -116,6 +145,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
                 candidate_logins=candidate_logins,
                 data_dir=self.config.data_dir,
                 windows_days=self.config.candidate_windows_days,
+                history=history,
             )
 
         interactions = build_interaction_features(
@@ -123,6 +153,7 @@ class AttentionRoutingFeatureExtractorV1(FeatureExtractor):
             pr_features=pr_features,
             candidate_features=candidates,
             data_dir=str(self.config.data_dir),
+            history=history,
         )
 
         out = {
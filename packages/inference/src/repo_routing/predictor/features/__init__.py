@@ -16,6 +16,7 @@ from .pr_surface import build_pr_surface_features
 from .pr_timeline import build_pr_timeline_features
 from .repo_priors import build_repo_priors_features
 from .similarity import build_similarity_features
+from .sql import HistoryContext
 from .task_policy import (
     DEFAULT_TASK_POLICY_REGISTRY,
     TaskPolicyRegistry,
@@ -43,6 +44,7 @@ __all__ = [
     "CandidateFeatureTable",
     "FeatureExtractionConfig",
     "FeatureExtractionContext",
+    "HistoryContext",
     "build_pr_surface_features",
     "build_pr_timeline_features",
     "build_ownership_features",
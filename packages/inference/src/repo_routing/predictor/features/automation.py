@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from ...inputs.models import PRInputBundle
-from .sql import connect_repo_db, cutoff_sql, load_repo_pr_ids
+from .sql import HistoryContext, cutoff_sql, history_context
 
 _BOT_RE = re.compile(r"(?i)(\[bot\]|dependabot|renovate|copilot|claude|github-actions)")
 _CATEGORY_RES: dict[str, re.Pattern[str]] = {
@@ -23,10 +23,11 @@ def build_automation_features(
     *,
     input: PRInputBundle,
     data_dir: str | Path,
+    history: HistoryContext | None = None,
 ) -> dict[str, Any]:
-    conn = connect_repo_db(repo=input.repo, data_dir=data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=input.repo, pr_number=input.pr_number)
+    with history_context(repo=input.repo, data_dir=data_dir, history=history) as history:
+        conn = history.conn
+        ids = history.pr_ids(input.pr_number)
         cutoff_s = cutoff_sql(input.cutoff)
 
         try:
@@ -44,8 +45,6 @@ def build_automation_features(
             ).fetchall()
         except sqlite3.OperationalError:
             rows = []
-    finally:
-        conn.close()
 
     bot_comments = 0
     bot_logins: set[str] = set()
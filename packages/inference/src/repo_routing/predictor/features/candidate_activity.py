@@ -9,7 +9,12 @@ from typing import Any
 from ...boundary.signals.path import path_boundary
 from ...inputs.models import PRInputBundle
 from ...time import parse_dt_utc
-from .sql import candidate_last_activity_and_counts, connect_repo_db, cutoff_sql
+from .sql import (
+    HistoryContext,
+    candidate_last_activity_and_counts_for_user,
+    cutoff_sql,
+    history_context,
+)
 from .stats import normalized_entropy
 
 
@@ -19,23 +24,20 @@ def days_since_last_candidate_activity(
     candidate_login: str,
     cutoff: datetime,
     data_dir: str | Path,
+    history: HistoryContext | None = None,
 ) -> float | None:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        if row is None:
+    with history_context(repo=repo, data_dir=data_dir, history=history) as history:
+        repo_id = history.repo_id
+        if repo_id is None:
             raise KeyError(f"repo not found in db: {repo}")
-        repo_id = int(row["id"])
 
-        last_ts, _counts = candidate_last_activity_and_counts(
-            conn=conn,
+        last_ts, _counts = candidate_last_activity_and_counts_for_user(
+            conn=history.conn,
             repo_id=repo_id,
-            candidate_login=candidate_login,
+            user_id=history.user_id(candidate_login),
             cutoff=cutoff,
             windows_days=(30,),
         )
-    finally:
-        conn.close()
 
     if last_ts is None:
         return None
@@ -49,373 +51,21 @@ def candidate_event_volume_by_windows(
     cutoff: datetime,
     windows_days: tuple[int, ...],
     data_dir: str | Path,
+    history: HistoryContext | None = None,
 ) -> dict[int, int]:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        if row is None:
+    with history_context(repo=repo, data_dir=data_dir, history=history) as history:
+        repo_id = history.repo_id
+        if repo_id is None:
             raise KeyError(f"repo not found in db: {repo}")
-        repo_id = int(row["id"])
 
-        _last_ts, counts = candidate_last_activity_and_counts(
-            conn=conn,
+        _last_ts, counts = candidate_last_activity_and_counts_for_user(
+            conn=history.conn,
             repo_id=repo_id,
-            candidate_login=candidate_login,
+            user_id=history.user_id(candidate_login),
             cutoff=cutoff,
             windows_days=windows_days,
         )
         return counts
-    finally:
-        conn.close()
-
-
-def _user_profile_row(
-    *,
-    repo: str,
-    candidate_login: str,
-    data_dir: str | Path,
-) -> tuple[str, str | None]:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        try:
-            row = conn.execute(
-                "select lower(coalesce(type, 'User')) as user_type, login from users where lower(login)=lower(?) limit 1",
-                (candidate_login,),
-            ).fetchone()
-        except sqlite3.OperationalError:
-            # Minimal test schemas may omit users.type.
-            row = conn.execute(
-                "select 'user' as user_type, login from users where lower(login)=lower(?) limit 1",
-                (candidate_login,),
-            ).fetchone()
-    finally:
-        conn.close()
-
-    if row is None:
-        return "user", None
-    return str(row["user_type"]).lower(), row["login"]
-
-
-def _candidate_account_age_days(
-    *,
-    repo: str,
-    candidate_login: str,
-    cutoff: datetime,
-    data_dir: str | Path,
-) -> float | None:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        user = conn.execute(
-            "select id from users where lower(login)=lower(?) limit 1",
-            (candidate_login,),
-        ).fetchone()
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        if user is None or repo_row is None:
-            return None
-        user_id = int(user["id"])
-        repo_id = int(repo_row["id"])
-
-        # Prefer users.created_at if present, otherwise derive from earliest seen event.
-        created_at = None
-        try:
-            row = conn.execute(
-                "select created_at from users where id = ?",
-                (user_id,),
-            ).fetchone()
-            if row is not None:
-                created_at = row["created_at"]
-        except sqlite3.OperationalError:
-            created_at = None
-
-        if created_at is not None:
-            ts = parse_dt_utc(created_at)
-            if ts is not None:
-                return max(0.0, (cutoff - ts).total_seconds() / 86400.0)
-
-        row = conn.execute(
-            """
-            select min(ts) as first_ts from (
-              select r.submitted_at as ts from reviews r where r.repo_id=? and r.user_id=? and r.submitted_at <= ?
-              union all
-              select c.created_at as ts from comments c where c.repo_id=? and c.user_id=? and c.created_at <= ?
-              union all
-              select e.occurred_at as ts from events e where e.repo_id=? and e.actor_id=? and e.occurred_at <= ?
-            )
-            """,
-            (
-                repo_id,
-                user_id,
-                cutoff_sql(cutoff),
-                repo_id,
-                user_id,
-                cutoff_sql(cutoff),
-                repo_id,
-                user_id,
-                cutoff_sql(cutoff),
-            ),
-        ).fetchone()
-        if row is None or row["first_ts"] is None:
-            return None
-        first_ts = parse_dt_utc(row["first_ts"])
-        if first_ts is None:
-            return None
-        return max(0.0, (cutoff - first_ts).total_seconds() / 86400.0)
-    except sqlite3.OperationalError:
-        return None
-    finally:
-        conn.close()
-
-
-def _open_reviews_est(
-    *,
-    repo: str,
-    candidate_login: str,
-    cutoff: datetime,
-    data_dir: str | Path,
-) -> int | None:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        user_row = conn.execute("select id from users where lower(login)=lower(?)", (candidate_login,)).fetchone()
-        if repo_row is None or user_row is None:
-            return 0
-        repo_id = int(repo_row["id"])
-        user_id = int(user_row["id"])
-        row = conn.execute(
-            """
-            select count(distinct rri.pull_request_id) as n
-            from pull_request_review_request_intervals rri
-            join pull_requests pr on pr.id = rri.pull_request_id and pr.repo_id = ?
-            join events se on se.id = rri.start_event_id
-            left join events ee on ee.id = rri.end_event_id
-            where rri.reviewer_type = 'User'
-              and rri.reviewer_id = ?
-              and se.occurred_at <= ?
-              and (ee.id is null or ? < ee.occurred_at)
-            """,
-            (repo_id, user_id, cutoff_sql(cutoff), cutoff_sql(cutoff)),
-        ).fetchone()
-        return 0 if row is None else int(row["n"] or 0)
-    except sqlite3.OperationalError:
-        return None
-    finally:
-        conn.close()
-
-
-def _count_reviews_comments(
-    *,
-    repo: str,
-    candidate_login: str,
-    cutoff: datetime,
-    window_days: int,
-    data_dir: str | Path,
-) -> tuple[int, int]:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        user_row = conn.execute("select id from users where lower(login) = lower(?)", (candidate_login,)).fetchone()
-        if repo_row is None or user_row is None:
-            return 0, 0
-        repo_id = int(repo_row["id"])
-        user_id = int(user_row["id"])
-        start_s = cutoff_sql(cutoff - timedelta(days=window_days))
-        cutoff_s = cutoff_sql(cutoff)
-        reviews_row = conn.execute(
-            """
-            select count(*) as n
-            from reviews r
-            where r.repo_id = ? and r.user_id = ? and r.submitted_at >= ? and r.submitted_at <= ?
-            """,
-            (repo_id, user_id, start_s, cutoff_s),
-        ).fetchone()
-        comments_row = conn.execute(
-            """
-            select count(*) as n
-            from comments c
-            where c.repo_id = ? and c.user_id = ? and c.created_at >= ? and c.created_at <= ?
-            """,
-            (repo_id, user_id, start_s, cutoff_s),
-        ).fetchone()
-        return (
-            0 if reviews_row is None else int(reviews_row["n"]),
-            0 if comments_row is None else int(comments_row["n"]),
-        )
-    finally:
-        conn.close()
-
-
-def _count_authored_prs(
-    *,
-    repo: str,
-    candidate_login: str,
-    cutoff: datetime,
-    window_days: int,
-    data_dir: str | Path,
-) -> int:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        user_row = conn.execute("select id from users where lower(login) = lower(?)", (candidate_login,)).fetchone()
-        if repo_row is None or user_row is None:
-            return 0
-        try:
-            row = conn.execute(
-                """
-                select count(*) as n
-                from pull_requests pr
-                where pr.repo_id = ?
-                  and pr.user_id = ?
-                  and pr.created_at is not null
-                  and pr.created_at >= ?
-                  and pr.created_at <= ?
-                """,
-                (
-                    int(repo_row["id"]),
-                    int(user_row["id"]),
-                    cutoff_sql(cutoff - timedelta(days=window_days)),
-                    cutoff_sql(cutoff),
-                ),
-            ).fetchone()
-        except sqlite3.OperationalError:
-            row = conn.execute(
-                """
-                select count(*) as n
-                from pull_requests pr
-                where pr.repo_id = ?
-                  and pr.user_id = ?
-                """,
-                (int(repo_row["id"]), int(user_row["id"])),
-            ).fetchone()
-        return 0 if row is None else int(row["n"])
-    finally:
-        conn.close()
-
-
-def _candidate_touched_pr_ids(
-    *,
-    repo: str,
-    candidate_login: str,
-    cutoff: datetime,
-    window_days: int,
-    data_dir: str | Path,
-) -> list[int]:
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        user_row = conn.execute("select id from users where lower(login) = lower(?)", (candidate_login,)).fetchone()
-        if repo_row is None or user_row is None:
-            return []
-        repo_id = int(repo_row["id"])
-        user_id = int(user_row["id"])
-        start_s = cutoff_sql(cutoff - timedelta(days=window_days))
-        cutoff_s = cutoff_sql(cutoff)
-        try:
-            rows = conn.execute(
-                """
-                select distinct pr_id from (
-                  select r.pull_request_id as pr_id
-                  from reviews r
-                  where r.repo_id = ? and r.user_id = ? and r.submitted_at >= ? and r.submitted_at <= ?
-                  union
-                  select c.pull_request_id as pr_id
-                  from comments c
-                  where c.repo_id = ? and c.user_id = ? and c.created_at >= ? and c.created_at <= ?
-                  union
-                  select pr.id as pr_id
-                  from pull_requests pr
-                  where pr.repo_id = ? and pr.user_id = ? and pr.created_at >= ? and pr.created_at <= ?
-                )
-                where pr_id is not null
-                order by pr_id asc
-                """,
-                (
-                    repo_id,
-                    user_id,
-                    start_s,
-                    cutoff_s,
-                    repo_id,
-                    user_id,
-                    start_s,
-                    cutoff_s,
-                    repo_id,
-                    user_id,
-                    start_s,
-                    cutoff_s,
-                ),
-            ).fetchall()
-        except sqlite3.OperationalError:
-            rows = conn.execute(
-                """
-                select distinct pr_id from (
-                  select r.pull_request_id as pr_id
-                  from reviews r
-                  where r.repo_id = ? and r.user_id = ? and r.submitted_at >= ? and r.submitted_at <= ?
-                  union
-                  select c.pull_request_id as pr_id
-                  from comments c
-                  where c.repo_id = ? and c.user_id = ? and c.created_at >= ? and c.created_at <= ?
-                  union
-                  select pr.id as pr_id
-                  from pull_requests pr
-                  where pr.repo_id = ? and pr.user_id = ?
-                )
-                where pr_id is not null
-                order by pr_id asc
-                """,
-                (repo_id, user_id, start_s, cutoff_s, repo_id, user_id, start_s, cutoff_s, repo_id, user_id),
-            ).fetchall()
-        return [int(r["pr_id"]) for r in rows]
-    finally:
-        conn.close()
-
-
-def _load_pr_paths_for_pr_ids(
-    *,
-    repo: str,
-    pr_ids: list[int],
-    cutoff: datetime,
-    data_dir: str | Path,
-) -> list[str]:
-    if not pr_ids:
-        return []
-    conn = connect_repo_db(repo=repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (repo,)).fetchone()
-        if repo_row is None:
-            return []
-        repo_id = int(repo_row["id"])
-
-        placeholders = ",".join("?" for _ in pr_ids)
-        rows = conn.execute(
-            f"""
-            with latest_head as (
-              select phi.pull_request_id as pr_id, phi.head_sha as head_sha,
-                     row_number() over (
-                        partition by phi.pull_request_id
-                        order by se.occurred_at desc, se.id desc
-                     ) as rn
-              from pull_request_head_intervals phi
-              join events se on se.id = phi.start_event_id
-              where se.occurred_at <= ?
-                and phi.pull_request_id in ({placeholders})
-            )
-            select pf.path as path
-            from latest_head lh
-            join pull_request_files pf
-              on pf.repo_id = ?
-             and pf.pull_request_id = lh.pr_id
-             and pf.head_sha = lh.head_sha
-            where lh.rn = 1
-            order by pf.path asc
-            """,
-            [cutoff_sql(cutoff), *pr_ids, repo_id],
-        ).fetchall()
-        return [str(r["path"]) for r in rows if r["path"] is not None]
-    except sqlite3.OperationalError:
-        # For tiny test schemas without interval/files relation richness.
-        return []
-    finally:
-        conn.close()
 
 
 def _dir_depth3(path: str) -> str:
@@ -441,56 +91,36 @@ def build_candidate_activity_features(
     data_dir: str | Path,
     windows_days: tuple[int, ...] = (7, 30, 90, 180),
     footprint_top_n: int = 12,
+    history: HistoryContext | None = None,
 ) -> dict[str, Any]:
-    days_since = days_since_last_candidate_activity(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
+    """Features for one candidate; a one-login `build_candidate_activity_table`."""
+    table = build_candidate_activity_table(
+        input=input,
+        candidate_logins=[candidate_login],
         data_dir=data_dir,
-    )
-    counts = candidate_event_volume_by_windows(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
         windows_days=windows_days,
-        data_dir=data_dir,
+        footprint_top_n=footprint_top_n,
+        history=history,
     )
+    return table[candidate_login]
 
-    user_type, canonical_login = _user_profile_row(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        data_dir=data_dir,
-    )
-    is_bot = user_type.lower() == "bot" or candidate_login.lower().endswith("[bot]")
 
-    review_count_180d, comment_count_180d = _count_reviews_comments(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
-        window_days=180,
-        data_dir=data_dir,
-    )
-    authored_pr_180d = _count_authored_prs(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
-        window_days=180,
-        data_dir=data_dir,
-    )
-
-    touched_pr_ids = _candidate_touched_pr_ids(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
-        window_days=180,
-        data_dir=data_dir,
-    )
-    touched_paths = _load_pr_paths_for_pr_ids(
-        repo=input.repo,
-        pr_ids=touched_pr_ids,
-        cutoff=input.cutoff,
-        data_dir=data_dir,
-    )
+def _candidate_feature_vector(
+    *,
+    candidate_login: str,
+    days_since: float | None,
+    counts: dict[int, int],
+    user_type: str,
+    canonical_login: str | None,
+    review_count_180d: int,
+    comment_count_180d: int,
+    authored_pr_180d: int,
+    touched_paths: list[str],
+    account_age_days: float | None,
+    open_reviews_est: int | None,
+    footprint_top_n: int,
+) -> dict[str, Any]:
+    is_bot = user_type.lower() == "bot" or candidate_login.lower().endswith("[bot]")
 
     boundaries = [path_boundary(p)[0] for p in touched_paths]
     dirs3 = [_dir_depth3(p) for p in touched_paths]
@@ -499,19 +129,6 @@ def build_candidate_activity_features(
     dir_counts = Counter(dirs3)
     path_counts = Counter(touched_paths)
 
-    account_age_days = _candidate_account_age_days(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
-        data_dir=data_dir,
-    )
-    open_reviews_est = _open_reviews_est(
-        repo=input.repo,
-        candidate_login=candidate_login,
-        cutoff=input.cutoff,
-        data_dir=data_dir,
-    )
-
     login_features: list[str] = []
     if candidate_login.lower().endswith("[bot]"):
         login_features.append("bot_suffix")
@@ -563,14 +180,412 @@ def build_candidate_activity_table(
     data_dir: str | Path,
     windows_days: tuple[int, ...] = (7, 30, 90, 180),
     footprint_top_n: int = 12,
+    history: HistoryContext | None = None,
 ) -> dict[str, dict[str, Any]]:
+    if history is None:
+        with HistoryContext(repo=input.repo, data_dir=data_dir) as history:
+            return build_candidate_activity_table(
+                input=input,
+                candidate_logins=candidate_logins,
+                data_dir=data_dir,
+                windows_days=windows_days,
+                footprint_top_n=footprint_top_n,
+                history=history,
+            )
+
+    repo_id = history.repo_id
+    if repo_id is None:
+        raise KeyError(f"repo not found in db: {input.repo}")
+
+    logins = sorted(set(candidate_logins), key=lambda s: s.lower())
+    user_ids = history.user_ids(logins)
+    uids = sorted({uid for uid in user_ids.values() if uid is not None})
+
+    conn = history.conn
+    cutoff = input.cutoff
+    activity = _grouped_activity(conn, repo_id=repo_id, user_ids=uids, cutoff=cutoff, windows_days=windows_days)
+    profiles = _grouped_profiles(conn, user_ids=uids)
+    authored = _grouped_authored_prs(conn, repo_id=repo_id, user_ids=uids, cutoff=cutoff, window_days=180)
+    touched = _grouped_touched_pr_ids(conn, repo_id=repo_id, user_ids=uids, cutoff=cutoff, window_days=180)
+    pr_paths = _grouped_pr_paths(
+        conn,
+        repo_id=repo_id,
+        pr_ids=sorted({pid for pids in touched.values() for pid in pids}),
+        cutoff=cutoff,
+    )
+    account_ages = _grouped_account_age_days(conn, repo_id=repo_id, user_ids=uids, cutoff=cutoff)
+    open_reviews = _grouped_open_reviews_est(conn, repo_id=repo_id, user_ids=uids, cutoff=cutoff)
+
     out: dict[str, dict[str, Any]] = {}
-    for login in sorted(set(candidate_logins), key=lambda s: s.lower()):
-        out[login] = build_candidate_activity_features(
-            input=input,
+    for login in logins:
+        uid = user_ids[login.lower()]
+        if uid is None:
+            out[login] = _candidate_feature_vector(
+                candidate_login=login,
+                days_since=None,
+                counts={int(d): 0 for d in windows_days},
+                user_type="user",
+                canonical_login=None,
+                review_count_180d=0,
+                comment_count_180d=0,
+                authored_pr_180d=0,
+                touched_paths=[],
+                account_age_days=None,
+                open_reviews_est=0,
+                footprint_top_n=footprint_top_n,
+            )
+            continue
+
+        latest_ts, counts, review_count_180d, comment_count_180d = activity.get(
+            uid, (None, {int(d): 0 for d in windows_days}, 0, 0)
+        )
+        user_type, canonical_login = profiles.get(uid, ("user", None))
+        out[login] = _candidate_feature_vector(
             candidate_login=login,
-            data_dir=data_dir,
-            windows_days=windows_days,
+            days_since=None if latest_ts is None else (cutoff - latest_ts).total_seconds() / 86400.0,
+            counts=counts,
+            user_type=user_type,
+            canonical_login=canonical_login,
+            review_count_180d=review_count_180d,
+            comment_count_180d=comment_count_180d,
+            authored_pr_180d=authored.get(uid, 0),
+            touched_paths=sorted(p for pid in touched.get(uid, []) for p in pr_paths.get(pid, [])),
+            account_age_days=account_ages.get(uid),
+            open_reviews_est=open_reviews.get(uid, 0) if open_reviews is not None else None,
             footprint_top_n=footprint_top_n,
         )
     return {k: out[k] for k in sorted(out, key=str.lower)}
+
+
+# Grouped queries behind `build_candidate_activity_table`. Each runs once per
+# candidate pool and returns results keyed by user id.
+
+
+def _id_chunks(ids: list[int], size: int = 500) -> list[list[int]]:
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+def _grouped_activity(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    user_ids: list[int],
+    cutoff: datetime,
+    windows_days: tuple[int, ...],
+) -> dict[int, tuple[datetime | None, dict[int, int], int, int]]:
+    """Last activity, windowed event counts and 180d review/comment counts."""
+    cutoff_s = cutoff_sql(cutoff)
+    start_180 = cutoff_sql(cutoff - timedelta(days=180))
+    window_cols = ",\n".join(
+        f"sum(case when ts >= ? then 1 else 0 end) as w{i}" for i in range(len(windows_days))
+    )
+    window_params = [cutoff_sql(cutoff - timedelta(days=int(d))) for d in windows_days]
+
+    out: dict[int, tuple[datetime | None, dict[int, int], int, int]] = {}
+    for chunk in _id_chunks(user_ids):
+        placeholders = ",".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"""
+            select
+              uid,
+              max(ts) as latest_ts,
+              sum(case when kind = 'review' and ts >= ? then 1 else 0 end) as reviews_180,
+              sum(case when kind = 'comment' and ts >= ? then 1 else 0 end) as comments_180,
+              {window_cols}
+            from (
+              select r.user_id as uid, r.submitted_at as ts, 'review' as kind
+              from reviews r
+              where r.repo_id = ?
+                and r.user_id in ({placeholders})
+                and r.submitted_at is not null
+                and r.submitted_at <= ?
+
+              union all
+
+              select c.user_id as uid, c.created_at as ts, 'comment' as kind
+              from comments c
+              where c.repo_id = ?
+                and c.user_id in ({placeholders})
+                and c.created_at is not null
+                and c.created_at <= ?
+            )
+            group by uid
+            """,
+            [
+                start_180,
+                start_180,
+                *window_params,
+                repo_id,
+                *chunk,
+                cutoff_s,
+                repo_id,
+                *chunk,
+                cutoff_s,
+            ],
+        ).fetchall()
+        for row in rows:
+            counts = {int(d): int(row[f"w{i}"] or 0) for i, d in enumerate(windows_days)}
+            latest = None if row["latest_ts"] is None else parse_dt_utc(row["latest_ts"])
+            out[int(row["uid"])] = (
+                latest,
+                counts,
+                int(row["reviews_180"] or 0),
+                int(row["comments_180"] or 0),
+            )
+    return out
+
+
+def _grouped_profiles(
+    conn: sqlite3.Connection,
+    *,
+    user_ids: list[int],
+) -> dict[int, tuple[str, str | None]]:
+    out: dict[int, tuple[str, str | None]] = {}
+    for chunk in _id_chunks(user_ids):
+        placeholders = ",".join("?" for _ in chunk)
+        try:
+            rows = conn.execute(
+                f"select id, lower(coalesce(type, 'User')) as user_type, login from users where id in ({placeholders})",
+                chunk,
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # Minimal test schemas may omit users.type.
+            rows = conn.execute(
+                f"select id, 'user' as user_type, login from users where id in ({placeholders})",
+                chunk,
+            ).fetchall()
+        out.update({int(r["id"]): (str(r["user_type"]).lower(), r["login"]) for r in rows})
+    return out
+
+
+def _grouped_authored_prs(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    user_ids: list[int],
+    cutoff: datetime,
+    window_days: int,
+) -> dict[int, int]:
+    out: dict[int, int] = {}
+    for chunk in _id_chunks(user_ids):
+        placeholders = ",".join("?" for _ in chunk)
+        try:
+            rows = conn.execute(
+                f"""
+                select pr.user_id as uid, count(*) as n
+                from pull_requests pr
+                where pr.repo_id = ?
+                  and pr.user_id in ({placeholders})
+                  and pr.created_at is not null
+                  and pr.created_at >= ?
+                  and pr.created_at <= ?
+                group by pr.user_id
+                """,
+                [
+                    repo_id,
+                    *chunk,
+                    cutoff_sql(cutoff - timedelta(days=window_days)),
+                    cutoff_sql(cutoff),
+                ],
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = conn.execute(
+                f"""
+                select pr.user_id as uid, count(*) as n
+                from pull_requests pr
+                where pr.repo_id = ?
+                  and pr.user_id in ({placeholders})
+                group by pr.user_id
+                """,
+                [repo_id, *chunk],
+            ).fetchall()
+        out.update({int(r["uid"]): int(r["n"]) for r in rows})
+    return out
+
+
+def _grouped_touched_pr_ids(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    user_ids: list[int],
+    cutoff: datetime,
+    window_days: int,
+) -> dict[int, list[int]]:
+    start_s = cutoff_sql(cutoff - timedelta(days=window_days))
+    cutoff_s = cutoff_sql(cutoff)
+    out: dict[int, list[int]] = {}
+    for chunk in _id_chunks(user_ids):
+        placeholders = ",".join("?" for _ in chunk)
+        params = [
+            repo_id,
+            *chunk,
+            start_s,
+            cutoff_s,
+            repo_id,
+            *chunk,
+            start_s,
+            cutoff_s,
+            repo_id,
+            *chunk,
+        ]
+        authored_filter = "and pr.created_at >= ? and pr.created_at <= ?"
+        try:
+            rows = conn.execute(
+                _touched_pr_ids_sql(placeholders, authored_filter),
+                [*params, start_s, cutoff_s],
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = conn.execute(_touched_pr_ids_sql(placeholders, ""), params).fetchall()
+        for r in rows:
+            out.setdefault(int(r["uid"]), []).append(int(r["pr_id"]))
+    return out
+
+
+def _touched_pr_ids_sql(placeholders: str, authored_filter: str) -> str:
+    return f"""
+        select distinct uid, pr_id from (
+          select r.user_id as uid, r.pull_request_id as pr_id
+          from reviews r
+          where r.repo_id = ? and r.user_id in ({placeholders}) and r.submitted_at >= ? and r.submitted_at <= ?
+          union
+          select c.user_id as uid, c.pull_request_id as pr_id
+          from comments c
+          where c.repo_id = ? and c.user_id in ({placeholders}) and c.created_at >= ? and c.created_at <= ?
+          union
+          select pr.user_id as uid, pr.id as pr_id
+          from pull_requests pr
+          where pr.repo_id = ? and pr.user_id in ({placeholders}) {authored_filter}
+        )
+        where pr_id is not null
+        order by uid asc, pr_id asc
+        """
+
+
+def _grouped_pr_paths(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    pr_ids: list[int],
+    cutoff: datetime,
+) -> dict[int, list[str]]:
+    """Changed paths at each PR's latest pre-cutoff head."""
+    out: dict[int, list[str]] = {}
+    try:
+        for chunk in _id_chunks(pr_ids):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                with latest_head as (
+                  select phi.pull_request_id as pr_id, phi.head_sha as head_sha,
+                         row_number() over (
+                            partition by phi.pull_request_id
+                            order by se.occurred_at desc, se.id desc
+                         ) as rn
+                  from pull_request_head_intervals phi
+                  join events se on se.id = phi.start_event_id
+                  where se.occurred_at <= ?
+                    and phi.pull_request_id in ({placeholders})
+                )
+                select lh.pr_id as pr_id, pf.path as path
+                from latest_head lh
+                join pull_request_files pf
+                  on pf.repo_id = ?
+                 and pf.pull_request_id = lh.pr_id
+                 and pf.head_sha = lh.head_sha
+                where lh.rn = 1
+                """,
+                [cutoff_sql(cutoff), *chunk, repo_id],
+            ).fetchall()
+            for r in rows:
+                if r["path"] is not None:
+                    out.setdefault(int(r["pr_id"]), []).append(str(r["path"]))
+    except sqlite3.OperationalError:
+        # For tiny test schemas without interval/files relation richness.
+        return {}
+    return out
+
+
+def _grouped_account_age_days(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    user_ids: list[int],
+    cutoff: datetime,
+) -> dict[int, float | None]:
+    """Account age from users.created_at, else from the earliest seen activity."""
+    out: dict[int, float | None] = {}
+    for chunk in _id_chunks(user_ids):
+        placeholders = ",".join("?" for _ in chunk)
+        try:
+            rows = conn.execute(
+                f"select id, created_at from users where id in ({placeholders})",
+                chunk,
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        for r in rows:
+            ts = parse_dt_utc(r["created_at"]) if r["created_at"] is not None else None
+            if ts is not None:
+                out[int(r["id"])] = max(0.0, (cutoff - ts).total_seconds() / 86400.0)
+
+    remaining = [uid for uid in user_ids if uid not in out]
+    cutoff_s = cutoff_sql(cutoff)
+    for chunk in _id_chunks(remaining):
+        placeholders = ",".join("?" for _ in chunk)
+        try:
+            rows = conn.execute(
+                f"""
+                select uid, min(ts) as first_ts from (
+                  select r.user_id as uid, r.submitted_at as ts from reviews r
+                  where r.repo_id=? and r.user_id in ({placeholders}) and r.submitted_at <= ?
+                  union all
+                  select c.user_id as uid, c.created_at as ts from comments c
+                  where c.repo_id=? and c.user_id in ({placeholders}) and c.created_at <= ?
+                  union all
+                  select e.actor_id as uid, e.occurred_at as ts from events e
+                  where e.repo_id=? and e.actor_id in ({placeholders}) and e.occurred_at <= ?
+                )
+                group by uid
+                """,
+                [repo_id, *chunk, cutoff_s, repo_id, *chunk, cutoff_s, repo_id, *chunk, cutoff_s],
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        first_by_uid = {int(r["uid"]): r["first_ts"] for r in rows}
+        for uid in chunk:
+            first_ts = parse_dt_utc(first_by_uid[uid]) if first_by_uid.get(uid) is not None else None
+            out[uid] = None if first_ts is None else max(0.0, (cutoff - first_ts).total_seconds() / 86400.0)
+    return out
+
+
+def _grouped_open_reviews_est(
+    conn: sqlite3.Connection,
+    *,
+    repo_id: int,
+    user_ids: list[int],
+    cutoff: datetime,
+) -> dict[int, int] | None:
+    """Active user review requests per reviewer; None if intervals are unavailable."""
+    out: dict[int, int] = {}
+    try:
+        for chunk in _id_chunks(user_ids):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                select rri.reviewer_id as uid, count(distinct rri.pull_request_id) as n
+                from pull_request_review_request_intervals rri
+                join pull_requests pr on pr.id = rri.pull_request_id and pr.repo_id = ?
+                join events se on se.id = rri.start_event_id
+                left join events ee on ee.id = rri.end_event_id
+                where rri.reviewer_type = 'User'
+                  and rri.reviewer_id in ({placeholders})
+                  and se.occurred_at <= ?
+                  and (ee.id is null or ? < ee.occurred_at)
+                group by rri.reviewer_id
+                """,
+                [repo_id, *chunk, cutoff_sql(cutoff), cutoff_sql(cutoff)],
+            ).fetchall()
+            out.update({int(r["uid"]): int(r["n"] or 0) for r in rows})
+    except sqlite3.OperationalError:
+        return None
+    return out
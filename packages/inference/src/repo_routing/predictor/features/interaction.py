@@ -5,7 +5,7 @@ from statistics import median
 from typing import Any
 
 from ...inputs.models import PRInputBundle
-from .sql import connect_repo_db, cutoff_sql, load_repo_pr_ids
+from .sql import HistoryContext, cutoff_sql, history_context
 
 
 def _dir_depth3(path: str) -> str:
@@ -38,130 +38,125 @@ def _author_candidate_social_counts(
     candidate_login: str,
     data_dir: str,
     lookback_days: int = 180,
+    history: HistoryContext | None = None,
 ) -> tuple[int, int, int, float | None]:
     if not input.author_login:
         return 0, 0, 0, None
-    conn = connect_repo_db(repo=input.repo, data_dir=data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=input.repo, pr_number=input.pr_number)
-        # Candidate reviews/comments on PRs authored by current author in lookback.
-        row = conn.execute(
-            """
-            with author_user as (
-              select id as author_id from users where lower(login)=lower(?) limit 1
-            ),
-            cand_user as (
-              select id as cand_id from users where lower(login)=lower(?) limit 1
-            ),
-            author_prs as (
-              select pr.id as pr_id
-              from pull_requests pr
-              join author_user au on au.author_id = pr.user_id
-              where pr.repo_id = ?
-                and pr.created_at is not null
-                and pr.created_at >= datetime(?, ?)
-                and pr.created_at <= ?
-            )
-            select
-              (
-                select count(*)
-                from reviews r
-                join cand_user cu on cu.cand_id = r.user_id
-                where r.repo_id = ?
-                  and r.pull_request_id in (select pr_id from author_prs)
-                  and r.submitted_at is not null
-                  and r.submitted_at <= ?
-              ) as reviews_n,
-              (
-                select count(*)
-                from comments c
-                join cand_user cu on cu.cand_id = c.user_id
-                where c.repo_id = ?
-                  and c.pull_request_id in (select pr_id from author_prs)
-                  and c.created_at is not null
-                  and c.created_at <= ?
-              ) as comments_n
-            """,
-            (
-                input.author_login,
-                candidate_login,
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-                f"-{int(lookback_days)} days",
-                cutoff_sql(input.cutoff),
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-            ),
-        ).fetchone()
-        if row is None:
-            return 0, 0, 0, None
-        reviews_n = int(row["reviews_n"] or 0)
-        comments_n = int(row["comments_n"] or 0)
+    with history_context(repo=input.repo, data_dir=data_dir, history=history) as history:
+        try:
+            conn = history.conn
+            ids = history.pr_ids(input.pr_number)
+            author_id = history.user_id(input.author_login)
+            cand_id = history.user_id(candidate_login)
+            if author_id is None or cand_id is None:
+                return 0, 0, 0, None
+            # Candidate reviews/comments on PRs authored by current author in lookback.
+            row = conn.execute(
+                """
+                with author_prs as (
+                  select pr.id as pr_id
+                  from pull_requests pr
+                  where pr.repo_id = ?
+                    and pr.user_id = ?
+                    and pr.created_at is not null
+                    and pr.created_at >= datetime(?, ?)
+                    and pr.created_at <= ?
+                )
+                select
+                  (
+                    select count(*)
+                    from reviews r
+                    where r.repo_id = ?
+                      and r.user_id = ?
+                      and r.pull_request_id in (select pr_id from author_prs)
+                      and r.submitted_at is not null
+                      and r.submitted_at <= ?
+                  ) as reviews_n,
+                  (
+                    select count(*)
+                    from comments c
+                    where c.repo_id = ?
+                      and c.user_id = ?
+                      and c.pull_request_id in (select pr_id from author_prs)
+                      and c.created_at is not null
+                      and c.created_at <= ?
+                  ) as comments_n
+                """,
+                (
+                    ids.repo_id,
+                    author_id,
+                    cutoff_sql(input.cutoff),
+                    f"-{int(lookback_days)} days",
+                    cutoff_sql(input.cutoff),
+                    ids.repo_id,
+                    cand_id,
+                    cutoff_sql(input.cutoff),
+                    ids.repo_id,
+                    cand_id,
+                    cutoff_sql(input.cutoff),
+                ),
+            ).fetchone()
+            if row is None:
+                return 0, 0, 0, None
+            reviews_n = int(row["reviews_n"] or 0)
+            comments_n = int(row["comments_n"] or 0)
 
-        latency_rows = conn.execute(
-            """
-            with author_user as (
-              select id as author_id from users where lower(login)=lower(?) limit 1
-            ),
-            cand_user as (
-              select id as cand_id from users where lower(login)=lower(?) limit 1
-            ),
-            author_prs as (
-              select pr.id as pr_id, pr.created_at as created_at
-              from pull_requests pr
-              join author_user au on au.author_id = pr.user_id
-              where pr.repo_id = ?
-                and pr.created_at is not null
-                and pr.created_at >= datetime(?, ?)
-                and pr.created_at <= ?
-            ),
-            cand_first as (
-              select ap.pr_id as pr_id, min(ts) as first_ts, ap.created_at as created_at
-              from author_prs ap
-              join (
-                select r.pull_request_id as pr_id, r.submitted_at as ts, r.user_id as uid
-                from reviews r where r.repo_id = ? and r.submitted_at is not null and r.submitted_at <= ?
-                union all
-                select c.pull_request_id as pr_id, c.created_at as ts, c.user_id as uid
-                from comments c where c.repo_id = ? and c.created_at is not null and c.created_at <= ?
-              ) ce on ce.pr_id = ap.pr_id
-              join cand_user cu on cu.cand_id = ce.uid
-              group by ap.pr_id, ap.created_at
-            )
-            select created_at, first_ts from cand_first
-            order by pr_id asc
-            """,
-            (
-                input.author_login,
-                candidate_login,
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-                f"-{int(lookback_days)} days",
-                cutoff_sql(input.cutoff),
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-                ids.repo_id,
-                cutoff_sql(input.cutoff),
-            ),
-        ).fetchall()
-        latencies: list[float] = []
-        from ...time import parse_dt_utc
+            latency_rows = conn.execute(
+                """
+                with author_prs as (
+                  select pr.id as pr_id, pr.created_at as created_at
+                  from pull_requests pr
+                  where pr.repo_id = ?
+                    and pr.user_id = ?
+                    and pr.created_at is not null
+                    and pr.created_at >= datetime(?, ?)
+                    and pr.created_at <= ?
+                ),
+                cand_first as (
+                  select ap.pr_id as pr_id, min(ts) as first_ts, ap.created_at as created_at
+                  from author_prs ap
+                  join (
+                    select r.pull_request_id as pr_id, r.submitted_at as ts
+                    from reviews r
+                    where r.repo_id = ? and r.user_id = ? and r.submitted_at is not null and r.submitted_at <= ?
+                    union all
+                    select c.pull_request_id as pr_id, c.created_at as ts
+                    from comments c
+                    where c.repo_id = ? and c.user_id = ? and c.created_at is not null and c.created_at <= ?
+                  ) ce on ce.pr_id = ap.pr_id
+                  group by ap.pr_id, ap.created_at
+                )
+                select created_at, first_ts from cand_first
+                order by pr_id asc
+                """,
+                (
+                    ids.repo_id,
+                    author_id,
+                    cutoff_sql(input.cutoff),
+                    f"-{int(lookback_days)} days",
+                    cutoff_sql(input.cutoff),
+                    ids.repo_id,
+                    cand_id,
+                    cutoff_sql(input.cutoff),
+                    ids.repo_id,
+                    cand_id,
+                    cutoff_sql(input.cutoff),
+                ),
+            ).fetchall()
+            latencies: list[float] = []
+            from ...time import parse_dt_utc
 
-        for r in latency_rows:
-            c = parse_dt_utc(r["created_at"])
-            f = parse_dt_utc(r["first_ts"])
-            if c is None or f is None:
-                continue
-            latencies.append(max(0.0, (f - c).total_seconds()))
+            for r in latency_rows:
+                c = parse_dt_utc(r["created_at"])
+                f = parse_dt_utc(r["first_ts"])
+                if c is None or f is None:
+                    continue
+                latencies.append(max(0.0, (f - c).total_seconds()))
 
-        latency_median = median(latencies) if latencies else None
-        return reviews_n + comments_n, reviews_n, comments_n, latency_median
-    except Exception:
-        return 0, 0, 0, None
-    finally:
-        conn.close()
+            latency_median = median(latencies) if latencies else None
+            return reviews_n + comments_n, reviews_n, comments_n, latency_median
+        except Exception:
+            return 0, 0, 0, None
 
 
 def build_interaction_features(
@@ -170,8 +165,18 @@ def build_interaction_features(
     pr_features: dict[str, Any],
     candidate_features: dict[str, dict[str, Any]],
     data_dir: str | None = None,
+    history: HistoryContext | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Build deterministic PR x candidate pair features."""
+    if history is None and data_dir:
+        with HistoryContext(repo=input.repo, data_dir=data_dir) as history:
+            return build_interaction_features(
+                input=input,
+                pr_features=pr_features,
+                candidate_features=candidate_features,
+                data_dir=data_dir,
+                history=history,
+            )
 
     mention_text = "\n".join([input.title or "", input.body or ""]).lower()
     requested_users = {
@@ -230,11 +235,12 @@ def build_interaction_features(
         social_reviews = 0
         social_comments = 0
         social_latency = None
-        if data_dir:
+        if history is not None:
             social_total, social_reviews, social_comments, social_latency = _author_candidate_social_counts(
                 input=input,
                 candidate_login=login,
-                data_dir=str(data_dir),
+                data_dir=str(history.data_dir),
+                history=history,
             )
 
         out[login] = {
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import fnmatch
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,8 +8,11 @@ from typing import Any
 from ...inputs.models import PRInputBundle
 from ...paths import repo_artifact_path, repo_codeowners_path
 from ...repo_profile.storage import CODEOWNERS_PATH_CANDIDATES
-from ...router.baselines.codeowners import CodeownersMatch
-from ...router.baselines.mentions import extract_targets
+from ...router.baselines.codeowners import (
+    CodeownersMatch,
+    CompiledCodeowners,
+    compile_codeowners,
+)
 
 
 @dataclass(frozen=True)
@@ -59,42 +61,19 @@ def load_codeowners_text_for_pr(*, input: PRInputBundle, data_dir: str | Path) -
 
 
 def parse_codeowners_rules(codeowners_text: str) -> list[CodeownersMatch]:
-    rules: list[CodeownersMatch] = []
-    for raw in codeowners_text.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = line.split()
-        if len(parts) < 2:
-            continue
-        pattern = parts[0]
-        owners = " ".join(parts[1:])
-        targets = extract_targets(owners)
-        if not targets:
-            continue
-        rules.append(CodeownersMatch(pattern=pattern, targets=targets))
-    return rules
-
-
-def _matches(pattern: str, path: str) -> bool:
-    if pattern.endswith("/"):
-        return path.startswith(pattern)
-    if "*" in pattern or "?" in pattern or "[" in pattern:
-        return fnmatch.fnmatch(path, pattern)
-    return path == pattern or path.endswith(pattern.lstrip("/"))
+    return list(compile_codeowners(codeowners_text).rules)
 
 
 def match_codeowners_for_changed_files(
     input: PRInputBundle,
     *,
-    rules: list[CodeownersMatch],
+    rules: list[CodeownersMatch] | CompiledCodeowners,
 ) -> OwnershipMatchSummary:
+    compiled = rules if isinstance(rules, CompiledCodeowners) else CompiledCodeowners(rules)
     owner_by_file: dict[str, set[str]] = {}
     for f in sorted(input.changed_files, key=lambda x: x.path):
         owners: set[str] = set()
-        for rule in rules:
-            if not _matches(rule.pattern, f.path):
-                continue
+        for rule in compiled.matching_rules(f.path):
             for t in rule.targets:
                 owners.add(t.name)
         owner_by_file[f.path] = owners
@@ -179,8 +158,7 @@ def build_ownership_features(
     active_candidates: set[str] | None = None,
 ) -> dict[str, Any]:
     text = load_codeowners_text_for_pr(input=input, data_dir=data_dir)
-    rules = parse_codeowners_rules(text or "")
-    summary = match_codeowners_for_changed_files(input, rules=rules)
+    summary = match_codeowners_for_changed_files(input, rules=compile_codeowners(text or ""))
 
     owner_set_sorted = sorted(summary.owner_set, key=str.lower)
 
@@ -10,30 +10,32 @@ from ...inputs.models import PRInputBundle
 from .patterns import WIP_TITLE_HINTS
 from .schemas import FeatureExtractionContext
 from .sql import (
+    HistoryContext,
     active_review_request_counts,
     comment_counts_pre_cutoff,
-    connect_repo_db,
     count_head_updates_pre_cutoff,
     cutoff_sql,
+    history_context,
     is_draft_at_cutoff as sql_is_draft_at_cutoff,
     latest_author_activity_pre_cutoff,
     latest_head_update_pre_cutoff,
-    load_repo_pr_ids,
     review_count_pre_cutoff as sql_review_count_pre_cutoff,
 )
 
 
+def _history(ctx: FeatureExtractionContext):
+    return history_context(repo=ctx.repo, data_dir=ctx.data_dir, history=ctx.history)
+
+
 def is_draft_at_cutoff(ctx: FeatureExtractionContext) -> bool:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         return sql_is_draft_at_cutoff(
             conn=conn,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
-    finally:
-        conn.close()
 
 
 def pr_age_seconds_at_cutoff(input: PRInputBundle) -> float:
@@ -44,36 +46,32 @@ def pr_age_seconds_at_cutoff(input: PRInputBundle) -> float:
 
 
 def time_since_last_head_update_seconds(ctx: FeatureExtractionContext) -> float | None:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         ts = latest_head_update_pre_cutoff(
             conn=conn,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
-    finally:
-        conn.close()
     return _seconds_between(ctx.cutoff, ts)
 
 
 def head_updates_pre_cutoff_count(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         return count_head_updates_pre_cutoff(
             conn=conn,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
-    finally:
-        conn.close()
 
 
 def head_updates_in_window_count(ctx: FeatureExtractionContext, *, days: int) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         start = cutoff_sql(ctx.cutoff - timedelta(days=days))
         cutoff_s = cutoff_sql(ctx.cutoff)
         row = conn.execute(
@@ -88,14 +86,12 @@ def head_updates_in_window_count(ctx: FeatureExtractionContext, *, days: int) ->
             (ids.pull_request_id, start, cutoff_s),
         ).fetchone()
         return 0 if row is None else int(row["n"])
-    finally:
-        conn.close()
 
 
 def head_update_burstiness_last_6h(ctx: FeatureExtractionContext) -> float:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         start = cutoff_sql(ctx.cutoff - timedelta(hours=6))
         cutoff_s = cutoff_sql(ctx.cutoff)
         row_recent = conn.execute(
@@ -119,8 +115,6 @@ def head_update_burstiness_last_6h(ctx: FeatureExtractionContext) -> float:
             """,
             (ids.pull_request_id, cutoff_s),
         ).fetchone()
-    finally:
-        conn.close()
 
     recent = 0 if row_recent is None else int(row_recent["n"])
     total = 0 if row_all is None else int(row_all["n"])
@@ -130,9 +124,9 @@ def head_update_burstiness_last_6h(ctx: FeatureExtractionContext) -> float:
 
 
 def last_author_activity_pre_cutoff_seconds(ctx: FeatureExtractionContext) -> float | None:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         ts = latest_author_activity_pre_cutoff(
             conn=conn,
             repo_id=ids.repo_id,
@@ -140,15 +134,13 @@ def last_author_activity_pre_cutoff_seconds(ctx: FeatureExtractionContext) -> fl
             author_id=ids.author_id,
             cutoff=ctx.cutoff,
         )
-    finally:
-        conn.close()
     return _seconds_between(ctx.cutoff, ts)
 
 
 def author_comment_count_pre_cutoff(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         author_n, _ = comment_counts_pre_cutoff(
             conn=conn,
             repo_id=ids.repo_id,
@@ -157,14 +149,12 @@ def author_comment_count_pre_cutoff(ctx: FeatureExtractionContext) -> int:
             cutoff=ctx.cutoff,
         )
         return author_n
-    finally:
-        conn.close()
 
 
 def non_author_comment_count_pre_cutoff(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         _, non_author_n = comment_counts_pre_cutoff(
             conn=conn,
             repo_id=ids.repo_id,
@@ -173,28 +163,24 @@ def non_author_comment_count_pre_cutoff(ctx: FeatureExtractionContext) -> int:
             cutoff=ctx.cutoff,
         )
         return non_author_n
-    finally:
-        conn.close()
 
 
 def review_count_pre_cutoff(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         return sql_review_count_pre_cutoff(
             conn=conn,
             repo_id=ids.repo_id,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
-    finally:
-        conn.close()
 
 
 def review_state_counts_pre_cutoff(ctx: FeatureExtractionContext) -> dict[str, int]:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         try:
             rows = conn.execute(
                 """
@@ -213,8 +199,6 @@ def review_state_counts_pre_cutoff(ctx: FeatureExtractionContext) -> dict[str, i
             ).fetchall()
         except sqlite3.OperationalError:
             rows = []
-    finally:
-        conn.close()
 
     out = {"approve": 0, "comment": 0, "changes_requested": 0}
     for row in rows:
@@ -230,9 +214,9 @@ def review_state_counts_pre_cutoff(ctx: FeatureExtractionContext) -> dict[str, i
 
 
 def unique_participants_count(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         rows = conn.execute(
             """
             select lower(login) as login from (
@@ -256,8 +240,6 @@ def unique_participants_count(ctx: FeatureExtractionContext) -> int:
                 cutoff_sql(ctx.cutoff),
             ),
         ).fetchall()
-    finally:
-        conn.close()
     return len({str(r["login"]).lower() for r in rows if r["login"] is not None})
 
 
@@ -268,37 +250,33 @@ def any_active_review_requests_at_cutoff(ctx: FeatureExtractionContext) -> bool:
 
 
 def requested_users_count_at_cutoff(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         users_n, _teams_n = active_review_request_counts(
             conn=conn,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
         return users_n
-    finally:
-        conn.close()
 
 
 def requested_teams_count_at_cutoff(ctx: FeatureExtractionContext) -> int:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         _users_n, teams_n = active_review_request_counts(
             conn=conn,
             pull_request_id=ids.pull_request_id,
             cutoff=ctx.cutoff,
         )
         return teams_n
-    finally:
-        conn.close()
 
 
 def request_event_add_remove_counts(ctx: FeatureExtractionContext) -> tuple[int, int]:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         rows = conn.execute(
             """
             select se.occurred_at as start_ts, ee.occurred_at as end_ts
@@ -309,8 +287,6 @@ def request_event_add_remove_counts(ctx: FeatureExtractionContext) -> tuple[int,
             """,
             (ids.pull_request_id,),
         ).fetchall()
-    finally:
-        conn.close()
 
     cutoff_s = cutoff_sql(ctx.cutoff)
     add_n = sum(1 for r in rows if r["start_ts"] is not None and str(r["start_ts"]) <= cutoff_s)
@@ -363,9 +339,9 @@ def _mentioned_user_logins(input: PRInputBundle) -> set[str]:
 
 
 def _comment_counts_human_bot(ctx: FeatureExtractionContext) -> tuple[int, int]:
-    conn = connect_repo_db(repo=ctx.repo, data_dir=ctx.data_dir)
-    try:
-        ids = load_repo_pr_ids(conn=conn, repo=ctx.repo, pr_number=ctx.pr_number)
+    with _history(ctx) as history:
+        conn = history.conn
+        ids = history.pr_ids(ctx.pr_number)
         try:
             rows = conn.execute(
                 """
@@ -390,8 +366,6 @@ def _comment_counts_human_bot(ctx: FeatureExtractionContext) -> tuple[int, int]:
                 """,
                 (ids.repo_id, ids.pull_request_id, cutoff_sql(ctx.cutoff)),
             ).fetchall()
-    finally:
-        conn.close()
 
     bot = 0
     human = 0
@@ -409,12 +383,23 @@ def build_pr_timeline_features(
     *,
     data_dir: str,
     codeowner_logins: set[str] | None = None,
+    history: HistoryContext | None = None,
 ) -> dict[str, Any]:
+    if history is None:
+        with HistoryContext(repo=input.repo, data_dir=data_dir) as history:
+            return build_pr_timeline_features(
+                input,
+                data_dir=data_dir,
+                codeowner_logins=codeowner_logins,
+                history=history,
+            )
+
     ctx = FeatureExtractionContext(
         repo=input.repo,
         pr_number=input.pr_number,
         cutoff=input.cutoff,
         data_dir=data_dir,
+        history=history,
     )
 
     req_users, req_teams = _requested_login_sets(input)
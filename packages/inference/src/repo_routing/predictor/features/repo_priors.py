@@ -6,12 +6,11 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
-import fnmatch
-
 from ...boundary.signals.path import path_boundary
 from ...inputs.models import PRInputBundle
-from .ownership import load_codeowners_text, parse_codeowners_rules
-from .sql import connect_repo_db, cutoff_sql
+from ...router.baselines.codeowners import compile_codeowners
+from .ownership import load_codeowners_text
+from .sql import HistoryContext, cutoff_sql, history_context
 from .stats import median_int
 
 
@@ -33,27 +32,19 @@ def _zscore(value: float, values: list[float]) -> float:
     return (value - mean) / sd
 
 
-def _codeowners_match(pattern: str, path: str) -> bool:
-    if pattern.endswith("/"):
-        return path.startswith(pattern)
-    if "*" in pattern or "?" in pattern or "[" in pattern:
-        return fnmatch.fnmatch(path, pattern)
-    return path == pattern or path.endswith(pattern.lstrip("/"))
-
-
 def build_repo_priors_features(
     *,
     input: PRInputBundle,
     data_dir: str | Path,
     window_days: int = 180,
     boundary_top_n: int = 12,
+    history: HistoryContext | None = None,
 ) -> dict[str, Any]:
-    conn = connect_repo_db(repo=input.repo, data_dir=data_dir)
-    try:
-        repo_row = conn.execute("select id from repos where full_name = ?", (input.repo,)).fetchone()
-        if repo_row is None:
+    with history_context(repo=input.repo, data_dir=data_dir, history=history) as history:
+        conn = history.conn
+        repo_id = history.repo_id
+        if repo_id is None:
             return {}
-        repo_id = int(repo_row["id"])
 
         start_s = cutoff_sql(input.cutoff - timedelta(days=window_days))
         cutoff_s = cutoff_sql(input.cutoff)
@@ -246,24 +237,14 @@ def build_repo_priors_features(
                 )
                 if not text:
                     continue
-                rules = parse_codeowners_rules(text)
-                if not rules:
+                rules = compile_codeowners(text)
+                if not rules.rules:
                     continue
-                owned = 0
-                for p in paths:
-                    matched = False
-                    for rule in rules:
-                        if _codeowners_match(rule.pattern, p):
-                            matched = True
-                            break
-                    if matched:
-                        owned += 1
+                owned = sum(1 for p in paths if rules.is_owned(p))
                 owner_coverage_vals.append(float(owned) / float(len(paths)))
         except Exception:
             owner_coverage_vals = []
 
-    finally:
-        conn.close()
 
     boundary_total = float(sum(boundary_counter.values()))
     boundary_top = sorted(boundary_counter.items(), key=lambda kv: (-kv[1], kv[0].lower()))[:boundary_top_n]
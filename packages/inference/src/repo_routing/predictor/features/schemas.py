@@ -3,7 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .sql import HistoryContext
 
 FeatureScalar = int | float | bool | str | None
 PRFeatureVector = dict[str, Any]
@@ -53,3 +56,4 @@ class FeatureExtractionContext:
     pr_number: int
     cutoff: datetime
     data_dir: str | Path
+    history: HistoryContext | None = None
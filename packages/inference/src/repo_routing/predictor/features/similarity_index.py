@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable
+
+from ...boundary.signals.path import path_boundary
+
+
+def dir_depth3(path: str) -> str:
+    parts = [p for p in path.split("/") if p]
+    if len(parts) <= 1:
+        return "__root__"
+    return "/".join(parts[: min(3, len(parts) - 1)])
+
+
+def jaccard(a: set[str] | frozenset[str], b: set[str] | frozenset[str]) -> float:
+    if not a and not b:
+        return 0.0
+    inter = len(a & b)
+    union = len(a | b)
+    return float(inter) / float(union) if union > 0 else 0.0
+
+
+def churn_similarity(a: int, b: int) -> float:
+    if a <= 0 and b <= 0:
+        return 1.0
+    m = max(a, b)
+    if m <= 0:
+        return 0.0
+    return 1.0 - (abs(a - b) / float(m))
+
+
+@dataclass
+class PRFileShape:
+    """Changed-file tokens and churn of one PR head."""
+
+    paths: set[str]
+    dirs: set[str]
+    boundaries: set[str]
+    churn: int = 0
+
+
+_EMPTY_SHAPE = PRFileShape(paths=set(), dirs=set(), boundaries=set())
+
+_HeadKey = tuple[int, str | None]
+
+
+class SimilarityIndex:
+    """Cutoff-aware inverted index of PR file shapes for one repo.
+
+    Holds the head history and the file shape of each head for PRs created
+    in the windows queried so far, plus postings from path / depth-3 dir /
+    boundary tokens to the heads that touch them. A query resolves each PR's
+    latest head at the cutoff (like the `latest_head` SQL it replaces),
+    scores only heads sharing a token with the current PR, and ranks the
+    rest by churn alone, which is exact because their Jaccard terms are zero.
+
+    `ensure_window` loads PRs by `created_at`, extending one contiguous
+    loaded range, so a single query reads only its lookback window and a
+    cohort reads each PR once. The index is a snapshot of the DB as loaded;
+    open a new context to see later ingests. Hold `lock` around
+    `ensure_window` + `nearest` when the index is shared between threads.
+    """
+
+    def __init__(self, *, repo_id: int) -> None:
+        self.repo_id = repo_id
+        self.lock = threading.Lock()
+        # When pull_requests lacks created_at/base_sha (minimal schemas) every
+        # PR is a candidate, matching the SQL fallback.
+        self.windowed = True
+        self.base_sha: dict[int, str | None] = {}
+        # CODEOWNERS owner sets keyed by (base_sha, paths), filled by callers.
+        self.owner_sets: dict[tuple[str | None, frozenset[str]], set[str]] = {}
+        self._created: dict[int, str | None] = {}
+        self._created_sorted: list[tuple[str, int]] | None = None
+        self._heads: dict[int, dict[int, tuple[str, str | None]]] = {}
+        self._head_order: dict[int, list[tuple[str, int, str | None]]] = {}
+        self._shapes: dict[_HeadKey, PRFileShape] = {}
+        self._postings: dict[tuple[str, str], set[_HeadKey]] = {}
+        self._loaded: tuple[str, str] | None = None
+        self._loaded_all = False
+        self._files_available = True
+
+    def ensure_window(self, conn: sqlite3.Connection, start_s: str, cutoff_s: str) -> None:
+        """Load PRs created in [start_s, cutoff_s] not loaded yet."""
+        if self._loaded_all:
+            return
+        if self._loaded is None:
+            pr_ids = self._load_prs(conn, ">=", start_s, "<=", cutoff_s)
+            if pr_ids is None:
+                # No created_at column: every PR is a candidate, load them all.
+                self._loaded_all = True
+                pr_ids = self._load_all_prs(conn)
+            else:
+                self._loaded = (start_s, cutoff_s)
+        else:
+            lo, hi = self._loaded
+            pr_ids = []
+            if start_s < lo:
+                pr_ids += self._load_prs(conn, ">=", start_s, "<", lo) or []
+                lo = start_s
+            if cutoff_s > hi:
+                pr_ids += self._load_prs(conn, ">", hi, "<=", cutoff_s) or []
+                hi = cutoff_s
+            self._loaded = (lo, hi)
+        if pr_ids and self._files_available:
+            try:
+                self._load_heads(conn, pr_ids)
+                self._load_files(conn, pr_ids)
+            except sqlite3.OperationalError:
+                self._files_available = False
+
+    def nearest(
+        self,
+        *,
+        cur_paths: set[str],
+        cur_dirs: set[str],
+        cur_boundaries: set[str],
+        cur_churn: int,
+        start_s: str,
+        cutoff_s: str,
+        exclude_pr_id: int | None,
+        top_k: int,
+    ) -> tuple[list[int], dict[int, PRFileShape]]:
+        """Return the top-k PR ids and their file shapes at the cutoff."""
+        cand_ids = [pid for pid in self._window(start_s, cutoff_s) if pid != (exclude_pr_id or -1)]
+        if not cand_ids:
+            return [], {}
+
+        heads = {pid: self._head_at(pid, cutoff_s) for pid in cand_ids}
+        overlapping: set[int] = set()
+        for kind, tokens in (("p", cur_paths), ("d", cur_dirs), ("b", cur_boundaries)):
+            for token in tokens:
+                for pid, sha in self._postings.get((kind, token), ()):
+                    if pid in heads and heads[pid] == sha:
+                        overlapping.add(pid)
+
+        scored: list[tuple[float, int]] = []
+        for pid in cand_ids:
+            shape = self.shape(pid, heads[pid])
+            if pid in overlapping:
+                score = (
+                    0.45 * jaccard(cur_paths, shape.paths)
+                    + 0.30 * jaccard(cur_dirs, shape.dirs)
+                    + 0.15 * jaccard(cur_boundaries, shape.boundaries)
+                    + 0.10 * churn_similarity(cur_churn, shape.churn)
+                )
+            else:
+                score = 0.10 * churn_similarity(cur_churn, shape.churn)
+            scored.append((score, pid))
+
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        top = [pid for _s, pid in scored[:top_k]]
+        return top, {pid: self.shape(pid, heads[pid]) for pid in top}
+
+    def shape(self, pr_id: int, head_sha: str | None) -> PRFileShape:
+        return self._shapes.get((pr_id, head_sha), _EMPTY_SHAPE)
+
+    def _window(self, start_s: str, cutoff_s: str) -> Iterable[int]:
+        if not self.windowed:
+            return sorted(self._created)
+        if self._created_sorted is None:
+            self._created_sorted = sorted(
+                (created, pid) for pid, created in self._created.items() if created is not None
+            )
+        keys = self._created_sorted
+        lo = bisect_left(keys, (start_s, -1))
+        hi = bisect_right(keys, (cutoff_s, float("inf")))
+        return sorted(pid for _created, pid in keys[lo:hi])
+
+    def _head_at(self, pr_id: int, cutoff_s: str) -> str | None:
+        order = self._head_order.get(pr_id)
+        if order is None:
+            order = sorted(
+                (occurred, event_id, sha)
+                for event_id, (occurred, sha) in self._heads.get(pr_id, {}).items()
+            )
+            self._head_order[pr_id] = order
+        i = bisect_right(order, (cutoff_s, float("inf"), ""))
+        # Heads without an as-of start produce no files (as in the SQL join).
+        return order[i - 1][2] if i > 0 else _NO_HEAD
+
+    def _load_prs(
+        self, conn: sqlite3.Connection, lo_op: str, lo: str, hi_op: str, hi: str
+    ) -> list[int] | None:
+        try:
+            rows = conn.execute(
+                f"""
+                select id, created_at, base_sha
+                from pull_requests
+                where repo_id = ? and created_at {lo_op} ? and created_at {hi_op} ?
+                order by id asc
+                """,
+                (self.repo_id, lo, hi),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            self.windowed = False
+            return None
+        return self._add_prs(rows)
+
+    def _load_all_prs(self, conn: sqlite3.Connection) -> list[int]:
+        rows = conn.execute(
+            """
+            select id, null as created_at, null as base_sha
+            from pull_requests
+            where repo_id = ?
+            order by id asc
+            """,
+            (self.repo_id,),
+        ).fetchall()
+        return self._add_prs(rows)
+
+    def _add_prs(self, rows) -> list[int]:  # type: ignore[no-untyped-def]
+        pr_ids: list[int] = []
+        for r in rows:
+            pid = int(r["id"])
+            self._created[pid] = r["created_at"]
+            self.base_sha[pid] = r["base_sha"]
+            pr_ids.append(pid)
+        if pr_ids:
+            self._created_sorted = None
+        return pr_ids
+
+    def _load_heads(self, conn: sqlite3.Connection, pr_ids: list[int]) -> None:
+        for chunk in _chunks(pr_ids):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                select phi.pull_request_id as pr_id, phi.head_sha as head_sha,
+                       se.id as event_id, se.occurred_at as occurred_at
+                from pull_request_head_intervals phi
+                join events se on se.id = phi.start_event_id
+                where phi.pull_request_id in ({placeholders})
+                """,
+                chunk,
+            ).fetchall()
+            for r in rows:
+                if r["occurred_at"] is None:
+                    continue
+                pid = int(r["pr_id"])
+                self._heads.setdefault(pid, {})[int(r["event_id"])] = (
+                    str(r["occurred_at"]),
+                    r["head_sha"],
+                )
+                self._head_order.pop(pid, None)
+
+    def _load_files(self, conn: sqlite3.Connection, pr_ids: list[int]) -> None:
+        for chunk in _chunks(pr_ids):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""
+                select pull_request_id as pr_id, head_sha, path, changes
+                from pull_request_files
+                where repo_id = ? and pull_request_id in ({placeholders})
+                """,
+                [self.repo_id, *chunk],
+            ).fetchall()
+            for r in rows:
+                key: _HeadKey = (int(r["pr_id"]), r["head_sha"])
+                shape = self._shapes.get(key)
+                if shape is None:
+                    shape = PRFileShape(paths=set(), dirs=set(), boundaries=set())
+                    self._shapes[key] = shape
+                path = str(r["path"])
+                tokens = (("p", path), ("d", dir_depth3(path)), ("b", path_boundary(path)[0]))
+                shape.paths.add(path)
+                shape.dirs.add(tokens[1][1])
+                shape.boundaries.add(tokens[2][1])
+                shape.churn += int(r["changes"] or 0)
+                for token in tokens:
+                    self._postings.setdefault(token, set()).add(key)
+
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+_ID_CHUNK_SIZE = 500
+
+
+def _chunks(ids: list[int]) -> Iterable[list[int]]:
+    for start in range(0, len(ids), _ID_CHUNK_SIZE):
+        yield ids[start : start + _ID_CHUNK_SIZE]
+
+
+# Sentinel head for PRs with no head at the cutoff; never matches a posting.
+_NO_HEAD = "\0no-head"
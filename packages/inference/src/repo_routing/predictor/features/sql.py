@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
+from ...history.db import connect_history_db
 from ...paths import repo_db_path
 from ...time import dt_sql_utc, parse_dt_utc
 
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+_ID_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class RepoPrIds:
@@ -17,16 +26,175 @@ class RepoPrIds:
     author_id: int | None
 
 
-def connect_repo_db(*, repo: str, data_dir: str | Path) -> sqlite3.Connection:
+def connect_repo_db(
+    *, repo: str, data_dir: str | Path, check_same_thread: bool = True
+) -> sqlite3.Connection:
     """Open repo DB with row factory configured.
 
     Callers must close the returned connection.
     """
-    conn = sqlite3.connect(str(repo_db_path(repo_full_name=repo, data_dir=data_dir)))
-    conn.row_factory = sqlite3.Row
+    conn = connect_history_db(
+        repo_db_path(repo_full_name=repo, data_dir=data_dir),
+        check_same_thread=check_same_thread,
+    )
     return conn
 
 
+class HistoryContext:
+    """Shared read handle on one repo's history DB for feature builders.
+
+    Owns a single read-only connection (opened on first use) and caches the
+    id lookups every feature family repeats: repo id, PR ids by number and
+    user ids by login. Pass one context through the builders instead of
+    letting each open its own connection.
+
+    By default the connection is bound to the thread that opens it. With
+    `shared=True` one context serves many threads: the read-only connection
+    may cross threads and each `cached` structure is built once.
+    """
+
+    def __init__(self, *, repo: str, data_dir: str | Path, shared: bool = False) -> None:
+        self.repo = repo
+        self.data_dir = data_dir
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._repo_id: int | None = None
+        self._repo_id_loaded = False
+        self._pr_ids: dict[int, RepoPrIds | None] = {}
+        self._user_ids: dict[str, int | None] = {}
+        self._cache: dict[str, Any] = {}
+
+    def __enter__(self) -> HistoryContext:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    self._conn = connect_repo_db(
+                        repo=self.repo,
+                        data_dir=self.data_dir,
+                        check_same_thread=not self.shared,
+                    )
+        return self._conn
+
+    @property
+    def repo_id(self) -> int | None:
+        if not self._repo_id_loaded:
+            row = self.conn.execute(
+                "select id from repos where full_name = ?",
+                (self.repo,),
+            ).fetchone()
+            self._repo_id = None if row is None else int(row["id"])
+            self._repo_id_loaded = True
+        return self._repo_id
+
+    def pr_ids(self, pr_number: int) -> RepoPrIds:
+        """Ids for one PR; raises KeyError like `load_repo_pr_ids`."""
+        repo_id = self.repo_id
+        if repo_id is None:
+            raise KeyError(f"repo not found in db: {self.repo}")
+        key = int(pr_number)
+        if key not in self._pr_ids:
+            pr = self.conn.execute(
+                """
+                select id, issue_id, user_id
+                from pull_requests
+                where repo_id = ? and number = ?
+                """,
+                (repo_id, key),
+            ).fetchone()
+            self._pr_ids[key] = (
+                None
+                if pr is None
+                else RepoPrIds(
+                    repo_id=repo_id,
+                    pull_request_id=int(pr["id"]),
+                    issue_id=(int(pr["issue_id"]) if pr["issue_id"] is not None else None),
+                    author_id=(int(pr["user_id"]) if pr["user_id"] is not None else None),
+                )
+            )
+        ids = self._pr_ids[key]
+        if ids is None:
+            raise KeyError(f"pr not found: {self.repo}#{pr_number}")
+        return ids
+
+    def pull_request_id(self, pr_number: int) -> int | None:
+        try:
+            return self.pr_ids(pr_number).pull_request_id
+        except KeyError:
+            return None
+
+    def user_id(self, login: str) -> int | None:
+        """Resolve a login case-insensitively (None if unknown)."""
+        return self.user_ids([login])[login.lower()]
+
+    def user_ids(self, logins: Iterable[str]) -> dict[str, int | None]:
+        """Resolve many logins at once, keyed by lowercased login.
+
+        Duplicate case-folded logins resolve to the lowest user id, matching
+        the row an unordered `limit 1` scan returns.
+        """
+        keys = sorted({login.lower() for login in logins})
+        missing = [k for k in keys if k not in self._user_ids]
+        if missing:
+            found: dict[str, int] = {}
+            for start in range(0, len(missing), _ID_CHUNK_SIZE):
+                chunk = missing[start : start + _ID_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self.conn.execute(
+                    f"""
+                    select lower(login) as login_key, min(id) as id
+                    from users
+                    where lower(login) in ({placeholders})
+                    group by lower(login)
+                    """,
+                    chunk,
+                ).fetchall()
+                found.update({str(r["login_key"]): int(r["id"]) for r in rows})
+            for key in missing:
+                self._user_ids[key] = found.get(key)
+        return {k: self._user_ids[k] for k in keys}
+
+    def cached(self, key: str, build: Callable[[], T]) -> T:
+        """Per-repo derived structure, built once for the context's lifetime."""
+        if key in self._cache:
+            return self._cache[key]
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            if key not in self._cache:
+                self._cache[key] = build()
+        return self._cache[key]
+
+    def close(self) -> None:
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+
+@contextmanager
+def history_context(
+    *,
+    repo: str,
+    data_dir: str | Path,
+    history: HistoryContext | None = None,
+) -> Iterator[HistoryContext]:
+    """Borrow `history` if given, else open a context closed on exit."""
+    if history is not None:
+        yield history
+        return
+    with HistoryContext(repo=repo, data_dir=data_dir) as owned:
+        yield owned
+
+
 def load_repo_pr_ids(
     *,
     conn: sqlite3.Connection,
@@ -291,10 +459,26 @@ def candidate_last_activity_and_counts(
         "select id from users where lower(login) = lower(?) limit 1",
         (candidate_login,),
     ).fetchone()
-    if user is None:
+    return candidate_last_activity_and_counts_for_user(
+        conn=conn,
+        repo_id=repo_id,
+        user_id=None if user is None else int(user["id"]),
+        cutoff=cutoff,
+        windows_days=windows_days,
+    )
+
+
+def candidate_last_activity_and_counts_for_user(
+    *,
+    conn: sqlite3.Connection,
+    repo_id: int,
+    user_id: int | None,
+    cutoff: datetime,
+    windows_days: tuple[int, ...],
+) -> tuple[datetime | None, dict[int, int]]:
+    if user_id is None:
         return None, {int(d): 0 for d in windows_days}
 
-    user_id = int(user["id"])
     cutoff_s = cutoff_sql(cutoff)
 
     last_row = conn.execute(
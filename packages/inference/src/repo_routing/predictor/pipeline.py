@@ -82,6 +82,12 @@ class PipelinePredictor(Predictor):
         self.last_features = features
         return self.ranker.rank(input, features, top_k=top_k)
 
+    def close(self) -> None:
+        """Release resources pooled by the feature extractor (if any)."""
+        close = getattr(self.feature_extractor, "close", None)
+        if callable(close):
+            close()
+
 
 class DummyLLMRanker(Ranker):
     """Offline test helper for LLM-like ranking.
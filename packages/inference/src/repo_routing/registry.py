@@ -132,6 +132,11 @@ class PredictorRouterAdapter:
             )
         return self.predictor.predict(bundle, top_k=top_k)
 
+    def close(self) -> None:
+        close = getattr(self.predictor, "close", None)
+        if callable(close):
+            close()
+
 
 def _load_import_target(import_path: str):  # type: ignore[no-untyped-def]
     if ":" not in import_path:
@@ -1,6 +1,7 @@
 """Routing algorithms and result schemas."""
 
 from .base import Evidence, RouteCandidate, RouteResult, Router, Target, TargetType
+from .context import RoutingContext
 from .stewards import StewardsRouter
 
 __all__ = [
@@ -8,6 +9,7 @@ __all__ = [
     "RouteCandidate",
     "RouteResult",
     "Router",
+    "RoutingContext",
     "Target",
     "TargetType",
     "StewardsRouter",
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import json
-from dataclasses import dataclass
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
@@ -52,6 +56,123 @@ def _matches(pattern: str, path: str) -> bool:
     return path == pattern or path.endswith(pattern.lstrip("/"))
 
 
+def _is_glob(pattern: str) -> bool:
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+@dataclass
+class _GlobNode:
+    children: dict[str, _GlobNode] = field(default_factory=dict)
+    rules: list[tuple[int, Callable[[str], object]]] = field(default_factory=list)
+
+
+class CompiledCodeowners:
+    """CODEOWNERS rules indexed for matching many paths.
+
+    Matching is exactly `_matches`, but a path is only tested against rules
+    that can match it:
+    - directory rules ("dir/") are looked up by the path's "/"-terminated prefixes,
+    - literal rules are looked up by path suffixes of the lengths present,
+    - glob rules sit in a trie keyed by their leading literal segments, with
+      the fnmatch regex compiled once.
+
+    `matching_rules` returns every matching rule in file order (the union
+    semantics used by the router and features); `owners_for` applies GitHub's
+    last-match-wins rule.
+    """
+
+    def __init__(self, rules: list[CodeownersMatch], *, content_hash: str | None = None) -> None:
+        self.rules = list(rules)
+        self.content_hash = content_hash
+        self._dir_rules: dict[str, list[int]] = {}
+        self._literal_rules: dict[str, list[int]] = {}
+        self._glob_root = _GlobNode()
+        self._by_path: dict[str, tuple[int, ...]] = {}
+
+        for i, rule in enumerate(self.rules):
+            pattern = rule.pattern
+            if pattern.endswith("/"):
+                self._dir_rules.setdefault(pattern, []).append(i)
+            elif _is_glob(pattern):
+                node = self._glob_root
+                for segment in pattern.split("/")[:-1]:
+                    if _is_glob(segment):
+                        break
+                    node = node.children.setdefault(segment, _GlobNode())
+                node.rules.append((i, re.compile(fnmatch.translate(pattern)).match))
+            else:
+                # `path == pattern` is implied by the suffix test.
+                self._literal_rules.setdefault(pattern.lstrip("/"), []).append(i)
+        self._literal_lengths = sorted({len(k) for k in self._literal_rules})
+
+    def _match_indices(self, path: str) -> tuple[int, ...]:
+        cached = self._by_path.get(path)
+        if cached is not None:
+            return cached
+
+        hits: list[int] = []
+        if self._dir_rules:
+            pos = path.find("/")
+            while pos >= 0:
+                hits.extend(self._dir_rules.get(path[: pos + 1], ()))
+                pos = path.find("/", pos + 1)
+        for n in self._literal_lengths:
+            if n > len(path):
+                break
+            hits.extend(self._literal_rules.get(path[len(path) - n :], ()))
+
+        node: _GlobNode | None = self._glob_root
+        segments = path.split("/")[:-1]
+        depth = 0
+        while node is not None:
+            hits.extend(i for i, match in node.rules if match(path))
+            if depth >= len(segments):
+                break
+            node = node.children.get(segments[depth])
+            depth += 1
+
+        out = tuple(sorted(hits))
+        self._by_path[path] = out
+        return out
+
+    def matching_rules(self, path: str) -> list[CodeownersMatch]:
+        return [self.rules[i] for i in self._match_indices(path)]
+
+    def is_owned(self, path: str) -> bool:
+        return bool(self._match_indices(path))
+
+    def owners_for(self, path: str) -> list[Target]:
+        indices = self._match_indices(path)
+        return list(self.rules[indices[-1]].targets) if indices else []
+
+
+_COMPILED_CACHE_SIZE = 64
+_compiled_cache: OrderedDict[str, CompiledCodeowners] = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+def compile_codeowners(text: str) -> CompiledCodeowners:
+    """Parse and index CODEOWNERS `text`, shared per content hash.
+
+    Many PRs share a base SHA (and many base SHAs share a CODEOWNERS file),
+    so compiled matchers are kept in a small process-wide LRU.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    with _compiled_cache_lock:
+        compiled = _compiled_cache.get(digest)
+        if compiled is not None:
+            _compiled_cache.move_to_end(digest)
+            return compiled
+
+    compiled = CompiledCodeowners(_parse_codeowners(text), content_hash=digest)
+    with _compiled_cache_lock:
+        compiled = _compiled_cache.setdefault(digest, compiled)
+        _compiled_cache.move_to_end(digest)
+        while len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+            _compiled_cache.popitem(last=False)
+    return compiled
+
+
 def _target_from_profile_node(node: dict[str, object]) -> Target | None:
     kind = str(node.get("kind") or "").lower()
     name = str(node.get("name") or "").strip()
@@ -150,6 +271,13 @@ class CodeownersRouter:
             Path(codeowners_dir) if codeowners_dir is not None else None
         )
 
+    @property
+    def routing_key(self) -> str | None:
+        # A custom CODEOWNERS provider makes results instance-specific.
+        if self.codeowners_at_base_sha is not None:
+            return None
+        return f"codeowners:enabled={self.enabled}:dir={self.codeowners_dir}"
+
     @staticmethod
     def default_codeowners_at_base_sha(
         repo: str, base_sha: str, data_dir: str | Path
@@ -200,12 +328,13 @@ class CodeownersRouter:
             changed_files = list(pr.changed_files)
 
         notes: list[str] = []
-        rules: list[CodeownersMatch] | None = None
+        rules: CompiledCodeowners | None = None
         risk = "high"
 
         if input_bundle is not None and input_bundle.repo_profile_path:
-            rules = _rules_from_repo_profile(input_bundle.repo_profile_path)
-            if rules is not None:
+            profile_rules = _rules_from_repo_profile(input_bundle.repo_profile_path)
+            if profile_rules is not None:
+                rules = CompiledCodeowners(profile_rules)
                 risk = "low"
                 notes.append("source=repo_profile")
             else:
@@ -242,10 +371,10 @@ class CodeownersRouter:
                     notes=[*notes, "CODEOWNERS not available"],
                 )
 
-            rules = _parse_codeowners(codeowners_text)
+            rules = compile_codeowners(codeowners_text)
             notes.append("source=codeowners")
 
-        if not rules or not changed_files:
+        if rules is None or not rules.rules or not changed_files:
             return RouteResult(
                 repo=repo,
                 pr_number=pr_number,
@@ -258,9 +387,7 @@ class CodeownersRouter:
 
         hits: dict[tuple[TargetType, str], list[Evidence]] = {}
         for f in changed_files:
-            for rule in rules:
-                if not _matches(rule.pattern, f.path):
-                    continue
+            for rule in rules.matching_rules(f.path):
                 for t in rule.targets:
                     key = (t.type, t.name)
                     hits.setdefault(key, []).append(
@@ -46,6 +46,8 @@ def extract_targets(text: str) -> list[Target]:
 class MentionsRouter:
     """Baseline: route to @mentions in PR body."""
 
+    routing_key = "mentions"
+
     def route(
         self,
         *,
@@ -56,8 +58,11 @@ class MentionsRouter:
         top_k: int = 5,
         input_bundle: PRInputBundle | None = None,
     ) -> RouteResult:
-        with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
-            pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of)
+        if input_bundle is not None:
+            pr = input_bundle.snapshot
+        else:
+            with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
+                pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of)
 
         text = pr.body or ""
         targets = extract_targets(text)
@@ -7,6 +7,7 @@ from ...history.index import popularity_index
 from ...history.reader import HistoryReader
 
 if TYPE_CHECKING:
+    from ...history.timeline import ActivityTimeline
     from ...inputs.models import PRInputBundle
 from ..base import Evidence, RouteCandidate, RouteResult, Target, TargetType
 
@@ -16,6 +17,12 @@ class PopularityRouter:
 
     def __init__(self, *, lookback_days: int = 180) -> None:
         self.lookback_days = lookback_days
+        # Activity timelines per (repo, data_dir), shared by every PR routed.
+        self._timelines: dict[tuple[str, str], ActivityTimeline] = {}
+
+    @property
+    def routing_key(self) -> str:
+        return f"popularity:lookback_days={self.lookback_days}"
 
     def route(
         self,
@@ -28,9 +35,20 @@ class PopularityRouter:
         input_bundle: PRInputBundle | None = None,
     ) -> RouteResult:
         with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
-            pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of)
+            if input_bundle is not None:
+                pr = input_bundle.snapshot
+            else:
+                pr = reader.pull_request_snapshot(number=pr_number, as_of=as_of)
+            key = (repo, str(data_dir))
+            timeline = self._timelines.get(key)
+            if timeline is None:
+                timeline = reader.activity_timeline()
+                self._timelines[key] = timeline
             ranked = popularity_index(
-                reader, as_of=as_of, lookback_days=self.lookback_days
+                reader,
+                as_of=as_of,
+                lookback_days=self.lookback_days,
+                timeline=timeline,
             )
 
         author = (pr.author_login or "").lower()
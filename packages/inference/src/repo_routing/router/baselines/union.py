@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from ..base import Evidence, RouteCandidate, RouteResult, TargetType
+from ..context import SHARED_TOP_K, RoutingContext, route_in_context, routing_key
 from .codeowners import CodeownersRouter
 from .mentions import MentionsRouter
 from .popularity import PopularityRouter
@@ -35,6 +36,14 @@ class UnionRouter:
         if include_codeowners:
             self._routers.append(("codeowners", CodeownersRouter(enabled=True)))
 
+    @property
+    def routing_key(self) -> str | None:
+        keys = [routing_key(router) for _, router in self._routers]
+        if any(k is None for k in keys):
+            return None
+        parts = ",".join(f"{name}={k}" for (name, _), k in zip(self._routers, keys))
+        return f"union({parts})"
+
     def route(
         self,
         *,
@@ -44,17 +53,20 @@ class UnionRouter:
         data_dir: str = "data",
         top_k: int = 5,
         input_bundle: PRInputBundle | None = None,
+        routing_context: RoutingContext | None = None,
     ) -> RouteResult:
         merged: dict[tuple[TargetType, str], dict[str, object]] = {}
         notes: list[str] = []
 
         for source_name, router in self._routers:
-            result = router.route(  # type: ignore[attr-defined]
+            result = route_in_context(
+                router,
+                routing_context=routing_context,
                 repo=repo,
                 pr_number=pr_number,
                 as_of=as_of,
                 data_dir=data_dir,
-                top_k=max(top_k, 10),
+                top_k=max(top_k, SHARED_TOP_K),
                 input_bundle=input_bundle,
             )
             notes.append(f"source={source_name}:{len(result.candidates)}")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .base import RouteResult
+
+if TYPE_CHECKING:
+    from ..inputs.models import PRInputBundle
+
+
+# Depth at which composite routers query their sub-routers, and at which
+# shared results are memoised so top-level and nested calls meet.
+SHARED_TOP_K = 10
+
+
+def routing_key(router: object) -> str | None:
+    """Key under which `router`'s results may be shared, or None.
+
+    Routers opt in by exposing a `routing_key` string that is equal for
+    instances that return the same result for the same PR and arguments.
+    `top_k` must only truncate their candidates (up to `SHARED_TOP_K`, the
+    result for a smaller `top_k` is a prefix of the larger one). Routers
+    with per-call side effects (features, LLM steps) must not opt in.
+    """
+    key = getattr(router, "routing_key", None)
+    return key if isinstance(key, str) and key else None
+
+
+def accepts_routing_context(router: object) -> bool:
+    route_fn = getattr(router, "route", None)
+    if route_fn is None:
+        return False
+    try:
+        sig = inspect.signature(route_fn)
+    except (TypeError, ValueError):
+        return False
+    return "routing_context" in sig.parameters
+
+
+def accepts_input_bundle(router: object) -> bool:
+    route_fn = getattr(router, "route", None)
+    if route_fn is None:
+        return False
+    try:
+        sig = inspect.signature(route_fn)
+    except (TypeError, ValueError):
+        return False
+    if "input_bundle" in sig.parameters:
+        return True
+    return any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
+    )
+
+
+class RoutingContext:
+    """Route results computed for one (repo, PR, cutoff) evaluation step.
+
+    The evaluation runner routes every top-level router through the context
+    and composite routers (union, hybrid ranker, LLM rerank) route their
+    sub-routers through it too, so a baseline used by several of them runs
+    once per PR. Shared results are computed at `max(top_k, SHARED_TOP_K)`
+    and truncated to the requested `top_k`. A context is bound to a single
+    PR; create a new one for each PR. Safe to share between threads routing
+    the same PR.
+    """
+
+    def __init__(self, *, repo: str, pr_number: int, as_of: datetime) -> None:
+        self.repo = repo
+        self.pr_number = pr_number
+        self.as_of = as_of
+        self._results: dict[tuple[str, str, int], RouteResult] = {}
+        self._locks: dict[tuple[str, str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def route(
+        self,
+        router: object,
+        *,
+        repo: str,
+        pr_number: int,
+        as_of: datetime,
+        data_dir: str = "data",
+        top_k: int = 5,
+        input_bundle: PRInputBundle | None = None,
+    ) -> RouteResult:
+        if (repo, pr_number, as_of) != (self.repo, self.pr_number, self.as_of):
+            raise ValueError(
+                f"routing context for {self.repo}#{self.pr_number}@{self.as_of.isoformat()} "
+                f"used for {repo}#{pr_number}@{as_of.isoformat()}"
+            )
+        kwargs: dict[str, object] = {
+            "repo": repo,
+            "pr_number": pr_number,
+            "as_of": as_of,
+            "data_dir": data_dir,
+            "top_k": top_k,
+        }
+        if input_bundle is not None and accepts_input_bundle(router):
+            kwargs["input_bundle"] = input_bundle
+        if accepts_routing_context(router):
+            kwargs["routing_context"] = self
+
+        key = routing_key(router)
+        if key is None:
+            return router.route(**kwargs)  # type: ignore[attr-defined]
+
+        depth = max(int(top_k), SHARED_TOP_K)
+        memo_key = (key, str(data_dir), depth)
+        with self._lock:
+            lock = self._locks.setdefault(memo_key, threading.Lock())
+        with lock:
+            result = self._results.get(memo_key)
+            if result is None:
+                kwargs["top_k"] = depth
+                result = router.route(**kwargs)  # type: ignore[attr-defined]
+                self._results[memo_key] = result
+        if depth == top_k:
+            return result
+        return result.model_copy(
+            update={"top_k": top_k, "candidates": result.candidates[:top_k]}
+        )
+
+
+def route_in_context(
+    router: object,
+    *,
+    routing_context: RoutingContext | None,
+    repo: str,
+    pr_number: int,
+    as_of: datetime,
+    data_dir: str = "data",
+    top_k: int = 5,
+    input_bundle: PRInputBundle | None = None,
+) -> RouteResult:
+    """Route through `routing_context` when one is given, else directly."""
+    if routing_context is not None:
+        return routing_context.route(
+            router,
+            repo=repo,
+            pr_number=pr_number,
+            as_of=as_of,
+            data_dir=data_dir,
+            top_k=top_k,
+            input_bundle=input_bundle,
+        )
+    return router.route(  # type: ignore[attr-defined]
+        repo=repo,
+        pr_number=pr_number,
+        as_of=as_of,
+        data_dir=data_dir,
+        top_k=top_k,
+        input_bundle=input_bundle,
+    )
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from .base import Evidence, RouteCandidate, RouteResult
 from .baselines.union import UnionRouter
+from .context import SHARED_TOP_K, RoutingContext, route_in_context
 
 if TYPE_CHECKING:
     from ..inputs.models import PRInputBundle
@@ -64,13 +65,16 @@ class HybridRankerRouter:
         data_dir: str = "data",
         top_k: int = 5,
         input_bundle: PRInputBundle | None = None,
+        routing_context: RoutingContext | None = None,
     ) -> RouteResult:
-        union_result = self.union_router.route(
+        union_result = route_in_context(
+            self.union_router,
+            routing_context=routing_context,
             repo=repo,
             pr_number=pr_number,
             as_of=as_of,
             data_dir=data_dir,
-            top_k=max(top_k, 10),
+            top_k=max(top_k, SHARED_TOP_K),
             input_bundle=input_bundle,
         )
 
@@ -4,9 +4,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..analysis.engine import analyze_pr
+from ..analysis.engine import analyze_pr, load_activity_timeline
 
 if TYPE_CHECKING:
+    from ..history.timeline import ActivityTimeline
     from ..inputs.models import PRInputBundle
 from ..router.base import RouteCandidate, RouteResult, Target, TargetType
 
@@ -14,6 +15,8 @@ from ..router.base import RouteCandidate, RouteResult, Target, TargetType
 class StewardsRouter:
     def __init__(self, *, config_path: str | Path) -> None:
         self.config_path = Path(config_path)
+        # Activity timelines per (repo, data_dir), shared by every PR routed.
+        self._timelines: dict[tuple[str, str], ActivityTimeline] = {}
 
     def route(
         self,
@@ -25,12 +28,21 @@ class StewardsRouter:
         top_k: int = 5,
         input_bundle: PRInputBundle | None = None,
     ) -> RouteResult:
+        key = (repo, str(data_dir))
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            timeline = load_activity_timeline(repo=repo, data_dir=data_dir)
+            self._timelines[key] = timeline
         analysis = analyze_pr(
             repo=repo,
             pr_number=pr_number,
             cutoff=as_of,
             data_dir=data_dir,
             config_path=self.config_path,
+            timeline=timeline,
+            boundary_cutoff_key=(
+                input_bundle.boundary_cutoff_key if input_bundle is not None else None
+            ),
         )
 
         candidates = [
@@ -167,3 +167,55 @@ def test_boundary_build_cli_parser_fallback_and_strict_mode(tmp_path: Path) -> N
     assert strict.exit_code != 0
     assert strict.exception is not None
     assert "snapshot root missing" in str(strict.exception)
+
+
+def test_boundary_build_cohort_cli_writes_one_artifact_per_bucket(tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    repo = _seed_boundary_db(data_dir)
+    db_path = data_dir / "github" / "acme" / "widgets" / "history.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.executemany(
+            "insert into pull_requests (id, repo_id, number, created_at) values (?, 1, ?, ?)",
+            [
+                (102, 2, "2024-01-10 09:30:00"),
+                (103, 3, "2024-01-12 17:45:00"),
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "boundary",
+            "build-cohort",
+            "--repo",
+            repo,
+            "--pr",
+            "1",
+            "--pr",
+            "2",
+            "--pr",
+            "3",
+            "--data-dir",
+            str(data_dir),
+            "--cutoff-policy",
+            "daily",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "prs=3 artifacts=2 policy=daily" in result.output
+
+    for day in ("2024-01-10T00:00:00Z", "2024-01-12T00:00:00Z"):
+        cutoff = parse_dt_utc(day)
+        assert cutoff is not None
+        manifest_path = boundary_manifest_path(
+            repo_full_name=repo,
+            data_dir=data_dir,
+            strategy_id="hybrid_path_cochange.v1",
+            cutoff_key=cutoff_key_utc(cutoff),
+        )
+        manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        assert manifest_payload["metadata"]["cutoff_policy"] == "daily"
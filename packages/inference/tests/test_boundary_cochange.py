@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from repo_routing.boundary.signals.cochange import cochange_matrix, cochange_scores
+
+
+def test_cochange_scores_are_normalized_by_file_frequency() -> None:
+    file_sets = [["a.py", "b.py"], ["a.py", "b.py", "c.py"], ["a.py"], ["d.py"]]
+
+    scores = cochange_scores(file_sets)
+
+    assert list(scores) == ["a.py", "b.py", "c.py"]
+    assert scores["a.py"] == {"b.py": 2 / 3, "c.py": 1 / 3}
+    assert scores["b.py"] == {"a.py": 1.0, "c.py": 0.5}
+    assert scores["c.py"] == {"a.py": 1.0, "b.py": 1.0}
+
+
+def test_cochange_matrix_rows_match_scores_and_cap_large_prs() -> None:
+    file_sets = [["a.py", "b.py"], ["b.py", "c.py"], [f"vendor/{i}.py" for i in range(50)]]
+
+    matrix = cochange_matrix(file_sets)
+    assert dict(matrix) == cochange_scores(file_sets)
+    assert matrix.row("missing.py") == {}
+    assert "vendor/0.py" in matrix
+
+    capped = cochange_matrix(file_sets, max_pr_files=10)
+    assert capped.skipped_prs == 1
+    assert "vendor/0.py" not in capped
+    assert capped.row("b.py") == {"a.py": 0.5, "c.py": 0.5}
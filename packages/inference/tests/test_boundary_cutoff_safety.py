@@ -4,8 +4,13 @@ import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
+from repo_routing.boundary.cutoffs import BoundaryCutoffPolicy, boundary_cutoff
 from repo_routing.boundary.models import MembershipMode
-from repo_routing.boundary.pipeline import build_boundary_model
+from repo_routing.boundary.pipeline import (
+    build_boundary_model,
+    build_boundary_models,
+    write_boundary_model_artifacts_for_cutoffs,
+)
 
 
 def _seed_boundary_db(base_dir: Path) -> str:
@@ -87,3 +92,47 @@ def test_post_cutoff_pr_does_not_affect_output(tmp_path: Path) -> None:
 
     assert early_files == {"src/a.py"}
     assert late_files == {"src/a.py", "docs/readme.md"}
+
+
+def test_incremental_builds_match_full_builds_per_cutoff(tmp_path: Path) -> None:
+    repo = _seed_boundary_db(tmp_path)
+    cutoffs = [
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 2, 15, tzinfo=timezone.utc),
+        datetime(2024, 1, 15, tzinfo=timezone.utc),
+    ]
+
+    built = list(
+        build_boundary_models(repo_full_name=repo, cutoffs_utc=cutoffs, data_dir=tmp_path)
+    )
+
+    assert [cutoff for cutoff, _, _ in built] == sorted(cutoffs)
+    for cutoff, model, rows in built:
+        full_model, full_rows = build_boundary_model(
+            repo_full_name=repo, cutoff_utc=cutoff, data_dir=tmp_path
+        )
+        assert model == full_model
+        assert rows == full_rows
+
+
+def test_daily_cutoff_policy_shares_one_leakage_safe_artifact(tmp_path: Path) -> None:
+    repo = _seed_boundary_db(tmp_path)
+    pr_cutoffs = [
+        datetime(2024, 2, 1, 0, 0, 0, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, 9, 30, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, 23, 59, tzinfo=timezone.utc),
+    ]
+
+    artifacts = write_boundary_model_artifacts_for_cutoffs(
+        repo_full_name=repo,
+        cutoffs_utc=pr_cutoffs,
+        data_dir=tmp_path,
+        cutoff_policy=BoundaryCutoffPolicy.DAILY,
+    )
+
+    assert list(artifacts) == ["2024-02-01T00-00-00Z"]
+    for cutoff in pr_cutoffs:
+        assert boundary_cutoff(cutoff, "daily") <= cutoff
+    artifact = artifacts["2024-02-01T00-00-00Z"]
+    assert artifact.manifest.metadata["cutoff_policy"] == "daily"
+    assert {u.path for u in artifact.model.units} == {"src/a.py", "docs/readme.md"}
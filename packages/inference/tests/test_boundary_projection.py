@@ -4,6 +4,8 @@ from datetime import datetime, timezone
 
 from repo_routing.boundary.artifacts import BoundaryManifest, BoundaryModelArtifact
 from repo_routing.boundary.consumption import project_files_to_boundary_footprint
+from repo_routing.boundary.handle import open_boundary_artifact
+from repo_routing.boundary.io import read_boundary_artifact, write_boundary_artifact
 from repo_routing.boundary.models import (
     BoundaryDef,
     BoundaryModel,
@@ -62,3 +64,41 @@ def test_projection_is_deterministic_and_reports_coverage() -> None:
     assert footprint.coverage.changed_file_count == 3
     assert footprint.coverage.covered_file_count == 2
     assert footprint.coverage.uncovered_files == ["missing.txt"]
+
+
+def test_artifact_handle_projection_matches_artifact_and_is_shared(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    model = _artifact().model
+    cutoff_key = "2024-01-10T00-00-00Z"
+    write_boundary_artifact(
+        model=model, repo_full_name=model.repo, data_dir=tmp_path, cutoff_key=cutoff_key
+    )
+    read = dict(
+        repo_full_name=model.repo,
+        data_dir=tmp_path,
+        strategy_id=model.strategy_id,
+        cutoff_key=cutoff_key,
+    )
+
+    handle = open_boundary_artifact(**read)
+    paths = ["tests/test_a.py", "src/a.py", "missing.txt"]
+    assert project_files_to_boundary_footprint(
+        paths=paths, artifact=handle
+    ) == project_files_to_boundary_footprint(paths=paths, artifact=read_boundary_artifact(**read))
+    assert open_boundary_artifact(**read) is handle
+
+    # Rewriting the artifact changes its hash, so a fresh handle is opened.
+    changed = model.model_copy(
+        update={
+            "memberships": [
+                Membership(unit_id="file:src/a.py", boundary_id="dir:src", weight=0.5),
+                Membership(unit_id="file:src/a.py", boundary_id="dir:tests", weight=0.5),
+                Membership(unit_id="file:tests/test_a.py", boundary_id="dir:tests", weight=1.0),
+            ]
+        }
+    )
+    write_boundary_artifact(
+        model=changed, repo_full_name=model.repo, data_dir=tmp_path, cutoff_key=cutoff_key
+    )
+    reopened = open_boundary_artifact(**read)
+    assert reopened is not handle
+    assert reopened.unit_weights("file:src/a.py") == {"dir:src": 0.5, "dir:tests": 0.5}
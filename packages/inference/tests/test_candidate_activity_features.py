@@ -9,6 +9,8 @@ from repo_routing.inputs.models import PRInputBundle
 from repo_routing.predictor.features.candidate_activity import (
     build_candidate_activity_features,
     build_candidate_activity_table,
+    candidate_event_volume_by_windows,
+    days_since_last_candidate_activity,
 )
 from repo_routing.predictor.features.sql import (
     candidate_last_activity_and_counts,
@@ -119,3 +121,38 @@ def test_candidate_activity_features(tmp_path: Path) -> None:
         windows_days=(30,),
     )
     assert list(table.keys()) == ["alice", "bob"]
+
+
+def test_candidate_activity_table_matches_per_candidate_features(tmp_path: Path) -> None:
+    repo, data_dir = _seed_db(tmp_path)
+    bundle = _bundle(repo)
+    logins = ["bob", "BOB", "alice", "ghost"]
+
+    table = build_candidate_activity_table(
+        input=bundle,
+        candidate_logins=logins,
+        data_dir=data_dir,
+        windows_days=(7, 30),
+    )
+    for login in logins:
+        assert table[login] == build_candidate_activity_features(
+            input=bundle,
+            candidate_login=login,
+            data_dir=data_dir,
+            windows_days=(7, 30),
+        )
+        # Grouped activity agrees with the per-user SQL helpers.
+        assert table[login]["cand.activity.days_since_last_event"] == (
+            days_since_last_candidate_activity(
+                repo=repo, candidate_login=login, cutoff=bundle.cutoff, data_dir=data_dir
+            )
+        )
+        counts = candidate_event_volume_by_windows(
+            repo=repo,
+            candidate_login=login,
+            cutoff=bundle.cutoff,
+            windows_days=(7, 30),
+            data_dir=data_dir,
+        )
+        assert table[login]["cand.activity.events_7d"] == counts[7]
+        assert table[login]["cand.activity.events_30d"] == counts[30]
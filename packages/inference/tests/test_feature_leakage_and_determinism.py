@@ -184,3 +184,64 @@ def test_feature_extractor_deterministic_output_bytes(tmp_path: Path) -> None:
 
     assert out1 == out2
     assert _stable_json_bytes(out1) == _stable_json_bytes(out2)
+
+
+def test_feature_extractor_reuses_one_history_connection(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    import repo_routing.predictor.features.sql as feature_sql
+
+    repo, data_dir = _seed_db(tmp_path)
+    bundle = _bundle(repo)
+
+    opened: list[str] = []
+    real_connect = feature_sql.connect_repo_db
+
+    def _counting_connect(*, repo: str, data_dir, **kwargs):  # type: ignore[no-untyped-def]
+        opened.append(repo)
+        return real_connect(repo=repo, data_dir=data_dir, **kwargs)
+
+    monkeypatch.setattr(feature_sql, "connect_repo_db", _counting_connect)
+
+    extractor = build_feature_extractor_v1(
+        data_dir=data_dir,
+        include_ownership_features=False,
+    )
+    out1 = extractor.extract(bundle)
+    out2 = extractor.extract(bundle)
+    extractor.close()
+
+    assert opened == [repo]
+    assert out1 == out2
+    assert out1["candidates"]
+
+
+def test_feature_extractor_shares_history_across_threads(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from concurrent.futures import ThreadPoolExecutor
+
+    import repo_routing.predictor.features.sql as feature_sql
+
+    repo, data_dir = _seed_db(tmp_path)
+    bundle = _bundle(repo)
+
+    opened: list[str] = []
+    real_connect = feature_sql.connect_repo_db
+
+    def _counting_connect(*, repo: str, data_dir, **kwargs):  # type: ignore[no-untyped-def]
+        opened.append(repo)
+        return real_connect(repo=repo, data_dir=data_dir, **kwargs)
+
+    monkeypatch.setattr(feature_sql, "connect_repo_db", _counting_connect)
+
+    extractor = build_feature_extractor_v1(
+        data_dir=data_dir,
+        include_ownership_features=False,
+    )
+    expected = extractor.extract(bundle)
+    outputs = []
+    # A fresh executor per "PR", as parallel router execution does.
+    for _ in range(3):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            outputs.extend(pool.map(lambda _: extractor.extract(bundle), range(2)))
+    extractor.close()
+
+    assert opened == [repo]
+    assert outputs == [expected] * 6
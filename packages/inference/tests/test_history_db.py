@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+from repo_routing.history.db import connect_history_db
+
+
+def _make_db(path):
+    conn = sqlite3.connect(str(path))
+    conn.execute("pragma journal_mode=WAL")
+    conn.execute("create table repos (id integer primary key, full_name text)")
+    conn.execute("insert into repos (id, full_name) values (1, 'acme/widgets')")
+    conn.commit()
+    return conn
+
+
+def test_connect_history_db_is_read_only(tmp_path):
+    db = tmp_path / "history.sqlite"
+    _make_db(db).close()
+
+    conn = connect_history_db(db)
+    try:
+        row = conn.execute("select full_name from repos where id = 1").fetchone()
+        assert row["full_name"] == "acme/widgets"
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("insert into repos (id, full_name) values (2, 'x/y')")
+    finally:
+        conn.close()
+
+
+def test_connect_history_db_reads_while_writer_is_open(tmp_path):
+    db = tmp_path / "history.sqlite"
+    writer = _make_db(db)
+    writer.execute("insert into repos (id, full_name) values (2, 'acme/gears')")
+
+    conn = connect_history_db(db)
+    try:
+        assert conn.execute("select count(*) from repos").fetchone()[0] == 1
+        writer.commit()
+        assert conn.execute("select count(*) from repos").fetchone()[0] == 2
+    finally:
+        conn.close()
+        writer.close()
+
+
+def test_connect_history_db_does_not_create_missing_file(tmp_path):
+    db = tmp_path / "missing" / "history.sqlite"
+    with pytest.raises(sqlite3.OperationalError):
+        connect_history_db(db)
+    assert not db.exists()
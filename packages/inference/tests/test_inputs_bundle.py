@@ -4,6 +4,11 @@ import json
 import sqlite3
 from pathlib import Path
 
+from repo_routing.artifacts.writer import (
+    build_pr_snapshot_and_inputs,
+    build_pr_snapshot_artifact,
+)
+from repo_routing.history.reader import HistoryReader
 from repo_routing.inputs.builder import build_pr_input_bundle
 from repo_routing.time import parse_dt_utc
 
@@ -72,3 +77,23 @@ def test_pr_input_bundle_deterministic_json(tmp_path: Path) -> None:
     assert j1 == j2
     assert b1.boundaries == []
     assert b1.file_boundaries == {}
+
+
+def test_snapshot_and_inputs_share_one_reader(tmp_path: Path) -> None:
+    repo, data_dir = _seed_db(tmp_path)
+    cutoff = parse_dt_utc("2024-01-02T00:00:00Z")
+    assert cutoff is not None
+
+    with HistoryReader(repo_full_name=repo, data_dir=data_dir) as reader:
+        pairs = [
+            build_pr_snapshot_and_inputs(
+                repo=repo, pr_number=1, as_of=cutoff, data_dir=data_dir, reader=reader
+            )
+            for _ in range(2)
+        ]
+
+    for snap, inputs in pairs:
+        assert snap == build_pr_snapshot_artifact(
+            repo=repo, pr_number=1, as_of=cutoff, data_dir=data_dir
+        )
+        assert inputs == build_pr_input_bundle(repo, 1, cutoff, data_dir)
@@ -8,6 +8,7 @@ import pytest
 
 from repo_routing.mixed_membership.boundaries.basis import (
     build_user_boundary_activity_rows,
+    rows_to_sparse_user_boundary_matrix,
     rows_to_user_boundary_matrix,
 )
 from repo_routing.mixed_membership.config import BoundaryMembershipConfig
@@ -108,6 +109,23 @@ def test_build_user_boundary_activity_rows_and_matrix(tmp_path: Path) -> None:
     assert len(matrix.values[0]) == len(matrix.boundaries)
 
 
+def test_sparse_matrix_matches_dense_matrix() -> None:
+    rows = [
+        {"user_login": "bob", "boundary": "src", "weight": 2.0},
+        {"user_login": "alice", "boundary": "docs", "weight": 1.0},
+        {"user_login": "bob", "boundary": "src", "weight": 0.5},
+        {"user_login": "carol", "boundary": "docs", "weight": 0.1},
+    ]
+
+    sparse = rows_to_sparse_user_boundary_matrix(rows, min_user_total_weight=0.5)
+    dense = rows_to_user_boundary_matrix(rows, min_user_total_weight=0.5)
+
+    assert sparse.shape == (2, 2)
+    assert list(zip(sparse.row_ix, sparse.col_ix, sparse.data)) == [(0, 0, 1.0), (1, 1, 2.5)]
+    assert sparse.to_dense() == dense
+    assert dense.values == [[1.0, 0.0], [0.0, 2.5]]
+
+
 def test_fit_nmf_and_derive_features(tmp_path: Path) -> None:
     pytest.importorskip("sklearn")
     pytest.importorskip("numpy")
@@ -141,3 +159,76 @@ def test_fit_nmf_and_derive_features(tmp_path: Path) -> None:
         candidate_logins=["bob"],
     )
     assert "pair.affinity.pr_boundary_dot_candidate_role_mix" in pair["bob"]
+
+
+def _seed_daily_history(data_dir: Path, *, days: int) -> None:
+    """Add 8 developers with 4 PRs a day across 6 areas from 2024-01-04."""
+    db = data_dir / "github" / "acme" / "widgets" / "history.sqlite"
+    areas = ["src/api", "src/ui", "docs", "infra/ci", "src/db", "tools"]
+    users = [(20 + i, f"dev{i}") for i in range(8)]
+    conn = sqlite3.connect(str(db))
+    try:
+        conn.executemany("insert into users (id, login, type) values (?, ?, 'User')", users)
+        pr_id = 200
+        for day in range(days):
+            for j in range(4):
+                pr_id += 1
+                opened = f"2024-01-{day + 4:02d} {j:02d}:00:00"
+                author = users[(day * 4 + j) % len(users)][0]
+                reviewer = users[(author + 3) % len(users)][0]
+                head = f"h{pr_id}"
+                conn.execute(
+                    "insert into pull_requests (id, repo_id, number, user_id, created_at) values (?, 1, ?, ?, ?)",
+                    (pr_id, pr_id, author, opened),
+                )
+                conn.execute(
+                    "insert into events (id, occurred_at, repo_id, actor_id, subject_type, subject_id) values (?, ?, 1, ?, 'pull_request', ?)",
+                    (pr_id, opened, author, pr_id),
+                )
+                conn.execute(
+                    "insert into pull_request_head_intervals (id, pull_request_id, start_event_id, end_event_id, head_sha, head_ref) values (?, ?, ?, null, ?, 'main')",
+                    (pr_id, pr_id, pr_id, head),
+                )
+                for k, area in enumerate((areas[(author + j) % 6], areas[(author + 2) % 6])):
+                    conn.execute(
+                        "insert into pull_request_files (repo_id, pull_request_id, head_sha, path, changes) values (1, ?, ?, ?, 5)",
+                        (pr_id, head, f"{area}/m{k}.py"),
+                    )
+                conn.execute(
+                    "insert into reviews (id, repo_id, pull_request_id, user_id, submitted_at) values (?, 1, ?, ?, ?)",
+                    (pr_id, pr_id, reviewer, f"2024-01-{day + 4:02d} {j:02d}:30:00"),
+                )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_warm_started_fit_reuses_previous_model(tmp_path: Path) -> None:
+    pytest.importorskip("sklearn")
+    pytest.importorskip("numpy")
+
+    repo, data_dir = _seed_db(tmp_path)
+    _seed_daily_history(data_dir, days=10)
+    cfg = BoundaryMembershipConfig(lookback_days=30, n_components=3)
+
+    def fit(cutoff: datetime, warm_start=None):  # type: ignore[no-untyped-def]
+        rows = build_user_boundary_activity_rows(
+            repo=repo, cutoff=cutoff, data_dir=data_dir, config=cfg
+        )
+        return fit_boundary_membership_nmf(
+            repo=repo, cutoff=cutoff, rows=rows, config=cfg, warm_start=warm_start
+        )
+
+    previous = fit(datetime(2024, 1, 12, tzinfo=timezone.utc))
+    cutoff = datetime(2024, 1, 14, tzinfo=timezone.utc)
+    cold = fit(cutoff)
+    warm = fit(cutoff, warm_start=previous)
+
+    assert warm.diagnostics["warm_started"] is True
+    assert "warm_started" not in cold.diagnostics
+    assert warm.users == cold.users
+    assert warm.roles == cold.roles
+    # Starting from the previous cutoff's factors converges sooner, to an
+    # equally good fit.
+    assert warm.diagnostics["n_iter"] < cold.diagnostics["n_iter"]
+    assert warm.diagnostics["reconstruction_err"] <= cold.diagnostics["reconstruction_err"] * 1.01
@@ -5,7 +5,11 @@ from pathlib import Path
 
 from repo_routing.history.models import PullRequestFile, PullRequestSnapshot
 from repo_routing.inputs.models import PRInputBundle
-from repo_routing.predictor.features.ownership import build_ownership_features
+from repo_routing.predictor.features.ownership import (
+    build_ownership_features,
+    parse_codeowners_rules,
+)
+from repo_routing.router.baselines.codeowners import _matches, compile_codeowners
 
 
 def _setup_files(tmp_path: Path, repo: str, base_sha: str) -> Path:
@@ -70,3 +74,37 @@ def test_build_ownership_features(tmp_path: Path) -> None:
     assert features["pr.owners.coverage_ratio"] > 0.0
     assert features["pr.owners.zero_owner_found"] is False
     assert features["pr.owners.overlap_active_candidates"] >= 1
+
+
+def test_compiled_codeowners_matches_rule_by_rule_semantics() -> None:
+    text = (
+        "* @everyone\n"
+        "src/ @core\n"
+        "src/*.py @py\n"
+        "/docs/ @docs\n"
+        "README.md @readme\n"
+        "lib/*/gen_* @gen\n"
+        "[ab]?.txt @short\n"
+    )
+    compiled = compile_codeowners(text)
+    assert compile_codeowners(text) is compiled
+
+    rules = parse_codeowners_rules(text)
+    paths = [
+        "src/app.py",
+        "src/pkg/deep.py",
+        "docs/index.md",
+        "README.md",
+        "pkg/README.md",
+        "lib/x/gen_a.go",
+        "lib/gen_a.go",
+        "a1.txt",
+        "other/b2.txt",
+    ]
+    for path in paths:
+        expected = [r.pattern for r in rules if _matches(r.pattern, path)]
+        assert [r.pattern for r in compiled.matching_rules(path)] == expected
+
+    # GitHub semantics: the last matching rule owns the file.
+    assert [t.name for t in compiled.owners_for("src/app.py")] == ["py"]
+    assert [t.name for t in compiled.owners_for("pkg/README.md")] == ["readme"]
@@ -10,6 +10,7 @@ from repo_routing.predictor.features.automation import build_automation_features
 from repo_routing.predictor.features.interaction import build_interaction_features
 from repo_routing.predictor.features.repo_priors import build_repo_priors_features
 from repo_routing.predictor.features.similarity import build_similarity_features
+from repo_routing.predictor.features.sql import HistoryContext
 
 
 def _seed_db(tmp_path: Path) -> tuple[str, Path]:
@@ -199,3 +200,52 @@ def test_repo_priors_similarity_automation_and_pair_social(tmp_path: Path) -> No
     assert interactions["bob"]["pair.social.prior_interactions_author_candidate_180d"] >= 1
     assert "pair.social.author_to_candidate_latency_median" in interactions["bob"]
     assert interactions["bob"]["pair.availability.historical_response_rate_bucket"] in {"none", "low", "medium", "high"}
+
+
+def test_similarity_index_loads_only_queried_windows(tmp_path: Path) -> None:
+    repo, data_dir = _seed_db(tmp_path)
+    db = data_dir / "github" / "acme" / "widgets" / "history.sqlite"
+    conn = sqlite3.connect(str(db))
+    try:
+        # Full schema, so candidates are windowed by created_at.
+        conn.execute("alter table pull_requests add column base_sha text")
+        # 99 predates the 365-day lookback; 103 is created after the first cutoff.
+        for pr_id, number, created, event_id in [
+            (99, 9, "2022-01-01 00:00:00", 9),
+            (103, 4, "2024-01-07 00:00:00", 4),
+        ]:
+            conn.execute(
+                "insert into pull_requests (id, repo_id, number, issue_id, user_id, created_at) values (?, 1, ?, null, 10, ?)",
+                (pr_id, number, created),
+            )
+            conn.execute(
+                "insert into events (id, occurred_at, repo_id, actor_id, subject_type, subject_id) values (?, ?, 1, 10, 'pull_request', ?)",
+                (event_id, created, pr_id),
+            )
+            conn.execute(
+                "insert into pull_request_head_intervals (id, pull_request_id, start_event_id, end_event_id, head_sha, head_ref) values (?, ?, ?, null, ?, 'main')",
+                (event_id, pr_id, event_id, f"h{pr_id}"),
+            )
+            conn.execute(
+                "insert into pull_request_files values (1, ?, ?, 'src/c.py', 'modified', 3, 1, 4)",
+                (pr_id, f"h{pr_id}"),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    bundle = _bundle(repo)
+    later = bundle.model_copy(update={"cutoff": datetime(2024, 1, 8, tzinfo=timezone.utc)})
+
+    with HistoryContext(repo=repo, data_dir=data_dir) as history:
+        first = build_similarity_features(input=bundle, data_dir=data_dir, top_k=2, history=history)
+        index = history.cached("similarity_index", lambda: None)
+        assert sorted(index.base_sha) == [100, 101, 102]
+        assert first["sim.nearest_prs.topk_ids"][0] == 101
+        assert first == build_similarity_features(input=bundle, data_dir=data_dir, top_k=2)
+
+        # A later cutoff extends the loaded window to the new PR only.
+        second = build_similarity_features(input=later, data_dir=data_dir, top_k=2, history=history)
+        assert sorted(index.base_sha) == [100, 101, 102, 103]
+        assert second["sim.nearest_prs.topk_ids"][0] == 103
+        assert second == build_similarity_features(input=later, data_dir=data_dir, top_k=2)
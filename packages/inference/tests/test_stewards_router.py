@@ -5,8 +5,11 @@ import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
+from repo_routing.analysis.engine import analyze_pr, load_activity_timeline
 from repo_routing.boundary.models import MembershipMode
 from repo_routing.boundary.pipeline import write_boundary_model_artifacts
+from repo_routing.history.index import popularity_index
+from repo_routing.history.reader import HistoryReader
 from repo_routing.paths import repo_db_path
 from repo_routing.router.stewards import StewardsRouter
 
@@ -190,8 +193,7 @@ Provenance: human', 'base3', 'main')
     return base_dir
 
 
-def test_stewards_router_ranks_candidates(tmp_path: Path) -> None:
-    data_dir = _seed_db(tmp_path / "data")
+def _write_config(tmp_path: Path) -> Path:
     config_path = tmp_path / "config.json"
     config_path.write_text(
         json.dumps(
@@ -217,6 +219,12 @@ def test_stewards_router_ranks_candidates(tmp_path: Path) -> None:
         ),
         encoding="utf-8",
     )
+    return config_path
+
+
+def test_stewards_router_ranks_candidates(tmp_path: Path) -> None:
+    data_dir = _seed_db(tmp_path / "data")
+    config_path = _write_config(tmp_path)
 
     write_boundary_model_artifacts(
         repo_full_name="acme/widgets",
@@ -238,3 +246,41 @@ def test_stewards_router_ranks_candidates(tmp_path: Path) -> None:
     assert result.candidates[0].target.name == "bob"
     assert result.confidence == "high"
     assert result.risk == "medium"
+
+
+def test_activity_timeline_matches_per_call_queries(tmp_path: Path) -> None:
+    data_dir = _seed_db(tmp_path / "data")
+    config_path = _write_config(tmp_path)
+    cutoff = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    write_boundary_model_artifacts(
+        repo_full_name="acme/widgets",
+        cutoff_utc=cutoff,
+        cutoff_key="2024-01-10T00-00-00Z",
+        data_dir=data_dir,
+        membership_mode=MembershipMode.MIXED,
+    )
+
+    timeline = load_activity_timeline(repo="acme/widgets", data_dir=data_dir)
+    for n in (1, 2, 3):
+        shared = analyze_pr(
+            repo="acme/widgets",
+            pr_number=n,
+            cutoff=cutoff,
+            data_dir=data_dir,
+            config_path=config_path,
+            timeline=timeline,
+        )
+        fresh = analyze_pr(
+            repo="acme/widgets",
+            pr_number=n,
+            cutoff=cutoff,
+            data_dir=data_dir,
+            config_path=config_path,
+        )
+        assert shared == fresh
+
+    with HistoryReader(repo_full_name="acme/widgets", data_dir=data_dir) as reader:
+        for as_of, lookback in [(cutoff, 180), (cutoff, 4), (datetime(2024, 1, 5, 12, tzinfo=timezone.utc), 1)]:
+            assert popularity_index(
+                reader, as_of=as_of, lookback_days=lookback, timeline=timeline
+            ) == popularity_index(reader, as_of=as_of, lookback_days=lookback)
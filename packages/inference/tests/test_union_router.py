@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import pytest
+
 from repo_routing.router.base import Evidence, RouteCandidate, RouteResult, Target, TargetType
 from repo_routing.router.baselines.union import UnionRouter
+from repo_routing.router.context import RoutingContext
+from repo_routing.router.hybrid_ranker import HybridRankerRouter
 
 
 class _FakeRouter:
@@ -47,3 +51,61 @@ def test_union_router_merges_candidates_and_preserves_sources() -> None:
     ev = out.candidates[0].evidence
     assert any((e.data or {}).get("source_router") == "mentions" for e in ev)
     assert any((e.data or {}).get("source_router") == "popularity" for e in ev)
+
+
+class _KeyedRouter(_FakeRouter):
+    def __init__(self, key: str, candidates: list[RouteCandidate]) -> None:
+        super().__init__(candidates)
+        self.routing_key = key
+        self.calls = 0
+
+    def route(self, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return super().route(**kwargs)
+
+
+def test_routing_context_shares_sub_router_results_within_a_pr() -> None:
+    as_of = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mentions = _KeyedRouter("mentions", [_candidate("alice", 1.0, "mention")])
+    unkeyed = _FakeRouter([_candidate("bob", 0.6, "popularity")])
+    union_a = UnionRouter(source_routers=[("mentions", mentions), ("popularity", unkeyed)])
+    union_b = UnionRouter(source_routers=[("mentions", mentions)])
+    hybrid = HybridRankerRouter(union_router=union_b)
+
+    ctx = RoutingContext(repo="acme/widgets", pr_number=7, as_of=as_of)
+    kwargs = {"repo": "acme/widgets", "pr_number": 7, "as_of": as_of, "top_k": 5}
+    out_a = union_a.route(**kwargs, routing_context=ctx)
+    out_b = hybrid.route(**kwargs, routing_context=ctx)
+
+    assert mentions.calls == 1
+    assert union_a.routing_key is None
+    assert out_a == union_a.route(**kwargs)
+    assert out_b == hybrid.route(**kwargs)
+
+    with pytest.raises(ValueError):
+        ctx.route(union_b, **{**kwargs, "pr_number": 8})
+
+
+class _TruncatingRouter(_KeyedRouter):
+    def route(self, **kwargs):  # type: ignore[no-untyped-def]
+        out = super().route(**kwargs)
+        return out.model_copy(update={"candidates": out.candidates[: out.top_k]})
+
+
+def test_routing_context_shares_top_level_and_nested_results_across_top_k() -> None:
+    as_of = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    names = [f"user{i:02d}" for i in range(12)]
+    popularity = _TruncatingRouter(
+        "popularity",
+        [_candidate(name, 1.0 / (1 + i), "popularity") for i, name in enumerate(names)],
+    )
+    union = UnionRouter(source_routers=[("popularity", popularity)])
+
+    ctx = RoutingContext(repo="acme/widgets", pr_number=7, as_of=as_of)
+    kwargs = {"repo": "acme/widgets", "pr_number": 7, "as_of": as_of, "top_k": 3}
+    top_level = ctx.route(popularity, **kwargs)
+    nested = ctx.route(union, **kwargs)
+
+    assert popularity.calls == 1
+    assert top_level == popularity.route(**kwargs)
+    assert nested == union.route(**kwargs)
@@ -5,6 +5,7 @@ from dataclasses import asdict
 from datetime import datetime, timezone
 
 from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy import event as sa_event
 from sqlalchemy import select
 
 from gh_history_ingestion.events.normalize import EventRecord
@@ -31,7 +32,145 @@ from gh_history_ingestion.storage.schema import (
 )
 
 
+DEFAULT_UPSERT_BATCH_SIZE = 1000
+_BATCHER_KEY = "gh.storage.upsert_batcher"
+
+
+class UpsertBatcher:
+    """Buffer upserts per model and write them as multi-row statements.
+
+    While attached to a session, every `upsert_*` helper and `insert_event`
+    buffers its values instead of executing one `INSERT ... ON CONFLICT` per
+    call. Rows are deduped by conflict key: upserts keep the last write,
+    events keep the first (matching `ON CONFLICT DO NOTHING`). Buffers are
+    written with `executemany` when `batch_size` rows are pending, before
+    `session.commit()`, and before any other statement runs on the session,
+    so reads always observe buffered writes.
+    """
+
+    def __init__(self, session, *, batch_size: int = DEFAULT_UPSERT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.session = session
+        self.batch_size = batch_size
+        self._buffers: dict[tuple, dict[tuple, dict]] = {}
+        self._pending = 0
+        self._flushing = False
+        self._attached = False
+
+    def __enter__(self) -> "UpsertBatcher":
+        self.attach()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.detach()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def attach(self) -> None:
+        if self._attached:
+            return
+        if _BATCHER_KEY in self.session.info:
+            raise RuntimeError("session already has an UpsertBatcher attached")
+        self.session.info[_BATCHER_KEY] = self
+        sa_event.listen(self.session, "before_commit", self._before_commit)
+        sa_event.listen(self.session, "do_orm_execute", self._before_execute)
+        self._attached = True
+
+    def detach(self) -> None:
+        if not self._attached:
+            return
+        sa_event.remove(self.session, "before_commit", self._before_commit)
+        sa_event.remove(self.session, "do_orm_execute", self._before_execute)
+        self.session.info.pop(_BATCHER_KEY, None)
+        self._attached = False
+
+    def add(self, model, values: dict, index_elements, *, do_nothing: bool = False):
+        index_elements = tuple(index_elements)
+        buffer_key = (model, index_elements, tuple(values), do_nothing)
+        rows = self._buffers.setdefault(buffer_key, {})
+        row_key = tuple(values[k] for k in index_elements)
+        if row_key in rows:
+            if do_nothing:
+                return
+            # Re-insert so the row keeps the position of its latest write.
+            del rows[row_key]
+        else:
+            self._pending += 1
+        rows[row_key] = values
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._flushing or not self._pending:
+            return
+        self._flushing = True
+        try:
+            buffers, self._buffers, self._pending = self._buffers, {}, 0
+            for (model, index_elements, columns, do_nothing), rows in buffers.items():
+                stmt = insert(model)
+                if do_nothing:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+                else:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=index_elements,
+                        set_={
+                            c: stmt.excluded[c]
+                            for c in columns
+                            if c not in index_elements
+                        },
+                    )
+                self.session.execute(stmt, list(rows.values()))
+        finally:
+            self._flushing = False
+
+    def _before_commit(self, session) -> None:
+        self.flush()
+
+    def _before_execute(self, orm_execute_state) -> None:
+        self.flush()
+
+
+class RowRecorder:
+    """Session stand-in that records upsert rows instead of writing them.
+
+    The `upsert_*` helpers and `insert_event` see it as a session with a
+    batcher attached, so payloads are normalised exactly as on a live
+    session (e.g. in a worker process). `replay` then hands the recorded
+    rows, in order, to the batcher of a real session.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[tuple] = []
+        self.info = {_BATCHER_KEY: self}
+
+    def add(self, model, values: dict, index_elements, *, do_nothing: bool = False):
+        self.rows.append((model, values, tuple(index_elements), do_nothing))
+
+    @staticmethod
+    def replay(batcher: UpsertBatcher, rows) -> None:
+        for model, values, index_elements, do_nothing in rows:
+            batcher.add(model, values, index_elements, do_nothing=do_nothing)
+
+
+def get_upsert_batcher(session) -> UpsertBatcher | None:
+    info = getattr(session, "info", None)
+    if not info:
+        return None
+    return info.get(_BATCHER_KEY)
+
+
 def _upsert(session, model, values, index_elements):
+    batcher = get_upsert_batcher(session)
+    if batcher is not None:
+        batcher.add(model, values, index_elements)
+        return
     stmt = insert(model).values(**values)
     update = {k: v for k, v in values.items() if k not in index_elements}
     stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=update)
@@ -420,6 +559,10 @@ def insert_event(session, event: EventRecord) -> None:
         else None,
         "event_key": event_key,
     }
+    batcher = get_upsert_batcher(session)
+    if batcher is not None:
+        batcher.add(Event, values, ["event_key"], do_nothing=True)
+        return
     stmt = insert(Event).values(**values)
     stmt = stmt.on_conflict_do_nothing(index_elements=["event_key"])
     session.execute(stmt)
@@ -8,12 +8,43 @@ from ..explorer.server import create_app
 from ..ingest.backfill import backfill_repo
 from ..ingest.incremental import incremental_update
 from ..ingest.pull_requests import backfill_pull_requests
+from ..ingest.replay import replay_archive
+from ..providers.github.archive import PageArchive
+from ..providers.github.cache import HttpResponseCache
 from ..runtime_defaults import DEFAULT_DATA_DIR, DEFAULT_EXPLORER_DATA_ROOT
-from .paths import default_db_path
+from ..storage.db import get_engine, optimize_db
+from .paths import default_archive_dir, default_db_path, default_http_cache_path
 
 app = typer.Typer(add_completion=False, pretty_exceptions_show_locals=False)
 
 
+def _open_http_cache(
+    *, enabled: bool, repo: str, data_dir: str, max_mb: int
+) -> HttpResponseCache | None:
+    if not enabled:
+        return None
+    return HttpResponseCache(
+        default_http_cache_path(repo_full_name=repo, data_dir=data_dir),
+        max_bytes=max_mb * 1024 * 1024,
+    )
+
+
+def _open_archive(*, enabled: bool, repo: str, data_dir: str) -> PageArchive | None:
+    if not enabled:
+        return None
+    return PageArchive(default_archive_dir(repo_full_name=repo, data_dir=data_dir))
+
+
+def _report_http_cache(cache: HttpResponseCache | None) -> None:
+    if cache is None:
+        return
+    print(
+        f"HTTP cache: {cache.hits} revalidated, {cache.misses} misses, "
+        f"{cache.total_bytes / (1024 * 1024):.1f} MiB stored"
+    )
+    cache.close()
+
+
 @app.command()
 def ingest(
     repo: str = typer.Option(..., help="Repository in owner/name format"),
@@ -34,6 +65,30 @@ def ingest(
         "--resume",
         help="Resume from persisted checkpoint stages when possible",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        min=1,
+        help="Max per-PR/per-issue sub-resource fetches in flight",
+    ),
+    repo_streams: bool = typer.Option(
+        False,
+        "--repo-streams",
+        help="Fetch comments/events from repo-wide listings instead of per issue/PR",
+    ),
+    archive: bool = typer.Option(
+        False,
+        "--archive",
+        help="Append raw API pages to the per-repo archive (see `replay`)",
+    ),
+    http_cache: bool = typer.Option(
+        True,
+        "--http-cache/--no-http-cache",
+        help="Revalidate cached GET responses with ETag/Last-Modified",
+    ),
+    http_cache_max_mb: int = typer.Option(
+        512, "--http-cache-max-mb", min=1, help="Size cap of the HTTP response cache"
+    ),
 ):
     """Run a one-shot full backfill for a GitHub repository."""
     db_path = (
@@ -41,6 +96,9 @@ def ingest(
     )
     db_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"[bold]Ingesting[/bold] {repo} -> {db_path}")
+    cache = _open_http_cache(
+        enabled=http_cache, repo=repo, data_dir=data_dir, max_mb=http_cache_max_mb
+    )
     asyncio.run(
         backfill_repo(
             repo,
@@ -49,8 +107,13 @@ def ingest(
             start_at=start_at,
             end_at=end_at,
             resume=resume,
+            concurrency=concurrency,
+            repo_streams=repo_streams,
+            http_cache=cache,
+            archive=_open_archive(enabled=archive, repo=repo, data_dir=data_dir),
         )
     )
+    _report_http_cache(cache)
 
 
 @app.command()
@@ -66,6 +129,24 @@ def incremental(
         "--resume",
         help="Resume from persisted checkpoint stages when possible",
     ),
+    repo_streams: bool = typer.Option(
+        False,
+        "--repo-streams",
+        help="Fetch comments/events from repo-wide listings instead of per issue/PR",
+    ),
+    archive: bool = typer.Option(
+        False,
+        "--archive",
+        help="Append raw API pages to the per-repo archive (see `replay`)",
+    ),
+    http_cache: bool = typer.Option(
+        True,
+        "--http-cache/--no-http-cache",
+        help="Revalidate cached GET responses with ETag/Last-Modified",
+    ),
+    http_cache_max_mb: int = typer.Option(
+        512, "--http-cache-max-mb", min=1, help="Size cap of the HTTP response cache"
+    ),
 ):
     """Run an incremental update using stored watermarks."""
     db_path = (
@@ -73,7 +154,20 @@ def incremental(
     )
     db_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"[bold]Incremental update[/bold] {repo} -> {db_path}")
-    asyncio.run(incremental_update(repo, db_path, resume=resume))
+    cache = _open_http_cache(
+        enabled=http_cache, repo=repo, data_dir=data_dir, max_mb=http_cache_max_mb
+    )
+    asyncio.run(
+        incremental_update(
+            repo,
+            db_path,
+            resume=resume,
+            repo_streams=repo_streams,
+            http_cache=cache,
+            archive=_open_archive(enabled=archive, repo=repo, data_dir=data_dir),
+        )
+    )
+    _report_http_cache(cache)
 
 
 @app.command()
@@ -95,6 +189,19 @@ def pull_requests(
     max_pages: int | None = typer.Option(
         None, help="Dev-only: limit pages per endpoint"
     ),
+    archive: bool = typer.Option(
+        False,
+        "--archive",
+        help="Append raw API pages to the per-repo archive (see `replay`)",
+    ),
+    http_cache: bool = typer.Option(
+        True,
+        "--http-cache/--no-http-cache",
+        help="Revalidate cached GET responses with ETag/Last-Modified",
+    ),
+    http_cache_max_mb: int = typer.Option(
+        512, "--http-cache-max-mb", min=1, help="Size cap of the HTTP response cache"
+    ),
 ):
     """Backfill pull requests created in a time window."""
     db_path = (
@@ -102,6 +209,9 @@ def pull_requests(
     )
     db_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"[bold]Pull request backfill[/bold] {repo} -> {db_path}")
+    cache = _open_http_cache(
+        enabled=http_cache, repo=repo, data_dir=data_dir, max_mb=http_cache_max_mb
+    )
     asyncio.run(
         backfill_pull_requests(
             repo,
@@ -110,8 +220,74 @@ def pull_requests(
             start_at=start_at,
             end_at=end_at,
             max_pages=max_pages,
+            http_cache=cache,
+            archive=_open_archive(enabled=archive, repo=repo, data_dir=data_dir),
         )
     )
+    _report_http_cache(cache)
+
+
+@app.command()
+def replay(
+    repo: str = typer.Option(..., help="Repository in owner/name format"),
+    db: str | None = typer.Option(None, help="SQLite database path"),
+    data_dir: str = typer.Option(
+        DEFAULT_DATA_DIR,
+        help="Base directory for per-repo SQLite databases",
+    ),
+    archive_dir: str | None = typer.Option(
+        None, help="Page archive directory (default: <repo dir>/archive)"
+    ),
+    workers: int = typer.Option(
+        4, "--workers", min=1, help="Processes decoding archive segments"
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Replace an existing database"
+    ),
+):
+    """Rebuild the database from the raw page archive, without the network."""
+    db_path = (
+        Path(db) if db else default_db_path(repo_full_name=repo, data_dir=data_dir)
+    )
+    source = (
+        Path(archive_dir)
+        if archive_dir
+        else default_archive_dir(repo_full_name=repo, data_dir=data_dir)
+    )
+    if not source.is_dir():
+        raise typer.BadParameter(f"missing archive: {source}")
+    if db_path.exists():
+        if not force:
+            raise typer.BadParameter(f"DB exists: {db_path} (use --force to replace)")
+        db_path.unlink()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    print(f"[bold]Replaying[/bold] {source} -> {db_path}")
+    pages = replay_archive(repo, db_path, source, workers=workers)
+    print(", ".join(f"{resource}: {count}" for resource, count in pages.items()))
+
+
+@app.command()
+def optimize(
+    repo: str = typer.Option(..., help="Repository in owner/name format"),
+    db: str | None = typer.Option(None, help="SQLite database path"),
+    data_dir: str = typer.Option(
+        DEFAULT_DATA_DIR,
+        help="Base directory for per-repo SQLite databases",
+    ),
+):
+    """Add missing query indexes to an existing database and run ANALYZE."""
+    db_path = (
+        Path(db) if db else default_db_path(repo_full_name=repo, data_dir=data_dir)
+    )
+    if not db_path.exists():
+        raise typer.BadParameter(f"missing DB: {db_path}")
+    print(f"[bold]Optimizing[/bold] {db_path}")
+    created = optimize_db(get_engine(db_path, profile="ingest"))
+    if created:
+        print(f"Created indexes: {', '.join(created)}")
+    else:
+        print("All indexes present")
+    print("ANALYZE complete")
 
 
 @app.command()
@@ -13,3 +13,27 @@ def default_db_path(*, repo_full_name: str, data_dir: str | Path) -> Path:
     owner, repo = repo_full_name.split("/", 1)
     base = Path(data_dir)
     return base / "github" / owner / repo / "history.sqlite"
+
+
+def default_http_cache_path(*, repo_full_name: str, data_dir: str | Path) -> Path:
+    """Compute the per-repo HTTP response cache path.
+
+    Layout:
+      <data_dir>/github/<owner>/<repo>/http_cache.sqlite
+    """
+
+    owner, repo = repo_full_name.split("/", 1)
+    base = Path(data_dir)
+    return base / "github" / owner / repo / "http_cache.sqlite"
+
+
+def default_archive_dir(*, repo_full_name: str, data_dir: str | Path) -> Path:
+    """Compute the per-repo raw page archive directory.
+
+    Layout:
+      <data_dir>/github/<owner>/<repo>/archive/<resource>/<YYYY-MM-DD>.jsonl.gz
+    """
+
+    owner, repo = repo_full_name.split("/", 1)
+    base = Path(data_dir)
+    return base / "github" / owner / repo / "archive"
@@ -12,14 +12,24 @@ from ..events.normalize import (
     normalize_review_comment,
 )
 from ..providers.github.auth import select_auth_token
+from ..providers.github.archive import PageArchive
+from ..providers.github.cache import HttpResponseCache
 from ..providers.github.client import GitHubRestClient
 from ..intervals.rebuild import rebuild_intervals
 from .qa import GapRecorder, write_qa_report
 from .pipeline import IngestStagePipeline
 from ..storage.db import get_engine, get_session, init_db
 from ..storage.schema import Issue, PullRequest
-from .pull_request_files import ingest_pull_request_files
+from .fanout import FetchedPages, FetchPool, collect_pages
+from .pull_request_files import fetch_pull_request_files, write_pull_request_files
+from .repo_streams import (
+    RoutedPages,
+    fetch_issue_comments_stream,
+    fetch_issue_events_stream,
+    fetch_review_comments_stream,
+)
 from gh.storage.upsert import (
+    UpsertBatcher,
     insert_event,
     upsert_comment,
     upsert_commit,
@@ -43,22 +53,40 @@ async def backfill_repo(
     db_path,
     *,
     client: GitHubRestClient | None = None,
+    http_cache: HttpResponseCache | None = None,
+    archive: PageArchive | None = None,
     max_pages: int | None = None,
     start_at: str | None = None,
     end_at: str | None = None,
     resume: bool = False,
+    concurrency: int = 1,
+    repo_streams: bool = False,
 ) -> None:
     owner, name = repo_full_name.split("/", 1)
-    engine = get_engine(db_path)
+    engine = get_engine(db_path, profile="ingest")
     init_db(engine)
     session = get_session(engine)
 
     if client is None:
         token = select_auth_token()
-        client = GitHubRestClient(token=token)
+        client = GitHubRestClient(token=token, cache=http_cache, archive=archive)
 
-    if hasattr(client, "__aenter__"):
-        async with client:
+    with UpsertBatcher(session):
+        if hasattr(client, "__aenter__"):
+            async with client:
+                await _run_backfill(
+                    session,
+                    client,
+                    owner,
+                    name,
+                    max_pages=max_pages,
+                    start_at=start_at,
+                    end_at=end_at,
+                    resume=resume,
+                    concurrency=concurrency,
+                    repo_streams=repo_streams,
+                )
+        else:
             await _run_backfill(
                 session,
                 client,
@@ -68,18 +96,9 @@ async def backfill_repo(
                 start_at=start_at,
                 end_at=end_at,
                 resume=resume,
+                concurrency=concurrency,
+                repo_streams=repo_streams,
             )
-    else:
-        await _run_backfill(
-            session,
-            client,
-            owner,
-            name,
-            max_pages=max_pages,
-            start_at=start_at,
-            end_at=end_at,
-            resume=resume,
-        )
 
 
 async def _run_backfill(
@@ -92,6 +111,8 @@ async def _run_backfill(
     start_at: str | None,
     end_at: str | None,
     resume: bool,
+    concurrency: int = 1,
+    repo_streams: bool = False,
 ) -> None:
     repo = await client.get_json(f"/repos/{owner}/{name}")
     upsert_user(session, repo.get("owner"))
@@ -194,36 +215,49 @@ async def _run_backfill(
     pr_id_by_number: dict[int, int] = {}
 
     if not pipeline.should_skip("pull_requests"):
-        async for pr in client.paginate(
-            f"/repos/{owner}/{name}/pulls",
-            params={"state": "all", "per_page": 100},
-            on_gap=GapRecorder(session, repo_id, "pulls"),
-            resource="pulls",
-            max_pages=max_pages,
-        ):
-            if not _include_object_in_window(pr, window_start, window_end):
-                continue
-            upsert_user(session, pr.get("user"))
-            pr_by_number[pr.get("number")] = pr
-            pr_id = upsert_pull_request(session, repo_id, pr, issue_id=None)
-            pr_id_by_number[pr.get("number")] = pr_id
-            await ingest_pull_request_files(
+
+        def write_files(key: tuple[int, str], fetched: FetchedPages) -> None:
+            pr_id, head_sha = key
+            write_pull_request_files(
                 session,
-                client,
-                owner,
-                name,
+                fetched,
                 repo_id=repo_id,
-                pull_request_number=pr.get("number"),
                 pull_request_id=pr_id,
-                head_sha=(pr.get("head") or {}).get("sha"),
-                max_pages=max_pages,
-            )
-            _insert_events(
-                session, normalize_pull_request(pr, repo_id), window_start, window_end
+                head_sha=head_sha,
             )
-            pr_updated = parse_datetime(pr.get("updated_at"))
-            if pr_updated and (max_pr_updated is None or pr_updated > max_pr_updated):
-                max_pr_updated = pr_updated
+
+        async with FetchPool(write_files, concurrency=concurrency) as files_pool:
+            async for pr in client.paginate(
+                f"/repos/{owner}/{name}/pulls",
+                params={"state": "all", "per_page": 100},
+                on_gap=GapRecorder(session, repo_id, "pulls"),
+                resource="pulls",
+                max_pages=max_pages,
+            ):
+                if not _include_object_in_window(pr, window_start, window_end):
+                    continue
+                upsert_user(session, pr.get("user"))
+                pr_by_number[pr.get("number")] = pr
+                pr_id = upsert_pull_request(session, repo_id, pr, issue_id=None)
+                pr_id_by_number[pr.get("number")] = pr_id
+                head_sha = (pr.get("head") or {}).get("sha")
+                if head_sha:
+                    await files_pool.submit(
+                        (pr_id, head_sha),
+                        fetch_pull_request_files(
+                            client,
+                            owner,
+                            name,
+                            pull_request_number=pr.get("number"),
+                            max_pages=max_pages,
+                        ),
+                    )
+                _insert_events(
+                    session, normalize_pull_request(pr, repo_id), window_start, window_end
+                )
+                pr_updated = parse_datetime(pr.get("updated_at"))
+                if pr_updated and (max_pr_updated is None or pr_updated > max_pr_updated):
+                    max_pr_updated = pr_updated
         session.commit()
         pipeline.checkpoint("pull_requests", count=len(pr_by_number))
     else:
@@ -282,105 +316,83 @@ async def _run_backfill(
         pipeline.checkpoint("issue_pr_linking")
 
     if not pipeline.should_skip("issue_activity"):
-        for issue in issues:
-            number = issue.get("number")
-            issue_id = issue_id_by_number[number]
-            pr_id = pr_id_by_number.get(number)
-
-            async for event_payload in client.paginate(
-                f"/repos/{owner}/{name}/issues/{number}/events",
-                params={"per_page": 100},
-                on_gap=GapRecorder(session, repo_id, "issue_events"),
-                resource="issue_events",
-                max_pages=max_pages,
-            ):
-                _upsert_related_for_issue_event(session, repo_id, event_payload)
-                _insert_events(
-                    session,
-                    normalize_issue_event(
-                        issue_id=issue_id,
-                        repo_id=repo_id,
-                        payload=event_payload,
-                        pull_request_id=pr_id,
-                    ),
-                    window_start,
-                    window_end,
-                )
 
-            async for comment in client.paginate(
-                f"/repos/{owner}/{name}/issues/{number}/comments",
-                params={"per_page": 100},
-                on_gap=GapRecorder(session, repo_id, "issue_comments"),
-                resource="issue_comments",
-                max_pages=max_pages,
-            ):
-                if not _include_comment_in_window(comment, window_start, window_end):
-                    continue
-                upsert_user(session, comment.get("user"))
-                upsert_comment(
-                    session,
-                    repo_id,
-                    comment,
-                    issue_id=issue_id,
-                    pull_request_id=pr_id,
-                    comment_type="issue",
-                )
-                _insert_events(
-                    session,
-                    normalize_issue_comment(comment, repo_id, issue_id),
-                    window_start,
-                    window_end,
+        def write_issue_activity(
+            key: tuple[int, int | None],
+            fetched: tuple[FetchedPages, FetchedPages],
+        ) -> None:
+            issue_id, pr_id = key
+            _write_issue_activity(
+                session,
+                repo_id,
+                issue_id,
+                pr_id,
+                events=fetched[0],
+                comments=fetched[1],
+                window_start=window_start,
+                window_end=window_end,
+            )
+
+        streams = None
+        if repo_streams:
+            # `max_pages` caps per-issue listings; a repo-wide stream cut at
+            # that many pages would silently truncate every issue at once.
+            streams = (
+                await fetch_issue_events_stream(client, owner, name, since=window_start),
+                await fetch_issue_comments_stream(client, owner, name, since=window_start),
+            )
+            for stream in streams:
+                stream.record_gaps(session, repo_id)
+
+        async with FetchPool(write_issue_activity, concurrency=concurrency) as pool:
+            for issue in issues:
+                number = issue.get("number")
+                await pool.submit(
+                    (issue_id_by_number[number], pr_id_by_number.get(number)),
+                    _fetch_issue_activity(
+                        client, owner, name, number, max_pages, streams=streams
+                    ),
                 )
         session.commit()
         pipeline.checkpoint("issue_activity")
 
     if not pipeline.should_skip("pull_request_activity"):
-        for number, pr in pr_by_number.items():
-            pr_id = pr_id_by_number.get(number)
-            if pr_id is None:
-                continue
-            async for review in client.paginate(
-                f"/repos/{owner}/{name}/pulls/{number}/reviews",
-                params={"per_page": 100},
-                on_gap=GapRecorder(session, repo_id, "reviews"),
-                resource="reviews",
-                max_pages=max_pages,
-            ):
-                if not in_window(review.get("submitted_at"), window_start, window_end):
-                    continue
-                upsert_user(session, review.get("user"))
-                upsert_review(session, repo_id, pr_id, review)
-                _insert_events(
-                    session,
-                    normalize_review(review, repo_id, pr_id),
-                    window_start,
-                    window_end,
-                )
 
-            async for comment in client.paginate(
-                f"/repos/{owner}/{name}/pulls/{number}/comments",
-                params={"per_page": 100},
-                on_gap=GapRecorder(session, repo_id, "review_comments"),
-                resource="review_comments",
-                max_pages=max_pages,
-            ):
-                if not _include_comment_in_window(comment, window_start, window_end):
+        def write_pr_activity(
+            pr_id: int, fetched: tuple[FetchedPages, FetchedPages]
+        ) -> None:
+            _write_pull_request_activity(
+                session,
+                repo_id,
+                pr_id,
+                reviews=fetched[0],
+                comments=fetched[1],
+                window_start=window_start,
+                window_end=window_end,
+            )
+
+        review_comments = None
+        if repo_streams:
+            review_comments = await fetch_review_comments_stream(
+                client, owner, name, since=window_start
+            )
+            review_comments.record_gaps(session, repo_id)
+
+        async with FetchPool(write_pr_activity, concurrency=concurrency) as pool:
+            for number in pr_by_number:
+                pr_id = pr_id_by_number.get(number)
+                if pr_id is None:
                     continue
-                upsert_user(session, comment.get("user"))
-                review_id = comment.get("pull_request_review_id")
-                upsert_comment(
-                    session,
-                    repo_id,
-                    comment,
-                    pull_request_id=pr_id,
-                    review_id=review_id,
-                    comment_type="review",
-                )
-                _insert_events(
-                    session,
-                    normalize_review_comment(comment, repo_id, pr_id, review_id),
-                    window_start,
-                    window_end,
+                await pool.submit(
+                    pr_id,
+                    _fetch_pull_request_activity(
+                        client,
+                        owner,
+                        name,
+                        number,
+                        max_pages,
+                        review_comments=review_comments,
+                    ),
                 )
         session.commit()
         pipeline.checkpoint("pull_request_activity")
@@ -408,6 +420,151 @@ async def _run_backfill(
         pipeline.checkpoint("qa_report_written", checkpoints=len(pipeline.checkpoints))
 
 
+async def _fetch_issue_activity(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    number: int,
+    max_pages: int | None,
+    *,
+    streams: tuple[RoutedPages, RoutedPages] | None = None,
+) -> tuple[FetchedPages, FetchedPages]:
+    if streams is not None:
+        events_stream, comments_stream = streams
+        return events_stream.pages_for(number), comments_stream.pages_for(number)
+    events = await collect_pages(
+        client,
+        f"/repos/{owner}/{name}/issues/{number}/events",
+        resource="issue_events",
+        max_pages=max_pages,
+    )
+    comments = await collect_pages(
+        client,
+        f"/repos/{owner}/{name}/issues/{number}/comments",
+        resource="issue_comments",
+        max_pages=max_pages,
+    )
+    return events, comments
+
+
+async def _fetch_pull_request_activity(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    number: int,
+    max_pages: int | None,
+    *,
+    review_comments: RoutedPages | None = None,
+) -> tuple[FetchedPages, FetchedPages]:
+    reviews = await collect_pages(
+        client,
+        f"/repos/{owner}/{name}/pulls/{number}/reviews",
+        resource="reviews",
+        max_pages=max_pages,
+    )
+    if review_comments is not None:
+        return reviews, review_comments.pages_for(number)
+    comments = await collect_pages(
+        client,
+        f"/repos/{owner}/{name}/pulls/{number}/comments",
+        resource="review_comments",
+        max_pages=max_pages,
+    )
+    return reviews, comments
+
+
+def _write_issue_activity(
+    session,
+    repo_id: int,
+    issue_id: int,
+    pr_id: int | None,
+    *,
+    events: FetchedPages,
+    comments: FetchedPages,
+    window_start,
+    window_end,
+) -> None:
+    events.record_gaps(session, repo_id)
+    for event_payload in events.items:
+        _upsert_related_for_issue_event(session, repo_id, event_payload)
+        _insert_events(
+            session,
+            normalize_issue_event(
+                issue_id=issue_id,
+                repo_id=repo_id,
+                payload=event_payload,
+                pull_request_id=pr_id,
+            ),
+            window_start,
+            window_end,
+        )
+
+    comments.record_gaps(session, repo_id)
+    for comment in comments.items:
+        if not _include_comment_in_window(comment, window_start, window_end):
+            continue
+        upsert_user(session, comment.get("user"))
+        upsert_comment(
+            session,
+            repo_id,
+            comment,
+            issue_id=issue_id,
+            pull_request_id=pr_id,
+            comment_type="issue",
+        )
+        _insert_events(
+            session,
+            normalize_issue_comment(comment, repo_id, issue_id),
+            window_start,
+            window_end,
+        )
+
+
+def _write_pull_request_activity(
+    session,
+    repo_id: int,
+    pr_id: int,
+    *,
+    reviews: FetchedPages,
+    comments: FetchedPages,
+    window_start,
+    window_end,
+) -> None:
+    reviews.record_gaps(session, repo_id)
+    for review in reviews.items:
+        if not in_window(review.get("submitted_at"), window_start, window_end):
+            continue
+        upsert_user(session, review.get("user"))
+        upsert_review(session, repo_id, pr_id, review)
+        _insert_events(
+            session,
+            normalize_review(review, repo_id, pr_id),
+            window_start,
+            window_end,
+        )
+
+    comments.record_gaps(session, repo_id)
+    for comment in comments.items:
+        if not _include_comment_in_window(comment, window_start, window_end):
+            continue
+        upsert_user(session, comment.get("user"))
+        review_id = comment.get("pull_request_review_id")
+        upsert_comment(
+            session,
+            repo_id,
+            comment,
+            pull_request_id=pr_id,
+            review_id=review_id,
+            comment_type="review",
+        )
+        _insert_events(
+            session,
+            normalize_review_comment(comment, repo_id, pr_id, review_id),
+            window_start,
+            window_end,
+        )
+
+
 def _upsert_related_for_issue_event(session, repo_id: int, payload: dict) -> None:
     if payload.get("label"):
         upsert_label(session, repo_id, payload.get("label"))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from ..providers.github.client import GitHubRestClient, PaginationGap
+from .qa import GapRecorder
+
+
+@dataclass
+class FetchedPages:
+    """Items and pagination gaps collected for one sub-resource listing.
+
+    Fetch tasks never touch the SQLAlchemy session; gaps are buffered here and
+    replayed by the writer via `record_gaps`.
+    """
+
+    resource: str
+    items: list[dict] = field(default_factory=list)
+    gaps: list[PaginationGap] = field(default_factory=list)
+
+    def record_gaps(self, session, repo_id: int) -> None:
+        recorder = GapRecorder(session, repo_id, self.resource)
+        for gap in self.gaps:
+            recorder(gap)
+
+
+async def collect_pages(
+    client: GitHubRestClient,
+    path: str,
+    *,
+    resource: str,
+    max_pages: int | None = None,
+) -> FetchedPages:
+    fetched = FetchedPages(resource=resource)
+    async for item in client.paginate(
+        path,
+        params={"per_page": 100},
+        on_gap=fetched.gaps.append,
+        resource=resource,
+        max_pages=max_pages,
+    ):
+        fetched.items.append(item)
+    return fetched
+
+
+class FetchPool:
+    """Bounded window of in-flight fetches drained by a single writer.
+
+    `submit` schedules a fetch coroutine as a task. Once `concurrency` fetches
+    are in flight, the oldest one is awaited and handed to `write` before the
+    next is admitted. Writes always run in the caller's coroutine, in
+    submission order, so a shared session is never touched concurrently and
+    the written rows match a serial run.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any, Any], None],
+        *,
+        concurrency: int = 1,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._write = write
+        self._concurrency = concurrency
+        self._pending: deque[tuple[Any, asyncio.Task]] = deque()
+
+    async def submit(self, key: Any, fetch: Awaitable[Any]) -> None:
+        self._pending.append((key, asyncio.ensure_future(fetch)))
+        while len(self._pending) >= self._concurrency:
+            await self._write_oldest()
+
+    async def drain(self) -> None:
+        while self._pending:
+            await self._write_oldest()
+
+    async def _write_oldest(self) -> None:
+        key, task = self._pending.popleft()
+        try:
+            result = await task
+        except BaseException:
+            self.cancel()
+            raise
+        self._write(key, result)
+
+    def cancel(self) -> None:
+        while self._pending:
+            _, task = self._pending.popleft()
+            task.cancel()
+
+    async def __aenter__(self) -> "FetchPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.drain()
+        else:
+            self.cancel()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import select
 
@@ -14,11 +14,14 @@ from ..events.normalize import (
     normalize_review_comment,
 )
 from ..providers.github.auth import select_auth_token
+from ..providers.github.archive import PageArchive
+from ..providers.github.cache import HttpResponseCache
 from ..providers.github.client import GitHubRestClient
 from ..intervals.rebuild import rebuild_intervals
 from ..storage.db import get_engine, get_session, init_db
 from ..storage.schema import Issue, PullRequest
 from gh.storage.upsert import (
+    UpsertBatcher,
     get_watermark,
     insert_event,
     upsert_comment,
@@ -39,6 +42,11 @@ from ..utils.time import parse_datetime
 from .qa import GapRecorder, write_qa_report
 from .pipeline import IngestStagePipeline
 from .pull_request_files import ingest_pull_request_files
+from .repo_streams import (
+    fetch_issue_comments_stream,
+    fetch_issue_events_stream,
+    fetch_review_comments_stream,
+)
 
 
 async def incremental_update(
@@ -46,27 +54,44 @@ async def incremental_update(
     db_path,
     *,
     client: GitHubRestClient | None = None,
+    http_cache: HttpResponseCache | None = None,
+    archive: PageArchive | None = None,
     resume: bool = False,
+    repo_streams: bool = False,
 ) -> None:
     owner, name = repo_full_name.split("/", 1)
-    engine = get_engine(db_path)
+    engine = get_engine(db_path, profile="ingest")
     init_db(engine)
     session = get_session(engine)
 
     if client is None:
         token = select_auth_token()
-        client = GitHubRestClient(token=token)
-
-    if hasattr(client, "__aenter__"):
-        async with client:
-            await _run_incremental(session, client, owner, name, resume=resume)
-    else:
-        await _run_incremental(session, client, owner, name, resume=resume)
+        client = GitHubRestClient(token=token, cache=http_cache, archive=archive)
+
+    with UpsertBatcher(session):
+        if hasattr(client, "__aenter__"):
+            async with client:
+                await _run_incremental(
+                    session, client, owner, name, resume=resume, repo_streams=repo_streams
+                )
+        else:
+            await _run_incremental(
+                session, client, owner, name, resume=resume, repo_streams=repo_streams
+            )
 
 
 async def _run_incremental(
-    session, client: GitHubRestClient, owner: str, name: str, *, resume: bool
+    session,
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    *,
+    resume: bool,
+    repo_streams: bool = False,
 ) -> None:
+    # Stream watermarks started by this run must predate its issue/PR
+    # listings, or activity on items created mid-run is never fetched.
+    run_started_at = datetime.now(timezone.utc)
     repo = await client.get_json(f"/repos/{owner}/{name}")
     upsert_user(session, repo.get("owner"))
     repo_id = upsert_repo(session, repo)
@@ -111,14 +136,36 @@ async def _run_incremental(
         ]
 
     if not pipeline.should_skip("issue_activity"):
-        await _incremental_issue_activity(
-            session, client, owner, name, repo_id, updated_issue_ids
-        )
+        if repo_streams:
+            await _incremental_issue_activity_streams(
+                session,
+                client,
+                owner,
+                name,
+                repo_id,
+                updated_issue_ids,
+                started_at=run_started_at,
+            )
+        else:
+            await _incremental_issue_activity(
+                session, client, owner, name, repo_id, updated_issue_ids
+            )
         pipeline.checkpoint("issue_activity")
     if not pipeline.should_skip("pull_request_activity"):
-        await _incremental_pr_activity(
-            session, client, owner, name, repo_id, updated_pr_ids
-        )
+        if repo_streams:
+            await _incremental_pr_activity_streams(
+                session,
+                client,
+                owner,
+                name,
+                repo_id,
+                updated_pr_ids,
+                started_at=run_started_at,
+            )
+        else:
+            await _incremental_pr_activity(
+                session, client, owner, name, repo_id, updated_pr_ids
+            )
         pipeline.checkpoint("pull_request_activity")
 
     if not pipeline.should_skip("intervals_rebuilt"):
@@ -359,14 +406,7 @@ async def _incremental_issue_activity(
             on_gap=GapRecorder(session, repo_id, "issue_events"),
             resource="issue_events",
         ):
-            _upsert_related_for_issue_event(session, repo_id, event_payload)
-            for event in normalize_issue_event(
-                issue_id=issue_id,
-                repo_id=repo_id,
-                payload=event_payload,
-                pull_request_id=pr_id,
-            ):
-                insert_event(session, event)
+            _write_issue_event(session, repo_id, issue_id, pr_id, event_payload)
 
         async for comment in client.paginate(
             f"/repos/{owner}/{name}/issues/{number}/comments",
@@ -374,17 +414,72 @@ async def _incremental_issue_activity(
             on_gap=GapRecorder(session, repo_id, "issue_comments"),
             resource="issue_comments",
         ):
-            upsert_user(session, comment.get("user"))
-            upsert_comment(
-                session,
-                repo_id,
-                comment,
-                issue_id=issue_id,
-                pull_request_id=pr_id,
-                comment_type="issue",
-            )
-            for event in normalize_issue_comment(comment, repo_id, issue_id):
-                insert_event(session, event)
+            _write_issue_comment(session, repo_id, issue_id, pr_id, comment)
+    session.commit()
+
+
+async def _incremental_issue_activity_streams(
+    session,
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    repo_id: int,
+    issue_ids: list[int],
+    *,
+    started_at: datetime,
+) -> None:
+    """Issue events and comments from the repo-wide listings.
+
+    Two requests (plus pages) replace two listings per updated issue. The
+    streams resume from their own watermarks; without them (first run in
+    this mode) the per-issue pass runs once and the streams start from
+    `started_at`. Items of issues not in the DB yet hold the watermark back
+    so the run that lists the issue picks them up.
+    """
+    events_watermark = get_watermark(session, repo_id, "issue_events")
+    comments_watermark = get_watermark(session, repo_id, "issue_comments")
+    if not _has_stream_watermark(events_watermark) or not _has_stream_watermark(
+        comments_watermark
+    ):
+        await _incremental_issue_activity(session, client, owner, name, repo_id, issue_ids)
+        _start_stream_watermark(session, repo_id, "issue_events", events_watermark, started_at)
+        _start_stream_watermark(
+            session, repo_id, "issue_comments", comments_watermark, started_at
+        )
+        session.commit()
+        return
+
+    events = await fetch_issue_events_stream(
+        client, owner, name, since=events_watermark.updated_at
+    )
+    comments = await fetch_issue_comments_stream(
+        client, owner, name, since=comments_watermark.updated_at
+    )
+    issue_id_by_number = _issue_id_by_number(session, repo_id)
+    pr_id_by_number = _pr_id_by_number(session, repo_id)
+
+    events.record_gaps(session, repo_id)
+    comments.record_gaps(session, repo_id)
+    skipped: set[int] = set()
+    for number in sorted(set(events.by_number) | set(comments.by_number)):
+        issue_id = issue_id_by_number.get(number)
+        if issue_id is None:
+            # Not listed yet; held back for the run that lists it.
+            skipped.add(number)
+            continue
+        pr_id = pr_id_by_number.get(number)
+        for event_payload in events.pages_for(number).items:
+            _write_issue_event(session, repo_id, issue_id, pr_id, event_payload)
+        for comment in comments.pages_for(number).items:
+            _write_issue_comment(session, repo_id, issue_id, pr_id, comment)
+    session.commit()
+
+    _advance_stream_watermark(
+        session, repo_id, "issue_events", events_watermark, events.resume_from(skipped)
+    )
+    _advance_stream_watermark(
+        session, repo_id, "issue_comments", comments_watermark, comments.resume_from(skipped)
+    )
     session.commit()
 
 
@@ -395,6 +490,8 @@ async def _incremental_pr_activity(
     name: str,
     repo_id: int,
     pr_ids: list[int],
+    *,
+    include_review_comments: bool = True,
 ) -> None:
     if not pr_ids:
         return
@@ -417,26 +514,143 @@ async def _incremental_pr_activity(
             for event in normalize_review(review, repo_id, pr_id):
                 insert_event(session, event)
 
+        if not include_review_comments:
+            continue
         async for comment in client.paginate(
             f"/repos/{owner}/{name}/pulls/{number}/comments",
             params={"per_page": 100},
             on_gap=GapRecorder(session, repo_id, "review_comments"),
             resource="review_comments",
         ):
-            upsert_user(session, comment.get("user"))
-            review_id = comment.get("pull_request_review_id")
-            upsert_comment(
-                session,
-                repo_id,
-                comment,
-                pull_request_id=pr_id,
-                review_id=review_id,
-                comment_type="review",
-            )
-            for event in normalize_review_comment(comment, repo_id, pr_id, review_id):
-                insert_event(session, event)
+            _write_review_comment(session, repo_id, pr_id, comment)
+    session.commit()
+
+
+async def _incremental_pr_activity_streams(
+    session,
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    repo_id: int,
+    pr_ids: list[int],
+    *,
+    started_at: datetime,
+) -> None:
+    """Reviews per updated PR (no repo-wide listing), review comments from
+    the repo-wide stream; see `_incremental_issue_activity_streams`."""
+    watermark = get_watermark(session, repo_id, "review_comments")
+    if not _has_stream_watermark(watermark):
+        await _incremental_pr_activity(session, client, owner, name, repo_id, pr_ids)
+        _start_stream_watermark(session, repo_id, "review_comments", watermark, started_at)
+        session.commit()
+        return
+
+    await _incremental_pr_activity(
+        session, client, owner, name, repo_id, pr_ids, include_review_comments=False
+    )
+    comments = await fetch_review_comments_stream(
+        client, owner, name, since=watermark.updated_at
+    )
+    pr_id_by_number = _pr_id_by_number(session, repo_id)
+    comments.record_gaps(session, repo_id)
+    skipped: set[int] = set()
+    for number in sorted(comments.by_number):
+        pr_id = pr_id_by_number.get(number)
+        if pr_id is None:
+            skipped.add(number)
+            continue
+        for comment in comments.pages_for(number).items:
+            _write_review_comment(session, repo_id, pr_id, comment)
     session.commit()
 
+    _advance_stream_watermark(
+        session, repo_id, "review_comments", watermark, comments.resume_from(skipped)
+    )
+    session.commit()
+
+
+def _write_issue_event(
+    session, repo_id: int, issue_id: int, pr_id: int | None, event_payload: dict
+) -> None:
+    _upsert_related_for_issue_event(session, repo_id, event_payload)
+    for event in normalize_issue_event(
+        issue_id=issue_id,
+        repo_id=repo_id,
+        payload=event_payload,
+        pull_request_id=pr_id,
+    ):
+        insert_event(session, event)
+
+
+def _write_issue_comment(
+    session, repo_id: int, issue_id: int, pr_id: int | None, comment: dict
+) -> None:
+    upsert_user(session, comment.get("user"))
+    upsert_comment(
+        session,
+        repo_id,
+        comment,
+        issue_id=issue_id,
+        pull_request_id=pr_id,
+        comment_type="issue",
+    )
+    for event in normalize_issue_comment(comment, repo_id, issue_id):
+        insert_event(session, event)
+
+
+def _write_review_comment(session, repo_id: int, pr_id: int, comment: dict) -> None:
+    upsert_user(session, comment.get("user"))
+    review_id = comment.get("pull_request_review_id")
+    upsert_comment(
+        session,
+        repo_id,
+        comment,
+        pull_request_id=pr_id,
+        review_id=review_id,
+        comment_type="review",
+    )
+    for event in normalize_review_comment(comment, repo_id, pr_id, review_id):
+        insert_event(session, event)
+
+
+def _issue_id_by_number(session, repo_id: int) -> dict[int, int]:
+    return {
+        int(number): int(issue_id)
+        for number, issue_id in session.execute(
+            select(Issue.number, Issue.id).where(Issue.repo_id == repo_id)
+        ).all()
+    }
+
+
+def _pr_id_by_number(session, repo_id: int) -> dict[int, int]:
+    return {
+        int(number): int(pr_id)
+        for number, pr_id in session.execute(
+            select(PullRequest.number, PullRequest.id).where(PullRequest.repo_id == repo_id)
+        ).all()
+    }
+
+
+def _has_stream_watermark(watermark) -> bool:
+    return watermark is not None and watermark.updated_at is not None
+
+
+def _start_stream_watermark(
+    session, repo_id: int, resource: str, watermark, started_at: datetime
+) -> None:
+    if not _has_stream_watermark(watermark):
+        upsert_watermark(session, repo_id, resource, updated_at=started_at)
+
+
+def _advance_stream_watermark(
+    session, repo_id: int, resource: str, watermark, resume_from: datetime | None
+) -> None:
+    if resume_from is None:
+        return
+    previous = parse_datetime(watermark.updated_at)
+    if resume_from > previous:
+        upsert_watermark(session, repo_id, resource, updated_at=resume_from)
+
 
 def _conditional_headers(watermark) -> dict | None:
     if watermark is None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from ..providers.github.client import GitHubRestClient
 from gh.storage.upsert import upsert_pull_request_file
+from .fanout import FetchedPages, collect_pages
 from .qa import GapRecorder
 
 
@@ -34,3 +35,38 @@ async def ingest_pull_request_files(
             head_sha=head_sha,
             file=file,
         )
+
+
+async def fetch_pull_request_files(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    *,
+    pull_request_number: int,
+    max_pages: int | None = None,
+) -> FetchedPages:
+    return await collect_pages(
+        client,
+        f"/repos/{owner}/{name}/pulls/{pull_request_number}/files",
+        resource="pull_request_files",
+        max_pages=max_pages,
+    )
+
+
+def write_pull_request_files(
+    session,
+    fetched: FetchedPages,
+    *,
+    repo_id: int,
+    pull_request_id: int,
+    head_sha: str | None,
+) -> None:
+    fetched.record_gaps(session, repo_id)
+    for file in fetched.items:
+        upsert_pull_request_file(
+            session,
+            repo_id,
+            pull_request_id,
+            head_sha=head_sha,
+            file=file,
+        )
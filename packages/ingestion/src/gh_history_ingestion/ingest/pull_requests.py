@@ -13,10 +13,13 @@ from ..events.normalize import (
 )
 from ..github.auth import select_auth_token
 from ..github.client import GitHubRestClient
+from ..providers.github.archive import PageArchive
+from ..providers.github.cache import HttpResponseCache
 from ..intervals.rebuild import rebuild_intervals
 from ..storage.db import get_engine, get_session, init_db
 from ..storage.schema import Issue
 from gh.storage.upsert import (
+    UpsertBatcher,
     insert_event,
     upsert_comment,
     upsert_issue,
@@ -41,6 +44,8 @@ async def backfill_pull_requests(
     start_at: str | None,
     end_at: str | None,
     client: GitHubRestClient | None = None,
+    http_cache: HttpResponseCache | None = None,
+    archive: PageArchive | None = None,
     max_pages: int | None = None,
 ) -> None:
     """Backfill pull requests created in a time window.
@@ -49,16 +54,28 @@ async def backfill_pull_requests(
     """
 
     owner, name = repo_full_name.split("/", 1)
-    engine = get_engine(db_path)
+    engine = get_engine(db_path, profile="ingest")
     init_db(engine)
     session = get_session(engine)
 
     if client is None:
         token = select_auth_token()
-        client = GitHubRestClient(token=token)
+        client = GitHubRestClient(token=token, cache=http_cache, archive=archive)
 
-    if hasattr(client, "__aenter__"):
-        async with client:
+    with UpsertBatcher(session):
+        if hasattr(client, "__aenter__"):
+            async with client:
+                await _run_pr_backfill(
+                    session,
+                    client,
+                    owner,
+                    name,
+                    with_truth=with_truth,
+                    start_at=start_at,
+                    end_at=end_at,
+                    max_pages=max_pages,
+                )
+        else:
             await _run_pr_backfill(
                 session,
                 client,
@@ -69,17 +86,6 @@ async def backfill_pull_requests(
                 end_at=end_at,
                 max_pages=max_pages,
             )
-    else:
-        await _run_pr_backfill(
-            session,
-            client,
-            owner,
-            name,
-            with_truth=with_truth,
-            start_at=start_at,
-            end_at=end_at,
-            max_pages=max_pages,
-        )
 
 
 async def _run_pr_backfill(
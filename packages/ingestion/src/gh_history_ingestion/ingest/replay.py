@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from ..events.normalize import (
+    normalize_issue_closed,
+    normalize_issue_opened,
+    normalize_pull_request,
+)
+from ..intervals.rebuild import rebuild_intervals
+from ..providers.github.archive import PageArchive, archive_resource, read_segment
+from ..providers.github.client import PaginationGap
+from ..storage.db import get_engine, get_session, init_db
+from ..storage.schema import Issue, PullRequest
+from ..utils.time import parse_datetime
+from gh.storage.upsert import (
+    RowRecorder,
+    UpsertBatcher,
+    insert_event,
+    upsert_commit,
+    upsert_issue,
+    upsert_label,
+    upsert_milestone,
+    upsert_pull_request,
+    upsert_ref,
+    upsert_release,
+    upsert_repo,
+    upsert_user,
+    upsert_watermark,
+)
+from .backfill import _write_issue_activity, _write_pull_request_activity
+from .fanout import FetchedPages
+from .pull_request_files import write_pull_request_files
+from .qa import GapRecorder, write_qa_report
+from .repo_streams import number_from_url
+
+# Resources replayed together, in dependency order: PRs and issues must exist
+# (and be linked) before their sub-resources are routed to them.
+REPLAY_PHASES: tuple[tuple[str, ...], ...] = (
+    ("repo",),
+    ("commits", "branches", "tags", "releases"),
+    ("pulls",),
+    ("issues",),
+    ("pull_request_files", "issue_events", "issue_comments", "reviews", "review_comments"),
+)
+
+
+def replay_archive(
+    repo_full_name: str,
+    db_path,
+    archive_dir: str | Path,
+    *,
+    workers: int = 1,
+) -> dict[str, int]:
+    """Rebuild a history database from a `PageArchive` without the network.
+
+    Each phase's segments are normalised by `workers` processes: the live
+    upsert helpers and normalizers run against a `RowRecorder`, with the
+    issue/PR ids learned by earlier phases passed in. A single writer
+    bulk-applies the recorded rows in fetch order, so pages re-fetched by
+    later runs overwrite earlier ones. Returns the number of pages replayed
+    per resource.
+    """
+    archive = PageArchive(archive_dir)
+    engine = get_engine(db_path, profile="ingest")
+    init_db(engine)
+    session = get_session(engine)
+
+    with UpsertBatcher(session) as batcher:
+        writer = _ReplayWriter(session, batcher, repo_full_name)
+        writer.apply_repo(archive)
+        for phase in REPLAY_PHASES[1:]:
+            for segment in _normalized(archive, phase, writer.context(), workers):
+                writer.apply(segment)
+            writer.finish_phase(phase)
+        writer.finish()
+    return writer.pages
+
+
+@dataclass(frozen=True)
+class _ReplayContext:
+    repo_id: int
+    issue_id_by_number: dict[int, int]
+    pr_id_by_number: dict[int, int]
+    pr_heads: dict[int, list[tuple[str, str | None]]]
+
+    def head_at(self, number: int, fetched_at: str) -> str | None:
+        # Head sha of the PR as last listed before these files were fetched.
+        head = None
+        for seen_at, sha in self.pr_heads.get(number, []):
+            if seen_at > fetched_at and head is not None:
+                break
+            head = sha
+        return head
+
+
+@dataclass
+class _NormalizedSegment:
+    resource: str
+    rows: list[tuple] = field(default_factory=list)
+    pages: int = 0
+    gaps: list[dict] = field(default_factory=list)
+    latest: dict[str, datetime] = field(default_factory=dict)
+    pr_heads: list[tuple[int, str, str | None]] = field(default_factory=list)
+
+    def see(self, watermark: str, value: datetime | None) -> None:
+        self.latest[watermark] = _later(self.latest.get(watermark), value)
+
+
+def _normalized(
+    archive: PageArchive, phase: tuple[str, ...], context: _ReplayContext, workers: int
+) -> Iterator[_NormalizedSegment]:
+    tasks = [(resource, path) for resource in phase for path in archive.segments(resource)]
+    if workers <= 1 or len(tasks) <= 1:
+        for resource, path in tasks:
+            yield _normalize_segment(resource, path, context)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(context,)
+    ) as executor:
+        # Keep a bounded window of segments normalising ahead of the writer.
+        pending: deque = deque()
+        queue = iter(tasks)
+        for resource, path in queue:
+            pending.append(executor.submit(_normalize_in_worker, resource, path))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            segment = pending.popleft().result()
+            task = next(queue, None)
+            if task is not None:
+                pending.append(executor.submit(_normalize_in_worker, *task))
+            yield segment
+
+
+_WORKER_CONTEXT: _ReplayContext | None = None
+
+
+def _init_worker(context: _ReplayContext) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _normalize_in_worker(resource: str, path: Path) -> _NormalizedSegment:
+    return _normalize_segment(resource, path, _WORKER_CONTEXT)
+
+
+def _normalize_segment(
+    resource: str, path: Path, context: _ReplayContext
+) -> _NormalizedSegment:
+    recorder = RowRecorder()
+    out = _NormalizedSegment(resource=resource, rows=recorder.rows)
+    normalize = _NORMALIZERS[resource]
+    for record in read_segment(path):
+        if record.get("kind") == "gap":
+            out.gaps.append(record)
+            continue
+        out.pages += 1
+        _, number = archive_resource(record.get("path") or "")
+        normalize(recorder, context, record, number, out)
+    return out
+
+
+def _normalize_commits(session, ctx, record, number, out) -> None:
+    for commit in record.get("data") or []:
+        upsert_user(session, commit.get("author"))
+        upsert_user(session, commit.get("committer"))
+        upsert_commit(session, ctx.repo_id, commit)
+        out.see(
+            "commits",
+            parse_datetime((commit.get("commit") or {}).get("committer", {}).get("date")),
+        )
+
+
+def _normalize_branches(session, ctx, record, number, out) -> None:
+    for branch in record.get("data") or []:
+        upsert_ref(
+            session,
+            ctx.repo_id,
+            ref_type="branch",
+            name=branch.get("name"),
+            sha=(branch.get("commit") or {}).get("sha"),
+            is_protected=branch.get("protected"),
+        )
+
+
+def _normalize_tags(session, ctx, record, number, out) -> None:
+    for tag in record.get("data") or []:
+        upsert_ref(
+            session,
+            ctx.repo_id,
+            ref_type="tag",
+            name=tag.get("name"),
+            sha=(tag.get("commit") or {}).get("sha"),
+            is_protected=None,
+        )
+
+
+def _normalize_releases(session, ctx, record, number, out) -> None:
+    for release in record.get("data") or []:
+        upsert_user(session, release.get("author"))
+        upsert_release(session, ctx.repo_id, release)
+
+
+def _normalize_pulls(session, ctx, record, number, out) -> None:
+    for pr in record.get("data") or []:
+        upsert_user(session, pr.get("user"))
+        upsert_pull_request(session, ctx.repo_id, pr, issue_id=None)
+        for event in normalize_pull_request(pr, ctx.repo_id):
+            insert_event(session, event)
+        out.pr_heads.append(
+            (pr.get("number"), record["fetched_at"], (pr.get("head") or {}).get("sha"))
+        )
+        out.see("pulls", parse_datetime(pr.get("updated_at")))
+
+
+def _normalize_issues(session, ctx, record, number, out) -> None:
+    for issue in record.get("data") or []:
+        upsert_user(session, issue.get("user"))
+        for label in issue.get("labels") or []:
+            upsert_label(session, ctx.repo_id, label)
+        if issue.get("milestone"):
+            upsert_milestone(session, ctx.repo_id, issue.get("milestone"))
+        upsert_issue(session, ctx.repo_id, issue)
+        for event in normalize_issue_opened(issue, ctx.repo_id):
+            insert_event(session, event)
+        for event in normalize_issue_closed(issue, ctx.repo_id):
+            insert_event(session, event)
+        out.see("issues", parse_datetime(issue.get("updated_at")))
+
+
+def _normalize_pull_request_files(session, ctx, record, number, out) -> None:
+    pr_id = ctx.pr_id_by_number.get(number)
+    if pr_id is None:
+        return
+    write_pull_request_files(
+        session,
+        FetchedPages(resource="pull_request_files", items=record.get("data") or []),
+        repo_id=ctx.repo_id,
+        pull_request_id=pr_id,
+        head_sha=ctx.head_at(number, record["fetched_at"]),
+    )
+
+
+def _normalize_issue_events(session, ctx, record, number, out) -> None:
+    for n, group in _route(record.get("data") or [], number, _issue_event_number):
+        _write_issue(session, ctx, n, events=group)
+
+
+def _normalize_issue_comments(session, ctx, record, number, out) -> None:
+    for n, group in _route(record.get("data") or [], number, _issue_comment_number):
+        _write_issue(session, ctx, n, comments=group)
+
+
+def _normalize_reviews(session, ctx, record, number, out) -> None:
+    _write_pull_request(session, ctx, number, reviews=record.get("data") or [])
+
+
+def _normalize_review_comments(session, ctx, record, number, out) -> None:
+    for n, group in _route(record.get("data") or [], number, _review_comment_number):
+        _write_pull_request(session, ctx, n, comments=group)
+
+
+_NORMALIZERS = {
+    "commits": _normalize_commits,
+    "branches": _normalize_branches,
+    "tags": _normalize_tags,
+    "releases": _normalize_releases,
+    "pulls": _normalize_pulls,
+    "issues": _normalize_issues,
+    "pull_request_files": _normalize_pull_request_files,
+    "issue_events": _normalize_issue_events,
+    "issue_comments": _normalize_issue_comments,
+    "reviews": _normalize_reviews,
+    "review_comments": _normalize_review_comments,
+}
+
+
+def _write_issue(
+    session,
+    ctx: _ReplayContext,
+    number: int,
+    *,
+    events: list[dict] = (),
+    comments: list[dict] = (),
+) -> None:
+    issue_id = ctx.issue_id_by_number.get(number)
+    if issue_id is None:
+        return
+    _write_issue_activity(
+        session,
+        ctx.repo_id,
+        issue_id,
+        ctx.pr_id_by_number.get(number),
+        events=FetchedPages(resource="issue_events", items=list(events)),
+        comments=FetchedPages(resource="issue_comments", items=list(comments)),
+        window_start=None,
+        window_end=None,
+    )
+
+
+def _write_pull_request(
+    session,
+    ctx: _ReplayContext,
+    number: int | None,
+    *,
+    reviews: list[dict] = (),
+    comments: list[dict] = (),
+) -> None:
+    pr_id = ctx.pr_id_by_number.get(number)
+    if pr_id is None:
+        return
+    _write_pull_request_activity(
+        session,
+        ctx.repo_id,
+        pr_id,
+        reviews=FetchedPages(resource="reviews", items=list(reviews)),
+        comments=FetchedPages(resource="review_comments", items=list(comments)),
+        window_start=None,
+        window_end=None,
+    )
+
+
+class _ReplayWriter:
+    """Applies normalised segments and tracks what later phases route by."""
+
+    def __init__(self, session, batcher: UpsertBatcher, repo_full_name: str) -> None:
+        self.session = session
+        self.batcher = batcher
+        self.repo_full_name = repo_full_name
+        self.repo_id: int | None = None
+        self.pages: dict[str, int] = {}
+        self.pr_rows: dict[int, dict] = {}
+        self.pr_heads: dict[int, list[tuple[str, str | None]]] = {}
+        self.issue_id_by_number: dict[int, int] = {}
+        self.latest: dict[str, datetime] = {}
+
+    def apply_repo(self, archive: PageArchive) -> None:
+        repo = None
+        for segment in archive.segments("repo"):
+            for record in read_segment(segment):
+                if record.get("kind") == "page":
+                    repo = record.get("data")
+                    self.pages["repo"] = self.pages.get("repo", 0) + 1
+        if repo is None:
+            raise ValueError(f"archive has no repository page for {self.repo_full_name}")
+        if (repo.get("full_name") or "").lower() != self.repo_full_name.lower():
+            raise ValueError(
+                f"archive is for {repo.get('full_name')!r}, not {self.repo_full_name!r}"
+            )
+        upsert_user(self.session, repo.get("owner"))
+        self.repo_id = upsert_repo(self.session, repo)
+        self.session.commit()
+
+    def context(self) -> _ReplayContext:
+        return _ReplayContext(
+            repo_id=self.repo_id,
+            issue_id_by_number=dict(self.issue_id_by_number),
+            pr_id_by_number={n: row["id"] for n, row in self.pr_rows.items()},
+            pr_heads={n: list(heads) for n, heads in self.pr_heads.items()},
+        )
+
+    def apply(self, segment: _NormalizedSegment) -> None:
+        if segment.pages:
+            self.pages[segment.resource] = self.pages.get(segment.resource, 0) + segment.pages
+        for gap in segment.gaps:
+            GapRecorder(self.session, self.repo_id, gap.get("resource") or segment.resource)(
+                PaginationGap(
+                    resource=gap.get("resource"),
+                    url=gap.get("url"),
+                    page=gap.get("page"),
+                    expected_page=gap.get("expected_page"),
+                    detail=gap.get("detail"),
+                )
+            )
+        RowRecorder.replay(self.batcher, segment.rows)
+        for model, values, _, _ in segment.rows:
+            if model is PullRequest:
+                self.pr_rows[values["number"]] = values
+            elif model is Issue:
+                self.issue_id_by_number[values["number"]] = values["id"]
+        for number, fetched_at, sha in segment.pr_heads:
+            self.pr_heads.setdefault(number, []).append((fetched_at, sha))
+        for watermark, value in segment.latest.items():
+            self.latest[watermark] = _later(self.latest.get(watermark), value)
+
+    def finish_phase(self, phase: tuple[str, ...]) -> None:
+        if phase == ("issues",):
+            # Link PRs to their issue rows, as backfill's issue_pr_linking stage.
+            for number, row in self.pr_rows.items():
+                issue_id = self.issue_id_by_number.get(number)
+                if issue_id is not None:
+                    self.batcher.add(PullRequest, {**row, "issue_id": issue_id}, ["id"])
+        self.session.commit()
+
+    def finish(self) -> None:
+        for watermark in ("commits", "issues", "pulls"):
+            if self.latest.get(watermark):
+                upsert_watermark(
+                    self.session, self.repo_id, watermark, updated_at=self.latest[watermark]
+                )
+        self.session.commit()
+        rebuild_intervals(self.session, self.repo_id)
+        write_qa_report(self.session, self.repo_id)
+
+
+def _issue_event_number(event: dict) -> int | None:
+    issue = event.get("issue") or {}
+    return issue.get("number") or number_from_url(issue.get("url"))
+
+
+def _issue_comment_number(comment: dict) -> int | None:
+    return number_from_url(comment.get("issue_url"))
+
+
+def _review_comment_number(comment: dict) -> int | None:
+    return number_from_url(comment.get("pull_request_url"))
+
+
+def _route(items: list[dict], number: int | None, route) -> list[tuple[int, list[dict]]]:
+    if number is not None:
+        return [(number, items)]
+    grouped: dict[int, list[dict]] = {}
+    for item in items:
+        n = route(item)
+        if n is not None:
+            grouped.setdefault(n, []).append(item)
+    return [(n, sorted(group, key=lambda i: i.get("id") or 0)) for n, group in grouped.items()]
+
+
+def _later(current: datetime | None, candidate: datetime | None) -> datetime | None:
+    if candidate is None:
+        return current
+    if current is None or candidate > current:
+        return candidate
+    return current
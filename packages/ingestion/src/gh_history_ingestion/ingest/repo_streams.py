@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from ..providers.github.client import GitHubRestClient, PaginationGap
+from ..utils.time import parse_datetime
+from .fanout import FetchedPages
+from .qa import GapRecorder
+
+
+@dataclass
+class RoutedPages:
+    """Items of one repo-wide listing grouped by issue / pull request number.
+
+    `pages_for(number)` returns them as the `FetchedPages` a per-number
+    listing would have produced (ordered by id, i.e. creation order), so the
+    per-number writers can be reused unchanged. Gaps belong to the stream
+    as a whole and are recorded once with `record_gaps`.
+    """
+
+    resource: str
+    by_number: dict[int, list[dict]] = field(default_factory=dict)
+    gaps: list[PaginationGap] = field(default_factory=list)
+    unrouted: int = 0
+    max_seen: datetime | None = None
+    earliest_by_number: dict[int, datetime] = field(default_factory=dict)
+
+    def pages_for(self, number: int) -> FetchedPages:
+        items = sorted(self.by_number.get(number, []), key=lambda item: item.get("id") or 0)
+        return FetchedPages(resource=self.resource, items=items)
+
+    def resume_from(self, skipped: set[int]) -> datetime | None:
+        """Watermark to resume the stream from, given numbers not written.
+
+        Items of a skipped number (e.g. an issue created after this run's
+        issue listing) must be seen again, so the watermark stops at the
+        earliest of them instead of moving past them to `max_seen`.
+        """
+        held = [self.earliest_by_number[n] for n in skipped if n in self.earliest_by_number]
+        if held:
+            return min([*held, self.max_seen]) if self.max_seen is not None else min(held)
+        return self.max_seen
+
+    def record_gaps(self, session, repo_id: int) -> None:
+        recorder = GapRecorder(session, repo_id, self.resource)
+        for gap in self.gaps:
+            recorder(gap)
+
+
+def number_from_url(url: str | None) -> int | None:
+    """`.../issues/123` or `.../pulls/123` -> 123."""
+    if not url:
+        return None
+    tail = url.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+async def _collect_stream(
+    client: GitHubRestClient,
+    path: str,
+    *,
+    resource: str,
+    params: dict,
+    route: Callable[[dict], int | None],
+    timestamp: Callable[[dict], datetime | None],
+    stop_before: datetime | None = None,
+    max_pages: int | None = None,
+) -> RoutedPages:
+    routed = RoutedPages(resource=resource)
+    async for item in client.paginate(
+        path,
+        params=params,
+        on_gap=routed.gaps.append,
+        resource=resource,
+        max_pages=max_pages,
+    ):
+        seen_at = timestamp(item)
+        if stop_before is not None and seen_at is not None and seen_at < stop_before:
+            break
+        number = route(item)
+        if number is None:
+            routed.unrouted += 1
+            continue
+        routed.by_number.setdefault(number, []).append(item)
+        if seen_at is None:
+            continue
+        if routed.max_seen is None or seen_at > routed.max_seen:
+            routed.max_seen = seen_at
+        earliest = routed.earliest_by_number.get(number)
+        if earliest is None or seen_at < earliest:
+            routed.earliest_by_number[number] = seen_at
+    return routed
+
+
+def _updated_at(item: dict) -> datetime | None:
+    return parse_datetime(item.get("updated_at") or item.get("created_at"))
+
+
+async def fetch_issue_comments_stream(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    *,
+    since: datetime | None = None,
+    max_pages: int | None = None,
+) -> RoutedPages:
+    """Issue and PR conversation comments updated since `since`."""
+    params: dict = {"per_page": 100, "sort": "updated", "direction": "asc"}
+    if since is not None:
+        params["since"] = _format_since(since)
+    return await _collect_stream(
+        client,
+        f"/repos/{owner}/{name}/issues/comments",
+        resource="issue_comments",
+        params=params,
+        route=lambda c: number_from_url(c.get("issue_url")),
+        timestamp=_updated_at,
+        max_pages=max_pages,
+    )
+
+
+async def fetch_review_comments_stream(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    *,
+    since: datetime | None = None,
+    max_pages: int | None = None,
+) -> RoutedPages:
+    """Pull request review (diff) comments updated since `since`."""
+    params: dict = {"per_page": 100, "sort": "updated", "direction": "asc"}
+    if since is not None:
+        params["since"] = _format_since(since)
+    return await _collect_stream(
+        client,
+        f"/repos/{owner}/{name}/pulls/comments",
+        resource="review_comments",
+        params=params,
+        route=lambda c: number_from_url(c.get("pull_request_url")),
+        timestamp=_updated_at,
+        max_pages=max_pages,
+    )
+
+
+async def fetch_issue_events_stream(
+    client: GitHubRestClient,
+    owner: str,
+    name: str,
+    *,
+    since: datetime | None = None,
+    max_pages: int | None = None,
+) -> RoutedPages:
+    """Issue events created since `since`.
+
+    The listing has no `since` filter but is returned newest first, so
+    paging stops at the first event older than `since`.
+    """
+    return await _collect_stream(
+        client,
+        f"/repos/{owner}/{name}/issues/events",
+        resource="issue_events",
+        params={"per_page": 100},
+        route=lambda e: (e.get("issue") or {}).get("number")
+        or number_from_url((e.get("issue") or {}).get("url")),
+        timestamp=lambda e: parse_datetime(e.get("created_at")),
+        stop_before=parse_datetime(since),
+        max_pages=max_pages,
+    )
+
+
+def _format_since(value: datetime) -> str:
+    text = parse_datetime(value).isoformat()
+    if text.endswith("+00:00"):
+        return text.replace("+00:00", "Z")
+    return text
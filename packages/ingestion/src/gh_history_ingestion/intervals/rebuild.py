@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import delete, false, select, update
+from sqlalchemy import delete, false, insert, select
 
 from ..storage.schema import (
     Comment,
@@ -22,6 +23,63 @@ from ..storage.schema import (
     ReviewContentInterval,
 )
 
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+_ID_CHUNK_SIZE = 500
+
+# Event types that open or close intervals, per event subject type. Events of
+# any other type never touch interval tables, so they are not loaded.
+_INTERVAL_EVENT_TYPES: dict[str, tuple[str, ...]] = {
+    "issue": (
+        "issue.opened",
+        "issue.reopened",
+        "issue.closed",
+        "issue.content.set",
+        "issue.content.edit",
+        "issue.label.add",
+        "issue.label.remove",
+        "issue.assignee.add",
+        "issue.assignee.remove",
+        "issue.milestone.set",
+        "issue.milestone.clear",
+    ),
+    "pull_request": (
+        "pull_request.draft.set",
+        "pull_request.head.set",
+        "pull_request.review_request.add",
+        "pull_request.review_request.remove",
+    ),
+    "comment": ("comment.created", "comment.edited", "comment.deleted"),
+    "review": ("review.submitted", "review.edited"),
+}
+
+
+class _IntervalTable:
+    """Interval rows for one table, built in memory.
+
+    Open rows are indexed by key (e.g. `(issue_id,)` or `(issue_id, label_id)`)
+    so closing them is a dict lookup instead of an `UPDATE ... WHERE
+    end_event_id IS NULL` round-trip. Several rows may be open under one key
+    (e.g. a label added twice); closing ends all of them, like the UPDATE did.
+    """
+
+    def __init__(self, model) -> None:
+        self.model = model
+        self.rows: list[dict[str, Any]] = []
+        self._open: dict[tuple, list[dict[str, Any]]] = {}
+
+    def open(self, key: tuple, **values: Any) -> None:
+        row = {**values, "end_event_id": None}
+        self.rows.append(row)
+        self._open.setdefault(key, []).append(row)
+
+    def close(self, key: tuple, end_event_id: int) -> None:
+        for row in self._open.pop(key, ()):
+            row["end_event_id"] = end_event_id
+
+    def write(self, session) -> None:
+        if self.rows:
+            session.execute(insert(self.model), self.rows)
+
 
 def rebuild_intervals(
     session,
@@ -32,6 +90,13 @@ def rebuild_intervals(
     review_ids: list[int] | None = None,
     comment_ids: list[int] | None = None,
 ) -> None:
+    """Rebuild interval tables for the given subjects (all repo subjects if None).
+
+    Only interval-relevant events of the affected subjects are read. All
+    start/end pairs are computed in one ordered pass per subject and the rows
+    are bulk-inserted.
+    """
+
     if issue_ids is None:
         issue_ids = session.scalars(
             select(Issue.id).where(Issue.repo_id == repo_id)
@@ -41,21 +106,22 @@ def rebuild_intervals(
             select(PullRequest.id).where(PullRequest.repo_id == repo_id)
         ).all()
     if review_ids is None:
-        if pr_ids:
-            review_ids = session.scalars(
-                select(Review.id).where(Review.pull_request_id.in_(pr_ids))
-            ).all()
-        else:
-            review_ids = []
+        review_ids = []
+        for chunk in _chunks(pr_ids):
+            review_ids.extend(
+                session.scalars(
+                    select(Review.id).where(Review.pull_request_id.in_(chunk))
+                ).all()
+            )
     if comment_ids is None:
-        if issue_ids or pr_ids:
-            issue_filter = Comment.issue_id.in_(issue_ids) if issue_ids else false()
-            pr_filter = Comment.pull_request_id.in_(pr_ids) if pr_ids else false()
-            comment_ids = session.scalars(
-                select(Comment.id).where(issue_filter | pr_filter)
-            ).all()
-        else:
-            comment_ids = []
+        comment_ids = []
+        for issue_chunk, pr_chunk in _paired_chunks(issue_ids, pr_ids):
+            issue_filter = Comment.issue_id.in_(issue_chunk) if issue_chunk else false()
+            pr_filter = Comment.pull_request_id.in_(pr_chunk) if pr_chunk else false()
+            comment_ids.extend(
+                session.scalars(select(Comment.id).where(issue_filter | pr_filter)).all()
+            )
+        comment_ids = list(dict.fromkeys(comment_ids))
 
     for model, ids, field in [
         (IssueStateInterval, issue_ids, IssueStateInterval.issue_id),
@@ -73,235 +139,178 @@ def rebuild_intervals(
         (CommentContentInterval, comment_ids, CommentContentInterval.comment_id),
         (ReviewContentInterval, review_ids, ReviewContentInterval.review_id),
     ]:
-        if ids:
-            session.execute(delete(model).where(field.in_(ids)))
+        for chunk in _chunks(ids):
+            session.execute(delete(model).where(field.in_(chunk)))
 
-    issue_set = set(issue_ids) if issue_ids is not None else None
-    pr_set = set(pr_ids) if pr_ids is not None else None
-    review_set = set(review_ids) if review_ids is not None else None
-    comment_set = set(comment_ids) if comment_ids is not None else None
+    tables = {
+        model: _IntervalTable(model)
+        for model in (
+            IssueStateInterval,
+            IssueContentInterval,
+            IssueLabelInterval,
+            IssueAssigneeInterval,
+            IssueMilestoneInterval,
+            PullRequestDraftInterval,
+            PullRequestHeadInterval,
+            PullRequestReviewRequestInterval,
+            CommentContentInterval,
+            ReviewContentInterval,
+        )
+    }
+    for subject_type, ids in [
+        ("issue", issue_ids),
+        ("pull_request", pr_ids),
+        ("comment", comment_ids),
+        ("review", review_ids),
+    ]:
+        for event in _iter_interval_events(session, repo_id, subject_type, ids):
+            _apply_event(tables, event)
 
-    events = session.scalars(
-        select(Event)
-        .where(Event.repo_id == repo_id)
-        .order_by(Event.occurred_at, Event.id)
-    ).all()
+    for table in tables.values():
+        table.write(session)
+    session.commit()
 
-    for event in events:
-        if event.subject_type == "issue" and issue_set is not None:
-            if event.subject_id not in issue_set:
-                continue
-        if event.subject_type == "pull_request" and pr_set is not None:
-            if event.subject_id not in pr_set:
-                continue
-        if event.subject_type == "review" and review_set is not None:
-            if event.subject_id not in review_set:
-                continue
-        if event.subject_type == "comment" and comment_set is not None:
-            if event.subject_id not in comment_set:
-                continue
-        payload = json.loads(event.payload_json) if event.payload_json else {}
-        if event.event_type in {"issue.opened", "issue.reopened"}:
-            _close_issue_state(session, event.subject_id, event.id)
-            session.add(
-                IssueStateInterval(
-                    issue_id=event.subject_id,
-                    state="open",
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "issue.closed":
-            _close_issue_state(session, event.subject_id, event.id)
-            session.add(
-                IssueStateInterval(
-                    issue_id=event.subject_id,
-                    state="closed",
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type in {"issue.content.set", "issue.content.edit"}:
-            session.execute(
-                update(IssueContentInterval)
-                .where(
-                    IssueContentInterval.issue_id == event.subject_id,
-                    IssueContentInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-            session.add(
-                IssueContentInterval(
-                    issue_id=event.subject_id,
-                    title=payload.get("title"),
-                    body=payload.get("body"),
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "issue.label.add":
-            session.add(
-                IssueLabelInterval(
-                    issue_id=event.subject_id,
-                    label_id=event.object_id,
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "issue.label.remove":
-            session.execute(
-                update(IssueLabelInterval)
-                .where(
-                    IssueLabelInterval.issue_id == event.subject_id,
-                    IssueLabelInterval.label_id == event.object_id,
-                    IssueLabelInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-        elif event.event_type == "issue.assignee.add":
-            session.add(
-                IssueAssigneeInterval(
-                    issue_id=event.subject_id,
-                    user_id=event.object_id,
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "issue.assignee.remove":
-            session.execute(
-                update(IssueAssigneeInterval)
-                .where(
-                    IssueAssigneeInterval.issue_id == event.subject_id,
-                    IssueAssigneeInterval.user_id == event.object_id,
-                    IssueAssigneeInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-        elif event.event_type == "issue.milestone.set":
-            session.add(
-                IssueMilestoneInterval(
-                    issue_id=event.subject_id,
-                    milestone_id=event.object_id,
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "issue.milestone.clear":
-            session.execute(
-                update(IssueMilestoneInterval)
-                .where(
-                    IssueMilestoneInterval.issue_id == event.subject_id,
-                    IssueMilestoneInterval.milestone_id == event.object_id,
-                    IssueMilestoneInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-        elif event.event_type == "pull_request.draft.set":
-            session.execute(
-                update(PullRequestDraftInterval)
-                .where(
-                    PullRequestDraftInterval.pull_request_id == event.subject_id,
-                    PullRequestDraftInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-            session.add(
-                PullRequestDraftInterval(
-                    pull_request_id=event.subject_id,
-                    is_draft=bool(payload.get("is_draft")),
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "pull_request.head.set":
-            session.execute(
-                update(PullRequestHeadInterval)
-                .where(
-                    PullRequestHeadInterval.pull_request_id == event.subject_id,
-                    PullRequestHeadInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-            session.add(
-                PullRequestHeadInterval(
-                    pull_request_id=event.subject_id,
-                    head_sha=event.commit_sha,
-                    head_ref=payload.get("head_ref"),
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "pull_request.review_request.add":
-            session.add(
-                PullRequestReviewRequestInterval(
-                    pull_request_id=event.subject_id,
-                    reviewer_type=event.object_type,
-                    reviewer_id=event.object_id,
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "pull_request.review_request.remove":
-            session.execute(
-                update(PullRequestReviewRequestInterval)
-                .where(
-                    PullRequestReviewRequestInterval.pull_request_id == event.subject_id,
-                    PullRequestReviewRequestInterval.reviewer_id == event.object_id,
-                    PullRequestReviewRequestInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-        elif event.event_type == "comment.created":
-            session.add(
-                CommentContentInterval(
-                    comment_id=event.subject_id,
-                    body=payload.get("body"),
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "comment.edited":
-            session.execute(
-                update(CommentContentInterval)
-                .where(
-                    CommentContentInterval.comment_id == event.subject_id,
-                    CommentContentInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-            session.add(
-                CommentContentInterval(
-                    comment_id=event.subject_id,
-                    body=payload.get("body"),
-                    start_event_id=event.id,
-                )
-            )
-        elif event.event_type == "comment.deleted":
-            session.execute(
-                update(CommentContentInterval)
-                .where(
-                    CommentContentInterval.comment_id == event.subject_id,
-                    CommentContentInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
-            )
-        elif event.event_type in {"review.submitted", "review.edited"}:
-            session.execute(
-                update(ReviewContentInterval)
-                .where(
-                    ReviewContentInterval.review_id == event.subject_id,
-                    ReviewContentInterval.end_event_id.is_(None),
-                )
-                .values(end_event_id=event.id)
+
+def _iter_interval_events(
+    session, repo_id: int, subject_type: str, subject_ids: Iterable[int]
+) -> Iterator[Any]:
+    # Interval keys never span subjects, so per-chunk ordering is sufficient.
+    for chunk in _chunks(subject_ids):
+        yield from session.execute(
+            select(
+                Event.id,
+                Event.subject_id,
+                Event.event_type,
+                Event.object_type,
+                Event.object_id,
+                Event.commit_sha,
+                Event.payload_json,
             )
-            session.add(
-                ReviewContentInterval(
-                    review_id=event.subject_id,
-                    body=payload.get("body"),
-                    state=payload.get("state"),
-                    start_event_id=event.id,
-                )
+            .where(
+                Event.repo_id == repo_id,
+                Event.subject_type == subject_type,
+                Event.subject_id.in_(chunk),
+                Event.event_type.in_(_INTERVAL_EVENT_TYPES[subject_type]),
             )
+            .order_by(Event.occurred_at, Event.id)
+        )
 
-    session.commit()
 
+def _apply_event(tables: dict[Any, _IntervalTable], event) -> None:
+    event_type = event.event_type
+    subject_id = event.subject_id
+    event_id = event.id
+    payload = json.loads(event.payload_json) if event.payload_json else {}
 
-def _close_issue_state(session, issue_id: int, end_event_id: int) -> None:
-    session.execute(
-        update(IssueStateInterval)
-        .where(
-            IssueStateInterval.issue_id == issue_id,
-            IssueStateInterval.end_event_id.is_(None),
+    if event_type in {"issue.opened", "issue.reopened", "issue.closed"}:
+        table = tables[IssueStateInterval]
+        table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            issue_id=subject_id,
+            state="closed" if event_type == "issue.closed" else "open",
+            start_event_id=event_id,
+        )
+    elif event_type in {"issue.content.set", "issue.content.edit"}:
+        table = tables[IssueContentInterval]
+        table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            issue_id=subject_id,
+            title=payload.get("title"),
+            body=payload.get("body"),
+            start_event_id=event_id,
         )
-        .values(end_event_id=end_event_id)
-    )
+    elif event_type == "issue.label.add":
+        tables[IssueLabelInterval].open(
+            (subject_id, event.object_id),
+            issue_id=subject_id,
+            label_id=event.object_id,
+            start_event_id=event_id,
+        )
+    elif event_type == "issue.label.remove":
+        tables[IssueLabelInterval].close((subject_id, event.object_id), event_id)
+    elif event_type == "issue.assignee.add":
+        tables[IssueAssigneeInterval].open(
+            (subject_id, event.object_id),
+            issue_id=subject_id,
+            user_id=event.object_id,
+            start_event_id=event_id,
+        )
+    elif event_type == "issue.assignee.remove":
+        tables[IssueAssigneeInterval].close((subject_id, event.object_id), event_id)
+    elif event_type == "issue.milestone.set":
+        tables[IssueMilestoneInterval].open(
+            (subject_id, event.object_id),
+            issue_id=subject_id,
+            milestone_id=event.object_id,
+            start_event_id=event_id,
+        )
+    elif event_type == "issue.milestone.clear":
+        tables[IssueMilestoneInterval].close((subject_id, event.object_id), event_id)
+    elif event_type == "pull_request.draft.set":
+        table = tables[PullRequestDraftInterval]
+        table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            pull_request_id=subject_id,
+            is_draft=bool(payload.get("is_draft")),
+            start_event_id=event_id,
+        )
+    elif event_type == "pull_request.head.set":
+        table = tables[PullRequestHeadInterval]
+        table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            pull_request_id=subject_id,
+            head_sha=event.commit_sha,
+            head_ref=payload.get("head_ref"),
+            start_event_id=event_id,
+        )
+    elif event_type == "pull_request.review_request.add":
+        tables[PullRequestReviewRequestInterval].open(
+            (subject_id, event.object_id),
+            pull_request_id=subject_id,
+            reviewer_type=event.object_type,
+            reviewer_id=event.object_id,
+            start_event_id=event_id,
+        )
+    elif event_type == "pull_request.review_request.remove":
+        tables[PullRequestReviewRequestInterval].close(
+            (subject_id, event.object_id), event_id
+        )
+    elif event_type in {"comment.created", "comment.edited"}:
+        table = tables[CommentContentInterval]
+        if event_type == "comment.edited":
+            table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            comment_id=subject_id,
+            body=payload.get("body"),
+            start_event_id=event_id,
+        )
+    elif event_type == "comment.deleted":
+        tables[CommentContentInterval].close((subject_id,), event_id)
+    elif event_type in {"review.submitted", "review.edited"}:
+        table = tables[ReviewContentInterval]
+        table.close((subject_id,), event_id)
+        table.open(
+            (subject_id,),
+            review_id=subject_id,
+            body=payload.get("body"),
+            state=payload.get("state"),
+            start_event_id=event_id,
+        )
+
+
+def _chunks(ids: Iterable[int], size: int = _ID_CHUNK_SIZE) -> Iterator[list[int]]:
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _paired_chunks(
+    left: list[int], right: list[int], size: int = _ID_CHUNK_SIZE
+) -> Iterator[tuple[list[int], list[int]]]:
+    for start in range(0, max(len(left), len(right)), size):
+        yield left[start : start + size], right[start : start + size]
@@ -1,4 +1,15 @@
+from .archive import PageArchive
 from .auth import select_auth_token
+from .cache import HttpResponseCache
 from .client import GitHubRestClient, GitHubResponse
+from .ratelimit import RateLimitScheduler, RateLimitState
 
-__all__ = ["GitHubRestClient", "GitHubResponse", "select_auth_token"]
+__all__ = [
+    "GitHubRestClient",
+    "GitHubResponse",
+    "HttpResponseCache",
+    "PageArchive",
+    "RateLimitScheduler",
+    "RateLimitState",
+    "select_auth_token",
+]
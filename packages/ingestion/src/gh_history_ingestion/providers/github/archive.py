@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping
+
+from .cache import _header
+
+_ARCHIVED_HEADERS = ("ETag", "Last-Modified", "Link")
+
+# (path segments after /repos/<owner>/<name>) -> archive resource. Per-number
+# listings and their repo-wide counterparts share a resource; replay routes
+# the items of either by number.
+_RESOURCES: dict[tuple[str, ...], str] = {
+    (): "repo",
+    ("commits",): "commits",
+    ("branches",): "branches",
+    ("tags",): "tags",
+    ("releases",): "releases",
+    ("pulls",): "pulls",
+    ("issues",): "issues",
+    ("issues", "events"): "issue_events",
+    ("issues", "comments"): "issue_comments",
+    ("pulls", "comments"): "review_comments",
+    ("issues", "#", "events"): "issue_events",
+    ("issues", "#", "comments"): "issue_comments",
+    ("pulls", "#", "reviews"): "reviews",
+    ("pulls", "#", "comments"): "review_comments",
+    ("pulls", "#", "files"): "pull_request_files",
+}
+
+
+def archive_resource(path: str) -> tuple[str, int | None]:
+    """Classify a repo API path: `/repos/o/n/pulls/7/files` -> ("pull_request_files", 7)."""
+    parts = [p for p in path.split("/") if p]
+    if len(parts) < 3 or parts[0] != "repos":
+        return "other", None
+    rest = parts[3:]
+    number = None
+    shape = []
+    for part in rest:
+        if part.isdigit() and number is None:
+            number = int(part)
+            shape.append("#")
+        else:
+            shape.append(part)
+    return _RESOURCES.get(tuple(shape), "other"), number
+
+
+class PageArchive:
+    """Append-only archive of raw GitHub API pages.
+
+    Every page the client hands out (including pages replayed from the HTTP
+    cache) is appended as one JSON record to
+    `<root>/<resource>/<YYYY-MM-DD>.jsonl.gz`, segmented by UTC fetch day.
+    Each record is its own gzip member, so a segment stays readable if a run
+    dies mid-write. Pagination gaps are archived too, so a replay
+    reproduces the QA state. See `ingest.replay.replay_archive`.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def append_page(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        *,
+        headers: Mapping[str, str],
+        data: Any,
+    ) -> None:
+        resource, _ = archive_resource(path)
+        self._append(
+            resource,
+            {
+                "kind": "page",
+                "method": method.upper(),
+                "path": path,
+                "params": {str(k): str(v) for k, v in (params or {}).items()},
+                "headers": {
+                    name: value
+                    for name in _ARCHIVED_HEADERS
+                    if (value := _header(headers, name)) is not None
+                },
+                "data": data,
+            },
+        )
+
+    def append_gap(
+        self,
+        resource: str | None,
+        *,
+        url: str | None,
+        page: int | None,
+        expected_page: int | None,
+        detail: str | None,
+    ) -> None:
+        self._append(
+            resource or "other",
+            {
+                "kind": "gap",
+                "resource": resource,
+                "url": url,
+                "page": page,
+                "expected_page": expected_page,
+                "detail": detail,
+            },
+        )
+
+    def _append(self, resource: str, record: dict) -> None:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            self._seq += 1
+            line = json.dumps(
+                {"fetched_at": now.isoformat(), "seq": self._seq, **record},
+                separators=(",", ":"),
+            )
+            segment = self.root / resource / f"{now.date().isoformat()}.jsonl.gz"
+            segment.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(segment, "ab") as fh:
+                fh.write(line.encode("utf-8") + b"\n")
+
+    def segments(self, resource: str) -> list[Path]:
+        """Segments of `resource` in time order."""
+        return sorted((self.root / resource).glob("*.jsonl.gz"))
+
+
+def read_segment(path: str | Path) -> list[dict]:
+    """Decode one archive segment (module-level so worker processes can run it)."""
+    records: list[dict] = []
+    with gzip.open(path, "rb") as fh:
+        for line in fh:
+            if line.strip():
+                records.append(json.loads(line))
+    return records
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+# Response headers worth replaying with a cached body; `Link` drives pagination.
+_STORED_HEADERS = ("ETag", "Last-Modified", "Link", "Content-Type")
+
+_SCHEMA = """
+create table if not exists http_cache (
+    key text primary key,
+    method text not null,
+    path text not null,
+    params text not null,
+    etag text,
+    last_modified text,
+    headers text not null,
+    body blob not null,
+    size integer not null,
+    last_used integer not null
+)
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    data: Any
+
+    def conditional_headers(self) -> dict[str, str]:
+        if self.etag:
+            return {"If-None-Match": self.etag}
+        if self.last_modified:
+            return {"If-Modified-Since": self.last_modified}
+        return {}
+
+
+class HttpResponseCache:
+    """On-disk cache of GitHub GET responses and their validators.
+
+    Entries are keyed by (method, path, params) and hold the ETag /
+    Last-Modified validators, the headers needed to replay the response and
+    the JSON body (zlib-compressed). `GitHubRestClient` sends the validators
+    as conditional headers and serves the stored body on a 304, which GitHub
+    does not count against the primary rate limit. Once the stored bodies
+    exceed `max_bytes`, least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str | Path, *, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("pragma journal_mode=wal")
+        self._conn.execute("pragma synchronous=normal")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(
+            "create index if not exists ix_http_cache_last_used on http_cache (last_used)"
+        )
+        self._conn.commit()
+        total, clock = self._conn.execute(
+            "select coalesce(sum(size), 0), coalesce(max(last_used), 0) from http_cache"
+        ).fetchone()
+        self._total_bytes = int(total)
+        self._clock = int(clock)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("select count(*) from http_cache").fetchone()
+        return int(count)
+
+    def get(self, method: str, path: str, params: Mapping[str, Any] | None) -> CachedResponse | None:
+        key, _ = _cache_key(method, path, params)
+        with self._lock:
+            row = self._conn.execute(
+                "select etag, last_modified, headers, body from http_cache where key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            self._conn.execute(
+                "update http_cache set last_used = ? where key = ?", (self._clock, key)
+            )
+            self._conn.commit()
+        etag, last_modified, headers, body = row
+        return CachedResponse(
+            etag=etag,
+            last_modified=last_modified,
+            headers=json.loads(headers),
+            data=json.loads(zlib.decompress(body)),
+        )
+
+    def put(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        *,
+        headers: Mapping[str, str],
+        data: Any,
+    ) -> bool:
+        """Store a 200 response; returns False when it is not cacheable."""
+        etag = _header(headers, "ETag")
+        last_modified = _header(headers, "Last-Modified")
+        if not etag and not last_modified:
+            return False
+        key, params_text = _cache_key(method, path, params)
+        stored_headers = {
+            name: value
+            for name in _STORED_HEADERS
+            if (value := _header(headers, name)) is not None
+        }
+        try:
+            encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+        body = zlib.compress(encoded)
+        if len(body) > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._conn.execute(
+                "select size from http_cache where key = ?", (key,)
+            ).fetchone()
+            self._clock += 1
+            self._conn.execute(
+                """
+                insert or replace into http_cache
+                (key, method, path, params, etag, last_modified, headers, body, size, last_used)
+                values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    method.upper(),
+                    path,
+                    params_text,
+                    etag,
+                    last_modified,
+                    json.dumps(stored_headers, sort_keys=True),
+                    body,
+                    len(body),
+                    self._clock,
+                ),
+            )
+            self._total_bytes += len(body) - (int(previous[0]) if previous else 0)
+            self._evict()
+            self._conn.commit()
+        return True
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "select key, size from http_cache order by last_used limit 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("delete from http_cache where key = ?", (key,))
+                self._total_bytes -= int(size)
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+
+def _cache_key(method: str, path: str, params: Mapping[str, Any] | None) -> tuple[str, str]:
+    params_text = json.dumps(
+        {str(k): str(v) for k, v in (params or {}).items()}, sort_keys=True
+    )
+    raw = "\n".join([method.upper(), path, params_text])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest(), params_text
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is not None:
+        return value
+    lowered = name.lower()
+    for key, candidate in headers.items():
+        if key.lower() == lowered:
+            return candidate
+    return None
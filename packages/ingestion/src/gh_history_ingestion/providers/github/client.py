@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Mapping
 from urllib.parse import parse_qs, urlparse
@@ -8,11 +10,16 @@ import httpx
 from aiolimiter import AsyncLimiter
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from .archive import PageArchive
+from .cache import HttpResponseCache
+from .ratelimit import RateLimitScheduler, RateLimitState
+
 try:
     from githubkit import GitHub
     from githubkit.auth import TokenAuthStrategy
@@ -25,11 +32,26 @@ class RetryableGitHubError(RuntimeError):
     pass
 
 
+class RateLimitedError(RetryableGitHubError):
+    """Rate limited; the scheduler holds further requests until it lifts."""
+
+
+_backoff = wait_exponential(multiplier=0.5, min=0.5, max=8)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimitedError):
+        return 0.0
+    return _backoff(retry_state)
+
+
 @dataclass(frozen=True)
 class GitHubResponse:
     data: Any
     headers: Mapping[str, str]
     status_code: int | None = None
+    from_cache: bool = False
 
 
 @dataclass(frozen=True)
@@ -55,15 +77,24 @@ class GitHubRestClient:
         limiter: AsyncLimiter | None = None,
         request_func: RequestFunc | None = None,
         timeout: float = 30.0,
+        cache: HttpResponseCache | None = None,
+        scheduler: RateLimitScheduler | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        archive: PageArchive | None = None,
+        prefetch: int = 4,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.archive = archive
+        self.prefetch = prefetch
+        self.scheduler = scheduler or RateLimitScheduler()
         self._limiter = limiter or AsyncLimiter(8, 1)
         self._request_func = request_func
         self._timeout = timeout
         self._client: httpx.AsyncClient | None = None
         self._gh = None
         if request_func is None:
-            if GitHub and TokenAuthStrategy and hasattr(GitHub, "arequest"):
+            if transport is None and GitHub and TokenAuthStrategy and hasattr(GitHub, "arequest"):
                 self._gh = GitHub(auth=TokenAuthStrategy(token))
             else:
                 self._client = httpx.AsyncClient(
@@ -74,6 +105,7 @@ class GitHubRestClient:
                         "User-Agent": "ingestion",
                     },
                     timeout=timeout,
+                    transport=transport,
                 )
 
     async def __aenter__(self) -> "GitHubRestClient":
@@ -85,6 +117,10 @@ class GitHubRestClient:
         if self._client is not None:
             await self._client.aclose()
 
+    @property
+    def rate_limit(self) -> RateLimitState:
+        return self.scheduler.state()
+
     async def request(
         self,
         method: str,
@@ -92,14 +128,80 @@ class GitHubRestClient:
         params: dict | None = None,
         headers: dict | None = None,
         full_url: str | None = None,
+    ) -> GitHubResponse:
+        response = await self._cached_request(method, path, params, headers, full_url)
+        if (
+            self.archive is not None
+            and method.upper() == "GET"
+            and response.status_code in (None, 200)
+            and response.data is not None
+        ):
+            self.archive.append_page(
+                method,
+                full_url or path,
+                params,
+                headers=response.headers,
+                data=response.data,
+            )
+        return response
+
+    async def _cached_request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None,
+        headers: dict | None,
+        full_url: str | None,
+    ) -> GitHubResponse:
+        if not self._uses_cache(method, headers):
+            return await self._request_with_retries(method, path, params, headers, full_url)
+
+        cache_path = full_url or path
+        cached = self.cache.get(method, cache_path, params)
+        if cached is not None:
+            headers = {**(headers or {}), **cached.conditional_headers()}
+        response = await self._request_with_retries(method, path, params, headers, full_url)
+        if response.status_code == 304 and cached is not None:
+            # Replay the stored page (incl. its Link header) under fresh headers.
+            merged = httpx.Headers(cached.headers)
+            for name, value in response.headers.items():
+                merged[name] = value
+            return GitHubResponse(
+                data=cached.data,
+                headers=merged,
+                status_code=200,
+                from_cache=True,
+            )
+        if response.status_code in (None, 200) and response.data is not None:
+            self.cache.put(
+                method, cache_path, params, headers=response.headers, data=response.data
+            )
+        return response
+
+    def _uses_cache(self, method: str, headers: dict | None) -> bool:
+        # Callers sending their own validators (watermarks) want the raw 304.
+        if self.cache is None or method.upper() != "GET":
+            return False
+        return not any(
+            k.lower() in {"if-none-match", "if-modified-since"} for k in (headers or {})
+        )
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        path: str,
+        params: dict | None,
+        headers: dict | None,
+        full_url: str | None,
     ) -> GitHubResponse:
         async for attempt in AsyncRetrying(
             retry=retry_if_exception_type((httpx.HTTPError, RetryableGitHubError)),
-            wait=wait_exponential(multiplier=0.5, min=0.5, max=8),
+            wait=_retry_wait,
             stop=stop_after_attempt(5),
             reraise=True,
         ):
             with attempt:
+                await self.scheduler.acquire()
                 async with self._limiter:
                     return await self._request(method, path, params, headers, full_url)
         raise RuntimeError("GitHub request retries exhausted")
@@ -113,7 +215,10 @@ class GitHubRestClient:
         full_url: str | None = None,
     ) -> GitHubResponse:
         if self._request_func is not None:
-            return await self._request_func(method, path, params, headers, full_url)
+            response = await self._request_func(method, path, params, headers, full_url)
+            if self.scheduler.observe(response.status_code, response.headers):
+                raise RateLimitedError(f"GitHub rate limited {response.status_code}")
+            return response
 
         if self._gh is not None:
             response = await self._gh.arequest(
@@ -123,6 +228,8 @@ class GitHubRestClient:
                 headers=headers,
             )
             status_code = getattr(response, "status_code", None)
+            if self.scheduler.observe(status_code, response.headers):
+                raise RateLimitedError(f"GitHub rate limited {status_code}")
             if status_code and status_code >= 400:
                 if status_code in {403, 429, 500, 502, 503, 504}:
                     raise RetryableGitHubError(f"GitHub retryable {status_code}")
@@ -139,6 +246,8 @@ class GitHubRestClient:
         response = await self._client.request(
             method, path, params=params, headers=headers
         )
+        if self.scheduler.observe(response.status_code, response.headers):
+            raise RateLimitedError(f"GitHub rate limited {response.status_code}")
         if response.status_code == 304:
             return GitHubResponse(data=None, headers=response.headers, status_code=304)
         if response.status_code in {403, 429, 500, 502, 503, 504}:
@@ -164,48 +273,86 @@ class GitHubRestClient:
         on_response: Callable[[GitHubResponse], None] | None = None,
         resource: str | None = None,
         max_pages: int | None = None,
+        prefetch: int | None = None,
     ):
+        """Yield the items of every page of a listing.
+
+        Pages are requested while the caller is still consuming earlier ones.
+        When the `Link` header names the last page, up to `prefetch` (default
+        `self.prefetch`) pages are fetched concurrently. Otherwise the next page
+        is fetched one ahead. Pages are still consumed, and gaps reported, in
+        link order: a prefetched page that is not the previous page's `next`
+        link is dropped and the link followed. `prefetch=0` disables
+        read-ahead.
+        """
+        if self.archive is not None:
+            on_gap = self._archiving_gaps(on_gap)
         next_path = path
         next_params = params or {}
         page = int(next_params.get("page", 1)) if next_params else 1
         pages_seen = 0
-        while next_path:
-            response = await self.request(
-                "GET", next_path, params=next_params, headers=headers
-            )
-            if on_response is not None:
-                on_response(response)
-            data = response.data or []
-            next_path, next_params = _next_page(response.headers)
-            if on_gap and not data and next_path:
-                on_gap(
-                    PaginationGap(
-                        resource=resource,
-                        url=next_path,
-                        page=page,
-                        expected_page=page,
-                        detail="empty page with next link",
-                    )
-                )
-            for item in data:
-                yield item
-            if next_path and on_gap:
-                next_page = _extract_page(next_params)
-                expected = page + 1
-                if next_page is not None and next_page != expected:
+        reader = _PageReader(
+            self,
+            headers,
+            depth=self.prefetch if prefetch is None else prefetch,
+            max_pages=max_pages,
+        )
+        try:
+            while next_path:
+                response = await reader.get(next_path, next_params)
+                if on_response is not None:
+                    on_response(response)
+                data = response.data or []
+                next_path, next_params = _next_page(response.headers)
+                if next_path:
+                    reader.read_ahead(next_path, next_params, response.headers)
+                if on_gap and not data and next_path:
                     on_gap(
                         PaginationGap(
                             resource=resource,
                             url=next_path,
-                            page=next_page,
-                            expected_page=expected,
-                            detail="non-sequential page",
+                            page=page,
+                            expected_page=page,
+                            detail="empty page with next link",
                         )
                     )
-            pages_seen += 1
-            if max_pages is not None and pages_seen >= max_pages:
-                break
-            page = _extract_page(next_params) or (page + 1)
+                for item in data:
+                    yield item
+                if next_path and on_gap:
+                    next_page = _extract_page(next_params)
+                    expected = page + 1
+                    if next_page is not None and next_page != expected:
+                        on_gap(
+                            PaginationGap(
+                                resource=resource,
+                                url=next_path,
+                                page=next_page,
+                                expected_page=expected,
+                                detail="non-sequential page",
+                            )
+                        )
+                pages_seen += 1
+                if max_pages is not None and pages_seen >= max_pages:
+                    break
+                page = _extract_page(next_params) or (page + 1)
+        finally:
+            await reader.close()
+
+    def _archiving_gaps(
+        self, on_gap: Callable[[PaginationGap], None] | None
+    ) -> Callable[[PaginationGap], None]:
+        def record(gap: PaginationGap) -> None:
+            self.archive.append_gap(
+                gap.resource,
+                url=gap.url,
+                page=gap.page,
+                expected_page=gap.expected_page,
+                detail=gap.detail,
+            )
+            if on_gap is not None:
+                on_gap(gap)
+
+        return record
 
     async def paginate_conditional(
         self,
@@ -239,6 +386,93 @@ class GitHubRestClient:
                 yield item
 
 
+class _PageReader:
+    """Page requests of one `paginate` call, issued ahead of the consumer."""
+
+    def __init__(
+        self,
+        client: GitHubRestClient,
+        headers: dict | None,
+        *,
+        depth: int,
+        max_pages: int | None,
+    ) -> None:
+        self._client = client
+        self._headers = headers
+        self._depth = max(depth, 0)
+        self._max_pages = max_pages
+        self._requested = 0
+        self._pending: deque[tuple[tuple, asyncio.Task]] = deque()
+
+    async def get(self, path: str, params: dict | None) -> GitHubResponse:
+        key = _request_key(path, params)
+        if self._pending and self._pending[0][0] == key:
+            _, task = self._pending.popleft()
+            return await task
+        # Nothing fetched ahead for this link (or the links changed under us).
+        await self.close()
+        self._requested += 1
+        return await self._client.request("GET", path, params=params, headers=self._headers)
+
+    def read_ahead(self, path: str, params: dict | None, headers: Mapping[str, str]) -> None:
+        if self._depth == 0:
+            return
+        scheduled = {key for key, _ in self._pending}
+        for target_path, target_params in _pages_ahead(path, params, headers, self._depth):
+            key = _request_key(target_path, target_params)
+            if key in scheduled:
+                continue
+            if self._max_pages is not None and self._requested >= self._max_pages:
+                return
+            self._requested += 1
+            self._pending.append(
+                (
+                    key,
+                    asyncio.ensure_future(
+                        self._client.request(
+                            "GET", target_path, params=target_params, headers=self._headers
+                        )
+                    ),
+                )
+            )
+
+    async def close(self) -> None:
+        tasks = [task for _, task in self._pending]
+        self._pending.clear()
+        # Discarded pages were requested but never consumed.
+        self._requested -= len(tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _pages_ahead(
+    path: str, params: dict | None, headers: Mapping[str, str], depth: int
+) -> list[tuple[str, dict | None]]:
+    # With rel="last" the remaining page URLs are known: `depth` of them from
+    # the next one on. Without it, only the next link is.
+    next_page = _extract_page(params)
+    last = _page_links(headers).get("last")
+    if next_page is None or last is None:
+        return [(path, params)]
+    last_path, last_params = last
+    last_page = _extract_page(last_params)
+    same_listing = last_path == path and {
+        k: v for k, v in last_params.items() if k != "page"
+    } == {k: v for k, v in params.items() if k != "page"}
+    if last_page is None or not same_listing:
+        return [(path, params)]
+    return [
+        (path, {**params, "page": str(n)})
+        for n in range(next_page, min(last_page, next_page + depth - 1) + 1)
+    ]
+
+
+def _request_key(path: str, params: dict | None) -> tuple:
+    return path, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+
 def _extract_response_data(response: Any) -> Any:
     if hasattr(response, "parsed_data"):
         return response.parsed_data
@@ -248,18 +482,23 @@ def _extract_response_data(response: Any) -> Any:
 
 
 def _next_page(headers: Mapping[str, str]) -> tuple[str | None, dict | None]:
+    return _page_links(headers).get("next", (None, None))
+
+
+def _page_links(headers: Mapping[str, str]) -> dict[str, tuple[str, dict]]:
     link = headers.get("Link") or headers.get("link")
     if not link:
-        return None, None
+        return {}
+    links: dict[str, tuple[str, dict]] = {}
     for part in link.split(","):
         section = part.strip()
-        if 'rel="next"' not in section:
-            continue
-        url = section.split(";")[0].strip().lstrip("<").rstrip(">")
-        parsed = urlparse(url)
-        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
-        return parsed.path, params
-    return None, None
+        for rel in ("next", "last"):
+            if f'rel="{rel}"' in section and rel not in links:
+                url = section.split(";")[0].strip().lstrip("<").rstrip(">")
+                parsed = urlparse(url)
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                links[rel] = (parsed.path, params)
+    return links
 
 
 def _extract_page(params: dict | None) -> int | None:
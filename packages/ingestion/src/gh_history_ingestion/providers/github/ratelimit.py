@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Mapping
+
+from .cache import _header
+
+# GitHub asks clients hitting a secondary limit without Retry-After to wait
+# at least a minute.
+SECONDARY_LIMIT_DEFAULT_WAIT = 60.0
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None
+    paused_until: float | None
+    requests: int
+    throttled_seconds: float
+
+
+class RateLimitScheduler:
+    """Paces requests of one token against its GitHub rate-limit budget.
+
+    Budget state comes from `X-RateLimit-Limit/Remaining/Reset` on every
+    response. Requests are released from a token bucket of `burst` requests
+    refilled at whatever rate spends the rest of the budget (minus `reserve`)
+    exactly at reset: short runs go out at full speed, long backfills are
+    spread over the window instead of draining it and stalling. A secondary
+    limit (`Retry-After`, or 403/429 with no budget left) pauses every task
+    sharing the scheduler until it lifts.
+    """
+
+    def __init__(
+        self,
+        *,
+        burst: int = 100,
+        reserve: int = 50,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.burst = int(burst)
+        self.reserve = int(reserve)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = asyncio.Lock()
+        self._limit: int | None = None
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
+        self._paused_until: float | None = None
+        self._tokens = float(self.burst)
+        self._refilled_at: float | None = None
+        self._requests = 0
+        self._throttled_seconds = 0.0
+
+    def state(self) -> RateLimitState:
+        return RateLimitState(
+            limit=self._limit,
+            remaining=self._remaining,
+            reset_at=self._reset_at,
+            paused_until=self._paused_until,
+            requests=self._requests,
+            throttled_seconds=self._throttled_seconds,
+        )
+
+    async def acquire(self) -> None:
+        """Wait until one more request fits the budget, then reserve it."""
+        async with self._lock:
+            while True:
+                delay = self._delay(self._clock())
+                if delay <= 0:
+                    break
+                self._throttled_seconds += delay
+                await self._sleep(delay)
+            if self._remaining is not None:
+                self._tokens -= 1.0
+                self._remaining -= 1
+            self._requests += 1
+
+    def observe(self, status_code: int | None, headers: Mapping[str, str]) -> bool:
+        """Update the budget from a response; True if it was rate limited."""
+        now = self._clock()
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        if limit is not None:
+            self._limit = limit
+        if remaining is not None and reset_at is not None:
+            if self._reset_at is None or float(reset_at) != self._reset_at:
+                self._reset_at = float(reset_at)
+                self._remaining = remaining
+                self._refilled_at = now
+            elif self._remaining is None or remaining < self._remaining:
+                # Responses can arrive out of order; keep the lowest count.
+                self._remaining = remaining
+
+        if status_code not in (403, 429):
+            return False
+        retry_after = _retry_after(headers, now)
+        if retry_after is not None:
+            self._pause(now + retry_after)
+            return True
+        if remaining == 0 and reset_at is not None:
+            self._pause(float(reset_at))
+            return True
+        if status_code == 429:
+            self._pause(now + SECONDARY_LIMIT_DEFAULT_WAIT)
+            return True
+        return False
+
+    def _pause(self, until: float) -> None:
+        if self._paused_until is None or until > self._paused_until:
+            self._paused_until = until
+
+    def _delay(self, now: float) -> float:
+        if self._paused_until is not None:
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._paused_until = None
+        if self._remaining is None or self._reset_at is None:
+            return 0.0
+        if now >= self._reset_at:
+            # New window; the next response reports the fresh budget.
+            self._remaining = None
+            self._reset_at = None
+            self._tokens = float(self.burst)
+            self._refilled_at = None
+            return 0.0
+        window = self._reset_at - now
+        budget = self._remaining - self.reserve
+        if budget <= 0:
+            return window
+        rate = max(budget - self._tokens, 0.0) / window
+        if self._refilled_at is not None:
+            self._tokens = min(float(self.burst), self._tokens + rate * (now - self._refilled_at))
+        self._refilled_at = now
+        if self._tokens >= 1.0:
+            return 0.0
+        if rate <= 0.0:
+            return window
+        return (1.0 - self._tokens) / rate
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = _header(headers, name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(headers: Mapping[str, str], now: float) -> float | None:
+    value = _header(headers, "Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
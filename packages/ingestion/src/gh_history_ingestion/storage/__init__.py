@@ -1,4 +1,19 @@
-from .db import get_engine, get_session, init_db
+from .db import (
+    SQLITE_PROFILES,
+    ensure_indexes,
+    get_engine,
+    get_session,
+    init_db,
+    optimize_db,
+)
 from .schema import Base
 
-__all__ = ["Base", "get_engine", "get_session", "init_db"]
+__all__ = [
+    "Base",
+    "SQLITE_PROFILES",
+    "ensure_indexes",
+    "get_engine",
+    "get_session",
+    "init_db",
+    "optimize_db",
+]
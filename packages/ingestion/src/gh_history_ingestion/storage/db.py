@@ -2,19 +2,52 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import Session
 
 from .schema import Base
 
+# Named PRAGMA sets applied on every new DBAPI connection.
+#
+# - "default": SQLite defaults (rollback journal, synchronous=FULL).
+# - "ingest": WAL so readers can run while an ingest writes, and
+#   synchronous=NORMAL so stage commits do not fsync (WAL stays consistent;
+#   only the last commits may be lost on power failure).
+# - "reader": read-only URI plus query_only for analysis/evaluation access.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "default": {},
+    "ingest": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "reader": {
+        "query_only": "ON",
+        "cache_size": -32768,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
 
-def get_engine(db_path: str | Path):
+
+def get_engine(db_path: str | Path, *, profile: str = "default"):
+    pragmas = _profile_pragmas(profile)
     db_path_str = str(db_path)
     if db_path_str == ":memory:":
         url = "sqlite+pysqlite:///:memory:"
+    elif profile == "reader":
+        uri = Path(db_path_str).resolve().as_uri()
+        url = f"sqlite+pysqlite:///{uri}?mode=ro&uri=true"
     else:
         url = f"sqlite+pysqlite:///{db_path_str}"
-    return create_engine(url, future=True)
+    engine = create_engine(url, future=True)
+    if pragmas:
+        event.listen(engine, "connect", _pragma_hook(pragmas))
+    return engine
 
 
 def get_session(engine) -> Session:
@@ -23,3 +56,56 @@ def get_session(engine) -> Session:
 
 def init_db(engine) -> None:
     Base.metadata.create_all(engine)
+    ensure_indexes(engine)
+
+
+def ensure_indexes(engine) -> list[str]:
+    """Create schema indexes missing from an existing database.
+
+    `create_all` only creates indexes together with new tables, so databases
+    built before an index was added to the schema need this migration step.
+    Returns the names of the indexes that were created.
+    """
+
+    created: list[str] = []
+    with engine.begin() as conn:
+        existing_tables = set(inspect(conn).get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {ix["name"] for ix in inspect(conn).get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda ix: str(ix.name)):
+                if index.name in existing:
+                    continue
+                index.create(conn)
+                created.append(str(index.name))
+    return created
+
+
+def optimize_db(engine) -> list[str]:
+    """Add missing indexes and refresh planner statistics (`ANALYZE`)."""
+
+    created = ensure_indexes(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    return created
+
+
+def _profile_pragmas(profile: str) -> dict[str, str | int]:
+    try:
+        return SQLITE_PROFILES[profile]
+    except KeyError:
+        known = ", ".join(sorted(SQLITE_PROFILES))
+        raise ValueError(f"unknown sqlite profile: {profile} (known: {known})") from None
+
+
+def _pragma_hook(pragmas: dict[str, str | int]):
+    def _on_connect(dbapi_connection, connection_record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return _on_connect
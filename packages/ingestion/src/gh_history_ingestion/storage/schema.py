@@ -169,6 +169,15 @@ class Review(Base):
     submitted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     commit_id: Mapped[str | None] = mapped_column(String, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_reviews_repo_pr_submitted",
+            "repo_id",
+            "pull_request_id",
+            "submitted_at",
+        ),
+    )
+
 
 class Comment(Base):
     __tablename__ = "comments"
@@ -190,6 +199,15 @@ class Comment(Base):
     in_reply_to_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     comment_type: Mapped[str | None] = mapped_column(String, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_comments_repo_pr_created",
+            "repo_id",
+            "pull_request_id",
+            "created_at",
+        ),
+    )
+
 
 class Commit(Base):
     __tablename__ = "commits"
@@ -256,6 +274,17 @@ class Event(Base):
     payload_json: Mapped[str | None] = mapped_column(Text, nullable=True)
     event_key: Mapped[str] = mapped_column(String, nullable=False, unique=True)
 
+    __table_args__ = (
+        Index("ix_events_repo_occurred", "repo_id", "occurred_at"),
+        Index(
+            "ix_events_subject_type_occurred",
+            "subject_type",
+            "subject_id",
+            "event_type",
+            "occurred_at",
+        ),
+    )
+
 
 class Watermark(Base):
     __tablename__ = "watermarks"
@@ -315,6 +344,8 @@ class IssueStateInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_issue_state_intervals_issue", "issue_id"),)
+
 
 class IssueContentInterval(Base):
     __tablename__ = "issue_content_intervals"
@@ -326,6 +357,8 @@ class IssueContentInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_issue_content_intervals_issue", "issue_id"),)
+
 
 class IssueLabelInterval(Base):
     __tablename__ = "issue_label_intervals"
@@ -336,6 +369,8 @@ class IssueLabelInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_issue_label_intervals_issue", "issue_id"),)
+
 
 class IssueAssigneeInterval(Base):
     __tablename__ = "issue_assignee_intervals"
@@ -346,6 +381,8 @@ class IssueAssigneeInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_issue_assignee_intervals_issue", "issue_id"),)
+
 
 class IssueMilestoneInterval(Base):
     __tablename__ = "issue_milestone_intervals"
@@ -356,6 +393,8 @@ class IssueMilestoneInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_issue_milestone_intervals_issue", "issue_id"),)
+
 
 class PullRequestDraftInterval(Base):
     __tablename__ = "pull_request_draft_intervals"
@@ -368,6 +407,13 @@ class PullRequestDraftInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (
+        Index(
+            "ix_pull_request_draft_intervals_pull_request",
+            "pull_request_id",
+        ),
+    )
+
 
 class PullRequestHeadInterval(Base):
     __tablename__ = "pull_request_head_intervals"
@@ -381,6 +427,13 @@ class PullRequestHeadInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (
+        Index(
+            "ix_pull_request_head_intervals_pull_request",
+            "pull_request_id",
+        ),
+    )
+
 
 class PullRequestReviewRequestInterval(Base):
     __tablename__ = "pull_request_review_request_intervals"
@@ -394,6 +447,13 @@ class PullRequestReviewRequestInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (
+        Index(
+            "ix_pull_request_review_request_intervals_pull_request",
+            "pull_request_id",
+        ),
+    )
+
 
 class CommentContentInterval(Base):
     __tablename__ = "comment_content_intervals"
@@ -404,6 +464,8 @@ class CommentContentInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_comment_content_intervals_comment", "comment_id"),)
+
 
 class ReviewContentInterval(Base):
     __tablename__ = "review_content_intervals"
@@ -415,6 +477,8 @@ class ReviewContentInterval(Base):
     start_event_id: Mapped[int] = mapped_column(Integer, ForeignKey("events.id"))
     end_event_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("events.id"))
 
+    __table_args__ = (Index("ix_review_content_intervals_review", "review_id"),)
+
 
 class ObjectSnapshot(Base):
     __tablename__ = "object_snapshots"
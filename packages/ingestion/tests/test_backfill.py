@@ -1,12 +1,19 @@
+import asyncio
+
 import pytest
 from sqlalchemy import func, select
 
 from gh_history_ingestion.ingest.backfill import backfill_repo
+from gh_history_ingestion.ingest.fanout import FetchPool
+from gh_history_ingestion.ingest.replay import replay_archive
+from gh_history_ingestion.providers.github.archive import PageArchive
+from gh_history_ingestion.providers.github.client import GitHubResponse, GitHubRestClient
 from gh_history_ingestion.storage.db import get_engine, get_session, init_db
 from gh_history_ingestion.storage.schema import (
     Comment,
     Commit,
     Event,
+    IngestionGap,
     Issue,
     PullRequest,
     PullRequestFile,
@@ -262,3 +269,167 @@ async def test_backfill_time_window_filters(tmp_path):
     assert session.scalar(select(func.count()).select_from(Issue)) == 1
     assert session.scalar(select(Issue.number)) == 2
     assert session.scalar(select(func.count()).select_from(Event)) >= 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_concurrent_fanout_matches_serial(tmp_path):
+    counts = {}
+    for concurrency in (1, 4):
+        db_path = tmp_path / f"backfill-c{concurrency}.db"
+        await backfill_repo(
+            "octo/repo", db_path, client=StubGitHubClient(), concurrency=concurrency
+        )
+        session = get_session(get_engine(db_path))
+        counts[concurrency] = {
+            model.__tablename__: session.scalar(select(func.count()).select_from(model))
+            for model in (Comment, Event, PullRequestFile, Review)
+        }
+    assert counts[4] == counts[1]
+
+
+class RepoStreamStubClient(StubGitHubClient):
+    """Serves activity only from the repo-wide listings, built from the
+    per-number fixtures above with the URLs GitHub uses for routing."""
+
+    async def _items(self, path):
+        return [item async for item in super().paginate(path)]
+
+    async def paginate(self, path, params=None, **kwargs):
+        base = "https://api.github.com/repos/octo/repo"
+        if path == "/repos/octo/repo/issues/comments":
+            self.calls.append((path, params))
+            for number in (2, 1):
+                for item in await self._items(f"/repos/octo/repo/issues/{number}/comments"):
+                    yield {**item, "issue_url": f"{base}/issues/{number}"}
+            return
+        if path == "/repos/octo/repo/issues/events":
+            self.calls.append((path, params))
+            for number in (2, 1):
+                for item in await self._items(f"/repos/octo/repo/issues/{number}/events"):
+                    yield {**item, "issue": {"number": number}}
+            return
+        if path == "/repos/octo/repo/pulls/comments":
+            self.calls.append((path, params))
+            return
+        if path.endswith(("/comments", "/events")):
+            raise AssertionError(f"Unexpected per-number listing: {path}")
+        async for item in super().paginate(path, params, **kwargs):
+            yield item
+
+
+@pytest.mark.asyncio
+async def test_backfill_repo_streams_match_per_number_activity(tmp_path):
+    rows = {}
+    for repo_streams in (False, True):
+        client = RepoStreamStubClient() if repo_streams else StubGitHubClient()
+        db_path = tmp_path / f"backfill-streams-{repo_streams}.db"
+        await backfill_repo("octo/repo", db_path, client=client, repo_streams=repo_streams)
+        session = get_session(get_engine(db_path))
+        rows[repo_streams] = {
+            "comments": session.execute(
+                select(Comment.id, Comment.issue_id, Comment.pull_request_id).order_by(Comment.id)
+            ).all(),
+            "events": session.execute(
+                select(Event.event_key, Event.subject_id).order_by(Event.event_key)
+            ).all(),
+            "reviews": session.execute(select(Review.id).order_by(Review.id)).all(),
+        }
+        if repo_streams:
+            paths = [path for path, _ in client.calls]
+            assert "/repos/octo/repo/issues/comments" in paths
+            assert "/repos/octo/repo/pulls/2/reviews" in paths
+
+    assert rows[True] == rows[False]
+    assert rows[True]["comments"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_repo_streams_ignore_per_listing_max_pages(tmp_path):
+    page_caps = {}
+
+    class CapRecordingClient(RepoStreamStubClient):
+        async def paginate(self, path, params=None, **kwargs):
+            page_caps[path] = kwargs.get("max_pages")
+            async for item in super().paginate(path, params, **kwargs):
+                yield item
+
+    await backfill_repo(
+        "octo/repo",
+        tmp_path / "capped.db",
+        client=CapRecordingClient(),
+        repo_streams=True,
+        max_pages=1,
+    )
+
+    assert page_caps["/repos/octo/repo/pulls/2/reviews"] == 1
+    for stream in ("issues/comments", "issues/events", "pulls/comments"):
+        assert page_caps[f"/repos/octo/repo/{stream}"] is None
+
+
+def _table_rows(db_path) -> dict[str, list[tuple]]:
+    session = get_session(get_engine(db_path))
+    rows = {}
+    for model in (Comment, Commit, Event, Issue, PullRequest, PullRequestFile, Ref, Release, Review):
+        # Surrogate autoincrement ids depend on write order; compare the rest.
+        columns = [
+            c for c in model.__table__.columns if not (c.primary_key and c.autoincrement is True)
+        ]
+        rows[model.__tablename__] = sorted(
+            tuple(str(v) for v in row) for row in session.execute(select(*columns)).all()
+        )
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_replay_rebuilds_database_from_archive(tmp_path):
+    stub = StubGitHubClient()
+
+    async def request_from_stub(method, path, params=None, headers=None, full_url=None):
+        if path == "/repos/octo/repo":
+            return GitHubResponse(data=await stub.get_json(path), headers={}, status_code=200)
+        items = [item async for item in stub.paginate(path, params)]
+        return GitHubResponse(data=items, headers={}, status_code=200)
+
+    archive = PageArchive(tmp_path / "archive")
+    live_db = tmp_path / "live.db"
+    await backfill_repo(
+        "octo/repo",
+        live_db,
+        client=GitHubRestClient(token="x", request_func=request_from_stub, archive=archive),
+    )
+    session = get_session(get_engine(live_db))
+    session.add(IngestionGap(repo_id=1, resource="reviews", detail="seeded"))
+    session.commit()
+    archive.append_gap("reviews", url=None, page=None, expected_page=None, detail="seeded")
+
+    replayed_db = tmp_path / "replayed.db"
+    pages = replay_archive("octo/repo", replayed_db, archive.root, workers=2)
+
+    assert pages["pulls"] == 1 and pages["reviews"] == 1
+    assert _table_rows(replayed_db) == _table_rows(live_db)
+    replayed = get_session(get_engine(replayed_db))
+    assert replayed.scalar(select(func.count()).select_from(IngestionGap)) == 1
+    assert replayed.scalar(select(PullRequest.issue_id)) == 101
+
+
+@pytest.mark.asyncio
+async def test_fetch_pool_bounds_in_flight_and_writes_in_order():
+    in_flight = {"now": 0, "peak": 0}
+    written = []
+
+    async def fetch(n):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.001 * (5 - n % 5))
+        in_flight["now"] -= 1
+        return n * 10
+
+    def write(key, result):
+        written.append((key, result))
+
+    async with FetchPool(write, concurrency=3) as pool:
+        for n in range(10):
+            await pool.submit(n, fetch(n))
+
+    assert written == [(n, n * 10) for n in range(10)]
+    assert in_flight["peak"] == 3
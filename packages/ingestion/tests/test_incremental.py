@@ -5,6 +5,7 @@ from gh_history_ingestion.ingest.incremental import incremental_update
 from gh_history_ingestion.storage.db import get_engine, get_session, init_db
 from gh_history_ingestion.storage.schema import (
     Commit,
+    Comment,
     IngestionCheckpoint,
     Issue,
     PullRequest,
@@ -313,3 +314,134 @@ async def test_incremental_resume_skips_completed_stages(tmp_path):
     session = get_session(engine)
     checkpoints = session.scalars(select(IngestionCheckpoint.stage)).all()
     assert "qa_report_written" in checkpoints
+
+
+class RepoStreamIncrementalClient(StubIncrementalClient):
+    async def paginate(self, path, params=None, headers=None, **kwargs):
+        if path == "/repos/octo/repo/issues/comments":
+            self.calls.append((path, params, headers))
+            yield {
+                "id": 600,
+                "body": "late comment",
+                "issue_url": "https://api.github.com/repos/octo/repo/issues/1",
+                "created_at": "2099-01-01T00:00:00Z",
+                "updated_at": "2099-01-02T00:00:00Z",
+                "user": {"id": 2, "login": "octo"},
+            }
+            return
+        if path in ("/repos/octo/repo/issues/events", "/repos/octo/repo/pulls/comments"):
+            self.calls.append((path, params, headers))
+            return
+        async for item in super().paginate(path, params, headers, **kwargs):
+            yield item
+
+
+@pytest.mark.asyncio
+async def test_incremental_repo_streams_start_from_per_number_pass(tmp_path):
+    db_path = tmp_path / "incremental-streams.db"
+
+    first = RepoStreamIncrementalClient()
+    await incremental_update("octo/repo", db_path, client=first, repo_streams=True)
+    first_paths = [call[0] for call in first.calls]
+    assert "/repos/octo/repo/issues/1/comments" in first_paths
+    assert "/repos/octo/repo/issues/comments" not in first_paths
+
+    session = get_session(get_engine(db_path))
+    started = {
+        wm.resource: parse_datetime(wm.updated_at)
+        for wm in session.execute(select(Watermark)).scalars()
+        if wm.resource in {"issue_events", "issue_comments", "review_comments"}
+    }
+    assert set(started) == {"issue_events", "issue_comments", "review_comments"}
+
+    second = RepoStreamIncrementalClient()
+    await incremental_update("octo/repo", db_path, client=second, repo_streams=True)
+    second_paths = [call[0] for call in second.calls]
+    assert "/repos/octo/repo/issues/1/comments" not in second_paths
+    assert "/repos/octo/repo/issues/1/events" not in second_paths
+    assert "/repos/octo/repo/pulls/1/comments" not in second_paths
+    assert "/repos/octo/repo/pulls/comments" in second_paths
+    comments_call = next(
+        call for call in second.calls if call[0] == "/repos/octo/repo/issues/comments"
+    )
+    assert parse_datetime(comments_call[1]["since"]) == started["issue_comments"]
+
+    session = get_session(get_engine(db_path))
+    assert session.scalar(select(Comment.issue_id).where(Comment.id == 600)) == 100
+    comments_wm = session.execute(
+        select(Watermark).where(Watermark.resource == "issue_comments")
+    ).scalar_one()
+    assert parse_datetime(comments_wm.updated_at) == parse_datetime("2099-01-02T00:00:00Z")
+
+
+class LateIssueStreamClient(RepoStreamIncrementalClient):
+    """Issue #2 has a comment in the stream before the issue listing has it."""
+
+    def __init__(self, *, list_late_issue: bool):
+        super().__init__()
+        self.list_late_issue = list_late_issue
+
+    async def paginate_conditional(self, path, params=None, headers=None, **kwargs):
+        async for item in super().paginate_conditional(path, params, headers, **kwargs):
+            yield item
+        if path == "/repos/octo/repo/issues" and self.list_late_issue:
+            yield {
+                "id": 102,
+                "number": 2,
+                "title": "Late issue",
+                "state": "open",
+                "created_at": "2099-01-01T00:00:00Z",
+                "updated_at": "2099-01-01T00:00:00Z",
+                "user": {"id": 2, "login": "octo"},
+            }
+
+    async def paginate(self, path, params=None, headers=None, **kwargs):
+        if path == "/repos/octo/repo/issues/comments":
+            self.calls.append((path, params, headers))
+            yield {
+                "id": 601,
+                "body": "on a new issue",
+                "issue_url": "https://api.github.com/repos/octo/repo/issues/2",
+                "created_at": "2099-01-01T00:00:00Z",
+                "updated_at": "2099-01-01T12:00:00Z",
+                "user": {"id": 2, "login": "octo"},
+            }
+        async for item in super().paginate(path, params, headers, **kwargs):
+            yield item
+
+
+@pytest.mark.asyncio
+async def test_incremental_repo_streams_hold_watermark_for_unlisted_issues(tmp_path):
+    db_path = tmp_path / "incremental-streams-race.db"
+    await incremental_update(
+        "octo/repo", db_path, client=RepoStreamIncrementalClient(), repo_streams=True
+    )
+
+    # The stream sees a comment on issue #2 before any issue listing has it.
+    await incremental_update(
+        "octo/repo",
+        db_path,
+        client=LateIssueStreamClient(list_late_issue=False),
+        repo_streams=True,
+    )
+    session = get_session(get_engine(db_path))
+    assert session.scalar(select(Comment.id).where(Comment.id == 601)) is None
+    assert session.scalar(select(Comment.issue_id).where(Comment.id == 600)) == 100
+    comments_wm = session.execute(
+        select(Watermark).where(Watermark.resource == "issue_comments")
+    ).scalar_one()
+    assert parse_datetime(comments_wm.updated_at) == parse_datetime("2099-01-01T12:00:00Z")
+
+    # The next run lists the issue and the held comment is written.
+    third = LateIssueStreamClient(list_late_issue=True)
+    await incremental_update("octo/repo", db_path, client=third, repo_streams=True)
+    comments_call = next(
+        call for call in third.calls if call[0] == "/repos/octo/repo/issues/comments"
+    )
+    assert parse_datetime(comments_call[1]["since"]) == parse_datetime("2099-01-01T12:00:00Z")
+    session = get_session(get_engine(db_path))
+    assert session.scalar(select(Comment.issue_id).where(Comment.id == 601)) == 102
+    comments_wm = session.execute(
+        select(Watermark).where(Watermark.resource == "issue_comments")
+    ).scalar_one()
+    assert parse_datetime(comments_wm.updated_at) == parse_datetime("2099-01-02T00:00:00Z")
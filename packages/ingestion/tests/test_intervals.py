@@ -8,6 +8,8 @@ from gh_history_ingestion.storage.schema import (
     IssueLabelInterval,
     IssueStateInterval,
     Label,
+    PullRequest,
+    PullRequestHeadInterval,
     Repo,
 )
 from gh.storage.upsert import insert_event
@@ -87,3 +89,56 @@ def test_interval_rebuild_for_issue_state_and_labels(tmp_path):
     assert states[1].state == "closed"
     assert len(labels) == 1
     assert labels[0].label_id == 5
+
+
+def test_interval_rebuild_scoped_to_subjects(tmp_path):
+    engine = get_engine(tmp_path / "intervals-scoped.db")
+    init_db(engine)
+    session = get_session(engine)
+    session.add(Repo(id=1, owner_login="octo", name="repo", full_name="octo/repo"))
+    session.add(Issue(id=10, repo_id=1, number=1, is_pull_request=True))
+    session.add(Issue(id=11, repo_id=1, number=2, is_pull_request=False))
+    session.add(PullRequest(id=20, repo_id=1, number=1, issue_id=10))
+    session.commit()
+
+    def add(subject_type, subject_id, event_type, day, **kwargs):
+        insert_event(
+            session,
+            EventRecord(
+                repo_id=1,
+                occurred_at=f"2024-01-{day:02d}T00:00:00Z",
+                actor_id=1,
+                subject_type=subject_type,
+                subject_id=subject_id,
+                event_type=event_type,
+                **kwargs,
+            ),
+        )
+
+    add("issue", 11, "issue.opened", 1)
+    add("pull_request", 20, "pull_request.head.set", 1, commit_sha="a")
+    add("pull_request", 20, "pull_request.head.set", 3, commit_sha="b")
+    session.commit()
+    rebuild_intervals(session, repo_id=1)
+
+    add("pull_request", 20, "pull_request.head.set", 2, commit_sha="c")
+    add("issue", 11, "issue.closed", 4)
+    session.commit()
+    rebuild_intervals(session, repo_id=1, issue_ids=[], pr_ids=[20])
+
+    heads = session.scalars(
+        select(PullRequestHeadInterval)
+        .where(PullRequestHeadInterval.pull_request_id == 20)
+        .order_by(PullRequestHeadInterval.start_event_id)
+    ).all()
+    assert [h.head_sha for h in heads] == ["a", "b", "c"]
+    by_sha = {h.head_sha: h for h in heads}
+    assert by_sha["a"].end_event_id == by_sha["c"].start_event_id
+    assert by_sha["c"].end_event_id == by_sha["b"].start_event_id
+    assert by_sha["b"].end_event_id is None
+
+    # Issue 11 was outside the rebuild scope: its close event is not applied yet.
+    states = session.scalars(
+        select(IssueStateInterval).where(IssueStateInterval.issue_id == 11)
+    ).all()
+    assert [(s.state, s.end_event_id) for s in states] == [("open", None)]
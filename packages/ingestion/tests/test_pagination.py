@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
 from gh_history_ingestion.github.client import GitHubResponse, GitHubRestClient
+from gh_history_ingestion.providers.github.cache import HttpResponseCache
 
 
 @pytest.mark.asyncio
@@ -122,3 +125,165 @@ async def test_paginate_max_pages_limits_results():
     ]
     assert items == [{"id": 1}]
     assert call_count["count"] == 1
+
+
+def _numbered_pages(next_links: dict[int, int], last: int | None):
+    """Fake request_func serving page n with `next_links[n]` as its next link."""
+    calls: list[int] = []
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def fake_request(method, path, params=None, headers=None, full_url=None):
+        page = int((params or {}).get("page", 1))
+        calls.append(page)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        links = []
+        if page in next_links:
+            links.append(f'<https://api.github.com/resource?page={next_links[page]}>; rel="next"')
+            if last is not None:
+                links.append(f'<https://api.github.com/resource?page={last}>; rel="last"')
+        return GitHubResponse(
+            data=[{"page": page}],
+            headers={"Link": ", ".join(links)} if links else {},
+            status_code=200,
+        )
+
+    return fake_request, calls, state
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_up_to_depth_when_last_page_is_known():
+    fake_request, calls, state = _numbered_pages({n: n + 1 for n in range(1, 6)}, last=6)
+    client = GitHubRestClient(token="x", request_func=fake_request, prefetch=3)
+
+    items = [item["page"] async for item in client.paginate("/resource")]
+
+    assert items == [1, 2, 3, 4, 5, 6]
+    assert sorted(calls) == [1, 2, 3, 4, 5, 6]
+    assert state["max_in_flight"] == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_looks_one_page_ahead_without_last_link():
+    fake_request, calls, state = _numbered_pages({1: 2, 2: 3}, last=None)
+    client = GitHubRestClient(token="x", request_func=fake_request)
+    requested_while_consuming = []
+
+    async for item in client.paginate("/resource"):
+        await asyncio.sleep(0)
+        requested_while_consuming.append(list(calls))
+
+    # The next page is already requested while the current one is consumed.
+    assert requested_while_consuming == [[1, 2], [1, 2, 3], [1, 2, 3]]
+    assert state["max_in_flight"] == 1
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch_follows_links_that_diverge_from_last():
+    # Page 2 skips to page 4, so the prefetched page 3 must not be yielded.
+    fake_request, calls, _ = _numbered_pages({1: 2, 2: 4, 4: 5}, last=5)
+    client = GitHubRestClient(token="x", request_func=fake_request, prefetch=4)
+    gaps = []
+
+    items = [item["page"] async for item in client.paginate("/resource", on_gap=gaps.append)]
+
+    assert items == [1, 2, 4, 5]
+    assert [(g.page, g.expected_page) for g in gaps] == [(4, 3)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch_respects_max_pages():
+    fake_request, calls, _ = _numbered_pages({n: n + 1 for n in range(1, 10)}, last=10)
+    client = GitHubRestClient(token="x", request_func=fake_request, prefetch=8)
+
+    items = [item["page"] async for item in client.paginate("/resource", max_pages=3)]
+
+    assert items == [1, 2, 3]
+    assert sorted(calls) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_http_cache_revalidates_and_replays_pages_on_304(tmp_path):
+    pages = {
+        "1": GitHubResponse(
+            data=[{"id": 1}],
+            headers={
+                "ETag": '"p1"',
+                "Link": '<https://api.github.com/resource?page=2&per_page=1>; rel="next"',
+            },
+            status_code=200,
+        ),
+        "2": GitHubResponse(
+            data=[{"id": 2}], headers={"ETag": '"p2"'}, status_code=200
+        ),
+    }
+    sent_headers = []
+
+    async def fake_request(method, path, params=None, headers=None, full_url=None):
+        sent_headers.append(headers)
+        page = pages[str((params or {}).get("page", "1"))]
+        if headers and headers.get("If-None-Match") == page.headers["ETag"]:
+            return GitHubResponse(data=None, headers={"ETag": page.headers["ETag"]}, status_code=304)
+        return page
+
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite")
+    client = GitHubRestClient(token="x", request_func=fake_request, cache=cache)
+    first = [item async for item in client.paginate("/resource", params={"per_page": 1})]
+    cache.close()
+
+    # A new run reopens the cache from disk and only revalidates.
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite")
+    client = GitHubRestClient(token="x", request_func=fake_request, cache=cache)
+    responses = []
+    second = [
+        item
+        async for item in client.paginate(
+            "/resource", params={"per_page": 1}, on_response=responses.append
+        )
+    ]
+
+    assert first == second == [{"id": 1}, {"id": 2}]
+    assert sent_headers[:2] == [None, None]
+    assert sent_headers[2:] == [{"If-None-Match": '"p1"'}, {"If-None-Match": '"p2"'}]
+    assert [r.from_cache for r in responses] == [True, True]
+    assert cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_http_cache_leaves_caller_conditional_requests_alone(tmp_path):
+    async def fake_request(method, path, params=None, headers=None, full_url=None):
+        if headers:
+            return GitHubResponse(data=None, headers={}, status_code=304)
+        return GitHubResponse(data=[{"id": 1}], headers={"ETag": '"a"'}, status_code=200)
+
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite")
+    client = GitHubRestClient(token="x", request_func=fake_request, cache=cache)
+    assert await client.get_json("/resource") == [{"id": 1}]
+
+    items = [
+        item
+        async for item in client.paginate_conditional(
+            "/resource", headers={"If-None-Match": '"a"'}
+        )
+    ]
+    assert items == []
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    cache = HttpResponseCache(tmp_path / "http_cache.sqlite", max_bytes=10_000)
+    payload = [{"body": f"{i}-" + "x" * 50} for i in range(200)]
+    for name in ("a", "b", "c"):
+        cache.put("GET", f"/{name}", None, headers={"ETag": name}, data=payload)
+    size = cache.total_bytes // 3
+    cache.max_bytes = size * 3
+    assert cache.get("GET", "/a", None) is not None
+
+    cache.put("GET", "/d", None, headers={"ETag": "d"}, data=payload)
+
+    assert cache.get("GET", "/b", None) is None
+    assert cache.get("GET", "/a", None) is not None
+    assert cache.total_bytes <= cache.max_bytes
+    assert len(cache) == 3
+    assert not cache.put("GET", "/e", None, headers={}, data=payload)
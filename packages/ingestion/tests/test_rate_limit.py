@@ -0,0 +1,108 @@
+import asyncio
+
+import httpx
+import pytest
+from aiolimiter import AsyncLimiter
+
+from gh_history_ingestion.providers.github.client import GitHubRestClient
+from gh_history_ingestion.providers.github.ratelimit import RateLimitScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _client(handler, clock: FakeClock, **scheduler_kwargs) -> GitHubRestClient:
+    return GitHubRestClient(
+        token="x",
+        limiter=AsyncLimiter(1_000, 1),
+        scheduler=RateLimitScheduler(clock=clock, sleep=clock.sleep, **scheduler_kwargs),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spreads_remaining_budget_until_reset():
+    clock = FakeClock()
+    served = {"count": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        served["count"] += 1
+        return httpx.Response(
+            200,
+            json={"n": served["count"]},
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": str(160 - served["count"]),
+                "X-RateLimit-Reset": "1100",
+            },
+        )
+
+    async with _client(handler, clock, burst=10, reserve=50) as client:
+        for _ in range(30):
+            await client.get_json("/resource")
+        state = client.rate_limit
+
+    assert served["count"] == 30
+    assert state.remaining == 130
+    assert state.requests == 30
+    # The burst goes out immediately, the rest is paced at ~1 request/s
+    # (about 100 requests spread over the 100 s left in the window).
+    assert clock.sleeps and all(s > 0 for s in clock.sleeps)
+    assert 15 < clock.now - 1_000.0 < 25
+    assert state.throttled_seconds == pytest.approx(sum(clock.sleeps))
+
+
+@pytest.mark.asyncio
+async def test_scheduler_waits_for_reset_when_budget_is_spent():
+    clock = FakeClock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        reset = "1060" if clock.now < 1_060 else "4660"
+        remaining = "0" if clock.now < 1_060 else "4999"
+        return httpx.Response(
+            403 if remaining == "0" else 200,
+            json={},
+            headers={"X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": reset},
+        )
+
+    async with _client(handler, clock, reserve=0) as client:
+        assert await client.get_json("/resource") == {}
+
+    assert clock.now == pytest.approx(1_060.0)
+
+
+@pytest.mark.asyncio
+async def test_secondary_limit_retry_after_pauses_all_tasks():
+    clock = FakeClock()
+    seen: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(clock.now)
+        if len(seen) == 1:
+            return httpx.Response(429, headers={"Retry-After": "30"})
+        return httpx.Response(200, json={"ok": True})
+
+    async with _client(handler, clock) as client:
+        results = await asyncio.gather(
+            client.get_json("/first"),
+            *[client.get_json(f"/other/{i}") for i in range(3)],
+        )
+        state = client.rate_limit
+
+    assert results == [{"ok": True}] * 4
+    # Every request issued after the 429 waited out the Retry-After.
+    assert seen[0] == 1_000.0
+    assert all(t >= 1_030.0 for t in seen[1:])
+    assert state.requests == 5
+    assert clock.sleeps == [30.0]
@@ -1,6 +1,6 @@
 from sqlalchemy import inspect
 
-from gh_history_ingestion.storage.db import get_engine, init_db
+from gh_history_ingestion.storage.db import get_engine, init_db, optimize_db
 
 
 def test_schema_creation(tmp_path):
@@ -51,3 +51,40 @@ def test_pull_request_files_indexes_exist(tmp_path):
     index_names = {idx["name"] for idx in inspector.get_indexes("pull_request_files")}
     assert "ix_pr_files_repo_pr_head" in index_names
     assert "ix_pr_files_repo_path" in index_names
+
+
+def test_ingest_profile_enables_wal(tmp_path):
+    db_path = tmp_path / "schema-wal.db"
+    engine = get_engine(db_path, profile="ingest")
+    init_db(engine)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("pragma journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("pragma synchronous").scalar() == 1
+
+    reader = get_engine(db_path, profile="reader")
+    with reader.connect() as conn:
+        assert conn.exec_driver_sql("pragma query_only").scalar() == 1
+        assert "events" in inspect(conn).get_table_names()
+
+
+def test_optimize_db_adds_indexes_to_existing_database(tmp_path):
+    db_path = tmp_path / "schema-legacy.db"
+    engine = get_engine(db_path)
+    init_db(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("drop index ix_events_repo_occurred")
+        conn.exec_driver_sql("drop index ix_reviews_repo_pr_submitted")
+
+    created = optimize_db(engine)
+
+    assert set(created) == {"ix_events_repo_occurred", "ix_reviews_repo_pr_submitted"}
+    inspector = inspect(engine)
+    event_indexes = {idx["name"] for idx in inspector.get_indexes("events")}
+    assert {"ix_events_repo_occurred", "ix_events_subject_type_occurred"} <= event_indexes
+    interval_indexes = {
+        idx["name"] for idx in inspector.get_indexes("pull_request_head_intervals")
+    }
+    assert "ix_pull_request_head_intervals_pull_request" in interval_indexes
+    assert optimize_db(engine) == []
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("select count(*) from sqlite_stat1").scalar() >= 0
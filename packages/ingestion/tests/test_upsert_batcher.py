@@ -0,0 +1,68 @@
+from sqlalchemy import func, select
+
+from gh_history_ingestion.events.event_record import EventRecord
+from gh_history_ingestion.storage.db import get_engine, get_session, init_db
+from gh_history_ingestion.storage.schema import Event, User
+from gh.storage.upsert import UpsertBatcher, insert_event, upsert_user
+
+
+def _session(tmp_path, name="batch.db"):
+    engine = get_engine(tmp_path / name)
+    init_db(engine)
+    return get_session(engine)
+
+
+def _event(payload):
+    return EventRecord(
+        repo_id=1,
+        occurred_at="2024-01-01T00:00:00Z",
+        actor_id=2,
+        subject_type="issue",
+        subject_id=100,
+        event_type="issue.comment.created",
+        object_type="comment",
+        object_id=500,
+        payload=payload,
+    )
+
+
+def test_batcher_dedupes_upserts_last_write_wins(tmp_path):
+    session = _session(tmp_path)
+    with UpsertBatcher(session) as batcher:
+        upsert_user(session, {"id": 2, "login": "old"})
+        upsert_user(session, {"id": 3, "login": "other"})
+        upsert_user(session, {"id": 2, "login": "new"})
+        assert batcher.pending == 2
+        session.commit()
+        assert batcher.pending == 0
+
+    assert session.scalar(select(func.count()).select_from(User)) == 2
+    assert session.scalar(select(User.login).where(User.id == 2)) == "new"
+
+
+def test_batcher_keeps_first_event_for_duplicate_keys(tmp_path):
+    session = _session(tmp_path)
+    with UpsertBatcher(session):
+        insert_event(session, _event({"body": "first"}))
+        insert_event(session, _event({"body": "second"}))
+    session.commit()
+
+    rows = session.scalars(select(Event.payload_json)).all()
+    assert rows == ['{"body": "first"}']
+
+
+def test_batcher_flushes_before_reads_and_at_batch_size(tmp_path):
+    session = _session(tmp_path)
+    with UpsertBatcher(session, batch_size=3) as batcher:
+        upsert_user(session, {"id": 1, "login": "a"})
+        assert session.scalar(select(func.count()).select_from(User)) == 1
+        assert batcher.pending == 0
+
+        for user_id in range(10, 13):
+            upsert_user(session, {"id": user_id, "login": f"u{user_id}"})
+        assert batcher.pending == 0
+
+    # Detached: plain upserts execute immediately again.
+    upsert_user(session, {"id": 20, "login": "direct"})
+    session.commit()
+    assert session.scalar(select(func.count()).select_from(User)) == 5